@@ -72,6 +72,9 @@ class Settings:
     EMBED_DEFAULT_MUTE: int = _getenv_int("EMBED_DEFAULT_MUTE", 0)
     EMBED_DEFAULT_LOOP: int = _getenv_int("EMBED_DEFAULT_LOOP", 0)
     VIDEO_PLAYER: str = os.getenv("VIDEO_PLAYER", "yurtube").strip() or "yurtube"
+    # hls.js for adaptive streaming in browsers without native HLS ("" = native HLS only, else progressive).
+    # Point it at a copy you host (e.g. /static/vendor/hls.js/<version>/hls.min.js), pinned to an exact version.
+    PLAYER_HLS_JS_URL: str = os.getenv("PLAYER_HLS_JS_URL", "").strip()
 
     FALLBACK_PLACEHOLDER_URL: str = os.getenv(
         "FALLBACK_PLACEHOLDER_URL",
@@ -104,6 +107,91 @@ class Settings:
 
     AUTO_LINK_GOOGLE_BY_EMAIL: bool = _getenv_bool("AUTO_LINK_GOOGLE_BY_EMAIL", True)
 
+    # uid -> avatar path cache shared by comments, notifications and listings
+    AVATAR_CACHE_TTL_SEC: int = _getenv_int("AVATAR_CACHE_TTL_SEC", 300)
+    AVATAR_CACHE_MAX: int = _getenv_int("AVATAR_CACHE_MAX", 50000)
+
+    # Signed-in user's username / channel_id / avatar path for headers and comment authorship
+    USER_PROFILE_CACHE_TTL_SEC: int = _getenv_int("USER_PROFILE_CACHE_TTL_SEC", 300)
+    USER_PROFILE_CACHE_MAX: int = _getenv_int("USER_PROFILE_CACHE_MAX", 20000)
+
+    # Avatar / playlist cover resizing: Pillow thread pool size, max file size and max decoded pixels of an upload
+    IMAGE_WORKERS: int = _getenv_int("IMAGE_WORKERS", 2)
+    IMAGE_MAX_BYTES: int = _getenv_int("IMAGE_MAX_BYTES", 10 * 1024 * 1024)
+    IMAGE_MAX_PIXELS: int = _getenv_int("IMAGE_MAX_PIXELS", 40_000_000)
+
+    # Event loop lag / blocking-call detector (services/monitor/loop_monitor.py), off by default
+    LOOP_MONITOR_ENABLED: bool = _getenv_bool("LOOP_MONITOR_ENABLED", False)
+    LOOP_MONITOR_INTERVAL_MS: int = _getenv_int("LOOP_MONITOR_INTERVAL_MS", 50)
+    LOOP_MONITOR_THRESHOLD_MS: int = _getenv_int("LOOP_MONITOR_THRESHOLD_MS", 100)
+    LOOP_MONITOR_STACK_LIMIT: int = _getenv_int("LOOP_MONITOR_STACK_LIMIT", 30)
+
+    # Request/DB/gRPC latency metrics (services/monitor/metrics_srv.py), Prometheus text at /internal/metrics.
+    # METRICS_TOKEN: scrapers send "Authorization: Bearer <token>"; empty = only loopback clients and admins
+    METRICS_ENABLED: bool = _getenv_bool("METRICS_ENABLED", True)
+    METRICS_TOKEN: str = os.getenv("METRICS_TOKEN", "")
+
+    # asyncpg pool. DB_ACQUIRE_TIMEOUT_SEC: get_conn fails instead of queueing forever when the pool is exhausted;
+    # DB_HOLD_WARN_MS: log checkouts held that long outside queries (0 = no hold tracking);
+    # DB_POOL_WARMUP: run the hot watch/listing/search statements on min_size connections at startup
+    DB_POOL_MIN_SIZE: int = _getenv_int("DB_POOL_MIN_SIZE", 2)
+    DB_POOL_MAX_SIZE: int = _getenv_int("DB_POOL_MAX_SIZE", 10)
+    DB_STATEMENT_CACHE_SIZE: int = _getenv_int("DB_STATEMENT_CACHE_SIZE", 256)
+    DB_POOL_MAX_IDLE_SEC: int = _getenv_int("DB_POOL_MAX_IDLE_SEC", 300)
+    DB_ACQUIRE_TIMEOUT_SEC: int = _getenv_int("DB_ACQUIRE_TIMEOUT_SEC", 10)
+    DB_HOLD_WARN_MS: int = _getenv_int("DB_HOLD_WARN_MS", 1000)
+    DB_POOL_WARMUP: bool = _getenv_bool("DB_POOL_WARMUP", True)
+
+    # Read replicas for read-only listing/search/feed queries (comma separated DSNs, empty = primary only).
+    # A replica lagging more than DB_REPLICA_MAX_LAG_SEC (checked every DB_REPLICA_CHECK_SEC) is skipped;
+    # a client that wrote something reads from the primary for DB_READ_YOUR_WRITES_SEC afterwards
+    DB_REPLICA_URLS: str = os.getenv("DB_REPLICA_URLS", "")
+    DB_REPLICA_POOL_MAX_SIZE: int = _getenv_int("DB_REPLICA_POOL_MAX_SIZE", 10)
+    DB_REPLICA_MAX_LAG_SEC: int = _getenv_int("DB_REPLICA_MAX_LAG_SEC", 5)
+    DB_REPLICA_CHECK_SEC: int = _getenv_int("DB_REPLICA_CHECK_SEC", 2)
+    DB_READ_YOUR_WRITES_SEC: int = _getenv_int("DB_READ_YOUR_WRITES_SEC", 10)
+    DB_READ_YOUR_WRITES_COOKIE: str = os.getenv("DB_READ_YOUR_WRITES_COOKIE", "yt_rw")
+
+    # Rendered listing fragments (home/trending/channel grids, anonymous right bar and pages);
+    # entries are served stale for another TTL while one request re-renders them
+    PAGE_CACHE_ENABLED: bool = _getenv_bool("PAGE_CACHE_ENABLED", True)
+    PAGE_CACHE_TTL_SEC: int = _getenv_int("PAGE_CACHE_TTL_SEC", 30)
+    PAGE_CACHE_MAX_ITEMS: int = _getenv_int("PAGE_CACHE_MAX_ITEMS", 2000)
+
+    # Shared Jinja2 environment: on-disk bytecode cache ("" = system temp dir), template mtime checks
+    # on every render only in DEBUG, compile everything at startup
+    TEMPLATES_BYTECODE_CACHE: bool = _getenv_bool("TEMPLATES_BYTECODE_CACHE", True)
+    TEMPLATES_BYTECODE_CACHE_DIR: str = os.getenv("TEMPLATES_BYTECODE_CACHE_DIR", "")
+    TEMPLATES_AUTO_RELOAD: bool = _getenv_bool("TEMPLATES_AUTO_RELOAD", _getenv_bool("DEBUG", False))
+    TEMPLATES_PRECOMPILE: bool = _getenv_bool("TEMPLATES_PRECOMPILE", True)
+
+    # Video like/dislike counters: shard rows per video; background reconcile against reactions
+    # and copy into videos.likes_count every REACTION_RECONCILE_SEC (0 = off)
+    REACTION_COUNTER_SHARDS: int = _getenv_int("REACTION_COUNTER_SHARDS", 8)
+    REACTION_RECONCILE_SEC: int = _getenv_int("REACTION_RECONCILE_SEC", 60)
+
+    # Resumable uploads: file is sent as fixed-size parts (client sends up to UPLOAD_PARALLEL_PARTS at once)
+    UPLOAD_RESUMABLE_ENABLED: bool = _getenv_bool("UPLOAD_RESUMABLE_ENABLED", True)
+    UPLOAD_PART_BYTES: int = _getenv_int("UPLOAD_PART_BYTES", 16 * 1024 * 1024)
+    UPLOAD_PARALLEL_PARTS: int = _getenv_int("UPLOAD_PARALLEL_PARTS", 4)
+    UPLOAD_MAX_BYTES: int = _getenv_int("UPLOAD_MAX_BYTES", 20 * 1024 * 1024 * 1024)
+    UPLOAD_SESSION_TTL_SEC: int = _getenv_int("UPLOAD_SESSION_TTL_SEC", 86400)
+    UPLOAD_SESSION_ASSEMBLE_STALE_SEC: int = _getenv_int("UPLOAD_SESSION_ASSEMBLE_STALE_SEC", 7200)
+
+    # Shared job progress registry (captions/sprites/translations/ytconvert), see services/job_registry_srv.py
+    JOBS_REDIS_URL: str = os.getenv("JOBS_REDIS_URL", "") or "redis://{}:{}/{}".format(
+        os.getenv("REDIS_HOST", "127.0.0.1"), os.getenv("REDIS_PORT", "6379"), os.getenv("REDIS_JOBS_DB", "3")
+    )
+    JOBS_REDIS_PREFIX: str = os.getenv("JOBS_REDIS_PREFIX", "yt:jobs:")
+    JOBS_TTL_SEC: int = _getenv_int("JOBS_TTL_SEC", 6 * 3600)
+    # status endpoints poll the service themselves when an unfinished entry was not updated for this long
+    JOBS_STALE_SEC: int = _getenv_int("JOBS_STALE_SEC", 30)
+
+    # Job watchers without a streaming RPC poll with exponential backoff between these bounds
+    JOB_WATCH_MIN_INTERVAL_MS: int = _getenv_int("JOB_WATCH_MIN_INTERVAL_MS", 500)
+    JOB_WATCH_MAX_INTERVAL_MS: int = _getenv_int("JOB_WATCH_MAX_INTERVAL_MS", 10000)
+    JOB_WATCH_BACKOFF_FACTOR: float = float(os.getenv("JOB_WATCH_BACKOFF_FACTOR", "1.5") or 1.5)
+
     AUTO_SPRITES_ENABLED = True
     AUTO_SPRITES_MIN_DURATION = 3
 
@@ -116,6 +204,9 @@ class Settings:
     YTCOMMENTS_ADDR: str = os.getenv("YTCOMMENTS_ADDR", "127.0.0.1:9093")
     YTCOMMENTS_TLS_ENABLED: bool = _getenv_bool("YTCOMMENTS_TLS_ENABLED", False)
     YTCOMMENTS_TIMEOUT_MS: int = _getenv_int("YTCOMMENTS_TIMEOUT_MS", 3000)
+    # tree loader: parallel ListReplies per BFS level, short-lived per-video cache of assembled trees
+    YTCOMMENTS_TREE_CONCURRENCY: int = _getenv_int("YTCOMMENTS_TREE_CONCURRENCY", 8)
+    YTCOMMENTS_TREE_CACHE_TTL_SEC: int = _getenv_int("YTCOMMENTS_TREE_CACHE_TTL_SEC", 5)
 
 
 settings = Settings()
\ No newline at end of file
@@ -34,4 +34,20 @@ def load_ytconvert_config() -> YtconvertClientConfig:
         chunk_bytes=chunk_bytes,
         upload_timeout_sec=upload_timeout_sec,
         grpc_plaintext=grpc_plaintext,
-    )
\ No newline at end of file
+    )
+
+def _env_bool(name: str, default: bool) -> bool:
+    v = (os.environ.get(name) or "").strip().lower()
+    if not v:
+        return default
+    return v in ("1", "true", "yes", "on")
+
+
+# After a conversion the ready renditions are remuxed into fMP4 segments + DASH/HLS manifests
+# (services/ytconvert/ytconvert_package_srv.py); the player switches quality by itself (ABR)
+YTCONVERT_PACKAGE_ENABLED: bool = _env_bool("YTCONVERT_PACKAGE_ENABLED", True)
+YTCONVERT_PACKAGE_SEGMENT_SEC: int = int(os.environ.get("YTCONVERT_PACKAGE_SEGMENT_SEC", "4") or 4)
+YTCONVERT_PACKAGE_UPLOAD_CONCURRENCY: int = int(os.environ.get("YTCONVERT_PACKAGE_UPLOAD_CONCURRENCY", "8") or 8)
+# A superseded stream/v<ts>/ dir is kept this long after the switch (players that loaded the old
+# manifest keep fetching its segments) and removed by a later repackage of the same video
+YTCONVERT_PACKAGE_KEEP_OLD_SEC: int = int(os.environ.get("YTCONVERT_PACKAGE_KEEP_OLD_SEC", "21600") or 21600)
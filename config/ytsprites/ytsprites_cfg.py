@@ -105,4 +105,12 @@ YTSPRITES_GRPC_MAX_RECV_MB: int = int(os.getenv("YTSPRITES_GRPC_MAX_RECV_MB", "5
 YTSPRITES_GRPC_COMPRESSION: str = os.getenv("YTSPRITES_GRPC_COMPRESSION", "gzip")
 
 YTSPRITES_HEALTH_TIMEOUT: float = float(os.getenv("YTSPRITES_HEALTH_TIMEOUT", "2.0"))
-YTSPRITES_SERVER_TTL: float = float(os.getenv("YTSPRITES_SERVER_TTL", "10"))
\ No newline at end of file
+YTSPRITES_SERVER_TTL: float = float(os.getenv("YTSPRITES_SERVER_TTL", "10"))
+
+# Backfill orchestrator (services/ytsprites/backfill_srv.py): jobs in flight in total and per server at most,
+# attempts per video, a job that stays queued longer than QUEUE_WAIT_SEC means the server is saturated
+YTSPRITES_BACKFILL_CONCURRENCY: int = int(os.getenv("YTSPRITES_BACKFILL_CONCURRENCY", "8"))
+YTSPRITES_BACKFILL_PER_SERVER: int = int(os.getenv("YTSPRITES_BACKFILL_PER_SERVER", "4"))
+YTSPRITES_BACKFILL_MAX_ATTEMPTS: int = int(os.getenv("YTSPRITES_BACKFILL_MAX_ATTEMPTS", "3"))
+YTSPRITES_BACKFILL_JOB_TIMEOUT: float = float(os.getenv("YTSPRITES_BACKFILL_JOB_TIMEOUT", "1800.0"))
+YTSPRITES_BACKFILL_QUEUE_WAIT_SEC: float = float(os.getenv("YTSPRITES_BACKFILL_QUEUE_WAIT_SEC", "60.0"))
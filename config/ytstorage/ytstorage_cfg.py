@@ -9,7 +9,36 @@ gRPC (required):
 - YTSTORAGE_GRPC_MAX_MSG_MB: max gRPC message size in MB
 
 Public URL (optional):
-- YTSTORAGE_PUBLIC_BASE_URL: if set, build_storage_url may use it (currently app serves via /internal/storage/file/* anyway)
+- YTSTORAGE_PUBLIC_BASE_URL: public base of static edge serving storage directly (used by "signed" delivery mode)
+
+Media delivery (optional):
+- YTSTORAGE_DELIVERY_MODE: proxy | signed | accel (default proxy)
+    proxy  - app streams bytes via /internal/storage/file/* (always available as fallback)
+    signed - build_storage_url emits expiring signed URLs on YTSTORAGE_PUBLIC_BASE_URL, edge serves them
+    accel  - app checks signature and answers with X-Accel-Redirect, nginx serves bytes itself
+- YTSTORAGE_URL_SIGN_KEY: signing secret (defaults to SECRET_KEY)
+- YTSTORAGE_URL_SIGN_SCHEME: hmac (HMAC-SHA256) | nginx (secure_link md5 compatible)
+- YTSTORAGE_URL_TTL_SEC: signed URL lifetime
+- YTSTORAGE_URL_TTL_BUCKET_SEC: expiry rounding, keeps URLs stable (browser cache friendly) within a bucket
+- YTSTORAGE_URL_REQUIRE_SIG: reject unsigned requests on /internal/storage/file/*
+- YTSTORAGE_ACCEL_PREFIX: nginx internal location for X-Accel-Redirect
+
+Proxy streaming (optional):
+- YTSTORAGE_STREAM_CHUNK_BYTES: chunk size sent to HTTP client
+- YTSTORAGE_STREAM_QUEUE_CHUNKS: max chunks buffered per response (backpressure for slow clients)
+- YTSTORAGE_META_CACHE_TTL_SEC / YTSTORAGE_META_CACHE_MAX: per-file size/etag cache (skips repeated Stat)
+- YTSTORAGE_READAHEAD_BYTES: prefetch window for sequential small ranges (0 = off)
+- YTSTORAGE_READAHEAD_MAX_BYTES: total memory budget for prefetched windows
+- YTSTORAGE_OPEN_RANGE_BYTES: with read-ahead on, open-ended video ranges (bytes=N-) are answered with at most
+    this many bytes, so players come back for the next (prefetched) range
+
+Listing pages (optional):
+- YTSTORAGE_EXISTS_CACHE_POS_TTL_SEC / YTSTORAGE_EXISTS_CACHE_NEG_TTL_SEC: TTL of cached exists results for batched checks
+- YTSTORAGE_STATMANY_FALLBACK_CONCURRENCY: parallel Exists calls when server has no StatMany
+
+Writes (optional):
+- YTSTORAGE_WRITE_INFLIGHT_BYTES: max bytes queued per writer before write() waits for the gRPC stream
+- YTSTORAGE_WRITE_HASH: "" | sha256 | xxhash - digest computed while writing (writer.hexdigest after close)
 """
 
 import os
@@ -25,5 +54,46 @@ try:
 except Exception:
     YTSTORAGE_GRPC_MAX_MSG_MB = 64
 
-# ---- optional public URL base (kept for future; not required for current /internal/storage/file/* serving) ----
-YTSTORAGE_PUBLIC_BASE_URL: str = os.getenv("YTSTORAGE_PUBLIC_BASE_URL", "").strip()
\ No newline at end of file
+# ---- optional public URL base (static edge: nginx/ytstorage HTTP) ----
+YTSTORAGE_PUBLIC_BASE_URL: str = os.getenv("YTSTORAGE_PUBLIC_BASE_URL", "").strip()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)).strip())
+    except Exception:
+        return default
+
+
+# ---- media delivery ----
+YTSTORAGE_DELIVERY_MODE: str = (os.getenv("YTSTORAGE_DELIVERY_MODE", "proxy").strip().lower() or "proxy")
+if YTSTORAGE_DELIVERY_MODE not in ("proxy", "signed", "accel"):
+    YTSTORAGE_DELIVERY_MODE = "proxy"
+
+YTSTORAGE_URL_SIGN_KEY: str = os.getenv("YTSTORAGE_URL_SIGN_KEY", "").strip()
+YTSTORAGE_URL_SIGN_SCHEME: str = (os.getenv("YTSTORAGE_URL_SIGN_SCHEME", "hmac").strip().lower() or "hmac")
+YTSTORAGE_URL_TTL_SEC: int = max(60, _env_int("YTSTORAGE_URL_TTL_SEC", 6 * 3600))
+YTSTORAGE_URL_TTL_BUCKET_SEC: int = max(1, _env_int("YTSTORAGE_URL_TTL_BUCKET_SEC", 3600))
+YTSTORAGE_URL_REQUIRE_SIG: bool = (os.getenv("YTSTORAGE_URL_REQUIRE_SIG", "").strip().lower() in ("1", "true", "yes", "on"))
+YTSTORAGE_ACCEL_PREFIX: str = os.getenv("YTSTORAGE_ACCEL_PREFIX", "/_ytstorage/").strip() or "/_ytstorage/"
+
+# ---- proxy streaming ----
+YTSTORAGE_STREAM_CHUNK_BYTES: int = max(16 * 1024, _env_int("YTSTORAGE_STREAM_CHUNK_BYTES", 256 * 1024))
+YTSTORAGE_STREAM_QUEUE_CHUNKS: int = max(1, _env_int("YTSTORAGE_STREAM_QUEUE_CHUNKS", 8))
+YTSTORAGE_META_CACHE_TTL_SEC: int = max(0, _env_int("YTSTORAGE_META_CACHE_TTL_SEC", 30))
+YTSTORAGE_META_CACHE_MAX: int = max(16, _env_int("YTSTORAGE_META_CACHE_MAX", 4096))
+YTSTORAGE_READAHEAD_BYTES: int = max(0, _env_int("YTSTORAGE_READAHEAD_BYTES", 0))
+YTSTORAGE_READAHEAD_MAX_BYTES: int = max(0, _env_int("YTSTORAGE_READAHEAD_MAX_BYTES", 64 * 1024 * 1024))
+YTSTORAGE_OPEN_RANGE_BYTES: int = max(256 * 1024, _env_int("YTSTORAGE_OPEN_RANGE_BYTES", 4 * 1024 * 1024))
+
+# ---- batched exists/stat ----
+YTSTORAGE_EXISTS_CACHE_POS_TTL_SEC: int = max(0, _env_int("YTSTORAGE_EXISTS_CACHE_POS_TTL_SEC", 600))
+YTSTORAGE_EXISTS_CACHE_NEG_TTL_SEC: int = max(0, _env_int("YTSTORAGE_EXISTS_CACHE_NEG_TTL_SEC", 60))
+YTSTORAGE_EXISTS_CACHE_MAX: int = max(16, _env_int("YTSTORAGE_EXISTS_CACHE_MAX", 20000))
+YTSTORAGE_STATMANY_FALLBACK_CONCURRENCY: int = max(1, _env_int("YTSTORAGE_STATMANY_FALLBACK_CONCURRENCY", 16))
+
+# ---- writes ----
+YTSTORAGE_WRITE_INFLIGHT_BYTES: int = max(64 * 1024, _env_int("YTSTORAGE_WRITE_INFLIGHT_BYTES", 8 * 1024 * 1024))
+YTSTORAGE_WRITE_HASH: str = os.getenv("YTSTORAGE_WRITE_HASH", "").strip().lower()
+if YTSTORAGE_WRITE_HASH not in ("", "sha256", "xxhash"):
+    YTSTORAGE_WRITE_HASH = ""
@@ -120,4 +120,7 @@ def load_yttrans_config() -> YTTransConfig:
     else:
         cfg.servers = [YTTransServer(host=cfg.host, port=cfg.port, token=cfg.token)]
 
-    return cfg
\ No newline at end of file
+    return cfg
+
+# translated VTT files written to storage at once when a job's result is stored
+YTTRANS_WRITE_CONCURRENCY: int = _parse_int(os.getenv("YTTRANS_WRITE_CONCURRENCY", "8"), 8)
@@ -1,37 +1,163 @@
+import asyncio
+import contextvars
 import logging
-from typing import Optional
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Optional, TypeVar
+from urllib.parse import urlsplit
 
 import asyncpg
 
 from config.config import settings
+from services.monitor.metrics_srv import metrics
 
 _pool: Optional[asyncpg.Pool] = None
+_pool_lock = asyncio.Lock()
+
+_F = TypeVar("_F", bound=Callable)
 
 logger = logging.getLogger(__name__)
 
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _query_op(query: str) -> str:
+    # statement type only (SELECT/INSERT/UPDATE/DELETE/WITH/...): bounded label set
+    head = (query or "").lstrip().split(None, 1)
+    return head[0].upper()[:16] if head else "UNKNOWN"
+
+
+def _on_query(record) -> None:
+    metrics.observe_db_query(_query_op(record.query), float(record.elapsed or 0.0), ok=record.exception is None)
+
+
+async def _init_conn(conn: asyncpg.Connection) -> None:
+    if metrics.enabled:
+        conn.add_query_logger(_on_query)
+
+
+def _pool_gauges() -> Dict[tuple, float]:
+    if _pool is None:
+        return {}
+    size = _pool.get_size()
+    idle = _pool.get_idle_size()
+    return {
+        (("state", "idle"),): float(idle),
+        (("state", "in_use"),): float(size - idle),
+    }
+
 
 async def init_db_pool() -> asyncpg.Pool:
     global _pool
-    if _pool is None:
-        _pool = await asyncpg.create_pool(dsn=settings.DATABASE_URL, min_size=1, max_size=10)
-        logger.info("PostgreSQL pool initialized")
+    if _pool is not None:
+        return _pool
+    async with _pool_lock:
+        if _pool is None:
+            _pool = await asyncpg.create_pool(
+                dsn=settings.DATABASE_URL,
+                min_size=max(0, settings.DB_POOL_MIN_SIZE),
+                max_size=max(1, settings.DB_POOL_MAX_SIZE),
+                statement_cache_size=max(0, settings.DB_STATEMENT_CACHE_SIZE),
+                max_inactive_connection_lifetime=float(settings.DB_POOL_MAX_IDLE_SEC),
+                init=_init_conn,
+            )
+            metrics.register_gauge("db_pool_connections", "Pooled DB connections by state.", _pool_gauges)
+            logger.info(
+                "PostgreSQL pool initialized min=%s max=%s statement_cache=%s",
+                settings.DB_POOL_MIN_SIZE, settings.DB_POOL_MAX_SIZE, settings.DB_STATEMENT_CACHE_SIZE,
+            )
+            await _init_replicas()
     return _pool
 
 
-async def get_conn() -> asyncpg.Connection:
+class _Hold:
+    """
+    One checkout of a pooled connection: where it was taken, when, and how much of it was spent in queries
+    (fed by a per-checkout asyncpg query logger).
+    """
+
+    __slots__ = ("site", "t0", "db_sec")
+
+    def __init__(self, site: str) -> None:
+        self.site = site
+        self.t0 = time.perf_counter()
+        self.db_sec = 0.0
+
+    def __call__(self, record) -> None:
+        self.db_sec += float(record.elapsed or 0.0)
+
+
+# id(connection proxy) -> current checkout
+_holds: Dict[int, _Hold] = {}
+
+
+def _caller_site(depth: int) -> str:
+    try:
+        f = sys._getframe(depth + 1)
+    except ValueError:
+        return "unknown"
+    return f"{os.path.relpath(f.f_code.co_filename, _ROOT)}:{f.f_code.co_name}"
+
+
+async def _acquire(pool: asyncpg.Pool, site: str, timeout: float, pool_name: str = "primary") -> asyncpg.Connection:
+    t0 = time.perf_counter()
+    try:
+        conn = await pool.acquire(timeout=timeout or None)
+    except Exception as e:
+        metrics.observe_db_acquire(time.perf_counter() - t0, ok=False)
+        if isinstance(e, asyncio.TimeoutError):
+            logger.warning(
+                "db pool exhausted: no %s connection in %ss at %s (size=%s idle=%s)",
+                pool_name, timeout, site, pool.get_size(), pool.get_idle_size(),
+            )
+        raise
+    metrics.observe_db_acquire(time.perf_counter() - t0)
+    if settings.DB_HOLD_WARN_MS > 0:
+        hold = _Hold(site)
+        conn.add_query_logger(hold)
+        _holds[id(conn)] = hold
+    return conn
+
+
+async def get_conn(_site: Optional[str] = None) -> asyncpg.Connection:
     if _pool is None:
         await init_db_pool()
     assert _pool is not None
-    return await _pool.acquire()
+    return await _acquire(_pool, _site or _caller_site(1), float(settings.DB_ACQUIRE_TIMEOUT_SEC))
+
+
+async def _finish_hold(conn: asyncpg.Connection) -> None:
+    hold = _holds.pop(id(conn), None)
+    if hold is None:
+        return
+    held = time.perf_counter() - hold.t0
+    metrics.observe_db_hold(hold.site, held)
+    if held * 1000.0 > settings.DB_HOLD_WARN_MS:
+        # query loggers run via call_soon: let the last one land before comparing
+        await asyncio.sleep(0)
+        idle_ms = (held - hold.db_sec) * 1000.0
+        if idle_ms > settings.DB_HOLD_WARN_MS:
+            metrics.inc_db_hold_warning(hold.site)
+            logger.warning(
+                "db connection held %.0f ms at %s, only %.0f ms in queries: release it around non-DB awaits",
+                held * 1000.0, hold.site, hold.db_sec * 1000.0,
+            )
+    try:
+        conn.remove_query_logger(hold)
+    except Exception:
+        pass
 
 
 async def release_conn(conn: asyncpg.Connection) -> None:
     global _pool
     if conn is None:
         return
+    await _finish_hold(conn)
+    pool = _replica_owner.pop(id(conn), None) or _pool
     try:
-        if _pool is not None:
-            await _pool.release(conn)
+        if pool is not None:
+            await pool.release(conn)
         else:
             await conn.close()
     except Exception as e:
@@ -42,9 +168,222 @@ async def release_conn(conn: asyncpg.Connection) -> None:
         logger.warning("release_conn: safe-closed connection due to error: %s", e)
 
 
+class _ConnCtx:
+    __slots__ = ("_site", "_read", "_conn")
+
+    def __init__(self, site: str, read: bool = False) -> None:
+        self._site = site
+        self._read = read
+        self._conn: Optional[asyncpg.Connection] = None
+
+    async def __aenter__(self) -> asyncpg.Connection:
+        if self._read:
+            self._conn = await get_read_conn(_site=self._site)
+        else:
+            self._conn = await get_conn(_site=self._site)
+        return self._conn
+
+    async def __aexit__(self, *exc) -> None:
+        conn, self._conn = self._conn, None
+        await release_conn(conn)
+
+
+def db_conn() -> _ConnCtx:
+    """
+    async with db_conn() as conn: ...
+    Same as a get_conn/release_conn pair (acquire wait and hold time are recorded, long holds outside
+    queries are logged); keep the block to DB work only.
+    """
+    return _ConnCtx(_caller_site(1))
+
+
+def db_read_conn() -> _ConnCtx:
+    """
+    async with db_read_conn() as conn: ...  (get_read_conn: replica when one is in rotation)
+    Only for blocks that call @read_only db functions.
+    """
+    return _ConnCtx(_caller_site(1), read=True)
+
+
+# ---------------------------------------------------------------------------
+# Read replicas
+# ---------------------------------------------------------------------------
+
+_REPLICA_ACQUIRE_TIMEOUT_SEC = 1.0
+
+_LAG_SQL = """
+    SELECT CASE
+      WHEN NOT pg_is_in_recovery() THEN 0
+      WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+      ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END::float8
+"""
+
+
+def read_only(fn: _F) -> _F:
+    """
+    Tags a db function as a pure read that tolerates replica lag (DB_REPLICA_MAX_LAG_SEC):
+    callers may run it on a connection from get_read_conn()/db_read_conn().
+    """
+    fn.__db_read_only__ = True  # type: ignore[attr-defined]
+    return fn
+
+
+class _Replica:
+    __slots__ = ("name", "dsn", "pool", "lag_sec", "healthy")
+
+    def __init__(self, dsn: str) -> None:
+        u = urlsplit(dsn)
+        self.name = f"{u.hostname or 'localhost'}:{u.port or 5432}"
+        self.dsn = dsn
+        self.pool: Optional[asyncpg.Pool] = None
+        self.lag_sec: Optional[float] = None
+        self.healthy = False
+
+
+_replicas: List[_Replica] = []
+_replica_rr = 0
+_replica_task: Optional[asyncio.Task] = None
+# id(connection proxy) -> replica pool it has to go back to
+_replica_owner: Dict[int, asyncpg.Pool] = {}
+
+
+class ReadRouting:
+    """
+    Per-request read routing state, set by middlewares.db_route_mw:
+    pinned: reads go to the primary (the client wrote recently, or this request writes);
+    wrote: this request changed data, the client gets the read-your-writes cookie.
+    """
+
+    __slots__ = ("pinned", "wrote")
+
+    def __init__(self, pinned: bool = False) -> None:
+        self.pinned = pinned
+        self.wrote = False
+
+
+read_routing: contextvars.ContextVar[Optional[ReadRouting]] = contextvars.ContextVar("read_routing", default=None)
+
+
+def note_write() -> None:
+    """
+    Marks the current request as a write (for GET handlers that write, e.g. watch history):
+    later reads of this request and of the client's next DB_READ_YOUR_WRITES_SEC go to the primary.
+    """
+    st = read_routing.get()
+    if st is not None:
+        st.wrote = True
+        st.pinned = True
+
+
+async def _open_replica(rep: _Replica) -> None:
+    rep.pool = await asyncpg.create_pool(
+        dsn=rep.dsn,
+        min_size=max(0, min(settings.DB_POOL_MIN_SIZE, settings.DB_REPLICA_POOL_MAX_SIZE)),
+        max_size=max(1, settings.DB_REPLICA_POOL_MAX_SIZE),
+        statement_cache_size=max(0, settings.DB_STATEMENT_CACHE_SIZE),
+        max_inactive_connection_lifetime=float(settings.DB_POOL_MAX_IDLE_SEC),
+        timeout=float(max(1, settings.DB_ACQUIRE_TIMEOUT_SEC)),
+        init=_init_conn,
+    )
+    logger.info("PostgreSQL replica pool initialized %s", rep.name)
+
+
+async def _check_replica(rep: _Replica) -> None:
+    try:
+        if rep.pool is None:
+            await _open_replica(rep)
+        assert rep.pool is not None
+        lag = await rep.pool.fetchval(_LAG_SQL, timeout=max(1.0, float(settings.DB_REPLICA_CHECK_SEC)))
+        rep.lag_sec = float(lag or 0.0)
+    except Exception as e:
+        if rep.healthy or rep.lag_sec is None:
+            logger.warning("db replica %s unavailable: %r", rep.name, e)
+        rep.lag_sec = None
+        rep.healthy = False
+        return
+    was = rep.healthy
+    rep.healthy = rep.lag_sec <= settings.DB_REPLICA_MAX_LAG_SEC
+    if was and not rep.healthy:
+        logger.warning("db replica %s lags %.1fs, reading from primary", rep.name, rep.lag_sec)
+    elif rep.healthy and not was:
+        logger.info("db replica %s in rotation (lag %.1fs)", rep.name, rep.lag_sec)
+
+
+async def _watch_replicas() -> None:
+    # replicas only serve reads once their lag is known; until the first check the primary does
+    while True:
+        await asyncio.gather(*(_check_replica(r) for r in _replicas))
+        await asyncio.sleep(max(1, settings.DB_REPLICA_CHECK_SEC))
+
+
+def _replica_gauges() -> Dict[tuple, float]:
+    # -1 = unreachable
+    return {(("replica", r.name),): (-1.0 if r.lag_sec is None else r.lag_sec) for r in _replicas}
+
+
+async def _init_replicas() -> None:
+    global _replica_task
+    dsns = [d.strip() for d in (settings.DB_REPLICA_URLS or "").split(",") if d.strip()]
+    if not dsns:
+        return
+    _replicas[:] = [_Replica(d) for d in dsns]
+    _replica_task = asyncio.create_task(_watch_replicas())
+    metrics.register_gauge("db_replica_lag_seconds", "Replication lag per read replica (-1 = unreachable).", _replica_gauges)
+
+
+def _pick_replica() -> Optional[_Replica]:
+    global _replica_rr
+    n = len(_replicas)
+    for i in range(n):
+        rep = _replicas[(_replica_rr + i) % n]
+        if rep.healthy and rep.pool is not None:
+            _replica_rr = (_replica_rr + i + 1) % n
+            return rep
+    return None
+
+
+async def get_read_conn(_site: Optional[str] = None) -> asyncpg.Connection:
+    """
+    Connection for @read_only db functions: a replica in rotation, otherwise the primary
+    (no replicas configured, all lagging/unreachable, replica pool busy, or the request is pinned to the primary).
+    Released with release_conn() like any other connection.
+    """
+    if _pool is None:
+        await init_db_pool()
+    site = _site or _caller_site(1)
+    if not _replicas:
+        return await get_conn(_site=site)
+    st = read_routing.get()
+    reason = "pinned"
+    if st is None or not st.pinned:
+        rep = _pick_replica()
+        reason = "no_replica"
+        if rep is not None:
+            assert rep.pool is not None
+            try:
+                conn = await _acquire(rep.pool, site, _REPLICA_ACQUIRE_TIMEOUT_SEC, pool_name=f"replica {rep.name}")
+            except Exception as e:
+                reason = "replica_busy" if isinstance(e, asyncio.TimeoutError) else "replica_error"
+            else:
+                _replica_owner[id(conn)] = rep.pool
+                metrics.inc_db_read("replica", "in_rotation")
+                return conn
+    metrics.inc_db_read("primary", reason)
+    return await get_conn(_site=site)
+
+
 async def shutdown_db_pool() -> None:
-    global _pool
+    global _pool, _replica_task
+    if _replica_task is not None:
+        _replica_task.cancel()
+        _replica_task = None
+    for rep in _replicas:
+        if rep.pool is not None:
+            await rep.pool.close()
+            rep.pool = None
+    _replicas.clear()
     if _pool is not None:
         await _pool.close()
         _pool = None
-        logger.info("PostgreSQL pool closed")
\ No newline at end of file
+        logger.info("PostgreSQL pool closed")
@@ -3,6 +3,8 @@ import asyncpg
 import json
 from datetime import datetime
 
+from db import read_only
+
 # Insert notification; dedupe_key optional (for batch likes)
 async def insert_notification(
     conn: asyncpg.Connection,
@@ -21,6 +23,7 @@ async def insert_notification(
     row = await conn.fetchrow(sql, user_uid, notif_type, json.dumps(payload), agg_key, dedupe_key)
     return row["notif_id"] if row else None
 
+@read_only
 async def list_notifications(
     conn: asyncpg.Connection,
     user_uid: str,
@@ -65,6 +68,7 @@ async def mark_all_read(conn: asyncpg.Connection, user_uid: str) -> int:
     )
     return int(res.split()[-1])
 
+@read_only
 async def unread_count(conn: asyncpg.Connection, user_uid: str) -> int:
     row = await conn.fetchrow(
         "SELECT COUNT(*) AS cnt FROM notifications WHERE user_uid = $1 AND read_at IS NULL",
@@ -2,6 +2,7 @@ from typing import Optional, List, Dict, Any
 import asyncpg
 
 from utils.idgen_ut import gen_id
+from db import read_only
 
 WATCH_LATER_TYPE = "system_watch_later"
 FAVORITES_TYPE = "system_favorites"
@@ -277,6 +278,7 @@ async def reorder_playlist_items(
         pos += 1
 
 
+@read_only
 async def list_playlist_items_with_assets(
     conn: asyncpg.Connection,
     playlist_id: str,
@@ -350,6 +352,7 @@ async def update_playlist_visibility(
     )
 
 
+@read_only
 async def get_playlist_brief(
     conn: asyncpg.Connection,
     playlist_id: str,
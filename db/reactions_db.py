@@ -1,7 +1,10 @@
 from typing import Optional, Tuple, Dict, Any
+import random
 import asyncpg
 import uuid
 
+from config.config import settings
+
 ReactionInt = int  # -1 (dislike), 0 (none), 1 (like)
 
 def _to_type(v: ReactionInt) -> Optional[str]:
@@ -18,32 +21,50 @@ def _to_int(t: Optional[str]) -> ReactionInt:
         return -1
     return 0
 
+def _shard() -> int:
+    return random.randrange(max(1, settings.REACTION_COUNTER_SHARDS))
+
+# Likes/dislikes live in video_reaction_counters: a few shard rows per video, so concurrent
+# clicks on one video do not queue on a single row lock. Totals are the sum of the shards,
+# videos.likes_count is folded in by reconcile_reaction_counters().
+_APPLY_DELTA = """
+, d AS (
+  SELECT (CASE WHEN new_type = 'like' THEN 1 ELSE 0 END) - (CASE WHEN old_type = 'like' THEN 1 ELSE 0 END) AS dl,
+         (CASE WHEN new_type = 'dislike' THEN 1 ELSE 0 END) - (CASE WHEN old_type = 'dislike' THEN 1 ELSE 0 END) AS dd
+  FROM tr
+), bump AS (
+  INSERT INTO video_reaction_counters AS c (video_id, shard, likes, dislikes)
+  SELECT $2::text, $3::smallint, dl, dd FROM d WHERE dl <> 0 OR dd <> 0
+  ON CONFLICT (video_id, shard) DO UPDATE
+  SET likes = c.likes + EXCLUDED.likes, dislikes = c.dislikes + EXCLUDED.dislikes, updated_at = NOW()
+)
+SELECT (SELECT new_type FROM tr) AS my_type,
+       COALESCE((SELECT SUM(likes) FROM video_reaction_counters WHERE video_id = $2), 0)
+         + COALESCE((SELECT dl FROM d), 0) AS likes,
+       COALESCE((SELECT SUM(dislikes) FROM video_reaction_counters WHERE video_id = $2), 0)
+         + COALESCE((SELECT dd FROM d), 0) AS dislikes
+"""
+
 async def get_video_reaction_state(
     conn: asyncpg.Connection,
     user_uid: Optional[str],
     video_id: str,
 ) -> Dict[str, Any]:
-    likes_row = await conn.fetchrow("SELECT likes_count FROM videos WHERE video_id = $1", video_id)
-    likes_count = int(likes_row["likes_count"]) if likes_row else 0
-    drow = await conn.fetchrow(
-        "SELECT COUNT(*) AS c FROM reactions WHERE video_id = $1 AND reaction_type = 'dislike'",
+    row = await conn.fetchrow(
+        """
+        SELECT COALESCE(SUM(c.likes), 0) AS likes,
+               COALESCE(SUM(c.dislikes), 0) AS dislikes,
+               (SELECT reaction_type FROM reactions WHERE user_uid = $2 AND video_id = $1) AS my_type
+        FROM video_reaction_counters c
+        WHERE c.video_id = $1
+        """,
         video_id,
+        user_uid,
     )
-    dislikes_count = int(drow["c"] if drow and drow["c"] is not None else 0)
-
-    my_reaction: ReactionInt = 0
-    if user_uid:
-        r = await conn.fetchrow(
-            "SELECT reaction_type FROM reactions WHERE user_uid = $1 AND video_id = $2",
-            user_uid,
-            video_id,
-        )
-        my_reaction = _to_int(r["reaction_type"]) if r and r["reaction_type"] else 0
-
     return {
-        "likes": likes_count,
-        "dislikes": dislikes_count,
-        "my_reaction": my_reaction,
+        "likes": max(0, int(row["likes"])) if row else 0,
+        "dislikes": max(0, int(row["dislikes"])) if row else 0,
+        "my_reaction": _to_int(row["my_type"]) if row else 0,
     }
 
 async def set_video_reaction(
@@ -52,72 +73,83 @@ async def set_video_reaction(
     video_id: str,
     reaction: ReactionInt,  # -1, 0, 1
 ) -> Tuple[int, int, ReactionInt]:
+    """
+    One statement: the reaction state transition (old -> new type) and the counter delta it implies.
+    """
     if reaction not in (-1, 0, 1):
         raise ValueError("invalid reaction")
 
-    prev = await conn.fetchrow(
-        "SELECT reaction_type FROM reactions WHERE user_uid = $1 AND video_id = $2",
-        user_uid,
-        video_id,
-    )
-    prev_type: Optional[str] = prev["reaction_type"] if prev and prev["reaction_type"] else None
     new_type: Optional[str] = _to_type(reaction)
-
-    delta_like = 0
-    if prev_type == "like" and new_type != "like":
-        delta_like = -1
-    elif prev_type != "like" and new_type == "like":
-        delta_like = 1
-
-    tr = conn.transaction()
-    await tr.start()
-    try:
-        if new_type is None:
-            # remove reaction if existed
-            await conn.execute(
-                "DELETE FROM reactions WHERE user_uid = $1 AND video_id = $2",
-                user_uid,
-                video_id,
-            )
-        elif prev_type is None:
-            # insert new
-            await conn.execute(
-                """
-                INSERT INTO reactions (reaction_uid, user_uid, video_id, reaction_type)
-                VALUES ($1, $2, $3, $4)
-                ON CONFLICT (user_uid, video_id) DO UPDATE SET reaction_type = EXCLUDED.reaction_type
-                """,
-                str(uuid.uuid4()),
-                user_uid,
-                video_id,
-                new_type,
-            )
-        elif prev_type != new_type:
-            # update type
-            await conn.execute(
-                "UPDATE reactions SET reaction_type = $3 WHERE user_uid = $1 AND video_id = $2",
-                user_uid,
-                video_id,
-                new_type,
+    if new_type is None:
+        row = await conn.fetchrow(
+            """
+            WITH tr AS (
+              DELETE FROM reactions WHERE user_uid = $1 AND video_id = $2
+              RETURNING reaction_type AS old_type, NULL::text AS new_type
             )
-
-        if delta_like != 0:
-            await conn.execute(
-                "UPDATE videos SET likes_count = GREATEST(0, likes_count + $2) WHERE video_id = $1",
-                video_id,
-                delta_like,
+            """ + _APPLY_DELTA,
+            user_uid,
+            video_id,
+            _shard(),
+        )
+    else:
+        # ON CONFLICT ... WHERE skips a no-op click (same type again): no row in tr, no delta
+        row = await conn.fetchrow(
+            """
+            WITH prev AS (
+              SELECT reaction_type FROM reactions WHERE user_uid = $1 AND video_id = $2 FOR UPDATE
+            ), up AS (
+              INSERT INTO reactions AS r (reaction_uid, user_uid, video_id, reaction_type)
+              VALUES ($4, $1, $2, $5)
+              ON CONFLICT (user_uid, video_id) DO UPDATE SET reaction_type = EXCLUDED.reaction_type
+              WHERE r.reaction_type <> EXCLUDED.reaction_type
+              RETURNING reaction_type
+            ), tr AS (
+              SELECT (SELECT reaction_type FROM prev) AS old_type, up.reaction_type AS new_type FROM up
             )
-
-        likes_row = await conn.fetchrow("SELECT likes_count FROM videos WHERE video_id = $1", video_id)
-        likes_count = int(likes_row["likes_count"]) if likes_row else 0
-        drow = await conn.fetchrow(
-            "SELECT COUNT(*) AS c FROM reactions WHERE video_id = $1 AND reaction_type = 'dislike'",
+            """ + _APPLY_DELTA,
+            user_uid,
             video_id,
+            _shard(),
+            str(uuid.uuid4()),
+            new_type,
         )
-        dislikes_count = int(drow["c"] if drow and drow["c"] is not None else 0)
-        await tr.commit()
-    except Exception:
-        await tr.rollback()
-        raise
 
-    return likes_count, dislikes_count, _to_int(new_type)
\ No newline at end of file
+    return max(0, int(row["likes"])), max(0, int(row["dislikes"])), _to_int(new_type)
+
+async def reconcile_reaction_counters(conn: asyncpg.Connection, touched_within_sec: int) -> int:
+    """
+    For videos whose counters changed recently: move the drift between shards and reactions
+    into shard 0 and copy likes into videos.likes_count (used by listings, search, trending).
+    Truth and shard sums are read in one snapshot, so concurrent clicks are not lost. Returns rows fixed.
+    """
+    return await conn.fetchval(
+        """
+        WITH touched AS (
+          SELECT DISTINCT video_id FROM video_reaction_counters
+          WHERE updated_at > NOW() - make_interval(secs => $1)
+        ), truth AS (
+          SELECT t.video_id,
+                 (SELECT COUNT(*) FROM reactions r WHERE r.video_id = t.video_id AND r.reaction_type = 'like') AS likes,
+                 (SELECT COUNT(*) FROM reactions r WHERE r.video_id = t.video_id AND r.reaction_type = 'dislike') AS dislikes,
+                 (SELECT SUM(c.likes) FROM video_reaction_counters c WHERE c.video_id = t.video_id) AS c_likes,
+                 (SELECT SUM(c.dislikes) FROM video_reaction_counters c WHERE c.video_id = t.video_id) AS c_dislikes
+          FROM touched t
+        ), fix AS (
+          INSERT INTO video_reaction_counters AS c (video_id, shard, likes, dislikes)
+          SELECT video_id, 0, likes - c_likes, dislikes - c_dislikes
+          FROM truth
+          WHERE likes <> c_likes OR dislikes <> c_dislikes
+          ON CONFLICT (video_id, shard) DO UPDATE
+          SET likes = c.likes + EXCLUDED.likes, dislikes = c.dislikes + EXCLUDED.dislikes
+          RETURNING video_id
+        ), fold AS (
+          UPDATE videos v SET likes_count = t.likes
+          FROM truth t
+          WHERE v.video_id = t.video_id AND v.likes_count <> t.likes
+          RETURNING v.video_id
+        )
+        SELECT (SELECT COUNT(*) FROM fix) + (SELECT COUNT(*) FROM fold)
+        """,
+        float(touched_within_sec),
+    )
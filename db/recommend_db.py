@@ -1,6 +1,9 @@
 from typing import Any, Dict, List, Optional, Sequence
 
+from db import read_only
 
+
+@read_only
 async def fetch_video_brief(conn, video_id: str) -> Optional[Dict[str, Any]]:
     """
     Fetch minimal info about a video used as the context seed for recommendations.
@@ -22,6 +25,7 @@ async def fetch_video_brief(conn, video_id: str) -> Optional[Dict[str, Any]]:
     return dict(row) if row else None
 
 
+@read_only
 async def list_category_public_recent(conn, category_id: str, exclude_video_id: str, limit: int) -> List[Dict[str, Any]]:
     """
     Public videos within the same category, ordered by recency.
@@ -45,6 +49,7 @@ async def list_category_public_recent(conn, category_id: str, exclude_video_id:
     return [dict(r) for r in rows]
 
 
+@read_only
 async def list_recent_from_authors(conn, author_uids: Sequence[str], exclude_video_id: str, limit: int) -> List[Dict[str, Any]]:
     """
     Public recent videos from a set of authors (subscriptions).
@@ -1,6 +1,9 @@
 from typing import Any, Dict, List
 
+from db import read_only
 
+
+@read_only
 async def fetch_video_assets_by_ids(conn, video_ids: List[str]) -> List[Dict[str, Any]]:
     """
     Bulk fetch assets and meta for given video ids.
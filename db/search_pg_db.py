@@ -1,5 +1,7 @@
 from typing import Any, Dict, List
 
+from db import read_only
+
 async def _set_trgm_limit(conn, threshold: float) -> None:
     """
     Try to set per-session pg_trgm threshold (best-effort).
@@ -9,6 +11,7 @@ async def _set_trgm_limit(conn, threshold: float) -> None:
     except Exception:
         pass
 
+@read_only
 async def pg_search_videos(conn, q: str, limit: int, offset: int, ts_config: str, trgm_threshold: float) -> List[Dict[str, Any]]:
     """
     Execute search. Returns list of dict rows:
@@ -99,6 +102,7 @@ async def pg_search_videos(conn, q: str, limit: int, offset: int, ts_config: str
     rows = await conn.fetch(sql, q, limit, offset, trgm_threshold)
     return [dict(r) for r in rows]
 
+@read_only
 async def pg_suggest_titles(conn, prefix: str, limit: int) -> List[Dict[str, Any]]:
     """
     Suggest titles by prefix using fuzzy-normalized title field.
@@ -3,8 +3,10 @@ from typing import List
 import asyncpg
 
 from utils.idgen_ut import gen_id
+from db import read_only
 
 
+@read_only
 async def is_subscribed(conn: asyncpg.Connection, subscriber_uid: str, channel_uid: str) -> bool:
     row = await conn.fetchrow(
         """
@@ -45,6 +47,7 @@ async def unsubscribe(conn: asyncpg.Connection, subscriber_uid: str, channel_uid
     )
 
 
+@read_only
 async def count_subscribers(conn: asyncpg.Connection, channel_uid: str) -> int:
     row = await conn.fetchrow(
         """
@@ -57,6 +60,7 @@ async def count_subscribers(conn: asyncpg.Connection, channel_uid: str) -> int:
     return int(row["cnt"]) if row else 0
 
 
+@read_only
 async def list_subscribers(conn: asyncpg.Connection, channel_uid: str) -> List[asyncpg.Record]:
     return await conn.fetch(
         """
@@ -70,6 +74,7 @@ async def list_subscribers(conn: asyncpg.Connection, channel_uid: str) -> List[a
     )
 
 
+@read_only
 async def list_subscriptions(conn: asyncpg.Connection, subscriber_uid: str) -> List[asyncpg.Record]:
     """
     Channels that the user is subscribed to.
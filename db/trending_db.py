@@ -1,6 +1,9 @@
 from typing import Any
 
+from db import read_only
 
+
+@read_only
 async def count_public_videos_in_window(conn, days: int) -> int:
     """
     Count public videos created within the last `days`.
@@ -17,6 +20,7 @@ async def count_public_videos_in_window(conn, days: int) -> int:
     return int(row["cnt"]) if row and "cnt" in row else 0
 
 
+@read_only
 async def fetch_trending_rows(conn, limit: int, offset: int, days: int):
     """
     Fetch trending rows within a strict `days` window with age-decayed score.
@@ -89,6 +93,7 @@ async def fetch_trending_rows(conn, limit: int, offset: int, days: int):
     return rows
 
 
+@read_only
 async def fetch_recent_public_rows(conn, limit: int):
     """
     Fetch most recent public videos.
@@ -0,0 +1,150 @@
+import json
+from typing import Any, Dict, List, Optional
+
+import asyncpg
+
+
+async def create_upload_session(
+    conn: asyncpg.Connection,
+    upload_id: str,
+    video_id: str,
+    author_uid: str,
+    storage_path: str,
+    filename: str,
+    total_bytes: int,
+    part_size: int,
+    total_parts: int,
+    params: Dict[str, Any],
+    ttl_sec: int,
+) -> None:
+    await conn.execute(
+        """
+        INSERT INTO upload_sessions (
+          upload_id, video_id, author_uid, storage_path, filename,
+          total_bytes, part_size, total_parts, state, params, expires_at
+        )
+        VALUES ($1,$2,$3,$4,$5,$6,$7,$8,'open',$9::jsonb, NOW() + make_interval(secs => $10))
+        """,
+        upload_id,
+        video_id,
+        author_uid,
+        storage_path,
+        filename or "",
+        int(total_bytes),
+        int(part_size),
+        int(total_parts),
+        json.dumps(params or {}, ensure_ascii=False),
+        float(ttl_sec),
+    )
+
+
+async def get_upload_session(conn: asyncpg.Connection, upload_id: str, author_uid: str) -> Optional[Dict[str, Any]]:
+    row = await conn.fetchrow(
+        """
+        SELECT upload_id, video_id, author_uid, storage_path, filename,
+               total_bytes, part_size, total_parts, state, params,
+               created_at, updated_at, expires_at, (expires_at < NOW()) AS expired
+        FROM upload_sessions
+        WHERE upload_id = $1 AND author_uid = $2
+        """,
+        upload_id,
+        author_uid,
+    )
+    if not row:
+        return None
+    d = dict(row)
+    params = d.get("params")
+    if isinstance(params, str):
+        try:
+            d["params"] = json.loads(params) if params.strip() else {}
+        except Exception:
+            d["params"] = {}
+    return d
+
+
+async def list_upload_parts(conn: asyncpg.Connection, upload_id: str) -> List[Dict[str, Any]]:
+    rows = await conn.fetch(
+        """
+        SELECT part_no, size_bytes, sha256
+        FROM upload_session_parts
+        WHERE upload_id = $1
+        ORDER BY part_no ASC
+        """,
+        upload_id,
+    )
+    return [dict(r) for r in rows]
+
+
+async def upsert_upload_part(conn: asyncpg.Connection, upload_id: str, part_no: int, size_bytes: int, sha256: str) -> bool:
+    """
+    Records a part only while the session is open (False otherwise). Locks the session row: run it in
+    the transaction that publishes the part file, so complete's open -> assembling switch waits for it.
+    """
+    row = await conn.fetchrow(
+        """
+        WITH s AS (
+          SELECT upload_id FROM upload_sessions
+          WHERE upload_id = $1 AND state = 'open' AND expires_at >= NOW()
+          FOR UPDATE
+        )
+        INSERT INTO upload_session_parts (upload_id, part_no, size_bytes, sha256)
+        SELECT s.upload_id, $2, $3, $4 FROM s
+        ON CONFLICT (upload_id, part_no)
+        DO UPDATE SET size_bytes = EXCLUDED.size_bytes, sha256 = EXCLUDED.sha256, created_at = NOW()
+        RETURNING part_no
+        """,
+        upload_id,
+        int(part_no),
+        int(size_bytes),
+        sha256,
+    )
+    if row is None:
+        return False
+    await conn.execute("UPDATE upload_sessions SET updated_at = NOW() WHERE upload_id = $1", upload_id)
+    return True
+
+
+async def set_upload_session_state(conn: asyncpg.Connection, upload_id: str, state: str, expected_state: Optional[str] = None) -> bool:
+    """
+    State transition; with expected_state acts as compare-and-set (guards concurrent complete calls).
+    """
+    if expected_state is None:
+        res = await conn.execute(
+            "UPDATE upload_sessions SET state = $2, updated_at = NOW() WHERE upload_id = $1",
+            upload_id,
+            state,
+        )
+    else:
+        res = await conn.execute(
+            "UPDATE upload_sessions SET state = $2, updated_at = NOW() WHERE upload_id = $1 AND state = $3",
+            upload_id,
+            state,
+            expected_state,
+        )
+    return res.endswith("1")
+
+
+async def list_expired_upload_sessions(conn: asyncpg.Connection, stale_assembling_sec: int, limit: int = 100) -> List[Dict[str, Any]]:
+    """
+    Expired open/failed/aborted sessions plus 'assembling' ones not touched for stale_assembling_sec
+    (the worker died mid-assembly). has_video: the pipeline already created the video row, so only
+    the part files may be removed, not the video directory.
+    """
+    rows = await conn.fetch(
+        """
+        SELECT s.upload_id, s.storage_path,
+               EXISTS (SELECT 1 FROM videos v WHERE v.video_id = s.video_id) AS has_video
+        FROM upload_sessions s
+        WHERE (s.state IN ('open', 'failed', 'aborted') AND s.expires_at < NOW())
+           OR (s.state = 'assembling' AND s.updated_at < NOW() - make_interval(secs => $1))
+        ORDER BY s.updated_at ASC
+        LIMIT $2
+        """,
+        float(stale_assembling_sec),
+        int(limit),
+    )
+    return [dict(r) for r in rows]
+
+
+async def delete_upload_session(conn: asyncpg.Connection, upload_id: str) -> None:
+    await conn.execute("DELETE FROM upload_sessions WHERE upload_id = $1", upload_id)
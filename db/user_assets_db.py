@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, List, Optional
 
 import asyncpg
 
@@ -35,4 +35,24 @@ async def delete_user_avatar(conn: asyncpg.Connection, user_uid: str) -> None:
         WHERE user_uid = $1 AND asset_type = 'avatar'
         """,
         user_uid,
-    )
\ No newline at end of file
+    )
+
+async def get_user_avatar_paths(conn: asyncpg.Connection, user_uids: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Bulk variant of get_user_avatar_path: every requested uid is in the result (None = no avatar).
+    """
+    uids = list({u for u in user_uids if u})
+    if not uids:
+        return {}
+    rows = await conn.fetch(
+        """
+        SELECT user_uid, path
+        FROM user_assets
+        WHERE user_uid = ANY($1::text[]) AND asset_type = 'avatar'
+        """,
+        uids,
+    )
+    out: Dict[str, Optional[str]] = {u: None for u in uids}
+    for r in rows:
+        out[r["user_uid"]] = r["path"]
+    return out
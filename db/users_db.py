@@ -3,6 +3,7 @@ from typing import Optional, Any, Dict, List
 import asyncpg
 
 from utils.security_ut import verify_password
+from db import read_only
 
 
 async def get_user_by_username(conn: asyncpg.Connection, username: str) -> Optional[asyncpg.Record]:
@@ -56,6 +57,7 @@ async def authenticate_user(conn: asyncpg.Connection, username: str, password: s
     return user
 
 
+@read_only
 async def get_user_by_name_or_channel(conn: asyncpg.Connection, name_or_channel: str) -> Optional[Dict[str, Any]]:
     """
     Fetch user by @username or channel_id with avatar asset path.
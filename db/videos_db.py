@@ -1,6 +1,8 @@
 from typing import Any, List, Optional
 import asyncpg
 
+from db import read_only
+
 
 async def create_video(
     conn: asyncpg.Connection,
@@ -64,6 +66,7 @@ async def set_video_ready(
         )
 
 
+@read_only
 async def list_latest_public_videos_count(conn) -> int:
     """
     Amount of public videos - for pagination on root page
@@ -79,6 +82,7 @@ async def list_latest_public_videos_count(conn) -> int:
     return int(row["cnt"] if row and row["cnt"] is not None else 0)
 
 
+@read_only
 async def list_latest_public_videos(conn, limit: int = 24, offset: int = 0):
     """
     returns list of public videos sorted by date desc., with pagination.
@@ -127,6 +131,7 @@ async def list_latest_public_videos(conn, limit: int = 24, offset: int = 0):
     return rows
 
 
+@read_only
 async def list_trending_public_videos(
     conn: asyncpg.Connection,
     period: str,
@@ -207,6 +212,7 @@ async def list_subscription_feed(
     )
 
 
+@read_only
 async def list_history_distinct_latest(
     conn: asyncpg.Connection,
     user_uid: str,
@@ -241,6 +247,7 @@ async def list_history_distinct_latest(
     )
 
 
+@read_only
 async def list_author_public_videos(
     conn: asyncpg.Connection,
     author_uid: str,
@@ -399,6 +406,7 @@ async def delete_video_by_owner(conn: Any, video_id: str, author_uid: str) -> st
     )
 
 
+@read_only
 async def count_history_distinct_latest(conn: asyncpg.Connection, user_uid: str) -> int:
     """
     Counts the total number of distinct videos in user's history.
@@ -417,6 +425,7 @@ async def count_history_distinct_latest(conn: asyncpg.Connection, user_uid: str)
     return result
 
 
+@read_only
 async def list_history_distinct_latest(
     conn: asyncpg.Connection,
     user_uid: str,
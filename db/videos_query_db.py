@@ -86,90 +86,102 @@ async def set_video_embed_params(conn, video_id: str, allow_embed: bool, params_
     )
 
 
-async def fetch_watch_video_full(conn, video_id: str) -> Optional[Dict[str, Any]]:
+async def load_watch_context(conn, video_id: str, view_uid: str, user_uid: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Everything watch/embed pages need in one round trip: video + author row, assets,
+    renditions, audio assets for download and caption tracks (JSON aggregates).
+    The view is recorded in the same statement; views_count is the incremented value.
+    """
     row = await conn.fetchrow(
         """
+        WITH vw AS (
+          INSERT INTO views (view_uid, user_uid, video_id, duration_sec)
+          SELECT $2::text, $3::text, video_id, 0 FROM videos WHERE video_id = $1
+        ), cnt AS (
+          UPDATE videos SET views_count = views_count + 1
+          WHERE video_id = $1
+          RETURNING views_count
+        )
         SELECT
           v.video_id,
           v.title,
           v.description,
           v.storage_path,
           v.created_at,
-          v.views_count,
-          v.likes_count,
+          COALESCE(cnt.views_count, v.views_count) AS views_count,
+          COALESCE(rc.likes, v.likes_count) AS likes_count,
           v.permit_download,
           v.allow_embed,
           v.allow_comments,
           v.embed_params,
-          v.captions_vtt, 
+          v.captions_vtt,
           v.captions_lang,
           u.username,
           u.channel_id,
           vcat.name AS category,
-          vthumb.path AS thumb_asset_path,
-          vanim.path  AS thumb_anim_asset_path,
-          uava.path   AS avatar_asset_path
+          va.thumb_asset_path,
+          va.thumb_anim_asset_path,
+          va.thumbs_vtt_path,
+          va.stream_hls_path,
+          va.stream_dash_path,
+          COALESCE(va.audio_assets, '[]'::json) AS audio_assets,
+          uava.path AS avatar_asset_path,
+          COALESCE(vr.renditions, '[]'::json) AS renditions,
+          COALESCE(ctracks.langs, '{}') AS caption_track_langs,
+          COALESCE(ctracks.paths, '{}') AS caption_track_paths
         FROM videos v
         JOIN users u ON u.user_uid = v.author_uid
+        LEFT JOIN cnt ON true
         LEFT JOIN categories vcat ON vcat.category_id = v.category_id
         LEFT JOIN LATERAL (
-          SELECT path
+          SELECT
+            MAX(path) FILTER (WHERE asset_type = 'thumbnail_default') AS thumb_asset_path,
+            MAX(path) FILTER (WHERE asset_type = 'thumbnail_anim')    AS thumb_anim_asset_path,
+            MAX(path) FILTER (WHERE asset_type = 'thumbs_vtt')        AS thumbs_vtt_path,
+            MAX(path) FILTER (WHERE asset_type = 'stream_hls')        AS stream_hls_path,
+            MAX(path) FILTER (WHERE asset_type = 'stream_dash')       AS stream_dash_path,
+            json_agg(json_build_object('asset_type', asset_type, 'path', path) ORDER BY asset_type)
+              FILTER (WHERE asset_type LIKE 'ytconvert_audio_%' OR asset_type LIKE 'audio_%') AS audio_assets
           FROM video_assets
-          WHERE video_id = v.video_id AND asset_type = 'thumbnail_default'
-          LIMIT 1
-        ) vthumb ON true
-        LEFT JOIN LATERAL (
-          SELECT path
-          FROM video_assets
-          WHERE video_id = v.video_id AND asset_type = 'thumbnail_anim'
-          LIMIT 1
-        ) vanim ON true
+          WHERE video_id = v.video_id
+        ) va ON true
         LEFT JOIN LATERAL (
           SELECT path
           FROM user_assets
           WHERE user_uid = v.author_uid AND asset_type = 'avatar'
           LIMIT 1
         ) uava ON true
-        WHERE v.video_id = $1
-        """,
-        video_id,
-    )
-    return dict(row) if row else None
-
-
-async def fetch_embed_video_info(conn, video_id: str) -> Optional[Dict[str, Any]]:
-    row = await conn.fetchrow(
-        """
-        SELECT
-          v.video_id,
-          v.title,
-          v.storage_path,
-          v.allow_embed,
-          v.captions_vtt,
-          v.captions_lang,
-          v.likes_count,
-          v.views_count,
-          v.created_at,
-          thumb.path  AS thumb_asset_path,
-          anim.path   AS thumb_anim_asset_path
-        FROM videos v
         LEFT JOIN LATERAL (
-          SELECT path
-          FROM video_assets
-          WHERE video_id = v.video_id AND asset_type = 'thumbnail_default'
-          LIMIT 1
-        ) thumb ON TRUE
+          SELECT json_agg(
+                   json_build_object('preset', preset, 'codec', codec, 'status', status, 'storage_path', storage_path)
+                   ORDER BY preset, codec
+                 ) AS renditions
+          FROM video_renditions
+          WHERE video_id = v.video_id
+        ) vr ON true
         LEFT JOIN LATERAL (
-          SELECT path
-          FROM video_assets
-          WHERE video_id = v.video_id AND asset_type = 'thumbnail_anim'
-          LIMIT 1
-        ) anim ON TRUE
+          SELECT array_agg(lang ORDER BY lang) AS langs, array_agg(rel_path ORDER BY lang) AS paths
+          FROM video_caption_tracks
+          WHERE video_id = v.video_id
+        ) ctracks ON true
+        LEFT JOIN LATERAL (
+          SELECT GREATEST(0, SUM(likes))::bigint AS likes
+          FROM video_reaction_counters
+          WHERE video_id = v.video_id
+        ) rc ON true
         WHERE v.video_id = $1
         """,
         video_id,
+        view_uid,
+        user_uid,
     )
-    return dict(row) if row else None
+    if not row:
+        return None
+    out = dict(row)
+    for key in ("renditions", "audio_assets"):
+        val = out.get(key)
+        out[key] = json.loads(val) if isinstance(val, str) else (val or [])
+    return out
 
 
 async def set_video_allow_comments(conn, video_id: str, allow: bool) -> None:
@@ -0,0 +1,65 @@
+"""
+Pool warm-up: runs the hot statements once on every min_size connection, so their prepared statements
+are in the asyncpg cache (keyed by SQL text) before the first watch/listing/search request.
+The real query functions are called with ids that match nothing; the watch statement, which also writes,
+runs inside a rolled back transaction.
+"""
+import asyncio
+import logging
+import time
+
+from config.config import settings
+from db import get_conn, init_db_pool, release_conn
+from db.reactions_db import get_video_reaction_state
+from db.search_db import fetch_video_assets_by_ids
+from db.videos_db import list_latest_public_videos, list_latest_public_videos_count
+from db.videos_query_db import load_watch_context
+
+log = logging.getLogger(__name__)
+
+_NO_ID = ""
+
+
+async def _warm_connection(conn) -> None:
+    tr = conn.transaction()
+    await tr.start()
+    try:
+        await load_watch_context(conn, _NO_ID, _NO_ID, None)
+    finally:
+        await tr.rollback()
+    await get_video_reaction_state(conn, None, _NO_ID)
+    await list_latest_public_videos(conn, limit=1, offset=0)
+    await list_latest_public_videos_count(conn)
+    await fetch_video_assets_by_ids(conn, [])
+
+
+async def _warm_pool(n: int) -> None:
+    await init_db_pool()
+    got = await asyncio.gather(
+        *(get_conn(_site="db/warmup_db.py:warm_up_db_pool") for _ in range(n)), return_exceptions=True
+    )
+    conns = [c for c in got if not isinstance(c, BaseException)]
+    try:
+        errors = [e for e in got if isinstance(e, BaseException)]
+        if errors:
+            raise errors[0]
+        await asyncio.gather(*(_warm_connection(c) for c in conns))
+    finally:
+        for c in conns:
+            await release_conn(c)
+
+
+async def warm_up_db_pool() -> None:
+    """
+    Opens the pool and warms DB_POOL_MIN_SIZE connections. Never raises and gives up after
+    DB_ACQUIRE_TIMEOUT_SEC: a DB that is down at startup only costs the warm-up.
+    """
+    if not settings.DB_POOL_WARMUP:
+        return
+    t0 = time.perf_counter()
+    n = max(1, settings.DB_POOL_MIN_SIZE)
+    try:
+        await asyncio.wait_for(_warm_pool(n), timeout=max(1, settings.DB_ACQUIRE_TIMEOUT_SEC))
+        log.info("db pool warmed connections=%s in %.0f ms", n, (time.perf_counter() - t0) * 1000.0)
+    except Exception as e:
+        log.warning("db pool warm-up failed: %r", e)
@@ -1,4 +1,4 @@
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict
 
 async def fetch_video_storage_path(conn, video_id: str, ensure_ready: bool = False) -> Optional[str]:
     if ensure_ready:
@@ -97,4 +97,86 @@ async def persist_sprite_assets(conn, video_id: str, web_paths: List[str]) -> No
             video_id,
             asset_type,
             wp,
-        )
\ No newline at end of file
+        )
+
+# --- backfill checkpoint (ytsprites_backfill) ---
+
+async def list_backfill_candidates(conn, limit: int, max_attempts: int, exclude: List[str]) -> List[Any]:
+    """
+    Videos still without sprites that the backfill has not submitted yet (or that failed fewer than max_attempts times).
+    Running jobs are excluded: they are re-attached from list_backfill_running().
+    """
+    rows = await conn.fetch(
+        """
+        SELECT v.video_id, v.storage_path
+        FROM videos v
+        LEFT JOIN ytsprites_backfill b ON b.video_id = v.video_id
+        WHERE v.processing_status = 'ready'
+          AND (v.thumbnails_ready IS DISTINCT FROM TRUE)
+          AND (b.video_id IS NULL OR (b.state = 'failed' AND b.attempts < $2))
+          AND NOT (v.video_id = ANY($3::text[]))
+        ORDER BY v.created_at ASC
+        LIMIT $1
+        """,
+        limit,
+        max_attempts,
+        exclude,
+    )
+    return rows
+
+
+async def count_backfill_remaining(conn, max_attempts: int) -> int:
+    row = await conn.fetchrow(
+        """
+        SELECT COUNT(*) AS n
+        FROM videos v
+        LEFT JOIN ytsprites_backfill b ON b.video_id = v.video_id
+        WHERE v.processing_status = 'ready'
+          AND (v.thumbnails_ready IS DISTINCT FROM TRUE)
+          AND (b.video_id IS NULL OR b.state = 'running' OR (b.state = 'failed' AND b.attempts < $1))
+        """,
+        max_attempts,
+    )
+    return int(row["n"]) if row else 0
+
+
+async def list_backfill_running(conn) -> List[Any]:
+    rows = await conn.fetch(
+        """
+        SELECT b.video_id, b.job_id, b.job_server, v.storage_path
+        FROM ytsprites_backfill b
+        JOIN videos v ON v.video_id = b.video_id
+        WHERE b.state = 'running'
+        ORDER BY b.updated_at ASC
+        """
+    )
+    return rows
+
+
+async def claim_backfill_item(conn, video_id: str, job_id: str, job_server: str) -> None:
+    await conn.execute(
+        """
+        INSERT INTO ytsprites_backfill (video_id, state, job_id, job_server, attempts, error)
+        VALUES ($1, 'running', $2, $3, 1, '')
+        ON CONFLICT (video_id) DO UPDATE
+        SET state = 'running', job_id = EXCLUDED.job_id, job_server = EXCLUDED.job_server,
+            attempts = ytsprites_backfill.attempts + 1, error = '', updated_at = NOW()
+        """,
+        video_id,
+        job_id,
+        job_server,
+    )
+
+
+async def finish_backfill_item(conn, video_id: str, state: str, error: str = "") -> None:
+    await conn.execute(
+        "UPDATE ytsprites_backfill SET state = $2, error = $3, updated_at = NOW() WHERE video_id = $1",
+        video_id,
+        state,
+        error or "",
+    )
+
+
+async def backfill_state_counts(conn) -> Dict[str, int]:
+    rows = await conn.fetch("SELECT state, COUNT(*) AS n FROM ytsprites_backfill GROUP BY state")
+    return {r["state"]: int(r["n"]) for r in rows}
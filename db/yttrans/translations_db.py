@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional
+
+
+async def get_translations_state(conn, video_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Last translation job + written langs in one round trip.
+    None if the video has neither (never translated, or only a legacy translations.meta.json).
+    """
+    row = await conn.fetchrow(
+        """
+        SELECT j.video_id IS NOT NULL AS has_job,
+               j.job_id, j.job_server, j.state, j.message, j.result_fetched,
+               j.source_lang, j.default_lang, j.engine,
+               COALESCE(
+                 (SELECT array_agg(t.lang ORDER BY t.lang) FROM video_caption_tracks t WHERE t.video_id = x.video_id),
+                 '{}'::text[]
+               ) AS langs
+        FROM (SELECT $1::text AS video_id) x
+        LEFT JOIN video_translation_jobs j ON j.video_id = x.video_id
+        """,
+        video_id,
+    )
+    if not row or (not row["has_job"] and not row["langs"]):
+        return None
+    return {
+        "langs": list(row["langs"] or []),
+        "default_lang": row["default_lang"] or "",
+        "source_lang": row["source_lang"] or "",
+        "engine": row["engine"] or "",
+        "job_id": row["job_id"] or "",
+        "job_server": row["job_server"] or "",
+        "state": row["state"] or "",
+        "message": row["message"] or "",
+        "result_fetched": bool(row["result_fetched"]),
+    }
+
+
+async def start_translation_job(conn, video_id: str, job_id: str, job_server: str) -> None:
+    await conn.execute(
+        """
+        INSERT INTO video_translation_jobs (video_id, job_id, job_server, state, message, result_fetched)
+        VALUES ($1, $2, $3, 'running', '', FALSE)
+        ON CONFLICT (video_id) DO UPDATE
+        SET job_id = EXCLUDED.job_id, job_server = EXCLUDED.job_server, state = 'running',
+            message = '', result_fetched = FALSE, updated_at = NOW()
+        """,
+        video_id,
+        job_id or "",
+        job_server or "",
+    )
+
+
+async def update_translation_job(
+    conn,
+    video_id: str,
+    *,
+    state: Optional[str] = None,
+    message: Optional[str] = None,
+    result_fetched: Optional[bool] = None,
+    default_lang: Optional[str] = None,
+    engine: Optional[str] = None,
+) -> None:
+    """
+    None = keep the current value.
+    """
+    await conn.execute(
+        """
+        UPDATE video_translation_jobs
+        SET state = COALESCE($2, state),
+            message = COALESCE($3, message),
+            result_fetched = COALESCE($4, result_fetched),
+            default_lang = COALESCE($5, default_lang),
+            engine = COALESCE($6, engine),
+            updated_at = NOW()
+        WHERE video_id = $1
+        """,
+        video_id,
+        state,
+        message,
+        result_fetched,
+        default_lang,
+        engine,
+    )
+
+
+async def upsert_caption_track(conn, video_id: str, lang: str, rel_path: str) -> None:
+    await conn.execute(
+        """
+        INSERT INTO video_caption_tracks (video_id, lang, rel_path)
+        VALUES ($1, $2, $3)
+        ON CONFLICT (video_id, lang) DO UPDATE SET rel_path = EXCLUDED.rel_path, updated_at = NOW()
+        """,
+        video_id,
+        lang,
+        rel_path,
+    )
+
+
+async def delete_caption_tracks(conn, video_id: str, langs: Iterable[str]) -> List[str]:
+    """
+    Returns langs that remain for the video.
+    """
+    rows = await conn.fetch(
+        """
+        WITH del AS (
+          DELETE FROM video_caption_tracks WHERE video_id = $1 AND lang = ANY($2::text[])
+        )
+        SELECT lang FROM video_caption_tracks
+        WHERE video_id = $1 AND lang <> ALL($2::text[])
+        ORDER BY lang
+        """,
+        video_id,
+        list(langs),
+    )
+    return [r["lang"] for r in rows]
+
+
+async def reset_translations(conn, video_id: str) -> None:
+    """
+    Drops all tracks and leaves an empty job row, so a legacy meta file is not imported again.
+    """
+    async with conn.transaction():
+        await conn.execute("DELETE FROM video_caption_tracks WHERE video_id = $1", video_id)
+        await conn.execute(
+            """
+            INSERT INTO video_translation_jobs (video_id) VALUES ($1)
+            ON CONFLICT (video_id) DO UPDATE
+            SET job_id = '', job_server = '', state = '', message = '', result_fetched = FALSE,
+                source_lang = '', default_lang = '', engine = '', updated_at = NOW()
+            """,
+            video_id,
+        )
+
+
+async def import_translations_meta(conn, video_id: str, meta: Dict[str, Any], captions_dir: str) -> None:
+    """
+    One-time import of a legacy captions/translations.meta.json; existing rows win.
+    """
+    captions_dir = captions_dir.strip("/")
+    async with conn.transaction():
+        await conn.execute(
+            """
+            INSERT INTO video_translation_jobs
+              (video_id, job_id, job_server, state, message, result_fetched, source_lang, default_lang, engine)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+            ON CONFLICT (video_id) DO NOTHING
+            """,
+            video_id,
+            str(meta.get("job_id") or ""),
+            str(meta.get("job_server") or ""),
+            str(meta.get("job_state") or ""),
+            str(meta.get("job_message") or ""),
+            bool(meta.get("job_result_fetched")),
+            str(meta.get("source_lang") or ""),
+            str(meta.get("default_lang") or ""),
+            str(meta.get("engine") or ""),
+        )
+        langs = [str(x).strip() for x in (meta.get("langs") or []) if str(x).strip()]
+        if langs:
+            await conn.executemany(
+                """
+                INSERT INTO video_caption_tracks (video_id, lang, rel_path)
+                VALUES ($1, $2, $3)
+                ON CONFLICT (video_id, lang) DO NOTHING
+                """,
+                [(video_id, l, f"{captions_dir}/{l}.vtt") for l in langs],
+            )
@@ -340,4 +340,101 @@ CREATE TABLE IF NOT EXISTS video_formats (
     PRIMARY KEY (video_id, format_name)
 );
 
-COMMIT;
\ No newline at end of file
+-- --------------------------------------------------------------------
+-- Resumable uploads (sessions + received parts)
+-- --------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS upload_sessions (
+    upload_id     TEXT PRIMARY KEY,
+    video_id      TEXT NOT NULL,
+    author_uid    TEXT NOT NULL REFERENCES users(user_uid) ON DELETE CASCADE,
+    storage_path  TEXT NOT NULL,
+    filename      TEXT NOT NULL DEFAULT '',
+    total_bytes   BIGINT NOT NULL,
+    part_size     BIGINT NOT NULL,
+    total_parts   INT NOT NULL,
+    state         TEXT NOT NULL DEFAULT 'open', -- open|assembling|done|aborted|failed
+    params        JSONB NOT NULL DEFAULT '{}'::jsonb,
+    created_at    TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at    TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    expires_at    TIMESTAMPTZ NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_upload_sessions_author ON upload_sessions(author_uid);
+-- partial indexes matching list_expired_upload_sessions (expired sessions, stale assemblies)
+DROP INDEX IF EXISTS idx_upload_sessions_expires;
+CREATE INDEX IF NOT EXISTS idx_upload_sessions_expired ON upload_sessions(expires_at) WHERE state IN ('open', 'failed', 'aborted');
+CREATE INDEX IF NOT EXISTS idx_upload_sessions_assembling ON upload_sessions(updated_at) WHERE state = 'assembling';
+
+CREATE TABLE IF NOT EXISTS upload_session_parts (
+    upload_id   TEXT NOT NULL REFERENCES upload_sessions(upload_id) ON DELETE CASCADE,
+    part_no     INT NOT NULL,
+    size_bytes  BIGINT NOT NULL,
+    sha256      TEXT NOT NULL,
+    created_at  TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (upload_id, part_no)
+);
+
+-- --------------------------------------------------------------------
+-- Sprites backfill checkpoint (one row per video the orchestrator has submitted)
+-- --------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS ytsprites_backfill (
+    video_id    TEXT PRIMARY KEY REFERENCES videos(video_id) ON DELETE CASCADE,
+    state       TEXT NOT NULL DEFAULT 'running', -- running|done|failed
+    job_id      TEXT NULL,
+    job_server  TEXT NULL,
+    attempts    INT NOT NULL DEFAULT 0,
+    error       TEXT NOT NULL DEFAULT '',
+    created_at  TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at  TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+CREATE INDEX IF NOT EXISTS idx_ytsprites_backfill_state ON ytsprites_backfill(state);
+
+-- --------------------------------------------------------------------
+-- Translated caption tracks + last translation job per video (watch page reads tracks with the video row)
+-- --------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS video_caption_tracks (
+    video_id    TEXT NOT NULL REFERENCES videos(video_id) ON DELETE CASCADE,
+    lang        TEXT NOT NULL,
+    rel_path    TEXT NOT NULL,
+    created_at  TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at  TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (video_id, lang)
+);
+
+CREATE TABLE IF NOT EXISTS video_translation_jobs (
+    video_id        TEXT PRIMARY KEY REFERENCES videos(video_id) ON DELETE CASCADE,
+    job_id          TEXT NOT NULL DEFAULT '',
+    job_server      TEXT NOT NULL DEFAULT '',
+    state           TEXT NOT NULL DEFAULT '', -- running|done|failed ('' = no job)
+    message         TEXT NOT NULL DEFAULT '',
+    result_fetched  BOOLEAN NOT NULL DEFAULT FALSE,
+    source_lang     TEXT NOT NULL DEFAULT '',
+    default_lang    TEXT NOT NULL DEFAULT '',
+    engine          TEXT NOT NULL DEFAULT '',
+    updated_at      TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- --------------------------------------------------------------------
+-- Like/dislike totals: a few shard rows per video (shard picked at random on each click)
+-- --------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS video_reaction_counters (
+    video_id    TEXT NOT NULL REFERENCES videos(video_id) ON DELETE CASCADE,
+    shard       SMALLINT NOT NULL,
+    likes       BIGINT NOT NULL DEFAULT 0,
+    dislikes    BIGINT NOT NULL DEFAULT 0,
+    updated_at  TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (video_id, shard)
+);
+
+CREATE INDEX IF NOT EXISTS video_reaction_counters_updated_idx ON video_reaction_counters (updated_at);
+
+-- Seed from existing reactions (only videos without counter rows yet)
+INSERT INTO video_reaction_counters (video_id, shard, likes, dislikes)
+SELECT r.video_id, 0,
+       COUNT(*) FILTER (WHERE r.reaction_type = 'like'),
+       COUNT(*) FILTER (WHERE r.reaction_type = 'dislike')
+FROM reactions r
+WHERE NOT EXISTS (SELECT 1 FROM video_reaction_counters c WHERE c.video_id = r.video_id)
+GROUP BY r.video_id
+ON CONFLICT (video_id, shard) DO NOTHING;
+
+COMMIT;
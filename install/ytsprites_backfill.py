@@ -0,0 +1,83 @@
+import sys
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+'''
+Generate sprites for all videos that still have none (resumable, several jobs in flight). Usage:
+source ../.venv/bin/activate
+python3 ytsprites_backfill.py [--concurrency 8] [--per-server 4] [--limit 0]
+deactivate
+
+Ctrl-C stops the run; jobs already submitted are re-attached by the next run.
+'''
+
+# Add project root to sys.path
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from config.ytsprites.ytsprites_cfg import (  # noqa: E402
+    YTSPRITES_BACKFILL_CONCURRENCY,
+    YTSPRITES_BACKFILL_PER_SERVER,
+    YTSPRITES_BACKFILL_MAX_ATTEMPTS,
+)
+from services.ytsprites.backfill_srv import SpritesBackfill  # noqa: E402
+
+
+def _fmt_eta(sec) -> str:
+    if sec is None:
+        return "?"
+    h, rem = divmod(int(sec), 3600)
+    return f"{h}h{rem // 60:02d}m"
+
+
+async def _report(bf: SpritesBackfill, every_sec: float) -> None:
+    while True:
+        await asyncio.sleep(every_sec)
+        st = bf.status()
+        servers = " ".join(f"{s['addr']}={s['inflight']}/{s['limit']}{'!' if s['blocked'] else ''}" for s in st["servers"])
+        print(
+            f"[{time.strftime('%H:%M:%S')}] done={st['done']} failed={st['failed']} in_flight={st['in_flight']} "
+            f"remaining={st['remaining']} rate={st['rate_per_min']}/min eta={_fmt_eta(st['eta_sec'])} {servers}",
+            flush=True,
+        )
+
+
+async def main() -> int:
+    ap = argparse.ArgumentParser(description="ytsprites backfill")
+    ap.add_argument("--concurrency", type=int, default=YTSPRITES_BACKFILL_CONCURRENCY, help="jobs in flight in total")
+    ap.add_argument("--per-server", type=int, default=YTSPRITES_BACKFILL_PER_SERVER, help="max jobs in flight per ytsprites server")
+    ap.add_argument("--max-attempts", type=int, default=YTSPRITES_BACKFILL_MAX_ATTEMPTS)
+    ap.add_argument("--limit", type=int, default=0, help="max videos to submit in this run (0 = all)")
+    ap.add_argument("--report-sec", type=float, default=30.0)
+    args = ap.parse_args()
+
+    bf = SpritesBackfill(
+        concurrency=args.concurrency,
+        per_server=args.per_server,
+        max_attempts=args.max_attempts,
+        limit=args.limit,
+    )
+    if not await bf.try_lock():
+        print("Another sprites backfill is running (CLI or app worker).")
+        return 1
+
+    reporter = asyncio.create_task(_report(bf, args.report_sec))
+    try:
+        st = await bf.run()
+    finally:
+        reporter.cancel()
+    print(f"Finished: state={st['state']} submitted={st['submitted']} done={st['done']} failed={st['failed']}")
+    if st.get("error"):
+        print(f"Error: {st['error']}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(asyncio.run(main()))
+    except KeyboardInterrupt:
+        print("Interrupted; run again to resume.")
@@ -0,0 +1,97 @@
+import sys
+import json
+import asyncio
+import inspect
+from pathlib import Path
+
+'''
+Import legacy captions/translations.meta.json files into video_caption_tracks / video_translation_jobs,
+so translated tracks of old videos show up on watch/embed pages. Safe to re-run (rows already in db win). Usage:
+source ../.venv/bin/activate
+python3 yttrans_tracks_import.py
+deactivate
+'''
+
+# Add project root to sys.path
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from db import get_conn, release_conn  # noqa: E402
+from db.yttrans.translations_db import import_translations_meta  # noqa: E402
+from services.ytstorage.base_srv import storage_exists_many  # noqa: E402
+from services.ytstorage.build_client_srv import build_storage_client  # noqa: E402
+
+BATCH = 200
+
+
+async def _read_json(storage, rel: str) -> dict:
+    reader = storage.open_reader(rel)
+    if inspect.isawaitable(reader):
+        reader = await reader
+    data = bytearray()
+    if hasattr(reader, "__aiter__"):
+        async for chunk in reader:
+            data += chunk or b""
+    else:
+        for chunk in reader:
+            data += chunk or b""
+    meta = json.loads(data.decode("utf-8", "ignore") or "{}")
+    return meta if isinstance(meta, dict) else {}
+
+
+async def main() -> int:
+    storage = build_storage_client()
+    imported = checked = failed = 0
+    last_id = ""
+    while True:
+        conn = await get_conn()
+        try:
+            rows = await conn.fetch(
+                """
+                SELECT v.video_id, v.storage_path
+                FROM videos v
+                WHERE v.video_id > $1
+                  AND NOT EXISTS (SELECT 1 FROM video_translation_jobs j WHERE j.video_id = v.video_id)
+                ORDER BY v.video_id
+                LIMIT $2
+                """,
+                last_id,
+                BATCH,
+            )
+        finally:
+            await release_conn(conn)
+        if not rows:
+            break
+        last_id = rows[-1]["video_id"]
+
+        metas = {r["video_id"]: f"{r['storage_path'].strip('/')}/captions/translations.meta.json" for r in rows}
+        exists = await storage_exists_many(storage, metas.values())
+
+        conn = await get_conn()
+        try:
+            for r in rows:
+                vid = r["video_id"]
+                rel = metas[vid]
+                meta: dict = {}
+                if exists.get(rel):
+                    try:
+                        meta = await _read_json(storage, rel)
+                    except Exception as e:
+                        failed += 1
+                        print(f"[SKIP] {vid}: {e}")
+                        continue
+                    imported += 1
+                # empty meta still leaves a job row: the video is marked as checked
+                await import_translations_meta(conn, vid, meta, f"{r['storage_path'].strip('/')}/captions")
+                checked += 1
+        finally:
+            await release_conn(conn)
+        print(f"checked={checked} imported={imported} failed={failed}", flush=True)
+
+    print(f"Done: checked={checked} imported={imported} failed={failed}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -9,13 +9,23 @@ from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
 from services.ytadmin.grpc_server_srv import app_grpc_server
 from services.monitor.uptime import uptime
+from services.monitor.loop_monitor import loop_monitor
+from db import shutdown_db_pool
+from db.warmup_db import warm_up_db_pool
 
 from config.config import settings
 
 from routes import register_routes
 from services.ytstorage.build_client_srv import build_storage_client
+from services.ytcms import ytcms_aio_client_srv as ytcms_aio_client
+from services.ytsprites import ytsprites_aio_client_srv as ytsprites_aio_client
+from services import images_srv, reaction_counters_srv
+from services.page_cache_srv import page_cache
+from utils.templates_ut import precompile_templates
 
 from middlewares.csrf_mw import NewCSRFMiddleware
+from middlewares.metrics_mw import MetricsMiddleware
+from middlewares.db_route_mw import ReadYourWritesMiddleware
 
 
 # Toggle built-in API docs
@@ -40,18 +50,34 @@ async def on_startup():
     app.state.storage = build_storage_client(kind="")
     logging.basicConfig(level=logging.INFO)
     uptime.set_started()
+    precompile_templates()  # before the loop monitor: it blocks the loop on purpose
+    loop_monitor.start()
+    await warm_up_db_pool()
+    reaction_counters_srv.start()
+    page_cache.start()
     if APP_GRPC_ENABLED:
         await app_grpc_server.start()
 
 
 @app.on_event("shutdown")
 async def on_shutdown():
+    await reaction_counters_srv.stop()
+    await page_cache.stop()
+    images_srv.shutdown()
+    await loop_monitor.stop()
     if APP_GRPC_ENABLED:
         await app_grpc_server.stop()
+    await ytcms_aio_client.close_channels()
+    await ytsprites_aio_client.close_channels()
+    await shutdown_db_pool()
 
 
 app.add_middleware(NewCSRFMiddleware, cookie_name=getattr(settings, "CSRF_COOKIE_NAME", "yt_csrf"))
 
+# Read replica routing: recent writers read from the primary
+if settings.DB_REPLICA_URLS:
+    app.add_middleware(ReadYourWritesMiddleware, cookie_name=settings.DB_READ_YOUR_WRITES_COOKIE)
+
 # Static mounts
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
@@ -61,5 +87,9 @@ app.add_middleware(ProxyHeadersMiddleware, trusted_hosts=["127.0.0.1", "::1"])
 # Minimal cookie session middleware
 app.add_middleware(SessionMiddleware, secret_key=settings.SECRET_KEY)
 
+# Per-route latency histograms (outermost: covers all other middlewares)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Register routes
 register_routes(app)
\ No newline at end of file
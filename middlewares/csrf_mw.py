@@ -1,6 +1,8 @@
-from typing import Callable, Iterable, Optional
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+import secrets
+from typing import Iterable, Optional
+
+from starlette.datastructures import Headers
+from starlette.requests import cookie_parser
 
 SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
 
@@ -9,29 +11,29 @@ def _cookie_name(settings) -> str:
     return getattr(settings, "CSRF_COOKIE_NAME", "yt_csrf")
 
 
-def _is_https(request: Request) -> bool:
-    xf_proto = (request.headers.get("x-forwarded-proto") or "").lower().strip()
+def _is_https(scope, headers: Headers) -> bool:
+    xf_proto = (headers.get("x-forwarded-proto") or "").lower().strip()
     if xf_proto in ("https", "wss"):
         return True
-    fwd = (request.headers.get("forwarded") or "").lower()
+    fwd = (headers.get("forwarded") or "").lower()
     if "proto=https" in fwd:
         return True
-    return request.url.scheme == "https"
+    return scope.get("scheme") == "https"
 
 
 def _gen_token() -> str:
-    import secrets as _sec
-    return _sec.token_urlsafe(32)
+    return secrets.token_urlsafe(32)
 
 
-class NewCSRFMiddleware(BaseHTTPMiddleware):
+class NewCSRFMiddleware:
     """
-    Only issues a CSRF cookie for SAFE methods. It doesn't read the request body at all.
+    Pure ASGI: only issues a CSRF cookie for SAFE methods. It doesn't read the request body at all,
+    and response bodies (streams, range responses) pass through untouched.
     Validation is performed in routers (double-submit cookies).
     """
     def __init__(self, app, cookie_name: Optional[str] = None, skip_paths: Optional[Iterable[str]] = None):
-        super().__init__(app)
         from config.config import settings
+        self.app = app
         self.settings = settings
         self.cookie_name = cookie_name or _cookie_name(settings)
         self._skip = tuple(skip_paths or ())
@@ -39,21 +41,24 @@ class NewCSRFMiddleware(BaseHTTPMiddleware):
     def _skipped(self, path: str) -> bool:
         return any(path.startswith(p) for p in self._skip)
 
-    async def dispatch(self, request: Request, call_next: Callable):
-        if self._skipped(request.url.path):
-            return await call_next(request)
-
-        method = (request.method or "").upper()
-        resp = await call_next(request)
-
-        if method in SAFE_METHODS:
-            if not (request.cookies.get(self.cookie_name) or "").strip():
-                resp.set_cookie(
-                    self.cookie_name,
-                    _gen_token(),
-                    httponly=False,
-                    secure=_is_https(request),
-                    samesite="lax",
-                    path="/",
-                )
-        return resp
\ No newline at end of file
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        if (scope.get("method") or "").upper() not in SAFE_METHODS or self._skipped(scope.get("path") or ""):
+            return await self.app(scope, receive, send)
+
+        headers = Headers(scope=scope)
+        if (cookie_parser(headers.get("cookie") or "").get(self.cookie_name) or "").strip():
+            return await self.app(scope, receive, send)
+
+        cookie = f"{self.cookie_name}={_gen_token()}; Path=/; SameSite=lax"
+        if _is_https(scope, headers):
+            cookie += "; Secure"
+
+        async def _send(message):
+            if message["type"] == "http.response.start":
+                message = dict(message)
+                message["headers"] = list(message.get("headers") or []) + [(b"set-cookie", cookie.encode("latin-1"))]
+            await send(message)
+
+        await self.app(scope, receive, _send)
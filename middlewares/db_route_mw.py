@@ -0,0 +1,59 @@
+import time
+from http.cookies import SimpleCookie
+
+from config.config import settings
+from db import ReadRouting, read_routing
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def _cookie_until(scope, name: str) -> float:
+    for k, v in scope.get("headers") or ():
+        if k != b"cookie":
+            continue
+        try:
+            c = SimpleCookie()
+            c.load(v.decode("latin-1"))
+            if name in c:
+                return float(c[name].value)
+        except Exception:
+            return 0.0
+    return 0.0
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pure ASGI: read routing for db.get_read_conn().
+
+    - unsafe methods (and GET handlers calling db.note_write()) pin the request to the primary and,
+      when they succeed, set a short-lived cookie;
+    - while the cookie is valid, the client's reads skip the replicas, so it sees its own edits,
+      reactions and subscriptions even when a replica lags.
+    """
+
+    def __init__(self, app, cookie_name: str = "yt_rw") -> None:
+        self.app = app
+        self.cookie_name = cookie_name
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        now = time.time()
+        unsafe = (scope.get("method") or "GET").upper() not in SAFE_METHODS
+        st = ReadRouting(pinned=unsafe or _cookie_until(scope, self.cookie_name) > now)
+        st.wrote = unsafe
+        token = read_routing.set(st)
+
+        async def _send(message):
+            if message["type"] == "http.response.start" and st.wrote and int(message.get("status") or 500) < 400:
+                ttl = max(1, int(settings.DB_READ_YOUR_WRITES_SEC))
+                cookie = f"{self.cookie_name}={int(time.time()) + ttl}; Max-Age={ttl}; Path=/; HttpOnly; SameSite=Lax"
+                message = dict(message)
+                message["headers"] = list(message.get("headers") or []) + [(b"set-cookie", cookie.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            read_routing.reset(token)
@@ -0,0 +1,41 @@
+import time
+
+from services.monitor.metrics_srv import metrics
+
+
+def _route_label(scope) -> str:
+    # FastAPI puts the matched APIRoute into the (shared) scope; path template keeps the label set small
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path:
+        return path
+    if (scope.get("path") or "").startswith("/static/"):
+        return "/static"
+    return "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI: per-route latency histogram (time to the last body chunk) for HTTP requests.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        t0 = time.perf_counter()
+        status_code = 500
+
+        async def _send(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = int(message.get("status") or 500)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            metrics.observe_http(scope.get("method") or "GET", _route_label(scope), status_code, time.perf_counter() - t0)
@@ -11,6 +11,7 @@ from .upload_rout import router as upload_router
 from .watch_rout import router as watch_router
 from .edit_rout import router as edit_router
 from .search_rout import router as search_router
+from .monitor_rout import router as monitor_router
 from .account_password_rout import router as account_password_router
 from .auth_google_rout import router as auth_google_router
 from .auth_twitter_rout import router as auth_twitter_router
@@ -62,6 +63,7 @@ def register_routes(app: FastAPI) -> None:
     app.include_router(edit_router)
     app.include_router(search_router)
     app.include_router(playlists_router)
+    app.include_router(monitor_router)
 
     # Comments
     app.include_router(comments_create_router)
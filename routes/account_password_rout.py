@@ -4,11 +4,11 @@ import secrets
 
 from fastapi import APIRouter, Form, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 
 from db import get_conn, release_conn
 from db.users_auth_db import get_user_auth_by_uid, update_user_password_hash
 from utils.security_ut import get_current_user, verify_password, hash_password
+from utils.templates_ut import templates
 from config.config import settings
 
 try:
@@ -27,9 +27,6 @@ PASSWORD_MIN_SCORE = max(0, min(PASSWORD_MIN_SCORE, 4))  # clamp
 
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
-templates.env.globals["sitename"] = settings.SITENAME
-templates.env.globals["support_email"] = settings.SUPPORT_EMAIL
 
 # --- CSRF helpers ---
 
@@ -141,10 +138,6 @@ async def password_form(request: Request) -> Any:
             "min_score": PASSWORD_MIN_SCORE,
             "zxcvbn": ZXCVBN_AVAILABLE,
             "csrf_token": csrf_token,
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
         },
         headers={"Cache-Control": "no-store"},
     )
@@ -198,10 +191,6 @@ async def password_change(
                 "min_score": PASSWORD_MIN_SCORE,
                 "zxcvbn": ZXCVBN_AVAILABLE,
                 "csrf_token": csrf_out,
-                "brand_logo_url": settings.BRAND_LOGO_URL,
-                "brand_tagline": settings.BRAND_TAGLINE,
-                "favicon_url": settings.FAVICON_URL,
-                "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
             },
             headers={"Cache-Control": "no-store"},
         )
@@ -237,10 +226,6 @@ async def password_change(
                     "min_score": PASSWORD_MIN_SCORE,
                     "zxcvbn": ZXCVBN_AVAILABLE,
                     "csrf_token": csrf_out,
-                    "brand_logo_url": settings.BRAND_LOGO_URL,
-                    "brand_tagline": settings.BRAND_TAGLINE,
-                    "favicon_url": settings.FAVICON_URL,
-                    "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
                 },
                 headers={"Cache-Control": "no-store"},
             )
@@ -267,10 +252,6 @@ async def password_change(
             "min_score": PASSWORD_MIN_SCORE,
             "zxcvbn": ZXCVBN_AVAILABLE,
             "csrf_token": csrf_out,
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
         },
         headers={"Cache-Control": "no-store"},
     )
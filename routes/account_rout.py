@@ -1,16 +1,17 @@
-import os
 import time
-import tempfile
 from typing import Any, Optional
 
 from fastapi import APIRouter, File, HTTPException, Request, UploadFile, status
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 
 from config.config import settings
-from services.ffmpeg_srv import generate_image_thumbnail
+from services.images_srv import AVATAR_VARIANTS, ImageError, read_upload, render_variants, upload_variants
+from services.avatars_srv import invalidate_avatar
+from services.page_cache_srv import invalidate_videos
+from services.user_profile_srv import invalidate_user_profile
 from utils.security_ut import get_current_user
 from utils.url_ut import build_storage_url
+from utils.templates_ut import templates
 
 from db.account_profile_db import (
     fetch_profile_data,
@@ -22,7 +23,6 @@ from db.account_profile_db import (
 from services.ytstorage.base_srv import StorageClient
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 
 def _cache_bust(url: Optional[str]) -> Optional[str]:
@@ -34,26 +34,6 @@ def _cache_bust(url: Optional[str]) -> Optional[str]:
     return f"{url}{sep}cb={int(time.time())}"
 
 
-async def _write_uploadfile_to_path(upload: UploadFile, dst_abs: str) -> None:
-    with open(dst_abs, "wb") as f:
-        while True:
-            chunk = await upload.read(1024 * 1024)
-            if not chunk:
-                break
-            f.write(chunk)
-
-
-async def _upload_local_file_to_storage(storage: StorageClient, rel_path: str, src_abs: str, overwrite: bool = True) -> None:
-    writer_ctx = await storage.open_writer(rel_path, overwrite=overwrite)
-    async with writer_ctx as w:
-        with open(src_abs, "rb") as f:
-            while True:
-                b = f.read(1024 * 1024)
-                if not b:
-                    break
-                await w.write(b)
-
-
 @router.get("/account", response_class=HTMLResponse)
 async def account_home(request: Request) -> Any:
     user = get_current_user(request)
@@ -104,10 +84,6 @@ async def account_home(request: Request) -> Any:
             "google_picture": None,
             "nav_avatar_url": nav_avatar_url,
             "nav_display_name": nav_display_name,
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
             "storage_public_base_url": getattr(settings, "YTSTORAGE_PUBLIC_BASE_URL", None),
         },
     )
@@ -130,29 +106,27 @@ async def account_profile_update(request: Request, avatar: Optional[UploadFile]
     prefix = (user["user_uid"] or "")[:2]
     user_dir_rel = f"{prefix}/{user['user_uid']}".strip("/")
 
-    # canonical rel paths in ytstorage
-    original_rel = storage.join(user_dir_rel, "avatar.png")
-    small_rel = storage.join(user_dir_rel, "avatar_small.png")
-
-    # generate thumbnails locally in temp dir, then upload to ytstorage
-    with tempfile.TemporaryDirectory(prefix="yurtube-avatar-") as tmpd:
-        original_abs = os.path.join(tmpd, "avatar.png")
-        small_abs = os.path.join(tmpd, "avatar_small.png")
-
-        await _write_uploadfile_to_path(avatar, original_abs)
-
-        # normalize/resize
-        generate_image_thumbnail(original_abs, original_abs, 512)
-        generate_image_thumbnail(original_abs, small_abs, 96)
+    try:
+        data = await read_upload(avatar)
+    except ImageError:
+        raise HTTPException(status_code=413, detail="Avatar file is too large")
+    if not data:
+        raise HTTPException(status_code=400, detail="Invalid avatar file")
 
-        # ensure remote dir exists
-        await storage.mkdirs(user_dir_rel, exist_ok=True)
+    # one decode -> 512/96 PNG, off the event loop; then all uploads at once
+    try:
+        outputs = await render_variants(data, AVATAR_VARIANTS)
+    except ImageError:
+        raise HTTPException(status_code=400, detail="Invalid avatar file")
 
-        await _upload_local_file_to_storage(storage, original_rel, original_abs, overwrite=True)
-        await _upload_local_file_to_storage(storage, small_rel, small_abs, overwrite=True)
+    await upload_variants(storage, user_dir_rel, outputs)
+    original_rel = storage.join(user_dir_rel, "avatar.png")
 
     # store original path in DB (you can also store small if needed later)
     await save_user_avatar_path(user["user_uid"], original_rel)
+    invalidate_avatar(user["user_uid"])
+    invalidate_user_profile(user["user_uid"])
+    await invalidate_videos(user["user_uid"])
 
     return RedirectResponse("/account", status_code=status.HTTP_302_FOUND)
 
@@ -164,20 +138,20 @@ async def account_avatar_delete(request: Request) -> Any:
         return RedirectResponse("/auth/login", status_code=status.HTTP_302_FOUND)
 
     await remove_user_avatar_record(user["user_uid"])
+    invalidate_avatar(user["user_uid"])
+    invalidate_user_profile(user["user_uid"])
+    await invalidate_videos(user["user_uid"])
 
     storage: StorageClient = request.app.state.storage
     prefix = (user["user_uid"] or "")[:2]
     user_dir_rel = f"{prefix}/{user['user_uid']}".strip("/")
 
     # best-effort delete of files + directory (recursive supported by RemoteStorageClient.remove)
-    try:
-        await storage.remove(storage.join(user_dir_rel, "avatar.png"), recursive=False)  # type: ignore[arg-type]
-    except Exception:
-        pass
-    try:
-        await storage.remove(storage.join(user_dir_rel, "avatar_small.png"), recursive=False)  # type: ignore[arg-type]
-    except Exception:
-        pass
+    for v in AVATAR_VARIANTS:
+        try:
+            await storage.remove(storage.join(user_dir_rel, v.name), recursive=False)  # type: ignore[arg-type]
+        except Exception:
+            pass
     try:
         await storage.remove(user_dir_rel, recursive=True)  # type: ignore[arg-type]
     except Exception:
@@ -5,7 +5,6 @@ import secrets
 import asyncpg
 from fastapi import APIRouter, Form, Request, status
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 
 from db import get_conn, release_conn
 from db.users_db import authenticate_user, create_user, get_user_by_username, get_user_by_email
@@ -16,10 +15,10 @@ from utils.security_ut import (
     get_current_user,
     hash_password,
 )
+from utils.templates_ut import templates
 from config.config import settings
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 # CSRF helpers
 def _gen_csrf_token() -> str:
@@ -62,10 +61,6 @@ async def login_page(request: Request) -> Any:
     csrf_token = _get_csrf_cookie(request) or _gen_csrf_token()
     resp = templates.TemplateResponse("auth/login.html",
     {
-        "brand_logo_url": settings.BRAND_LOGO_URL,
-        "brand_tagline": settings.BRAND_TAGLINE,
-        "favicon_url": settings.FAVICON_URL,
-        "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
         "request": request,
         "current_user": None,
         "csrf_token": csrf_token,
@@ -94,10 +89,6 @@ async def login(
         return templates.TemplateResponse(
             "auth/login.html",
             {
-                "brand_logo_url": settings.BRAND_LOGO_URL,
-                "brand_tagline": settings.BRAND_TAGLINE,
-                "favicon_url": settings.FAVICON_URL,
-                "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
                 "request": request,
                 "current_user": None,
                 "error": "Invalid username or password",
@@ -128,10 +119,6 @@ async def register_page(request: Request) -> Any:
     csrf_token = _get_csrf_cookie(request) or _gen_csrf_token()
     resp = templates.TemplateResponse("auth/register.html",
     {
-        "brand_logo_url": settings.BRAND_LOGO_URL,
-        "brand_tagline": settings.BRAND_TAGLINE,
-        "favicon_url": settings.FAVICON_URL,
-        "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
         "request": request,
         "current_user": None,
         "csrf_token": csrf_token,
@@ -158,10 +145,6 @@ async def register(
             return templates.TemplateResponse(
                 "auth/register.html",
                 {
-                    "brand_logo_url": settings.BRAND_LOGO_URL,
-                    "brand_tagline": settings.BRAND_TAGLINE,
-                    "favicon_url": settings.FAVICON_URL,
-                    "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
                     "request": request,
                     "current_user": None,
                     "error": "Username already taken",
@@ -176,10 +159,6 @@ async def register(
             return templates.TemplateResponse(
                 "auth/register.html",
                 {
-                    "brand_logo_url": settings.BRAND_LOGO_URL,
-                    "brand_tagline": settings.BRAND_TAGLINE,
-                    "favicon_url": settings.FAVICON_URL,
-                    "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
                     "request": request,
                     "current_user": None,
                     "error": "Email is already registered",
@@ -204,10 +183,6 @@ async def register(
             return templates.TemplateResponse(
                 "auth/register.html",
                 {
-                    "brand_logo_url": settings.BRAND_LOGO_URL,
-                    "brand_tagline": settings.BRAND_TAGLINE,
-                    "favicon_url": settings.FAVICON_URL,
-                    "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
                     "request": request,
                     "current_user": None,
                     "error": "Username or email is already registered",
@@ -3,39 +3,26 @@ import os
 
 from fastapi import APIRouter, Query, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 
 from config.config import settings
-from db import get_conn, release_conn
+from db import get_read_conn, release_conn
 from db.subscriptions_db import list_subscriptions
 from db.videos_db import (
     list_history_distinct_latest,
     list_trending_public_videos,
 )
-from utils.format_ut import fmt_dt
 from utils.security_ut import get_current_user
 from utils.thumbs_ut import DEFAULT_THUMB_DATA_URI
 from utils.url_ut import build_storage_url
+from utils.templates_ut import templates
+from services.avatars_srv import avatar_small_url as _avatar_small_url
 from services.feed.trending_srv import fetch_trending, fetch_recent_public, fetch_trending_page
+from services.page_cache_srv import SCOPE_VIDEOS, page_cache
 
 # --- Storage abstraction ---
 from services.ytstorage.base_srv import StorageClient
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
-templates.env.filters["dt"] = fmt_dt
-templates.env.globals["sitename"] = settings.SITENAME
-templates.env.globals["support_email"] = settings.SUPPORT_EMAIL
-
-
-def _avatar_small_url(avatar_path: Optional[str]) -> str:
-    if not avatar_path:
-        return "/static/img/avatar_default.svg"
-    if avatar_path.endswith("avatar.png"):
-        small_rel = avatar_path[: -len("avatar.png")] + "avatar_small.png"
-    else:
-        small_rel = avatar_path
-    return build_storage_url(small_rel)
 
 
 def _thumb_url(thumb_path: Optional[str]) -> str:
@@ -78,10 +65,43 @@ async def trending(
     else:
         bucket = 30
 
+    async def _grid() -> str:
+        return await _render_trending_grid(page, per_page, bucket)
+
+    def _context(current_user: Optional[Dict[str, Any]], grid_html: str) -> Dict[str, Any]:
+        return {
+            "request": request,
+            "current_user": current_user,
+            "grid_html": grid_html,
+            "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
+        }
+
+    params = (page, per_page, bucket)
+    scopes = (SCOPE_VIDEOS,)  # view/like counts move the order within PAGE_CACHE_TTL_SEC
+    current_user = get_current_user(request)
+    if current_user is None:
+        # anonymous: the whole page is shared
+        async def _page() -> str:
+            grid_html = await page_cache.get_or_render("trending_grid", params, scopes, _grid)
+            return templates.get_template("trending.html").render(_context(None, grid_html))
+
+        html = await page_cache.get_or_render("trending_page", params, scopes, _page)
+        return HTMLResponse(html, headers={"Cache-Control": "no-store"})
+
+    grid_html = await page_cache.get_or_render("trending_grid", params, scopes, _grid)
+    return templates.TemplateResponse(
+        "trending.html", _context(current_user, grid_html), headers={"Cache-Control": "no-store"}
+    )
+
+
+async def _render_trending_grid(page: int, per_page: int, days: int) -> str:
+    """
+    Period switch, video grid and pagination of /trending: the same for every visitor, cached in page_cache.
+    """
     limit = per_page
     offset = (page - 1) * per_page
 
-    videos, total = await fetch_trending_page(limit=limit, offset=offset, days=bucket)
+    videos, total = await fetch_trending_page(limit=limit, offset=offset, days=days)
     last_page = max(1, (total + per_page - 1) // per_page)
 
     # build small window of page numbers around current page
@@ -89,15 +109,8 @@ async def trending(
     end = min(last_page, page + 2)
     page_numbers = list(range(start, end + 1))
 
-    return templates.TemplateResponse(
-        "trending.html",
+    return templates.get_template("partials/trending_grid.html").render(
         {
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
-            "request": request,
-            "current_user": get_current_user(request),
             "videos": videos,
             "videos_count": len(videos),
             "total": total,
@@ -105,10 +118,8 @@ async def trending(
             "per_page": per_page,
             "last_page": last_page,
             "page_numbers": page_numbers,
-            "days": bucket,
-            "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
-        },
-        headers={"Cache-Control": "no-store"},
+            "days": days,
+        }
     )
 
 
@@ -131,13 +142,13 @@ async def subscriptions(
             },
         )
 
-    conn = await get_conn()
+    conn = await get_read_conn()
     try:
         rows = await list_subscriptions(conn, user["user_uid"])
         channels = []
         for r in rows:
             d = dict(r)
-            d["avatar_url_small"] = _avatar_small_url(d.get("avatar_asset_path"))
+            d["avatar_url_small"] = _avatar_small_url(d.get("avatar_asset_path"), d.get("user_uid"))
             channels.append(d)
     finally:
         await release_conn(conn)
@@ -145,10 +156,7 @@ async def subscriptions(
     return templates.TemplateResponse(
         "subscriptions.html",
         {
-            "brand_logo_url": settings.BRAND_LOGO_URL,
             "brand_tagline": settings.brand_tagline if hasattr(settings, "brand_tagline") else settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
             "request": request,
             "current_user": user,
             "channels": channels,
@@ -4,10 +4,9 @@ import secrets
 
 from fastapi import APIRouter, Form, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 
 from config.config import settings
-from db import get_conn, release_conn
+from db import get_conn, get_read_conn, release_conn
 from db.subscriptions_db import (
     count_subscribers,
     is_subscribed,
@@ -17,19 +16,17 @@ from db.subscriptions_db import (
 )
 from db.videos_db import list_author_public_videos
 from db.users_db import get_user_by_name_or_channel as db_get_user_by_name_or_channel
-from utils.format_ut import fmt_dt
 from utils.security_ut import get_current_user
 from utils.thumbs_ut import DEFAULT_THUMB_DATA_URI
 from utils.url_ut import build_storage_url
+from utils.templates_ut import templates
+from services.avatars_srv import avatar_small_url as _avatar_small_url
+from services.page_cache_srv import channel_scope, page_cache
 
 # --- Storage abstraction ---
 from services.ytstorage.base_srv import StorageClient
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
-templates.env.filters["dt"] = fmt_dt
-templates.env.globals["sitename"] = settings.SITENAME
-templates.env.globals["support_email"] = settings.SUPPORT_EMAIL
 
 # --- CSRF helpers ---
 
@@ -54,16 +51,6 @@ def _validate_csrf(request: Request, form_token: Optional[str]) -> bool:
 
 # --- Helpers ---
 
-def _avatar_small_url(avatar_path: Optional[str]) -> str:
-    if not avatar_path:
-        return "/static/img/avatar_default.svg"
-    if avatar_path.endswith("avatar.png"):
-        small_rel = avatar_path[: -len("avatar.png")] + "avatar_small.png"
-    else:
-        small_rel = avatar_path
-    return build_storage_url(small_rel)
-
-
 def _with_ver(url: Optional[str], ver: Optional[int]) -> Optional[str]:
     if not url:
         return url
@@ -90,7 +77,7 @@ def _augment(request: Request, vrow: Dict[str, Any]) -> Dict[str, Any]:
         v["thumb_anim_url"] = _with_ver(build_storage_url(anim_rel), ver) if os.path.isfile(abs_anim) else None
     else:
         v["thumb_anim_url"] = None
-    v["author_avatar_url_small"] = _avatar_small_url(v.get("avatar_asset_path"))
+    v["author_avatar_url_small"] = _avatar_small_url(v.get("avatar_asset_path"), v.get("author_uid"))
     return v
 
 
@@ -108,14 +95,10 @@ async def _render_channel(request: Request, owner: Optional[Dict[str, Any]]) ->
                 "request": request,
                 "current_user": user,
                 "owner": None,
-                "videos": [],
+                "grid_html": "",
                 "subscribers": 0,
                 "subscribed": False,
                 "csrf_token": csrf_token,
-                "brand_logo_url": settings.BRAND_LOGO_URL,
-                "brand_tagline": settings.BRAND_TAGLINE,
-                "favicon_url": settings.FAVICON_URL,
-                "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
                 "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
             },
             status_code=404,
@@ -124,30 +107,37 @@ async def _render_channel(request: Request, owner: Optional[Dict[str, Any]]) ->
             resp.set_cookie(settings.CSRF_COOKIE_NAME, csrf_token, httponly=False, secure=True, samesite="lax", path="/")
         return resp
 
-    conn = await get_conn()
+    conn = await get_read_conn()
     try:
         subs_cnt = await count_subscribers(conn, owner["user_uid"])
         subd = False
         user_uid = user.get("user_uid") if user else None
         if user_uid:
             subd = await is_subscribed(conn, user_uid, owner["user_uid"])
-        rows = await list_author_public_videos(conn, owner["user_uid"], limit=100, offset=0)
-        videos = [_augment(request, dict(r)) for r in rows]
     finally:
         await release_conn(conn)
 
+    async def _grid() -> str:
+        conn2 = await get_read_conn()
+        try:
+            rows = await list_author_public_videos(conn2, owner["user_uid"], limit=100, offset=0)
+        finally:
+            await release_conn(conn2)
+        videos = [_augment(request, dict(r)) for r in rows]
+        return templates.get_template("partials/channel_grid.html").render({"videos": videos})
+
+    grid_html = await page_cache.get_or_render(
+        "channel_grid", (owner["user_uid"],), (channel_scope(owner["user_uid"]),), _grid
+    )
+
     csrf_token = _get_csrf_cookie(request) or _gen_csrf_token()
     resp = templates.TemplateResponse(
         "channel.html",
         {
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
             "request": request,
             "current_user": user,
             "owner": owner,
-            "videos": videos,
+            "grid_html": grid_html,
             "subscribers": subs_cnt,
             "subscribed": subd,
             "csrf_token": csrf_token,
@@ -163,7 +153,7 @@ async def _render_channel(request: Request, owner: Optional[Dict[str, Any]]) ->
 
 @router.get("/@{username}", response_class=HTMLResponse)
 async def channel_by_username(request: Request, username: str) -> Any:
-    conn = await get_conn()
+    conn = await get_read_conn()
     try:
         owner = await _get_user_by_name_or_channel(conn, username)
     finally:
@@ -174,7 +164,7 @@ async def channel_by_username(request: Request, username: str) -> Any:
 @router.get("/c/{channel_id}", response_class=HTMLResponse)
 @router.get("/channel/{channel_id}", response_class=HTMLResponse)
 async def channel_by_id(request: Request, channel_id: str) -> Any:
-    conn = await get_conn()
+    conn = await get_read_conn()
     try:
         owner = await _get_user_by_name_or_channel(conn, channel_id)
     finally:
@@ -189,7 +179,7 @@ async def channel_by_id(request: Request, channel_id: str) -> Any:
 @router.get("/channel/{name}/subscribers", response_class=HTMLResponse)
 async def channel_subscribers(request: Request, name: str) -> Any:
     user = get_current_user(request)
-    conn = await get_conn()
+    conn = await get_read_conn()
     try:
         owner = await _get_user_by_name_or_channel(conn, name)
         if not owner:
@@ -2,10 +2,9 @@ from fastapi import APIRouter, Request, HTTPException
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
 
-from utils.security_ut import get_current_user
 from db import get_conn, release_conn
 from db.videos_db import get_video
-from db.users_db import get_user_by_uid
+from services.user_profile_srv import current_user_profile
 
 from services.ytcomments.client_srv import get_ytcomments_client, UserContext
 
@@ -24,31 +23,25 @@ class CreateCommentIn(BaseModel):
 
 @router.post("/create")
 async def create_comment_api(request: Request, data: CreateCommentIn) -> Dict[str, Any]:
-    user = get_current_user(request)
-    if not user:
+    profile = await current_user_profile(request)
+    if not profile:
         raise HTTPException(status_code=401, detail="auth_required")
 
-    current_uid = str(user["user_uid"])
+    current_uid = str(profile["user_uid"])
 
     conn = await get_conn()
     try:
         vrow = await get_video(conn, data.video_id)
-        user_row = await get_user_by_uid(conn, current_uid)
     finally:
         await release_conn(conn)
 
     if not vrow:
         raise HTTPException(status_code=404, detail="video_not_found")
 
-    username = ""
-    if user_row and user_row.get("username"):
-        username = str(user_row["username"] or "")
-
-    # TODO: if you have channel_id in user profile, pass it here too
     ctx = UserContext(
         user_uid=current_uid,
-        username=username or None,
-        channel_id=None,
+        username=profile["username"] or None,
+        channel_id=profile["channel_id"] or None,
         ip=(request.client.host if request.client else None),
         user_agent=str(request.headers.get("user-agent") or "") or None,
     )
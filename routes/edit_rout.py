@@ -9,7 +9,6 @@ import tempfile
 
 from fastapi import APIRouter, Form, HTTPException, Request, UploadFile, File, Query, BackgroundTasks
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 
 from config.config import settings
 from db import get_conn, release_conn
@@ -27,16 +26,15 @@ from services.ffmpeg_srv import (
     async_generate_animated_preview,
 )
 from services.search.indexer_srch import fire_and_forget_reindex, reindex_video
+from services.page_cache_srv import invalidate_videos
 from utils.security_ut import get_current_user
 from utils.url_ut import build_storage_url
+from utils.templates_ut import templates
 
 # --- Storage abstraction ---
 from services.ytstorage.base_srv import StorageClient
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
-templates.env.globals["sitename"] = settings.SITENAME
-templates.env.globals["support_email"] = settings.SUPPORT_EMAIL
 
 
 def _bool_from_form(val: Optional[str]) -> bool:
@@ -154,6 +152,8 @@ async def edit_page(request: Request, v: str = Query(..., min_length=12, max_len
 
         tap = video.get("thumb_asset_path")
         video["thumb_url"] = build_storage_url(tap) if tap else None
+        sp = video.get("storage_path")
+        video["video_url"] = build_storage_url(f"{sp}/original.webm") if sp else None
 
         cats = await list_categories(conn)
         categories = [dict(c) for c in cats]
@@ -169,10 +169,6 @@ async def edit_page(request: Request, v: str = Query(..., min_length=12, max_len
     resp = templates.TemplateResponse(
         "manage/edit_video.html",
         {
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
             "request": request,
             "current_user": user,
             "video": video,
@@ -244,6 +240,7 @@ async def edit_meta(
         )
     finally:
         await release_conn(conn)
+    await invalidate_videos(user["user_uid"])
 
     background_tasks.add_task(reindex_video, video_id)
     return RedirectResponse(f"/manage/edit?v={video_id}", status_code=302)
@@ -421,6 +418,7 @@ async def regen_thumbs(
         except Exception:
             pass
 
+    await invalidate_videos(user["user_uid"])
     return RedirectResponse(f"/manage/edit?v={video_id}", status_code=302)
 
 
@@ -473,6 +471,7 @@ async def upload_thumbs(
             await upsert_video_asset(conn, video_id, "thumbnail_anim", anim_rel)
     finally:
         await release_conn(conn)
+    await invalidate_videos(user["user_uid"])
 
     return RedirectResponse(f"/manage/edit?v={video_id}", status_code=302)
 
@@ -551,10 +550,6 @@ async def pick_thumb_page(request: Request, v: str = Query(..., min_length=12, m
     resp = templates.TemplateResponse(
         "manage/pick_thumbnail.html",
         {
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
             "request": request,
             "current_user": user,
             "video": video,
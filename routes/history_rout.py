@@ -1,32 +1,26 @@
 import secrets
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 import os
-import asyncio
 
 from fastapi import APIRouter, Form, Request, Query
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 
 from config.config import settings
-from db import get_conn, release_conn
+from db import get_read_conn, release_conn
 from db.videos_db import count_history_distinct_latest, list_history_distinct_latest
 from db.history_db import clear_history, remove_history_item
 from utils.url_ut import build_storage_url
 from utils.security_ut import get_current_user
 from utils.thumbs_ut import DEFAULT_THUMB_DATA_URI
-from utils.format_ut import fmt_dt
+from utils.templates_ut import templates
 
 # --- Pagination utilities ---
 from utils.pagination_ut import normalize_page, normalize_page_size, build_page_range
 
 # --- Storage abstraction ---
-from services.ytstorage.base_srv import StorageClient
+from services.ytstorage.base_srv import StorageClient, storage_exists_many
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
-templates.env.filters["dt"] = fmt_dt
-templates.env.globals["sitename"] = settings.SITENAME
-templates.env.globals["support_email"] = settings.SUPPORT_EMAIL
 
 
 # --- CSRF helpers ---
@@ -61,15 +55,19 @@ def _validate_csrf(request: Request, form_token: Optional[str]) -> bool:
 
 # --- Helpers ---
 
-async def _augment(vrow: dict, storage_client: StorageClient) -> dict:
+def _anim_rel(vrow: dict) -> Optional[str]:
+    tap = vrow.get("thumb_asset_path")
+    if tap and "/" in tap:
+        return tap.rsplit("/", 1)[0] + "/thumb_anim.webp"
+    return None
+
+
+def _augment(vrow: dict, anim_exists: Dict[str, bool]) -> dict:
     v = dict(vrow)
     tap = v.get("thumb_asset_path")
     v["thumb_url"] = build_storage_url(tap) if tap else DEFAULT_THUMB_DATA_URI
-    if tap and "/" in tap:
-        anim_rel = tap.rsplit("/", 1)[0] + "/thumb_anim.webp"
-        v["thumb_anim_url"] = build_storage_url(anim_rel) if await storage_client.exists(anim_rel) else None
-    else:
-        v["thumb_anim_url"] = None
+    anim_rel = _anim_rel(v)
+    v["thumb_anim_url"] = build_storage_url(anim_rel) if anim_rel and anim_exists.get(anim_rel) else None
     return v
 
 
@@ -102,10 +100,6 @@ async def history_page(
                 "prev_page": None,
                 "next_page": None,
                 "page_items": [],
-                "brand_logo_url": settings.BRAND_LOGO_URL,
-                "brand_tagline": settings.BRAND_TAGLINE,
-                "favicon_url": settings.FAVICON_URL,
-                "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
                 "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
             },
         )
@@ -124,15 +118,18 @@ async def history_page(
     page_size = normalize_page_size(page_size)
     offset = (page - 1) * page_size
 
-    conn = await get_conn()
+    conn = await get_read_conn()
     try:
         total = await count_history_distinct_latest(conn, user["user_uid"])
         rows = await list_history_distinct_latest(conn, user["user_uid"], limit=page_size, offset=offset)
-        storage_client: StorageClient = request.app.state.storage
-        videos = await asyncio.gather(*[_augment(dict(r), storage_client) for r in rows])
     finally:
         await release_conn(conn)
 
+    storage_client: StorageClient = request.app.state.storage
+    rows = [dict(r) for r in rows]
+    anim_exists = await storage_exists_many(storage_client, [x for x in map(_anim_rel, rows) if x])
+    videos = [_augment(r, anim_exists) for r in rows]
+
     # Compute pagination
     total_pages = max(1, (total + page_size - 1) // page_size)
     has_prev = page > 1
@@ -169,10 +166,6 @@ async def history_page(
             "prev_page": (page - 1) if has_prev else None,
             "next_page": (page + 1) if has_next else None,
             "page_items": page_items,
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
             "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
         },
     )
@@ -15,7 +15,6 @@ from typing import Any, Dict, List, Optional
 import json
 from fastapi import APIRouter, Request, HTTPException, Query
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, Field
 
 from config.config import settings
@@ -27,15 +26,14 @@ from db.videos_query_db import (
     set_video_embed_params_raw as db_set_video_embed_params_raw,
 )
 from db.videos_db import get_video as db_get_video
-from db.user_assets_db import get_user_avatar_path
+from services.avatars_srv import get_avatar_small_urls
 from db.users_db import get_usernames_by_uids
-from utils.url_ut import build_storage_url
 from utils.security_ut import get_current_user
+from utils.templates_ut import templates
 
 from services.ytcomments.ytcomments_adapter import fetch_root, build_tree_payload
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 
 @router.get("/manage/comments", response_class=HTMLResponse)
@@ -59,10 +57,6 @@ async def comments_admin_page(request: Request, v: str = Query(..., min_length=1
     return templates.TemplateResponse(
         "manage/comments.html",
         {
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
             "request": request,
             "current_user": user,
             "video_id": video_id,
@@ -199,16 +193,7 @@ async def api_comments_users_get(request: Request, v: str = Query(..., min_lengt
         uids = list(counts.keys())
         if uids:
             names = await get_usernames_by_uids(conn, uids)
-            for au in uids:
-                p = await get_user_avatar_path(conn, au)
-                if p:
-                    if p.endswith("avatar.png"):
-                        small_rel = p[: -len("avatar.png")] + "avatar_small.png"
-                        avatars[au] = build_storage_url(small_rel)
-                    else:
-                        avatars[au] = build_storage_url(p)
-                else:
-                    avatars[au] = "/static/img/avatar_default.svg"
+            avatars = await get_avatar_small_urls(conn, uids)
     finally:
         await release_conn(conn)
 
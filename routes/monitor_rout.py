@@ -0,0 +1,48 @@
+import hmac
+
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from config.config import settings
+from services.monitor.loop_monitor import loop_monitor
+from services.monitor.metrics_srv import metrics
+from services.monitor.uptime import uptime
+from utils.security_ut import require_admin
+
+router = APIRouter()
+
+
+@router.get("/internal/monitor/loop")
+async def monitor_loop(request: Request):
+    """
+    Event loop lag and blocking-call stats of this worker (LOOP_MONITOR_ENABLED):
+    per-route stall counts and the stacks of the last stalls.
+    """
+    denied = await require_admin(request)
+    if denied:
+        return denied
+    return {"ok": True, "uptime_sec": round(uptime.uptime_sec(), 1), **loop_monitor.snapshot()}
+
+
+def _scraper_allowed(request: Request) -> bool:
+    token = settings.METRICS_TOKEN
+    if token:
+        auth = request.headers.get("authorization") or ""
+        return hmac.compare_digest(auth, f"Bearer {token}")
+    host = request.client.host if request.client else ""
+    return host in ("127.0.0.1", "::1")
+
+
+@router.get("/internal/metrics")
+async def monitor_metrics(request: Request):
+    """
+    Prometheus text format: HTTP/DB/gRPC latency histograms, error counters, db pool gauges.
+    Scrapers authenticate with METRICS_TOKEN (or come from loopback when it is not set); admins always can.
+    """
+    if not metrics.enabled:
+        return JSONResponse({"ok": False, "error": "metrics_disabled"}, status_code=404)
+    if not _scraper_allowed(request):
+        denied = await require_admin(request)
+        if denied:
+            return denied
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -4,7 +4,7 @@ from typing import Any, Dict, List
 import json
 
 from utils.security_ut import get_current_user
-from db import get_conn, release_conn
+from db import get_conn, get_read_conn, release_conn
 from db.notifications_db import (
     list_notifications,
     unread_count,
@@ -14,6 +14,7 @@ from db.notifications_db import (
     set_user_prefs,
 )
 from config.notifications_cfg import notifications_config
+from services.avatars_srv import get_avatar_small_urls
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
@@ -41,31 +42,43 @@ async def notifications_list(
     if not getattr(notifications_config, "ENABLED", True):
         return {"ok": True, "notifications": [], "unread": 0}
 
-    conn = await get_conn()
+    conn = await get_read_conn()
     try:
         rows = await list_notifications(conn, user["user_uid"], limit, offset)
-        items = []
-        for r in rows:
-            payload = r["payload"]
-            if isinstance(payload, str):
-                try:
-                    payload = json.loads(payload)
-                except Exception:
-                    payload = {}
-            items.append(
-                {
-                    "notif_id": str(r["notif_id"]),
-                    "type": r["type"],
-                    "payload": payload,
-                    "created_at": r["created_at"].isoformat(),
-                    "read_at": r["read_at"].isoformat() if r["read_at"] else None,
-                }
-            )
         uc = await unread_count(conn, user["user_uid"])
-        return {"ok": True, "notifications": items, "unread": uc}
     finally:
         await release_conn(conn)
 
+    items = []
+    for r in rows:
+        payload = r["payload"]
+        if isinstance(payload, str):
+            try:
+                payload = json.loads(payload)
+            except Exception:
+                payload = {}
+        items.append(
+            {
+                "notif_id": str(r["notif_id"]),
+                "type": r["type"],
+                "payload": payload,
+                "created_at": r["created_at"].isoformat(),
+                "read_at": r["read_at"].isoformat() if r["read_at"] else None,
+            }
+        )
+    actor_uids = [it["payload"].get("actor_uid") for it in items if isinstance(it["payload"], dict)]
+    # primary: the avatar path cache must not be filled from a lagging replica
+    conn = await get_conn()
+    try:
+        avatars = await get_avatar_small_urls(conn, [u for u in actor_uids if isinstance(u, str)])
+    finally:
+        await release_conn(conn)
+    for it in items:
+        au = it["payload"].get("actor_uid") if isinstance(it["payload"], dict) else None
+        if au in avatars:
+            it["actor_avatar_url"] = avatars[au]
+    return {"ok": True, "notifications": items, "unread": uc}
+
 @router.get("/unread-count")
 async def notifications_unread_count(request: Request) -> Any:
     user = get_current_user(request)
@@ -73,7 +86,7 @@ async def notifications_unread_count(request: Request) -> Any:
         raise HTTPException(status_code=401, detail="auth_required")
     if not getattr(notifications_config, "ENABLED", True):
         return {"ok": True, "unread": 0}
-    conn = await get_conn()
+    conn = await get_read_conn()
     try:
         uc = await unread_count(conn, user["user_uid"])
         return {"ok": True, "unread": uc}
@@ -1,15 +1,15 @@
 from typing import Any, Dict, List, Optional
-import io
 import inspect
 
 from fastapi import APIRouter, Request, HTTPException, UploadFile, File
 from fastapi.responses import JSONResponse, HTMLResponse
-from fastapi.templating import Jinja2Templates
 
 from config.config import settings
 from db import get_conn, release_conn
 from utils.security_ut import get_current_user
 from utils.url_ut import build_storage_url
+from utils.templates_ut import templates
+from services.images_srv import PLAYLIST_COVER_VARIANTS, ImageError, read_upload, render_variants, upload_variants
 from services.ytstorage.base_srv import StorageClient
 
 from db.playlists_db import (
@@ -37,9 +37,6 @@ from db.playlists_db import (
 
 router = APIRouter(prefix="/playlists", tags=["playlists"])
 
-templates = Jinja2Templates(directory="templates")
-templates.env.globals["sitename"] = settings.SITENAME
-templates.env.globals["support_email"] = settings.SUPPORT_EMAIL
 
 
 def _get_csrf_cookie(request: Request) -> str:
@@ -199,10 +196,6 @@ async def playlists_page(request: Request) -> Any:
         it["cover_url"] = build_storage_url(cov) if cov else None
 
     context = {
-        "brand_logo_url": settings.BRAND_LOGO_URL,
-        "brand_tagline": settings.BRAND_TAGLINE,
-        "favicon_url": settings.FAVICON_URL,
-        "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
         "request": request,
         "current_user": user,
         "playlists": items,
@@ -320,10 +313,6 @@ async def playlist_edit_page(request: Request, playlist_id: str) -> Any:
     cover_url = build_storage_url(pl.get("cover_asset_path")) if pl.get("cover_asset_path") else None
 
     context = {
-        "brand_logo_url": settings.BRAND_LOGO_URL,
-        "brand_tagline": settings.BRAND_TAGLINE,
-        "favicon_url": settings.FAVICON_URL,
-        "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
         "request": request,
         "current_user": user,
         "playlist": pl,
@@ -471,7 +460,7 @@ async def api_upload_cover(request: Request, playlist_id: str, file: UploadFile
     """
     Multipart: file=<image>
     Save the cover to storage: users/<USERID>/playlists/<PLAYLIST_ID>/cover.webp
-    Support for async/sync StorageClient, as in upload_rout.
+    Resized (480x270 center crop) off the event loop, see services.images_srv.
     """
     user = get_current_user(request)
     if not user:
@@ -480,52 +469,24 @@ async def api_upload_cover(request: Request, playlist_id: str, file: UploadFile
     if not _validate_csrf(request):
         raise HTTPException(status_code=403, detail="csrf_required")
 
-    data = await file.read()
+    try:
+        data = await read_upload(file)
+    except ImageError:
+        raise HTTPException(status_code=413, detail="file_too_large")
     if not data or len(data) < 10:
         raise HTTPException(status_code=400, detail="empty_file")
 
     storage: StorageClient = request.app.state.storage
     rel_dir = storage.join("users", user["user_uid"], "playlists", playlist_id)
-    rel_path = storage.join(rel_dir, "cover.webp")
+    rel_path = storage.join(rel_dir, PLAYLIST_COVER_VARIANTS[0].name)
 
     try:
-        from PIL import Image
-        img = Image.open(io.BytesIO(data)).convert("RGB")
-        target_w, target_h = 480, 270
-        img_ratio = img.width / img.height
-        target_ratio = target_w / target_h
-        if img_ratio > target_ratio:
-            new_w = int(img.height * target_ratio)
-            x0 = (img.width - new_w) // 2
-            img = img.crop((x0, 0, x0 + new_w, img.height))
-        else:
-            new_h = int(img.width / target_ratio)
-            y0 = (img.height - new_h) // 2
-            img = img.crop((0, y0, img.width, y0 + new_h))
-        img = img.resize((target_w, target_h), Image.LANCZOS)
-        buf = io.BytesIO()
-        img.save(buf, format="WEBP", quality=85)
-        out = buf.getvalue()
-    except Exception:
-        out = data
-
-    mkdirs_res = storage.mkdirs(rel_dir, exist_ok=True)
-    if inspect.isawaitable(mkdirs_res):
-        await mkdirs_res
-
-    writer_ctx = storage.open_writer(rel_path, overwrite=True)
-    if inspect.isawaitable(writer_ctx):
-        writer_ctx = await writer_ctx
+        outputs = await render_variants(data, PLAYLIST_COVER_VARIANTS)
+    except ImageError:
+        raise HTTPException(status_code=400, detail="invalid_image")
 
     try:
-        if hasattr(writer_ctx, "__aenter__"):
-            async with writer_ctx as w:
-                wr = w.write(out)
-                if inspect.isawaitable(wr):
-                    await wr
-        else:
-            with writer_ctx as w:
-                w.write(out)
+        await upload_variants(storage, rel_dir, outputs)
     except Exception:
         raise HTTPException(status_code=500, detail="storage_error")
 
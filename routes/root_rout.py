@@ -1,60 +1,26 @@
 from typing import Any, Dict, Optional, List, Tuple, Union
 import os
 import asyncio
-import inspect
 
 from fastapi import APIRouter, Request, Query
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
-from config.config import settings
-from db import get_conn, release_conn
+from db import get_read_conn, release_conn
 from db.videos_db import list_latest_public_videos_count, list_latest_public_videos
-from utils.format_ut import fmt_dt
 from utils.security_ut import get_current_user
+from utils.templates_ut import templates
 from utils.thumbs_ut import DEFAULT_THUMB_DATA_URI
 from utils.url_ut import build_storage_url
+from services.avatars_srv import avatar_small_url as _avatar_small_url
+from services.page_cache_srv import SCOPE_VIDEOS, page_cache
 
 # --- Pagination utilities ---
 from utils.pagination_ut import normalize_page, normalize_page_size, build_page_range
 
 # --- Storage abstraction ---
-from services.ytstorage.base_srv import StorageClient
+from services.ytstorage.base_srv import StorageClient, storage_exists_many
 
 router = APIRouter(tags=["root"])
-templates = Jinja2Templates(directory="templates")
-templates.env.filters["dt"] = fmt_dt
-templates.env.globals["sitename"] = settings.SITENAME
-templates.env.globals["support_email"] = settings.SUPPORT_EMAIL
-
-
-def _avatar_small_url(avatar_path: Optional[str]) -> str:
-    if not avatar_path:
-        return "/static/img/avatar_default.svg"
-    if avatar_path.endswith("avatar.png"):
-        small_rel = avatar_path[: -len("avatar.png")] + "avatar_small.png"
-    else:
-        small_rel = avatar_path
-    return build_storage_url(small_rel)
-
-
-async def _storage_exists(storage_client: StorageClient, rel: str) -> bool:
-    """
-    Safe exists check supporting both async and sync implementations.
-    """
-    fn = getattr(storage_client, "exists", None)
-    if not callable(fn):
-        return False
-    res = fn(rel)
-    if inspect.isawaitable(res):
-        try:
-            return bool(await res)
-        except Exception:
-            return False
-    try:
-        return bool(res)
-    except Exception:
-        return False
 
 
 def _with_ver(url: Optional[str], ver: Optional[int]) -> Optional[str]:
@@ -70,7 +36,19 @@ def _with_ver(url: Optional[str], ver: Optional[int]) -> Optional[str]:
     return f"{url}{sep}v={v}"
 
 
-async def _augment(vrow: Dict[str, Any], storage_client: StorageClient) -> Dict[str, Any]:
+def _legacy_anim_rel(vrow: Dict[str, Any]) -> Optional[str]:
+    """
+    Legacy static name of animated preview, checked only when DB has no anim asset.
+    """
+    if vrow.get("thumb_anim_asset_path"):
+        return None
+    thumb_path = vrow.get("thumb_asset_path")
+    if thumb_path and "/" in thumb_path:
+        return thumb_path.rsplit("/", 1)[0] + "/thumb_anim.webp"
+    return None
+
+
+def _augment(vrow: Dict[str, Any], anim_exists: Dict[str, bool]) -> Dict[str, Any]:
     v = dict(vrow)
     thumb_path = v.get("thumb_asset_path")
     ver = v.get("thumb_pref_offset")
@@ -78,16 +56,15 @@ async def _augment(vrow: Dict[str, Any], storage_client: StorageClient) -> Dict[
 
     # Prefer explicit DB asset path for animated preview, fall back to legacy static name.
     anim_asset = v.get("thumb_anim_asset_path")
+    anim_rel = _legacy_anim_rel(v)
     if anim_asset:
         v["thumb_anim_url"] = _with_ver(build_storage_url(anim_asset), ver)
-    elif thumb_path and "/" in thumb_path:
-        anim_rel = thumb_path.rsplit("/", 1)[0] + "/thumb_anim.webp"
-        exists = await _storage_exists(storage_client, anim_rel)
-        v["thumb_anim_url"] = _with_ver(build_storage_url(anim_rel), ver) if exists else None
+    elif anim_rel:
+        v["thumb_anim_url"] = _with_ver(build_storage_url(anim_rel), ver) if anim_exists.get(anim_rel) else None
     else:
         v["thumb_anim_url"] = None
 
-    v["author_avatar_url_small"] = _avatar_small_url(v.get("avatar_asset_path"))
+    v["author_avatar_url_small"] = _avatar_small_url(v.get("avatar_asset_path"), v.get("author_uid"))
     return v
 
 
@@ -150,18 +127,13 @@ def _build_page_items(page: int, total_pages: int, page_size: int) -> List[Dict[
     return items
 
 
-@router.get("/", response_class=HTMLResponse)
-async def index(
-        request: Request,
-        page: Optional[int] = Query(default=1, ge=1),
-        page_size: Optional[int] = Query(default=24, ge=6, le=96),
-    ) -> Any:
-    # Pagination
-    page = normalize_page(page)
-    page_size = normalize_page_size(page_size)
+async def _render_home_grid(request: Request, page: int, page_size: int) -> str:
+    """
+    Video grid + pagination of the home page: the same for every visitor, cached in page_cache.
+    """
     offset = (page - 1) * page_size
 
-    conn = await get_conn()
+    conn = await get_read_conn()
     try:
         total = await list_latest_public_videos_count(conn)  # get all public videos amount
         rows = await list_latest_public_videos(conn, limit=page_size, offset=offset)
@@ -179,31 +151,62 @@ async def index(
     # Storage client
     storage_client: StorageClient = request.app.state.storage
 
+    # Legacy anim previews: one batched existence check for the whole page
+    rows = [dict(r) for r in rows]
+    anim_exists = await storage_exists_many(storage_client, [x for x in map(_legacy_anim_rel, rows) if x])
+
     # Augment rows with URLs
     videos: List[Dict[str, Any]] = []
     for r in rows:
         try:
-            videos.append(await _augment(dict(r), storage_client))
+            videos.append(_augment(r, anim_exists))
         except Exception:
-            videos.append(dict(r))
-
-    context = {
-        "brand_logo_url": settings.BRAND_LOGO_URL,
-        "brand_tagline": settings.BRAND_TAGLINE,
-        "favicon_url": settings.FAVICON_URL,
-        "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
+            videos.append(r)
+
+    return templates.get_template("partials/home_grid.html").render(
+        {
+            "videos": videos,
+            "page": page,
+            "page_size": page_size,
+            "has_prev": has_prev,
+            "has_next": has_next,
+            "prev_page": prev_page,
+            "next_page": next_page,
+            "page_items": page_items,
+        }
+    )
+
+
+def _page_context(request: Request, current_user: Optional[Dict[str, Any]], grid_html: str) -> Dict[str, Any]:
+    return {
         "request": request,
-        "current_user": get_current_user(request),
-        "videos": videos,
-        "videos_count": len(videos),
-        "page": page,
-        "page_size": page_size,
-        "total": total,
-        "total_pages": total_pages,
-        "has_prev": has_prev,
-        "has_next": has_next,
-        "prev_page": prev_page,
-        "next_page": next_page,
-        "page_items": page_items,
+        "current_user": current_user,
+        "grid_html": grid_html,
     }
-    return templates.TemplateResponse("index.html", context)
\ No newline at end of file
+
+
+@router.get("/", response_class=HTMLResponse)
+async def index(
+        request: Request,
+        page: Optional[int] = Query(default=1, ge=1),
+        page_size: Optional[int] = Query(default=24, ge=6, le=96),
+    ) -> Any:
+    # Pagination
+    page = normalize_page(page)
+    page_size = normalize_page_size(page_size)
+
+    async def _grid() -> str:
+        return await _render_home_grid(request, page, page_size)
+
+    current_user = get_current_user(request)
+    if current_user is None:
+        # anonymous: the whole page is shared
+        async def _page() -> str:
+            grid_html = await page_cache.get_or_render("home_grid", (page, page_size), (SCOPE_VIDEOS,), _grid)
+            return templates.get_template("index.html").render(_page_context(request, None, grid_html))
+
+        html = await page_cache.get_or_render("home_page", (page, page_size), (SCOPE_VIDEOS,), _page)
+        return HTMLResponse(html)
+
+    grid_html = await page_cache.get_or_render("home_grid", (page, page_size), (SCOPE_VIDEOS,), _grid)
+    return templates.TemplateResponse("index.html", _page_context(request, current_user, grid_html))
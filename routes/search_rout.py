@@ -3,20 +3,17 @@ import datetime
 
 from fastapi import APIRouter, Query, Request
 from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
 
 from config.config import settings
 from services.search.search_client_srch import get_backend
 from services.search.settings_srch import settings as settings_srch
 from utils.security_ut import get_current_user
 from utils.url_ut import build_storage_url
-from db import get_conn, release_conn
+from utils.templates_ut import templates
+from db import get_read_conn, release_conn
 from db.search_db import fetch_video_assets_by_ids
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
-templates.env.globals["sitename"] = settings.SITENAME
-templates.env.globals["support_email"] = settings.SUPPORT_EMAIL
 
 
 def _page_args(page: int, per_page: int) -> Dict[str, int]:
@@ -42,7 +39,7 @@ async def _enrich_results(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         return rows
 
     # use db utility for bulk fetch instead of inline SQL here
-    conn = await get_conn()
+    conn = await get_read_conn()
     try:
         rows_db = await fetch_video_assets_by_ids(conn, ids)
         by_id: Dict[str, Dict[str, Any]] = {d["video_id"]: d for d in rows_db if d.get("video_id")}
@@ -109,10 +106,6 @@ async def search_page(
             "page": args["page"],
             "per_page": args["per_page"],
             "engine": settings_srch.BACKEND,
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
             "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
         },
     )
@@ -3,12 +3,9 @@ from typing import Any
 
 from fastapi import APIRouter, Request
 from fastapi.responses import FileResponse, HTMLResponse
-from fastapi.templating import Jinja2Templates
 from config.config import settings
+from utils.templates_ut import templates
 
-templates = Jinja2Templates(directory="templates")
-templates.env.globals["sitename"] = settings.SITENAME
-templates.env.globals["support_email"] = settings.SUPPORT_EMAIL
 
 router = APIRouter()
 
@@ -25,10 +22,6 @@ async def privacy_page(request: Request) -> Any:
     return templates.TemplateResponse(
         "auth/privacy.html",
         {
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
             "request": request,
             "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
         },
@@ -40,10 +33,6 @@ async def terms_page(request: Request) -> Any:
     return templates.TemplateResponse(
         "auth/terms.html",
         {
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
             "request": request,
             "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
         },
@@ -54,10 +43,6 @@ async def terms_page(request: Request) -> Any:
 async def about_page(request: Request) -> Any:
     return templates.TemplateResponse("about.html", 
         {
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
             "request": request,
             "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
         })
\ No newline at end of file
@@ -1,20 +1,20 @@
 import os
 import inspect
+import secrets
 import time
 import shutil
 import subprocess
 import asyncio
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile, BackgroundTasks
 from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
 
 from config.config import settings
 from config.ytstorage.ytstorage_cfg import YTSTORAGE_GRPC_ADDRESS, YTSTORAGE_GRPC_TOKEN
 
-from db import get_conn, release_conn
+from db import db_conn, get_conn, release_conn
 from db.assets_db import upsert_video_asset
 from db.categories_db import category_exists, list_categories
 from db.subscriptions_db import count_subscribers
@@ -31,10 +31,21 @@ from db.ytsprites.ytsprites_db import fetch_video_storage_path
 ##deprecated
 ##from db.comments.root_db import delete_all_comments_for_video
 from db.ytcms.captions_db import set_video_captions
+from db.upload_sessions_db import (
+    create_upload_session,
+    get_upload_session,
+    list_upload_parts,
+    upsert_upload_part,
+    set_upload_session_state,
+    list_expired_upload_sessions,
+    delete_upload_session,
+)
 
 ## Deprecated:
 ##from services.ytcms.captions_generation import generate_captions
-from services.ytsprites.ytsprites_client_srv import create_job_storage_driven, watch_status, get_result, create_thumbnails_job
+from services.ytsprites.ytsprites_client_srv import create_thumbnails_job
+from services.ytsprites.ytsprites_aio_client_srv import create_job_storage_driven
+from services.ytsprites.sprites_job_srv import follow_sprites_job
 from services.ffmpeg_srv import (
     async_generate_thumbnails,
     pick_thumbnail_offsets,
@@ -42,6 +53,7 @@ from services.ffmpeg_srv import (
     async_generate_animated_preview,
 )
 from services.search.indexer_srch import fire_and_forget_reindex, delete_from_index
+from services.page_cache_srv import invalidate_videos
 from utils.idgen_ut import gen_id
 from utils.security_ut import get_current_user
 from utils.url_ut import build_storage_url
@@ -54,10 +66,10 @@ from utils.ytstorage.path_ut import build_video_storage_rel
 # --- ytconvert (stage 0) ---
 from services.ytconvert.ytconvert_runner_srv import schedule_ytconvert_job
 from utils.ytconvert.variants_ut import compute_suggested_variants, expand_requested_variant_ids
+from utils.templates_ut import templates
 
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 
 # ---------- CSRF (multipart route-level) ----------
@@ -246,10 +258,6 @@ async def manage_home(request: Request) -> Any:
     return templates.TemplateResponse(
         "manage/my_videos.html",
         {
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
             "request": request,
             "current_user": user,
             "videos": videos,
@@ -288,6 +296,7 @@ async def manage_delete(
             raise HTTPException(status_code=404, detail="Video not found")
     finally:
         await release_conn(conn)
+    await invalidate_videos(user["user_uid"])
 
     storage_client: StorageClient = request.app.state.storage
     asyncio.create_task(
@@ -300,152 +309,36 @@ async def manage_delete(
     return RedirectResponse("/manage", status_code=302)
 
 
-# ---------- Upload ----------
-
-@router.get("/upload", response_class=HTMLResponse)
-async def upload_page(request: Request) -> Any:
-    user = get_current_user(request)
-    if not user:
-        return RedirectResponse("/auth/login", status_code=302)
-
-    conn = await get_conn()
-    try:
-        cats = await list_categories(conn)
-    finally:
-        await release_conn(conn)
-
-    csrf_token = _csrf_cookie(request)
-
-    return templates.TemplateResponse(
-        "manage/upload.html",
-        {
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
-            "request": request,
-            "current_user": user,
-            "categories": cats,
-            "csrf_token": csrf_token,
-            "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
-            # stage-0 placeholder (empty)
-            "suggested_variants": [],
-        },
-        headers={"Cache-Control": "no-store"},
-    )
-
-
-@router.post("/upload", response_class=HTMLResponse)
-async def upload_video(
+async def _finish_upload(
     request: Request,
-    file: UploadFile = File(...),
-    title: str = Form(""),
-    description: str = Form(""),
-    status: str = Form("private"),
-    category_id: Optional[str] = Form(None),
-    permit_download: bool = Form(False),
-    is_age_restricted: bool = Form(False),
-    is_made_for_kids: bool = Form(False),
-    generate_captions_flag: Optional[int] = Form(0, alias="generate_captions"),
-    captions_lang: str = Form("auto"),
-    ytconvert_variants: Optional[List[str]] = Form(None),
-    csrf_token: Optional[str] = Form(None),
-) -> Any:
+    user: Dict[str, Any],
+    *,
+    video_id: str,
+    storage_rel: str,
+    original_rel_path: str,
+    fields: Dict[str, Any],
+    requested_variants: List[str],
+    generate_captions_flag: Any,
+    captions_lang: str,
+    local_original_abs: Optional[str] = None,
+) -> Tuple[List[Dict[str, str]], List[Any], Dict[str, Any]]:
+    """
+    Post-write upload pipeline shared by the multipart and resumable uploads:
+    meta.json, DB record, ytconvert job, probe, thumbnails, animated preview, sprites.
+    - local_original_abs: local copy of the original written while uploading;
+      when given the original is not read back from storage; its directory is removed when the pipeline
+      ends, on failure too
+    DB connections are taken per step, never across storage I/O, ffmpeg or ytsprites calls.
+    Returns (thumbnail candidates, suggested ytconvert variants, source info).
+    """
     import tempfile
-    import shutil
-
-    user = get_current_user(request)
-    if not user:
-        return RedirectResponse("/auth/login", status_code=302)
-
-    if not _validate_csrf_multipart(request, csrf_token):
-        return JSONResponse({"ok": False, "error": "csrf_required"}, status_code=403)
-
-    if status not in ("public", "private", "unlisted"):
-        raise HTTPException(status_code=400, detail="Invalid status")
 
-    title_final = (title or "").strip() or _fallback_title(file)
-    cat_id: Optional[str] = (category_id or "").strip() or None
+    storage_client: StorageClient = request.app.state.storage
+    original_name = "original.webm"
+    # local copy of the original, thumbnails and the animated preview; removed however the pipeline ends
+    tmp_dir = os.path.dirname(local_original_abs) if local_original_abs else tempfile.mkdtemp(prefix="yt_up_")
 
-    conn = await get_conn()
     try:
-        cats = await list_categories(conn)
-        if cat_id is not None and not await category_exists(conn, cat_id):
-            form_data: Dict[str, Any] = {
-                "title": title_final,
-                "description": description,
-                "status": status,
-                "category_id": cat_id,
-                "permit_download": bool(permit_download),
-                "is_age_restricted": is_age_restricted,
-                "is_made_for_kids": is_made_for_kids,
-            }
-            return templates.TemplateResponse(
-                "manage/upload.html",
-                {
-                    "brand_logo_url": settings.BRAND_LOGO_URL,
-                    "brand_tagline": settings.BRAND_TAGLINE,
-                    "favicon_url": settings.FAVICON_URL,
-                    "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
-                    "request": request,
-                    "current_user": user,
-                    "categories": cats,
-                    "error": "Selected category does not exist.",
-                    "form": form_data,
-                    "csrf_token": _csrf_cookie(request),
-                    "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
-                    "suggested_variants": [],
-                },
-                status_code=400,
-                headers={"Cache-Control": "no-store"},
-            )
-
-        video_id = gen_id(12)
-
-        # --- ytconvert job request ---
-        requested_variants: List[str] = []
-        if ytconvert_variants:
-            try:
-                requested_variants = [str(x).strip() for x in ytconvert_variants if str(x).strip()]
-            except Exception:
-                requested_variants = []
-        if requested_variants:
-            requested_variants = expand_requested_variant_ids(requested_variants)
-        if requested_variants:
-            print(f"[UPLOAD] ytconvert requested_variants={requested_variants} video_id={video_id}")
-        # --- /ytconvert job request ---
-
-        storage_client: StorageClient = request.app.state.storage
-        storage_rel = build_video_storage_rel(video_id)
-
-        mkdirs_res = storage_client.mkdirs(storage_rel, exist_ok=True)
-        if inspect.isawaitable(mkdirs_res):
-            await mkdirs_res
-
-        original_name = "original.webm"
-        original_rel_path = storage_client.join(storage_rel, original_name)
-
-        writer_ctx = storage_client.open_writer(original_rel_path, overwrite=True)
-        if inspect.isawaitable(writer_ctx):
-            writer_ctx = await writer_ctx
-
-        if hasattr(writer_ctx, "__aenter__"):
-            async with writer_ctx as out:
-                while True:
-                    chunk = await file.read(1024 * 1024)
-                    if not chunk:
-                        break
-                    wr = out.write(chunk)
-                    if inspect.isawaitable(wr):
-                        await wr
-        else:
-            with writer_ctx as out:
-                while True:
-                    chunk = await file.read(1024 * 1024)
-                    if not chunk:
-                        break
-                    out.write(chunk)
-
         meta_rel_path = storage_client.join(storage_rel, "meta.json")
 
         exists_res = storage_client.exists(meta_rel_path)
@@ -469,59 +362,63 @@ async def upload_video(
                 with writer_ctx2 as f:
                     f.write(payload)
 
-        # DB record uses relative storage path!!
-        await create_video(
-            conn=conn,
-            video_id=video_id,
-            author_uid=user["user_uid"],
-            title=title_final,
-            description=description,
-            status=status,
-            storage_path=storage_rel,
-            category_id=cat_id,
-            permit_download=bool(permit_download),
-            is_age_restricted=is_age_restricted,
-            is_made_for_kids=is_made_for_kids,
-        )
-
         local_job_id = None
-        if requested_variants:
-            try:
-                local_job_id = await create_ytconvert_job(
-                    conn=conn,
-                    video_id=video_id,
-                    author_uid=user["user_uid"],
-                    requested_variants=requested_variants,
-                )
-            except Exception as e:
-                print(f"[YTCONVERT] integration error local_job_id={local_job_id} exc={e!r}")
+        async with db_conn() as conn:
+            # DB record uses relative storage path!!
+            await create_video(
+                conn=conn,
+                video_id=video_id,
+                author_uid=user["user_uid"],
+                title=fields["title"],
+                description=fields.get("description") or "",
+                status=fields["status"],
+                storage_path=storage_rel,
+                category_id=fields.get("category_id"),
+                permit_download=bool(fields.get("permit_download")),
+                is_age_restricted=bool(fields.get("is_age_restricted")),
+                is_made_for_kids=bool(fields.get("is_made_for_kids")),
+            )
+
+            if requested_variants:
+                try:
+                    local_job_id = await create_ytconvert_job(
+                        conn=conn,
+                        video_id=video_id,
+                        author_uid=user["user_uid"],
+                        requested_variants=requested_variants,
+                    )
+                except Exception as e:
+                    print(f"[YTCONVERT] integration error local_job_id={local_job_id} exc={e!r}")
 
         storage_abs_root = storage_client.to_abs("")
         original_abs_path_storage = storage_client.to_abs(original_rel_path)
 
         is_local_mode = os.path.exists(original_abs_path_storage)
 
-        tmp_dir = None
         original_abs_path = original_abs_path_storage
 
-        if not is_local_mode:
-            tmp_dir = tempfile.mkdtemp(prefix="yt_up_")
+        if not is_local_mode and local_original_abs and os.path.exists(local_original_abs):
+            original_abs_path = local_original_abs
+        elif not is_local_mode:
             original_abs_path = os.path.join(tmp_dir, original_name)
 
             reader_ctx = storage_client.open_reader(original_rel_path)
             if inspect.isawaitable(reader_ctx):
                 reader_ctx = await reader_ctx
 
-            if hasattr(reader_ctx, "__aiter__") or hasattr(reader_ctx, "__anext__"):
-                async for chunk in reader_ctx:
-                    if chunk:
-                        with open(original_abs_path, "ab") as lf:
-                            lf.write(chunk)
-            else:
-                for chunk in reader_ctx:
-                    if chunk:
-                        with open(original_abs_path, "ab") as lf:
-                            lf.write(chunk)
+            loop = asyncio.get_running_loop()
+            lf = await loop.run_in_executor(None, open, original_abs_path, "wb")
+            try:
+                if hasattr(reader_ctx, "__aiter__") or hasattr(reader_ctx, "__anext__"):
+                    async for chunk in reader_ctx:
+                        if chunk:
+                            await loop.run_in_executor(None, lf.write, chunk)
+                else:
+                    for chunk in reader_ctx:
+                        if chunk:
+                            await loop.run_in_executor(None, lf.write, chunk)
+            finally:
+                await loop.run_in_executor(None, lf.close)
 
         duration = await async_probe_duration_seconds(original_abs_path)
 
@@ -540,7 +437,7 @@ async def upload_video(
             thumbs_abs_dir = storage_client.to_abs(thumbs_rel_dir)
         else:
             thumbs_rel_dir = storage_client.join(storage_rel, "thumbs")
-            thumbs_abs_dir = os.path.join(tmp_dir or tempfile.gettempdir(), "thumbs")
+            thumbs_abs_dir = os.path.join(tmp_dir, "thumbs")
         os.makedirs(thumbs_abs_dir, exist_ok=True)
 
         candidates_abs: List[str] = []
@@ -557,7 +454,8 @@ async def upload_video(
             selected_abs: Optional[str] = candidates_abs[0] if candidates_abs else None
             selected_rel = (os.path.relpath(selected_abs, storage_abs_root) if selected_abs else None)
             if selected_rel:
-                await upsert_video_asset(conn, video_id, "thumbnail_default", selected_rel)
+                async with db_conn() as conn:
+                    await upsert_video_asset(conn, video_id, "thumbnail_default", selected_rel)
             for p_abs in candidates_abs:
                 rel = os.path.relpath(p_abs, storage_abs_root)
                 candidates.append({"rel": rel, "url": build_storage_url(rel), "sel": "1" if selected_rel == rel else "0"})
@@ -595,7 +493,8 @@ async def upload_video(
 
             selected_rel = uploaded_rels[0] if uploaded_rels else None
             if selected_rel:
-                await upsert_video_asset(conn, video_id, "thumbnail_default", selected_rel)
+                async with db_conn() as conn:
+                    await upsert_video_asset(conn, video_id, "thumbnail_default", selected_rel)
             for remote_rel in uploaded_rels:
                 candidates.append({"rel": remote_rel, "url": build_storage_url(remote_rel), "sel": "1" if selected_rel == remote_rel else "0"})
 
@@ -605,10 +504,10 @@ async def upload_video(
             original_abs_path, anim_abs_local, start_sec=start_sec, duration_sec=3, fps=12
         )
 
+        anim_rel_db: Optional[str] = None
         if ok_anim and os.path.exists(anim_abs_local):
             if is_local_mode:
-                anim_rel = os.path.relpath(anim_abs_local, storage_abs_root)
-                await upsert_video_asset(conn, video_id, "thumbnail_anim", anim_rel)
+                anim_rel_db = os.path.relpath(anim_abs_local, storage_abs_root)
             else:
                 anim_rel_remote = storage_client.join(thumbs_rel_dir, "thumb_anim.webp")
                 writer_ctx_anim = storage_client.open_writer(anim_rel_remote, overwrite=True)
@@ -632,9 +531,13 @@ async def upload_video(
                                 if not chunk:
                                     break
                                 f.write(chunk)
-                await upsert_video_asset(conn, video_id, "thumbnail_anim", anim_rel_remote)
+                anim_rel_db = anim_rel_remote
 
-        await set_video_ready(conn, video_id, duration)
+        async with db_conn() as conn:
+            if anim_rel_db:
+                await upsert_video_asset(conn, video_id, "thumbnail_anim", anim_rel_db)
+            await set_video_ready(conn, video_id, duration)
+        await invalidate_videos(user["user_uid"])
 
         if local_job_id and requested_variants:
             try:
@@ -665,16 +568,19 @@ async def upload_video(
                         reader_ctx_local = storage_client.open_reader(original_rel_path)
                         if inspect.isawaitable(reader_ctx_local):
                             reader_ctx_local = await reader_ctx_local
-                        if hasattr(reader_ctx_local, "__aiter__") or hasattr(reader_ctx_local, "__anext__"):
-                            async for _chunk in reader_ctx_local:
-                                if _chunk:
-                                    with open(src_for_caps, "ab") as _lf:
-                                        _lf.write(_chunk)
-                        else:
-                            for _chunk in reader_ctx_local:
-                                if _chunk:
-                                    with open(src_for_caps, "ab") as _lf:
-                                        _lf.write(_chunk)
+                        _loop = asyncio.get_running_loop()
+                        _lf = await _loop.run_in_executor(None, open, src_for_caps, "wb")
+                        try:
+                            if hasattr(reader_ctx_local, "__aiter__") or hasattr(reader_ctx_local, "__anext__"):
+                                async for _chunk in reader_ctx_local:
+                                    if _chunk:
+                                        await _loop.run_in_executor(None, _lf.write, _chunk)
+                            else:
+                                for _chunk in reader_ctx_local:
+                                    if _chunk:
+                                        await _loop.run_in_executor(None, _lf.write, _chunk)
+                        finally:
+                            await _loop.run_in_executor(None, _lf.close)
                     try:
                         rel_vtt, meta = await generate_captions(
                             video_id=video_id,
@@ -683,11 +589,8 @@ async def upload_video(
                             lang=lang_req or "auto",
                             storage_client=storage_client,
                         )
-                        conn2 = await get_conn()
-                        try:
+                        async with db_conn() as conn2:
                             await set_video_captions(conn2, video_id, rel_vtt, meta.get("lang") or lang_req, meta)
-                        finally:
-                            await release_conn(conn2)
                         print(f"[UPLOAD] captions generated video_id={video_id} lang={meta.get('lang')}")
                     except Exception as e:
                         print(f"[UPLOAD] captions generation failed video_id={video_id}: {e}")
@@ -708,7 +611,8 @@ async def upload_video(
             min_dur = getattr(settings, "AUTO_SPRITES_MIN_DURATION", 3)
             auto_enabled = getattr(settings, "AUTO_SPRITES_ENABLED", True)
             if auto_enabled and (isinstance(duration, (int, float)) and duration >= min_dur):
-                storage_rel_db = await fetch_video_storage_path(conn, video_id, ensure_ready=True)
+                async with db_conn() as conn:
+                    storage_rel_db = await fetch_video_storage_path(conn, video_id, ensure_ready=True)
                 if storage_rel_db:
                     original_abs_for_job = storage_client.to_abs(storage_client.join(storage_rel_db, "original.webm"))
                     out_base_abs = storage_client.to_abs(storage_rel_db)
@@ -722,7 +626,7 @@ async def upload_video(
                         )
                         '''
                         ############
-                        job_id, job_server = create_job_storage_driven(
+                        job_id, job_server = await create_job_storage_driven(
                             video_id=video_id,
                             source_storage_addr=YTSTORAGE_GRPC_ADDRESS,
                             source_rel_path=f"{storage_rel_db}/original.webm".lstrip("/"),
@@ -732,17 +636,10 @@ async def upload_video(
                             filename="original.webm",
                             storage_token=YTSTORAGE_GRPC_TOKEN,
                         )
-                        watch_status(job_id, job_server)
-                        rep = get_result(job_id, job_server)
-                        if rep.state == rep.JOB_STATE_DONE:
-                            if rep.vtt and rep.vtt.rel_path:
-                                await upsert_video_asset(conn, video_id, "thumbs_vtt", rep.vtt.rel_path)
-                            for idx, art in enumerate(rep.sprites, start=1):
-                                if art.rel_path:
-                                    await upsert_video_asset(conn, video_id, f"sprite:{idx}", art.rel_path)
-                            await mark_thumbnails_ready(conn, video_id)
+                        # the job runs on its own; assets are recorded by the background watcher
+                        follow_sprites_job(video_id, job_id, job_server)
                         ############
-                        print(f"[AUTOSPRITES] queued video_id={video_id} job={job.get('job_id')}")
+                        print(f"[AUTOSPRITES] enqueued video_id={video_id} job={job_id} server={job_server}")
                     else:
                         print(f"[AUTOSPRITES] original missing for video_id={video_id}")
                 else:
@@ -752,29 +649,208 @@ async def upload_video(
         except Exception as e:
             print(f"[AUTOSPRITES] failed to enqueue video_id={video_id}: {e}")
 
-        if not is_local_mode and tmp_dir and os.path.isdir(tmp_dir):
-            try:
-                shutil.rmtree(tmp_dir)
-            except Exception:
-                pass
+        return candidates, suggested_variants, src_info
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
 
+# ---------- Upload ----------
+
+@router.get("/upload", response_class=HTMLResponse)
+async def upload_page(request: Request) -> Any:
+    user = get_current_user(request)
+    if not user:
+        return RedirectResponse("/auth/login", status_code=302)
+
+    conn = await get_conn()
+    try:
+        cats = await list_categories(conn)
     finally:
         await release_conn(conn)
 
+    csrf_token = _csrf_cookie(request)
+
+    return templates.TemplateResponse(
+        "manage/upload.html",
+        {
+            "request": request,
+            "current_user": user,
+            "categories": cats,
+            "csrf_token": csrf_token,
+            "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
+            "upload_resumable": bool(getattr(settings, "UPLOAD_RESUMABLE_ENABLED", False)),
+            # stage-0 placeholder (empty)
+            "suggested_variants": [],
+        },
+        headers={"Cache-Control": "no-store"},
+    )
+
+
+@router.post("/upload", response_class=HTMLResponse)
+async def upload_video(
+    request: Request,
+    file: UploadFile = File(...),
+    title: str = Form(""),
+    description: str = Form(""),
+    status: str = Form("private"),
+    category_id: Optional[str] = Form(None),
+    permit_download: bool = Form(False),
+    is_age_restricted: bool = Form(False),
+    is_made_for_kids: bool = Form(False),
+    generate_captions_flag: Optional[int] = Form(0, alias="generate_captions"),
+    captions_lang: str = Form("auto"),
+    ytconvert_variants: Optional[List[str]] = Form(None),
+    csrf_token: Optional[str] = Form(None),
+) -> Any:
+    import tempfile
+    import shutil
+
+    user = get_current_user(request)
+    if not user:
+        return RedirectResponse("/auth/login", status_code=302)
+
+    if not _validate_csrf_multipart(request, csrf_token):
+        return JSONResponse({"ok": False, "error": "csrf_required"}, status_code=403)
+
+    if status not in ("public", "private", "unlisted"):
+        raise HTTPException(status_code=400, detail="Invalid status")
+
+    title_final = (title or "").strip() or _fallback_title(file)
+    cat_id: Optional[str] = (category_id or "").strip() or None
+
+    async with db_conn() as conn:
+        cats = await list_categories(conn)
+        cat_missing = cat_id is not None and not await category_exists(conn, cat_id)
+
+    if cat_missing:
+        form_data: Dict[str, Any] = {
+            "title": title_final,
+            "description": description,
+            "status": status,
+            "category_id": cat_id,
+            "permit_download": bool(permit_download),
+            "is_age_restricted": is_age_restricted,
+            "is_made_for_kids": is_made_for_kids,
+        }
+        return templates.TemplateResponse(
+            "manage/upload.html",
+            {
+                "request": request,
+                "current_user": user,
+                "categories": cats,
+                "error": "Selected category does not exist.",
+                "form": form_data,
+                "csrf_token": _csrf_cookie(request),
+                "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
+                "suggested_variants": [],
+            },
+            status_code=400,
+            headers={"Cache-Control": "no-store"},
+        )
+
+    video_id = gen_id(12)
+
+    # --- ytconvert job request ---
+    requested_variants: List[str] = []
+    if ytconvert_variants:
+        try:
+            requested_variants = [str(x).strip() for x in ytconvert_variants if str(x).strip()]
+        except Exception:
+            requested_variants = []
+    if requested_variants:
+        requested_variants = expand_requested_variant_ids(requested_variants)
+    if requested_variants:
+        print(f"[UPLOAD] ytconvert requested_variants={requested_variants} video_id={video_id}")
+    # --- /ytconvert job request ---
+
+    storage_client: StorageClient = request.app.state.storage
+    storage_rel = build_video_storage_rel(video_id)
+
+    mkdirs_res = storage_client.mkdirs(storage_rel, exist_ok=True)
+    if inspect.isawaitable(mkdirs_res):
+        await mkdirs_res
+
+    original_name = "original.webm"
+    original_rel_path = storage_client.join(storage_rel, original_name)
+
+    writer_ctx = storage_client.open_writer(original_rel_path, overwrite=True)
+    if inspect.isawaitable(writer_ctx):
+        writer_ctx = await writer_ctx
+
+    # local copy is written in the same pass, so probing/thumbnails need no read back from storage
+    # (disk writes run in the default executor, off the event loop)
+    loop = asyncio.get_running_loop()
+    tmp_dir = tempfile.mkdtemp(prefix="yt_up_")
+    local_original_abs = os.path.join(tmp_dir, original_name)
+    try:
+        lf = await loop.run_in_executor(None, open, local_original_abs, "wb")
+        try:
+            if hasattr(writer_ctx, "__aenter__"):
+                async with writer_ctx as out:
+                    while True:
+                        chunk = await file.read(1024 * 1024)
+                        if not chunk:
+                            break
+                        wr = out.write(chunk)
+                        await loop.run_in_executor(None, lf.write, chunk)
+                        if inspect.isawaitable(wr):
+                            await wr
+            else:
+                with writer_ctx as out:
+                    while True:
+                        chunk = await file.read(1024 * 1024)
+                        if not chunk:
+                            break
+                        out.write(chunk)
+                        await loop.run_in_executor(None, lf.write, chunk)
+        finally:
+            await loop.run_in_executor(None, lf.close)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    candidates, suggested_variants, src_info = await _finish_upload(
+        request,
+        user,
+        video_id=video_id,
+        storage_rel=storage_rel,
+        original_rel_path=original_rel_path,
+        fields={
+            "title": title_final,
+            "description": description,
+            "status": status,
+            "category_id": cat_id,
+            "permit_download": bool(permit_download),
+            "is_age_restricted": is_age_restricted,
+            "is_made_for_kids": is_made_for_kids,
+        },
+        requested_variants=requested_variants,
+        generate_captions_flag=generate_captions_flag,
+        captions_lang=captions_lang,
+        local_original_abs=local_original_abs,
+    )
+
     try:
         fire_and_forget_reindex(video_id)
     except Exception:
         pass
 
+    return _render_select_thumbnail(request, user, video_id, candidates, suggested_variants, src_info)
+
+
+def _render_select_thumbnail(
+    request: Request,
+    user: Dict[str, Any],
+    video_id: str,
+    candidates: List[Dict[str, str]],
+    suggested_variants: List[Any],
+    src_info: Dict[str, Any],
+) -> Any:
     cookie_tok = _csrf_cookie(request)
     context_token = cookie_tok
     resp = templates.TemplateResponse(
         "manage/select_thumbnail.html",
         {
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
             "request": request,
             "current_user": user,
             "video_id": video_id,
@@ -790,6 +866,405 @@ async def upload_video(
     return resp
 
 
+# ---------- Resumable upload (sessions + parallel parts) ----------
+
+def _part_rel(storage_client: StorageClient, storage_rel: str, part_no: int) -> str:
+    return storage_client.join(storage_rel, "upload_parts", f"{int(part_no):05d}.part")
+
+
+async def _remove_quietly(storage_client: StorageClient, rel: str) -> None:
+    try:
+        res = storage_client.remove(rel)
+        if inspect.isawaitable(res):
+            await res
+    except Exception as e:
+        print(f"[UPLOAD] cleanup of {rel} failed: {e}")
+
+
+def _expected_part_size(sess: Dict[str, Any], part_no: int) -> int:
+    part_size = int(sess["part_size"])
+    if part_no < int(sess["total_parts"]) - 1:
+        return part_size
+    return int(sess["total_bytes"]) - part_size * (int(sess["total_parts"]) - 1)
+
+
+def _session_json(sess: Dict[str, Any], parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "ok": True,
+        "upload_id": sess["upload_id"],
+        "video_id": sess["video_id"],
+        "state": sess["state"],
+        "part_size": int(sess["part_size"]),
+        "total_parts": int(sess["total_parts"]),
+        "total_bytes": int(sess["total_bytes"]),
+        "parallel": max(1, int(getattr(settings, "UPLOAD_PARALLEL_PARTS", 4))),
+        "received": [int(p["part_no"]) for p in parts],
+    }
+
+
+async def _bg_cleanup_expired_sessions(storage_client: StorageClient) -> None:
+    conn = await get_conn()
+    try:
+        stale_sec = int(getattr(settings, "UPLOAD_SESSION_ASSEMBLE_STALE_SEC", 7200))
+        expired = await list_expired_upload_sessions(conn, stale_sec, limit=50)
+        for it in expired:
+            # a video row means the pipeline got that far: keep its files, drop only the parts
+            target = storage_client.join(it["storage_path"], "upload_parts") if it["has_video"] else it["storage_path"]
+            try:
+                res = storage_client.remove(target, recursive=True)  # type: ignore[call-arg]
+                if inspect.isawaitable(res):
+                    await res
+            except Exception as e:
+                print(f"[UPLOAD] expired session storage cleanup failed upload_id={it['upload_id']}: {e}")
+            await delete_upload_session(conn, it["upload_id"])
+    except Exception as e:
+        print(f"[UPLOAD] expired session cleanup failed: {e}")
+    finally:
+        await release_conn(conn)
+
+
+@router.post("/upload/sessions")
+async def upload_session_create(
+    request: Request,
+    filename: str = Form(""),
+    size: int = Form(...),
+    title: str = Form(""),
+    description: str = Form(""),
+    status: str = Form("private"),
+    category_id: Optional[str] = Form(None),
+    permit_download: bool = Form(False),
+    is_age_restricted: bool = Form(False),
+    is_made_for_kids: bool = Form(False),
+    generate_captions_flag: Optional[int] = Form(0, alias="generate_captions"),
+    captions_lang: str = Form("auto"),
+    ytconvert_variants: Optional[List[str]] = Form(None),
+    csrf_token: Optional[str] = Form(None),
+) -> Any:
+    """
+    Opens a resumable upload. Video metadata is taken here, the file follows as parts:
+    PUT /upload/sessions/{upload_id}/parts/{n} (any order, in parallel), then POST .../complete.
+    """
+    user = get_current_user(request)
+    if not user:
+        return JSONResponse({"ok": False, "error": "auth_required"}, status_code=401)
+    if not _validate_csrf_multipart(request, csrf_token):
+        return JSONResponse({"ok": False, "error": "csrf_required"}, status_code=403)
+    if not getattr(settings, "UPLOAD_RESUMABLE_ENABLED", False):
+        return JSONResponse({"ok": False, "error": "resumable_disabled"}, status_code=404)
+
+    if status not in ("public", "private", "unlisted"):
+        return JSONResponse({"ok": False, "error": "invalid_status"}, status_code=400)
+    total_bytes = int(size or 0)
+    max_bytes = int(getattr(settings, "UPLOAD_MAX_BYTES", 0))
+    if total_bytes <= 0 or (max_bytes > 0 and total_bytes > max_bytes):
+        return JSONResponse({"ok": False, "error": "invalid_size"}, status_code=400)
+
+    base = os.path.splitext((filename or "").strip())[0].strip()
+    title_final = (title or "").strip() or base[:200] or ("Video " + datetime.utcnow().strftime("%Y-%m-%d %H:%M"))
+    cat_id: Optional[str] = (category_id or "").strip() or None
+
+    requested_variants: List[str] = []
+    if ytconvert_variants:
+        requested_variants = [str(x).strip() for x in ytconvert_variants if str(x).strip()]
+    if requested_variants:
+        requested_variants = expand_requested_variant_ids(requested_variants)
+
+    part_size = max(1024 * 1024, int(getattr(settings, "UPLOAD_PART_BYTES", 16 * 1024 * 1024)))
+    total_parts = (total_bytes + part_size - 1) // part_size
+
+    storage_client: StorageClient = request.app.state.storage
+    video_id = gen_id(12)
+    upload_id = gen_id(20)
+    storage_rel = build_video_storage_rel(video_id)
+
+    conn = await get_conn()
+    try:
+        if cat_id is not None and not await category_exists(conn, cat_id):
+            return JSONResponse({"ok": False, "error": "category_not_found"}, status_code=400)
+
+        mkdirs_res = storage_client.mkdirs(storage_client.join(storage_rel, "upload_parts"), exist_ok=True)
+        if inspect.isawaitable(mkdirs_res):
+            await mkdirs_res
+
+        await create_upload_session(
+            conn,
+            upload_id=upload_id,
+            video_id=video_id,
+            author_uid=user["user_uid"],
+            storage_path=storage_rel,
+            filename=(filename or "")[:255],
+            total_bytes=total_bytes,
+            part_size=part_size,
+            total_parts=total_parts,
+            params={
+                "title": title_final,
+                "description": description,
+                "status": status,
+                "category_id": cat_id,
+                "permit_download": bool(permit_download),
+                "is_age_restricted": bool(is_age_restricted),
+                "is_made_for_kids": bool(is_made_for_kids),
+                "generate_captions": int(generate_captions_flag or 0),
+                "captions_lang": captions_lang or "auto",
+                "ytconvert_variants": requested_variants,
+            },
+            ttl_sec=int(getattr(settings, "UPLOAD_SESSION_TTL_SEC", 86400)),
+        )
+        sess = await get_upload_session(conn, upload_id, user["user_uid"])
+    finally:
+        await release_conn(conn)
+
+    asyncio.create_task(_bg_cleanup_expired_sessions(storage_client))
+    print(f"[UPLOAD] session opened upload_id={upload_id} video_id={video_id} bytes={total_bytes} parts={total_parts}")
+    return JSONResponse(_session_json(sess, []), headers={"Cache-Control": "no-store"})
+
+
+@router.get("/upload/sessions/{upload_id}")
+async def upload_session_status(request: Request, upload_id: str) -> Any:
+    """
+    Resume point: which parts the server already has.
+    """
+    user = get_current_user(request)
+    if not user:
+        return JSONResponse({"ok": False, "error": "auth_required"}, status_code=401)
+    conn = await get_conn()
+    try:
+        sess = await get_upload_session(conn, upload_id, user["user_uid"])
+        if not sess:
+            return JSONResponse({"ok": False, "error": "not_found"}, status_code=404)
+        parts = await list_upload_parts(conn, upload_id)
+    finally:
+        await release_conn(conn)
+    return JSONResponse(_session_json(sess, parts), headers={"Cache-Control": "no-store"})
+
+
+@router.put("/upload/sessions/{upload_id}/parts/{part_no}")
+async def upload_session_put_part(request: Request, upload_id: str, part_no: int) -> Any:
+    """
+    Raw body = part bytes, streamed straight into storage (sha256 computed in the same pass).
+    Optional X-Part-Sha256 header (hex, sent by static/brython/upload.bry) is verified.
+    Re-sending a part overwrites it.
+    """
+    user = get_current_user(request)
+    if not user:
+        return JSONResponse({"ok": False, "error": "auth_required"}, status_code=401)
+    if not _validate_csrf_multipart(request, ""):
+        return JSONResponse({"ok": False, "error": "csrf_required"}, status_code=403)
+
+    conn = await get_conn()
+    try:
+        sess = await get_upload_session(conn, upload_id, user["user_uid"])
+    finally:
+        await release_conn(conn)
+    if not sess:
+        return JSONResponse({"ok": False, "error": "not_found"}, status_code=404)
+    if sess["state"] != "open" or sess.get("expired"):
+        return JSONResponse({"ok": False, "error": "session_closed"}, status_code=409)
+    if part_no < 0 or part_no >= int(sess["total_parts"]):
+        return JSONResponse({"ok": False, "error": "invalid_part"}, status_code=400)
+
+    expected = _expected_part_size(sess, part_no)
+    storage_client: StorageClient = request.app.state.storage
+    rel = _part_rel(storage_client, sess["storage_path"], part_no)
+    # streamed under a unique name; only renamed to `rel` while the session row is locked open,
+    # so complete never reads a part that is being rewritten
+    tmp_rel = f"{rel}.{secrets.token_hex(6)}.tmp"
+
+    received = 0
+    published = False
+    # the tmp object is removed on every way out that does not publish it: rejected parts,
+    # client disconnects, cancellation, storage or DB errors (those propagate after the cleanup)
+    try:
+        # the storage writer hashes the bytes as it sends them: one pass, no second hash here
+        writer = await storage_client.open_writer(tmp_rel, overwrite=True, hash_algo="sha256", expected_size=expected)  # type: ignore[call-arg]
+        try:
+            async with writer as out:
+                async for chunk in request.stream():
+                    if not chunk:
+                        continue
+                    received += len(chunk)
+                    if received > expected:
+                        raise ValueError("part_too_large")
+                    await out.write(chunk)
+        except ValueError as e:
+            return JSONResponse({"ok": False, "error": str(e)}, status_code=400)
+
+        if received != expected:
+            return JSONResponse({"ok": False, "error": "part_size_mismatch", "expected": expected, "received": received}, status_code=400)
+        digest = writer.hexdigest or ""
+        want = (request.headers.get("X-Part-Sha256") or "").strip().lower()
+        if want and want != digest:
+            return JSONResponse({"ok": False, "error": "part_checksum_mismatch"}, status_code=400)
+
+        async with db_conn() as conn:
+            async with conn.transaction():
+                if await upsert_upload_part(conn, upload_id, part_no, received, digest):
+                    res = storage_client.rename(tmp_rel, rel, overwrite=True)  # type: ignore[call-arg]
+                    if inspect.isawaitable(res):
+                        await res
+                    published = True
+    finally:
+        if not published:
+            await _remove_quietly(storage_client, tmp_rel)
+    if not published:
+        return JSONResponse({"ok": False, "error": "session_closed"}, status_code=409)
+    return JSONResponse({"ok": True, "part_no": part_no, "size": received, "sha256": digest})
+
+
+@router.post("/upload/sessions/{upload_id}/complete", response_class=HTMLResponse)
+async def upload_session_complete(request: Request, upload_id: str) -> Any:
+    """
+    Concatenates parts into original.webm (one append pass, local copy written alongside),
+    then runs the regular post-upload pipeline and renders the thumbnail selection page.
+    """
+    import tempfile
+
+    user = get_current_user(request)
+    if not user:
+        return JSONResponse({"ok": False, "error": "auth_required"}, status_code=401)
+    if not _validate_csrf_multipart(request, ""):
+        return JSONResponse({"ok": False, "error": "csrf_required"}, status_code=403)
+
+    storage_client: StorageClient = request.app.state.storage
+
+    # the connection is only held for the session bookkeeping, not across assembly or the pipeline
+    async with db_conn() as conn:
+        sess = await get_upload_session(conn, upload_id, user["user_uid"])
+        if not sess:
+            return JSONResponse({"ok": False, "error": "not_found"}, status_code=404)
+        parts = await list_upload_parts(conn, upload_id)
+        have = {int(p["part_no"]) for p in parts}
+        missing = [n for n in range(int(sess["total_parts"])) if n not in have]
+        if missing:
+            return JSONResponse({"ok": False, "error": "parts_missing", "missing": missing[:100]}, status_code=409)
+        # guards against a double submit assembling the same file twice
+        if not await set_upload_session_state(conn, upload_id, "assembling", expected_state="open"):
+            return JSONResponse({"ok": False, "error": "session_closed"}, status_code=409)
+
+    video_id = sess["video_id"]
+    storage_rel = sess["storage_path"]
+    params = sess.get("params") or {}
+    original_rel_path = storage_client.join(storage_rel, "original.webm")
+
+    loop = asyncio.get_running_loop()
+    tmp_dir = tempfile.mkdtemp(prefix="yt_up_")
+    local_original_abs = os.path.join(tmp_dir, "original.webm")
+    try:
+        writer_ctx = storage_client.open_writer(original_rel_path, overwrite=True)
+        if inspect.isawaitable(writer_ctx):
+            writer_ctx = await writer_ctx
+        # the local copy is written off the event loop
+        lf = await loop.run_in_executor(None, open, local_original_abs, "wb")
+        try:
+            if hasattr(writer_ctx, "__aenter__"):
+                async with writer_ctx as out:
+                    for n in range(int(sess["total_parts"])):
+                        reader_ctx = storage_client.open_reader(_part_rel(storage_client, storage_rel, n))
+                        if inspect.isawaitable(reader_ctx):
+                            reader_ctx = await reader_ctx
+                        if hasattr(reader_ctx, "__aiter__"):
+                            async for chunk in reader_ctx:
+                                if chunk:
+                                    wr = out.write(chunk)
+                                    await loop.run_in_executor(None, lf.write, chunk)
+                                    if inspect.isawaitable(wr):
+                                        await wr
+                        else:
+                            with reader_ctx as rf:
+                                while True:
+                                    chunk = rf.read(1024 * 1024)
+                                    if not chunk:
+                                        break
+                                    wr = out.write(chunk)
+                                    await loop.run_in_executor(None, lf.write, chunk)
+                                    if inspect.isawaitable(wr):
+                                        await wr
+            else:
+                with writer_ctx as out:
+                    for n in range(int(sess["total_parts"])):
+                        with storage_client.open_reader(_part_rel(storage_client, storage_rel, n)) as rf:
+                            while True:
+                                chunk = rf.read(1024 * 1024)
+                                if not chunk:
+                                    break
+                                out.write(chunk)
+                                await loop.run_in_executor(None, lf.write, chunk)
+        finally:
+            await loop.run_in_executor(None, lf.close)
+        if os.path.getsize(local_original_abs) != int(sess["total_bytes"]):
+            raise RuntimeError("assembled size mismatch")
+    except Exception as e:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        async with db_conn() as conn:
+            await set_upload_session_state(conn, upload_id, "open")
+        print(f"[UPLOAD] session assembly failed upload_id={upload_id}: {e}")
+        return JSONResponse({"ok": False, "error": "assembly_failed"}, status_code=500)
+
+    try:
+        rm_res = storage_client.remove(storage_client.join(storage_rel, "upload_parts"), recursive=True)  # type: ignore[call-arg]
+        if inspect.isawaitable(rm_res):
+            await rm_res
+    except Exception as e:
+        print(f"[UPLOAD] parts cleanup failed upload_id={upload_id}: {e}")
+
+    requested_variants = [str(x) for x in (params.get("ytconvert_variants") or []) if str(x).strip()]
+    try:
+        candidates, suggested_variants, src_info = await _finish_upload(
+            request,
+            user,
+            video_id=video_id,
+            storage_rel=storage_rel,
+            original_rel_path=original_rel_path,
+            fields=params,
+            requested_variants=requested_variants,
+            generate_captions_flag=params.get("generate_captions") or 0,
+            captions_lang=params.get("captions_lang") or "auto",
+            local_original_abs=local_original_abs,
+        )
+    except Exception:
+        async with db_conn() as conn:
+            await set_upload_session_state(conn, upload_id, "failed")
+        raise
+    async with db_conn() as conn:
+        await set_upload_session_state(conn, upload_id, "done")
+
+    print(f"[UPLOAD] session completed upload_id={upload_id} video_id={video_id}")
+    try:
+        fire_and_forget_reindex(video_id)
+    except Exception:
+        pass
+
+    return _render_select_thumbnail(request, user, video_id, candidates, suggested_variants, src_info)
+
+
+@router.delete("/upload/sessions/{upload_id}")
+async def upload_session_abort(request: Request, upload_id: str) -> Any:
+    user = get_current_user(request)
+    if not user:
+        return JSONResponse({"ok": False, "error": "auth_required"}, status_code=401)
+    if not _validate_csrf_multipart(request, ""):
+        return JSONResponse({"ok": False, "error": "csrf_required"}, status_code=403)
+
+    conn = await get_conn()
+    try:
+        sess = await get_upload_session(conn, upload_id, user["user_uid"])
+        if not sess:
+            return JSONResponse({"ok": False, "error": "not_found"}, status_code=404)
+        if not await set_upload_session_state(conn, upload_id, "aborted", expected_state="open"):
+            return JSONResponse({"ok": False, "error": "session_closed"}, status_code=409)
+        storage_client: StorageClient = request.app.state.storage
+        try:
+            res = storage_client.remove(sess["storage_path"], recursive=True)  # type: ignore[call-arg]
+            if inspect.isawaitable(res):
+                await res
+        except Exception as e:
+            print(f"[UPLOAD] session storage cleanup failed upload_id={upload_id}: {e}")
+        await delete_upload_session(conn, upload_id)
+    finally:
+        await release_conn(conn)
+    return JSONResponse({"ok": True})
+
+
 @router.post("/upload/select-thumbnail")
 @router.post("/upload/select-thumbnail/")
 @router.post("/upload/select_thumbnail")
@@ -882,5 +1357,6 @@ async def select_thumbnail(request: Request) -> Any:
         await upsert_video_asset(conn, form_video_id, "thumbnail_default", sel)
     finally:
         await release_conn(conn)
+    await invalidate_videos(user["user_uid"])
 
     return RedirectResponse(f"/manage/edit?v={form_video_id}", status_code=302)
\ No newline at end of file
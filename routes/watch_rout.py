@@ -1,47 +1,27 @@
 from typing import Any, Dict, List, Optional
 import os
+import asyncio
 import json
-import inspect
 import re
 from urllib.parse import urlencode
 
 from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
 from config.config import settings
-from db import get_conn, release_conn
-from db.assets_db import get_thumbnail_asset_path, get_thumbs_vtt_asset, list_video_audio_assets_for_download
-from db.views_db import add_view, increment_video_views_counter
-from db.videos_db import get_video
-from db.videos_query_db import fetch_watch_video_full, fetch_embed_video_info
-from db.video_renditions_db import list_video_renditions as db_list_video_renditions
+from config.ytstorage.ytstorage_cfg import YTSTORAGE_DELIVERY_MODE, YTSTORAGE_PUBLIC_BASE_URL, YTSTORAGE_URL_REQUIRE_SIG
+from db import get_conn, get_read_conn, note_write, release_conn
+from db.videos_query_db import load_watch_context
 from services.feed.recommend_srv import fetch_rightbar_for_video  # right-bar recommendations
-from utils.format_ut import fmt_dt
+from services.page_cache_srv import SCOPE_VIDEOS, counter_crossed, counters_scope, page_cache
+from utils.idgen_ut import gen_id
 from utils.security_ut import get_current_user
-from utils.url_ut import build_storage_url
+from utils.url_ut import build_sprites_vtt_url, build_storage_url
+from utils.templates_ut import templates
 
 from db.playlists_db import get_playlist_brief
-from services.ytstorage.base_srv import StorageClient
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
-templates.env.filters["dt"] = fmt_dt
-templates.env.globals["brand_logo_url"] = settings.BRAND_LOGO_URL
-templates.env.globals["favicon_url"] = settings.FAVICON_URL
-templates.env.globals["apple_touch_icon_url"] = settings.APPLE_TOUCH_ICON_URL
-templates.env.globals["sitename"] = settings.SITENAME
-templates.env.globals["support_email"] = settings.SUPPORT_EMAIL
-
-
-def _avatar_small_url(avatar_path: Optional[str]) -> str:
-    if not avatar_path:
-        return "/static/img/avatar_default.svg"
-    if avatar_path.endswith("avatar.png"):
-        small_rel = avatar_path[: -len("avatar.png")] + "avatar_small.png"
-    else:
-        small_rel = avatar_path
-    return build_storage_url(small_rel)
 
 
 def _base_url(request: Request) -> str:
@@ -109,31 +89,16 @@ def _embed_defaults_from_row(vrow: Dict[str, Any]) -> Dict[str, int]:
     return {"autoplay": 1 if ap else 0, "mute": 1 if mu else 0, "loop": 1 if lo else 0, "start": max(0, st)}
 
 
-async def _load_translations_langs(storage_client: StorageClient, storage_rel: str) -> List[str]:
-    rel = os.path.join(storage_rel.strip("/"), "captions", "translations.meta.json")
-    ex = storage_client.exists(rel)
-    if inspect.isawaitable(ex):
-        ex = await ex
-    if not ex:
-        return []
-    try:
-        reader = storage_client.open_reader(rel)
-        if inspect.isawaitable(reader):
-            reader = await reader
-        data = b""
-        if hasattr(reader, "__aiter__") or hasattr(reader, "__anext__"):
-            async for chunk in reader:
-                if chunk:
-                    data += chunk
-        else:
-            for chunk in reader:
-                if chunk:
-                    data += chunk
-        meta = json.loads((data.decode("utf-8", "ignore") or "{}"))
-        langs = meta.get("langs") or []
-        return [str(x).strip() for x in langs if str(x).strip()]
-    except Exception:
-        return []
+def _subtitles_from_row(video: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Translated caption tracks (video_caption_tracks) come with the video row.
+    """
+    langs = video.get("caption_track_langs") or []
+    paths = video.get("caption_track_paths") or []
+    return [
+        {"label": code, "srclang": code, "src": build_storage_url(rel), "default": False}
+        for code, rel in zip(langs, paths)
+    ]
 
 
 _slug_re = re.compile(r"[^a-zA-Z0-9 _.-]+")
@@ -278,207 +243,230 @@ def _build_player_sources(video: Dict[str, Any], renditions: List[Dict[str, Any]
     return uniq
 
 
-@router.get("/watch", response_class=HTMLResponse)
-async def watch_page(request: Request, v: str, p: Optional[str] = Query(None)) -> Any:
-    user = get_current_user(request)
-    conn = await get_conn()
+def _build_player_stream(video: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    """
+    DASH/HLS manifest URLs of the packaged renditions (adaptive quality in the player).
+    Segments are referenced relative to the manifest and carry no signature, so manifests are
+    not offered where every storage URL must be signed.
+    """
+    hls_rel = video.get("stream_hls_path")
+    dash_rel = video.get("stream_dash_path")
+    if not (hls_rel or dash_rel):
+        return None
+    if YTSTORAGE_URL_REQUIRE_SIG or (YTSTORAGE_DELIVERY_MODE == "signed" and YTSTORAGE_PUBLIC_BASE_URL):
+        return None
+    return {
+        "hls": build_storage_url(hls_rel) or "",
+        "dash": build_storage_url(dash_rel) or "",
+        "hls_js": settings.PLAYER_HLS_JS_URL,
+    }
+
+
+async def _load_rightbar(video_id: str, user_uid: Optional[str], playlist_id: Optional[str]) -> List[Dict[str, Any]]:
     try:
-        row = await fetch_watch_video_full(conn, v)
-        video: Optional[Dict[str, Any]] = dict(row) if row else None
-
-        caption_vtt: Optional[str] = video.get("captions_vtt") if video and video.get("captions_vtt") else None
-        caption_lang: str = video.get("captions_lang") if video and video.get("captions_lang") else "auto"
-
-        if not row:
-            subtitles: List[Dict[str, Any]] = []
-            player_options: Dict[str, Any] = {"autoplay": False, "muted": False, "loop": False, "start": 0}
-            embed_url = f"{_base_url(request)}/embed?v={v}"
-            context = {
-                "brand_logo_url": settings.BRAND_LOGO_URL,
-                "brand_tagline": settings.BRAND_TAGLINE,
-                "favicon_url": settings.FAVICON_URL,
-                "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
-                "request": request,
-                "current_user": user,
-                "video": None,
-                "video_id": v,
-                "player_name": settings.VIDEO_PLAYER,
-                "video_src": None,
-                "poster_url": None,
-                "thumb_anim_url": None,
-                "avatar_url": None,
-                "allow_embed": False,
-                "embed_url": embed_url,
-                "subtitles": subtitles,
-                "player_options": player_options,
-                "not_found": True,
-                "fallback_image_url": settings.FALLBACK_PLACEHOLDER_URL,
-                "sprites_vtt_url": None,
-                "caption_vtt": caption_vtt,
-                "caption_lang": caption_lang,
-                "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
-                "caption_vtt_url": build_storage_url(caption_vtt) if caption_vtt else None,
-                "allow_comments": False,
-                "upnext_title": "Up next",
-                # download menu
-                "show_download_menu": False,
-                "download_items": [],
-                # player extra
-                "player_sources": [],
-                "player_permit_download": False,
-                "player_download_items": [],
-            }
-            headers = {"Cache-Control": "no-store"}
-            return templates.TemplateResponse("watch.html", context, headers=headers)
+        if getattr(settings, "RIGHTBAR_ENABLED", True):
+            limit = int(getattr(settings, "RIGHTBAR_LIMIT", 12) or 12)
+            if user_uid is None and not playlist_id:
+                # anonymous recommendations do not depend on the visitor: shared fragment
+                async def _render() -> List[Dict[str, Any]]:
+                    return await fetch_rightbar_for_video(video_id, None, limit=limit)
+
+                items = await page_cache.get_or_render(
+                    "rightbar", (video_id, limit), (SCOPE_VIDEOS, counters_scope(video_id)), _render
+                )
+                return [dict(it) for it in items]
+            return await fetch_rightbar_for_video(video_id, user_uid, limit=limit, playlist_id=playlist_id)
+    except Exception:
+        pass
+    return []
 
-        user_uid: Optional[str] = user["user_uid"] if user else None
-        await add_view(conn, video_id=v, user_uid=user_uid, duration_sec=0)
-        await increment_video_views_counter(conn, video_id=v)
-        try:
-            video["views_count"] = int(video.get("views_count") or 0) + 1
-        except Exception:
-            pass
 
-        video_src = build_storage_url(video["storage_path"].strip("/").rstrip("/") + "/original.webm")
-        poster_url = build_storage_url(video["thumb_asset_path"]) if video.get("thumb_asset_path") else None
-        thumb_anim_url = build_storage_url(video["thumb_anim_asset_path"]) if video.get("thumb_anim_asset_path") else None
-        avatar_url = build_storage_url(video["avatar_asset_path"]) if video.get("avatar_asset_path") else None
-        video["avatar_url"] = avatar_url
+async def _load_upnext_title(playlist_id: Optional[str], user_uid: Optional[str]) -> str:
+    if not playlist_id:
+        return "Up next"
+    try:
+        conn = await get_read_conn()
+        try:
+            brief = await get_playlist_brief(conn, playlist_id)
+        finally:
+            await release_conn(conn)
+    except Exception:
+        brief = None
+    if brief:
+        vis = str(brief.get("visibility") or "").strip().lower()
+        owner_uid = str(brief.get("owner_uid") or "")
+        if vis in ("public", "unlisted") or (user_uid and owner_uid == user_uid):
+            name = (brief.get("name") or "").strip()
+            if name:
+                return name
+    return "Up next"
 
-        opts = _embed_defaults_from_row(video)
 
-        subtitles: List[Dict[str, Any]] = []
-        player_options: Dict[str, Any] = {
-            "autoplay": False,
-            "muted": False,
-            "loop": False,
-            "start": 0,
-        }
+@router.get("/watch", response_class=HTMLResponse)
+async def watch_page(request: Request, v: str, p: Optional[str] = Query(None)) -> Any:
+    user = get_current_user(request)
+    user_uid: Optional[str] = user["user_uid"] if user else None
 
-        allow_embed = bool(video.get("allow_embed"))
-        base = _base_url(request)
-        embed_url = (
-            f"{base}/embed?"
-            f"v={video['video_id']}"
-            f"&autoplay={opts['autoplay']}"
-            f"&muted={opts['mute']}"
-            f"&loop={opts['loop']}"
-            f"&t={opts['start']}"
-        )
-        sprites_vtt_rel = await get_thumbs_vtt_asset(conn, video["video_id"])
-        sprites_vtt_url = build_storage_url(sprites_vtt_rel) if sprites_vtt_rel else None
-
-        storage_client: StorageClient = request.app.state.storage
-        langs = await _load_translations_langs(storage_client, video["storage_path"])
-        if langs:
-            cap_dir = video["storage_path"].strip("/").rstrip("/") + "/captions"
-            for code in langs:
-                rel = f"{cap_dir}/{code}.vtt"
-                subtitles.append({
-                    "label": code,
-                    "srclang": code,
-                    "src": build_storage_url(rel),
-                    "default": False,
-                })
-
-        recommended_videos: List[Dict[str, Any]] = []
-        try:
-            if getattr(settings, "RIGHTBAR_ENABLED", True):
-                limit = int(getattr(settings, "RIGHTBAR_LIMIT", 12) or 12)
-                recommended_videos = await fetch_rightbar_for_video(video["video_id"], user_uid, limit=limit, playlist_id=p)
-        except Exception:
-            recommended_videos = []
-
-        upnext_title = "Up next"
-        if p:
-            try:
-                brief = await get_playlist_brief(conn, p)
-            except Exception:
-                brief = None
-            if brief:
-                vis = str(brief.get("visibility") or "").strip().lower()
-                owner_uid = str(brief.get("owner_uid") or "")
-                if vis in ("public", "unlisted") or (user_uid and owner_uid == user_uid):
-                    name = (brief.get("name") or "").strip()
-                    if name:
-                        upnext_title = name
-
-        allow_comments = video.get("allow_comments", True)
-
-        # Renditions: used both for download menu and for player sources
+    # Right bar and playlist title need only the ids: run them (on their own connections)
+    # while the video context loads.
+    rightbar_task = asyncio.create_task(_load_rightbar(v, user_uid, p))
+    upnext_task = asyncio.create_task(_load_upnext_title(p, user_uid))
+    try:
+        conn = await get_conn()
         try:
-            renditions = await db_list_video_renditions(conn, video["video_id"])
-        except Exception:
-            renditions = []
-
-        player_sources = _build_player_sources(video, renditions)
-
-        # Download menu data (page)
-        show_download_menu = bool(video.get("permit_download"))
-        download_items: List[Dict[str, str]] = []
-        player_download_items: List[Dict[str, str]] = []
-        if show_download_menu:
-            try:
-                audio_assets = await list_video_audio_assets_for_download(conn, video["video_id"])
-            except Exception:
-                audio_assets = []
-            download_items = _build_download_items(video, renditions, audio_assets)
-            player_download_items = download_items
-
+            video = await load_watch_context(conn, v, gen_id(20), user_uid)
+        finally:
+            await release_conn(conn)
+        if user_uid:
+            # the view went into the user's history: read it back from the primary for a while
+            note_write()
+        if video and counter_crossed(int(video.get("views_count") or 0)):
+            await page_cache.invalidate(counters_scope(v))
+    except BaseException:
+        rightbar_task.cancel()
+        upnext_task.cancel()
+        raise
+
+    caption_vtt: Optional[str] = video.get("captions_vtt") if video and video.get("captions_vtt") else None
+    caption_lang: str = video.get("captions_lang") if video and video.get("captions_lang") else "auto"
+
+    if not video:
+        rightbar_task.cancel()
+        upnext_task.cancel()
+        subtitles: List[Dict[str, Any]] = []
+        player_options: Dict[str, Any] = {"autoplay": False, "muted": False, "loop": False, "start": 0}
+        embed_url = f"{_base_url(request)}/embed?v={v}"
         context = {
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
             "request": request,
             "current_user": user,
-            "video": video,
+            "video": None,
+            "video_id": v,
             "player_name": settings.VIDEO_PLAYER,
-            "video_src": video_src,
-            "poster_url": poster_url,
-            "thumb_anim_url": thumb_anim_url,
-            "avatar_url": avatar_url,
-            "allow_embed": allow_embed,
+            "video_src": None,
+            "poster_url": None,
+            "thumb_anim_url": None,
+            "avatar_url": None,
+            "allow_embed": False,
             "embed_url": embed_url,
             "subtitles": subtitles,
             "player_options": player_options,
-            "recommended_videos": recommended_videos,
-            "sprites_vtt_url": sprites_vtt_url,
+            "not_found": True,
+            "fallback_image_url": settings.FALLBACK_PLACEHOLDER_URL,
+            "sprites_vtt_url": None,
             "caption_vtt": caption_vtt,
             "caption_lang": caption_lang,
             "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
             "caption_vtt_url": build_storage_url(caption_vtt) if caption_vtt else None,
-            "allow_comments": allow_comments,
-            "upnext_title": upnext_title,
-            # download menu (page)
-            "show_download_menu": show_download_menu,
-            "download_items": download_items,
+            "allow_comments": False,
+            "upnext_title": "Up next",
+            # download menu
+            "show_download_menu": False,
+            "download_items": [],
             # player extra
-            "player_sources": player_sources,
-            "player_permit_download": show_download_menu,
-            "player_download_items": player_download_items,
+            "player_sources": [],
+            "player_stream": None,
+            "player_permit_download": False,
+            "player_download_items": [],
         }
+        headers = {"Cache-Control": "no-store"}
+        return templates.TemplateResponse("watch.html", context, headers=headers)
 
-        link_entries: List[str] = []
-
-        def _add_link(url: Optional[str], rel: str, as_type: str) -> None:
-            if url:
-                link_entries.append(f"<{url}>; rel={rel}; as={as_type}; crossorigin=anonymous")
-
-        _add_link(poster_url, "preload", "image")
-        _add_link(thumb_anim_url, "preload", "image")
-        _add_link(sprites_vtt_url, "preload", "image")
+    video_src = build_storage_url(video["storage_path"].strip("/").rstrip("/") + "/original.webm")
+    poster_url = build_storage_url(video["thumb_asset_path"]) if video.get("thumb_asset_path") else None
+    thumb_anim_url = build_storage_url(video["thumb_anim_asset_path"]) if video.get("thumb_anim_asset_path") else None
+    avatar_url = build_storage_url(video["avatar_asset_path"]) if video.get("avatar_asset_path") else None
+    video["avatar_url"] = avatar_url
+
+    opts = _embed_defaults_from_row(video)
+
+    subtitles = _subtitles_from_row(video)
+    player_options = {
+        "autoplay": False,
+        "muted": False,
+        "loop": False,
+        "start": 0,
+    }
+
+    allow_embed = bool(video.get("allow_embed"))
+    base = _base_url(request)
+    embed_url = (
+        f"{base}/embed?"
+        f"v={video['video_id']}"
+        f"&autoplay={opts['autoplay']}"
+        f"&muted={opts['mute']}"
+        f"&loop={opts['loop']}"
+        f"&t={opts['start']}"
+    )
+    sprites_vtt_rel = video.get("thumbs_vtt_path")
+    sprites_vtt_url = build_sprites_vtt_url(sprites_vtt_rel)
+
+    allow_comments = video.get("allow_comments", True)
+
+    # Renditions: used both for download menu and for player sources
+    renditions = video.get("renditions") or []
+    player_sources = _build_player_sources(video, renditions)
+    player_stream = _build_player_stream(video)
+
+    # Download menu data (page)
+    show_download_menu = bool(video.get("permit_download"))
+    download_items: List[Dict[str, str]] = []
+    player_download_items: List[Dict[str, str]] = []
+    if show_download_menu:
+        download_items = _build_download_items(video, renditions, video.get("audio_assets") or [])
+        player_download_items = download_items
+
+    recommended_videos, upnext_title = await asyncio.gather(rightbar_task, upnext_task)
+
+    context = {
+        "request": request,
+        "current_user": user,
+        "video": video,
+        "player_name": settings.VIDEO_PLAYER,
+        "video_src": video_src,
+        "poster_url": poster_url,
+        "thumb_anim_url": thumb_anim_url,
+        "avatar_url": avatar_url,
+        "allow_embed": allow_embed,
+        "embed_url": embed_url,
+        "subtitles": subtitles,
+        "player_options": player_options,
+        "recommended_videos": recommended_videos,
+        "sprites_vtt_url": sprites_vtt_url,
+        "caption_vtt": caption_vtt,
+        "caption_lang": caption_lang,
+        "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
+        "caption_vtt_url": build_storage_url(caption_vtt) if caption_vtt else None,
+        "allow_comments": allow_comments,
+        "upnext_title": upnext_title,
+        # download menu (page)
+        "show_download_menu": show_download_menu,
+        "download_items": download_items,
+        # player extra
+        "player_sources": player_sources,
+        "player_stream": player_stream,
+        "player_permit_download": show_download_menu,
+        "player_download_items": player_download_items,
+    }
+
+    link_entries: List[str] = []
+
+    def _add_link(url: Optional[str], rel: str, as_type: str) -> None:
+        if url:
+            link_entries.append(f"<{url}>; rel={rel}; as={as_type}; crossorigin=anonymous")
+
+    _add_link(poster_url, "preload", "image")
+    _add_link(thumb_anim_url, "preload", "image")
+    _add_link(sprites_vtt_url, "preload", "image")
+    if not player_stream:
         _add_link(video_src, "preload", "video")
-        caption_vtt_url = build_storage_url(caption_vtt) if caption_vtt else None
-        _add_link(caption_vtt_url, "preload", "track")
+    caption_vtt_url = build_storage_url(caption_vtt) if caption_vtt else None
+    _add_link(caption_vtt_url, "preload", "track")
 
-        headers = {"Cache-Control": "no-store"}
-        if link_entries:
-            headers["Link"] = ", ".join(link_entries)
+    headers = {"Cache-Control": "no-store"}
+    if link_entries:
+        headers["Link"] = ", ".join(link_entries)
 
-        return templates.TemplateResponse("watch.html", context, headers=headers)
-    finally:
-        await release_conn(conn)
+    return templates.TemplateResponse("watch.html", context, headers=headers)
 
 
 @router.get("/embed", response_class=HTMLResponse)
@@ -491,138 +479,106 @@ async def embed_page(
     loop: int = 0
 ) -> Any:
     user = get_current_user(request)
+    user_uid: Optional[str] = user["user_uid"] if user else None
     conn = await get_conn()
     try:
-        row = await fetch_embed_video_info(conn, v)
-        video: Optional[Dict[str, Any]] = dict(row) if row else None
-
-        caption_vtt: Optional[str] = video.get("captions_vtt") if video and video.get("captions_vtt") else None
-        caption_lang: str = video.get("captions_lang") if video and video.get("captions_lang") else "auto"
-
-        if not video:
-            subtitles: List[Dict[str, Any]] = []
-            player_options: Dict[str, Any] = {
-                "autoplay": bool(autoplay),
-                "muted": bool(muted),
-                "loop": bool(loop),
-                "start": max(0, int(t or 0)),
-            }
-            context = {
-                "brand_logo_url": settings.BRAND_LOGO_URL,
-                "brand_tagline": settings.BRAND_TAGLINE,
-                "favicon_url": settings.FAVICON_URL,
-                "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
-                "request": request,
-                "video": None,
-                "player_name": settings.VIDEO_PLAYER,
-                "video_src": None,
-                "poster_url": None,
-                "video_id": v,
-                "subtitles": subtitles,
-                "player_options": player_options,
-                "not_found": True,
-                "fallback_image_url": settings.FALLBACK_PLACEHOLDER_URL,
-                "sprites_vtt_url": None,
-                "caption_vtt": caption_vtt,
-                "caption_lang": caption_lang,
-                "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
-                "caption_vtt_url": build_storage_url(caption_vtt) if caption_vtt else None,
-                # player extra
-                "player_sources": [],
-                "player_permit_download": False,
-                "player_download_items": [],
-            }
-            headers = {"Cache-Control": "no-store"}
-            return templates.TemplateResponse("embed.html", context, headers=headers)
-
-        user_uid: Optional[str] = user["user_uid"] if user else None
-        await add_view(conn, video_id=v, user_uid=user_uid, duration_sec=0)
-        await increment_video_views_counter(conn, video_id=v)
-
-        video_src = build_storage_url(video["storage_path"].strip("/").rstrip("/") + "/original.webm")
-        poster_url = build_storage_url(video["thumb_asset_path"]) if video.get("thumb_asset_path") else None
+        video = await load_watch_context(conn, v, gen_id(20), user_uid)
+    finally:
+        await release_conn(conn)
+    if user_uid:
+        note_write()
 
-        subtitles: List[Dict[str, Any]] = []
-        player_options: Dict[str, Any] = {
-            "autoplay": bool(autoplay),
-            "muted": bool(muted),
-            "loop": bool(loop),
-            "start": max(0, int(t or 0)),
-        }
+    caption_vtt: Optional[str] = video.get("captions_vtt") if video and video.get("captions_vtt") else None
+    caption_lang: str = video.get("captions_lang") if video and video.get("captions_lang") else "auto"
 
-        sprites_vtt_rel = await get_thumbs_vtt_asset(conn, video["video_id"])
-        sprites_vtt_url = build_storage_url(sprites_vtt_rel) if sprites_vtt_rel else None
-
-        storage_client: StorageClient = request.app.state.storage
-        langs = await _load_translations_langs(storage_client, video["storage_path"])
-        if langs:
-            cap_dir = video["storage_path"].strip("/").rstrip("/") + "/captions"
-            for code in langs:
-                rel = f"{cap_dir}/{code}.vtt"
-                subtitles.append({
-                    "label": code,
-                    "srclang": code,
-                    "src": build_storage_url(rel),
-                    "default": False,
-                })
-
-        # renditions for sources and downloads
-        try:
-            renditions = await db_list_video_renditions(conn, video["video_id"])
-        except Exception:
-            renditions = []
-        player_sources = _build_player_sources(video, renditions)
-
-        # permit_download + download items for embed player:
-        show_download_menu = bool(video.get("permit_download"))
-        player_download_items: List[Dict[str, str]] = []
-        if show_download_menu:
-            try:
-                audio_assets = await list_video_audio_assets_for_download(conn, video["video_id"])
-            except Exception:
-                audio_assets = []
-            player_download_items = _build_download_items(video, renditions, audio_assets)
+    player_options: Dict[str, Any] = {
+        "autoplay": bool(autoplay),
+        "muted": bool(muted),
+        "loop": bool(loop),
+        "start": max(0, int(t or 0)),
+    }
 
+    if not video:
         context = {
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
             "request": request,
-            "video": video,
+            "video": None,
             "player_name": settings.VIDEO_PLAYER,
-            "video_src": video_src,
-            "poster_url": poster_url,
-            "video_id": video["video_id"],
-            "subtitles": subtitles,
+            "video_src": None,
+            "poster_url": None,
+            "video_id": v,
+            "subtitles": [],
             "player_options": player_options,
-            "sprites_vtt_url": sprites_vtt_url,
+            "not_found": True,
+            "fallback_image_url": settings.FALLBACK_PLACEHOLDER_URL,
+            "sprites_vtt_url": None,
             "caption_vtt": caption_vtt,
             "caption_lang": caption_lang,
             "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
             "caption_vtt_url": build_storage_url(caption_vtt) if caption_vtt else None,
             # player extra
-            "player_sources": player_sources,
-            "player_permit_download": show_download_menu,
-            "player_download_items": player_download_items,
+            "player_sources": [],
+            "player_stream": None,
+            "player_permit_download": False,
+            "player_download_items": [],
         }
+        headers = {"Cache-Control": "no-store"}
+        return templates.TemplateResponse("embed.html", context, headers=headers)
 
-        link_entries: List[str] = []
-
-        def _add_link(url: Optional[str], rel: str, as_type: str) -> None:
-            if url:
-                link_entries.append(f"<{url}>; rel={rel}; as={as_type}; crossorigin=anonymous")
-
-        _add_link(poster_url, "preload", "image")
-        _add_link(sprites_vtt_url, "preload", "image")
+    video_src = build_storage_url(video["storage_path"].strip("/").rstrip("/") + "/original.webm")
+    poster_url = build_storage_url(video["thumb_asset_path"]) if video.get("thumb_asset_path") else None
+
+    subtitles = _subtitles_from_row(video)
+
+    sprites_vtt_rel = video.get("thumbs_vtt_path")
+    sprites_vtt_url = build_sprites_vtt_url(sprites_vtt_rel)
+
+    # renditions for sources and downloads
+    renditions = video.get("renditions") or []
+    player_sources = _build_player_sources(video, renditions)
+    player_stream = _build_player_stream(video)
+
+    # permit_download + download items for embed player:
+    show_download_menu = bool(video.get("permit_download"))
+    player_download_items: List[Dict[str, str]] = []
+    if show_download_menu:
+        player_download_items = _build_download_items(video, renditions, video.get("audio_assets") or [])
+
+    context = {
+        "request": request,
+        "video": video,
+        "player_name": settings.VIDEO_PLAYER,
+        "video_src": video_src,
+        "poster_url": poster_url,
+        "video_id": video["video_id"],
+        "subtitles": subtitles,
+        "player_options": player_options,
+        "sprites_vtt_url": sprites_vtt_url,
+        "caption_vtt": caption_vtt,
+        "caption_lang": caption_lang,
+        "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
+        "caption_vtt_url": build_storage_url(caption_vtt) if caption_vtt else None,
+        # player extra
+        "player_sources": player_sources,
+        "player_stream": player_stream,
+        "player_permit_download": show_download_menu,
+        "player_download_items": player_download_items,
+    }
+
+    link_entries: List[str] = []
+
+    def _add_link(url: Optional[str], rel: str, as_type: str) -> None:
+        if url:
+            link_entries.append(f"<{url}>; rel={rel}; as={as_type}; crossorigin=anonymous")
+
+    _add_link(poster_url, "preload", "image")
+    _add_link(sprites_vtt_url, "preload", "image")
+    if not player_stream:
         _add_link(video_src, "preload", "video")
-        caption_vtt_url = build_storage_url(caption_vtt) if caption_vtt else None
-        _add_link(caption_vtt_url, "preload", "track")
+    caption_vtt_url = build_storage_url(caption_vtt) if caption_vtt else None
+    _add_link(caption_vtt_url, "preload", "track")
 
-        headers = {"Cache-Control": "no-store"}
-        if link_entries:
-            headers["Link"] = ", ".join(link_entries)
+    headers = {"Cache-Control": "no-store"}
+    if link_entries:
+        headers["Link"] = ", ".join(link_entries)
 
-        return templates.TemplateResponse("embed.html", context, headers=headers)
-    finally:
-        await release_conn(conn)
\ No newline at end of file
+    return templates.TemplateResponse("embed.html", context, headers=headers)
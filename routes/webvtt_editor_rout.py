@@ -6,11 +6,12 @@ from fastapi import APIRouter, Request, Form, HTTPException, Query
 from fastapi.responses import RedirectResponse, HTMLResponse, Response
 
 from config.config import settings
+from utils.templates_ut import templates
 from utils.security_ut import get_current_user
 from db import get_conn, release_conn
 from db.videos_db import get_owned_video
 from db.assets_db import get_thumbs_vtt_asset
-from utils.url_ut import build_storage_url
+from utils.url_ut import build_sprites_vtt_url, build_storage_url
 
 # --- Storage abstraction ---
 from services.ytstorage.base_srv import StorageClient
@@ -174,7 +175,7 @@ async def webvtt_edit(
         sprites_vtt_rel = await get_thumbs_vtt_asset(conn, video_id)
     finally:
         await release_conn(conn)
-    sprites_vtt_url = build_storage_url(sprites_vtt_rel) if sprites_vtt_rel else None
+    sprites_vtt_url = build_sprites_vtt_url(sprites_vtt_rel)
 
     # current captions track for player
     subtitles: List[Dict[str, str]] = []
@@ -194,8 +195,6 @@ async def webvtt_edit(
 
     player_options = {"autoplay": False, "muted": False, "loop": False, "start": max(0, int(t or 0))}
 
-    from fastapi.templating import Jinja2Templates
-    templates = Jinja2Templates(directory="templates")
     return templates.TemplateResponse(
         "manage/webvtt_editor.html",
         {
@@ -209,10 +208,6 @@ async def webvtt_edit(
             "sprites_vtt_url": sprites_vtt_url,
             "player_options": player_options,
             "csrf_token": getattr(settings, "CSRF_TOKEN", ""),
-            "brand_logo_url": settings.BRAND_LOGO_URL,
-            "brand_tagline": settings.BRAND_TAGLINE,
-            "favicon_url": settings.FAVICON_URL,
-            "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
             "player_name": settings.VIDEO_PLAYER,
             "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
         },
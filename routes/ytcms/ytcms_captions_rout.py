@@ -1,5 +1,4 @@
 import json
-import time
 import asyncio
 from typing import Optional, Any, Dict
 
@@ -13,7 +12,9 @@ from db.ytsprites.ytsprites_db import fetch_video_storage_path
 from db.ytcms.captions_db import set_video_captions, reset_video_captions, get_video_captions_status
 from utils.security_ut import get_current_user
 
-from services.ytcms.ytcms_client_srv import (
+from services.job_registry_srv import job_registry, KIND_CAPTIONS
+from services.job_watch_srv import watch_job
+from services.ytcms.ytcms_aio_client_srv import (
     submit_storage_job,
     get_status as ytcms_get_status,
     get_result as ytcms_get_result,
@@ -25,51 +26,160 @@ router = APIRouter(tags=["captions"])
 
 AUTO_MIN_DURATION = getattr(settings, "AUTO_CAPTIONS_MIN_DURATION", 3)
 
-_JOB_STATE: Dict[str, Dict[str, Any]] = {}
-_JOB_TTL_SEC = 6 * 3600
+_TERMINAL_STATUSES = ("done", "fail")
+# background watcher gives up after this long; status polls take over via the stale check
+_WATCH_MAX_SEC = 6 * 3600
+# video_id -> watcher task of this process; a resubmit or delete cancels the previous one
+_WATCHERS: Dict[str, "asyncio.Task[None]"] = {}
 
-PERCENT_ACTIVE_GRACE_SEC = 12.0
-PREV_STATUS_GRACE_SEC = 12.0
 
-
-def _set_job_state(video_id: str, status: str, percent: int = -1, job_id: Optional[str] = None, job_server: Optional[str] = None) -> None:
-    now = time.time()
-    prev = _JOB_STATE.get(video_id) or {}
-    _JOB_STATE[video_id] = {
+async def _set_job_state(video_id: str, status: str, percent: int = -1, job_id: Optional[str] = None, job_server: Optional[str] = None) -> None:
+    fields: Dict[str, Any] = {
         "status": status,
         "percent": int(percent if isinstance(percent, (int, float)) else -1),
-        "job_id": job_id if job_id is not None else prev.get("job_id"),
-        "job_server": job_server if job_server is not None else prev.get("job_server"),
-        "ts": now,
-        "last_active_percent": int(percent)
-        if isinstance(percent, (int, float)) and 0 < int(percent) < 100
-        else (prev.get("last_active_percent", -1)),
-        "last_active_percent_ts": now
-        if isinstance(percent, (int, float)) and 0 < int(percent) < 100
-        else (prev.get("last_active_percent_ts", 0.0)),
-        "last_process_status": status if status in ("start", "wait", "process") else (prev.get("last_process_status", None)),
-        "last_process_status_ts": now if status in ("start", "wait", "process") else (prev.get("last_process_status_ts", 0.0)),
     }
+    if job_id is not None:
+        fields["job_id"] = job_id
+    if job_server is not None:
+        fields["job_server"] = job_server
+    await job_registry.update(KIND_CAPTIONS, video_id, fields)
 
 
-def _get_job_state(video_id: str) -> Optional[Dict[str, Any]]:
-    row = _JOB_STATE.get(video_id)
-    if not row:
-        return None
-    if time.time() - float(row.get("ts", 0)) > _JOB_TTL_SEC:
-        try:
-            del _JOB_STATE[video_id]
-        except Exception:
-            pass
-        return None
-    return row
+async def _get_job_state(video_id: str) -> Optional[Dict[str, Any]]:
+    return await job_registry.get(KIND_CAPTIONS, video_id)
+
+
+def _stop_watcher(video_id: str) -> None:
+    task = _WATCHERS.pop(video_id, None)
+    if task is not None and not task.done():
+        task.cancel()
+
+
+async def _clear_job_state(video_id: str) -> None:
+    _stop_watcher(video_id)
+    await job_registry.clear(KIND_CAPTIONS, video_id)
+
+
+def _status_payload(video_id: str, status: str, percent: int, lang: Optional[str], job_id: Optional[str], job_server: Optional[str], rel_vtt: Optional[str] = None) -> Dict[str, Any]:
+    return {
+        "ok": True,
+        "video_id": video_id,
+        "status": status,
+        "percent": percent,
+        "has_vtt": bool(rel_vtt),
+        "rel_vtt": rel_vtt,
+        "lang": lang,
+        "job_id": job_id,
+        "job_server": job_server,
+    }
+
+
+async def _fetch_ytcms_status(job_id: str, job_server: str) -> Dict[str, Any]:
+    """
+    One GetStatus round trip -> {"status": wait|process|ready|fail, "percent"}; "ready" = result not stored yet.
+    """
+    st = await ytcms_get_status(job_id=job_id, server_addr=job_server)
+    st_name = st.State.Name(st.state).lower()
+    pct = int(st.percent) if isinstance(getattr(st, "percent", None), (int, float)) else -1
+    pct = max(-1, min(100, pct))
+
+    if st_name in ("queued",):
+        return {"status": "wait", "percent": pct}
+    if st_name in ("running",):
+        return {"status": "process", "percent": pct}
+    if st_name in ("done",):
+        return {"status": "ready", "percent": pct}
+    if st_name in ("failed", "canceled"):
+        return {"status": "fail", "percent": pct}
+    return {"status": "wait", "percent": pct}
+
+
+async def _store_result(video_id: str, job_id: str, job_server: str, lang: Optional[str]) -> Dict[str, Any]:
+    res = await ytcms_get_result(job_id=job_id, server_addr=job_server)
+    if res.state != ytcms_pb2.JobStatus.DONE:
+        await _set_job_state(video_id, status="fail", percent=-1, job_id=job_id, job_server=job_server)
+        return _status_payload(video_id, "fail", -1, lang, job_id, job_server)
+
+    c = await get_conn()
+    try:
+        meta_to_store = {
+            "ytcms_job_id": job_id,
+            "ytcms_job_server": job_server,
+            "lang": res.detected_lang or lang,
+            "task": res.task,
+            "model": res.model,
+            "device": res.device,
+            "compute_type": res.compute_type,
+            "duration_sec": float(res.duration_sec or 0.0),
+            "vtt_rel_path": res.vtt_rel_path,
+            "meta_rel_path": res.meta_rel_path,
+        }
+        await set_video_captions(c, video_id, res.vtt_rel_path, res.detected_lang or lang, meta_to_store)
+    finally:
+        await release_conn(c)
+
+    await _set_job_state(video_id, status="done", percent=100, job_id=job_id, job_server=job_server)
+    return _status_payload(video_id, "done", 100, res.detected_lang or lang, job_id, job_server, rel_vtt=res.vtt_rel_path)
+
+
+async def _poll_ytcms(video_id: str, job_id: str, job_server: str, lang: Optional[str]) -> Dict[str, Any]:
+    """
+    Single status check (used by the status route when no watcher reports); on DONE stores the result.
+    """
+    snap = await _fetch_ytcms_status(job_id, job_server)
+    if snap["status"] == "ready":
+        return await _store_result(video_id, job_id, job_server, lang)
+    await _set_job_state(video_id, status=snap["status"], percent=snap["percent"], job_id=job_id, job_server=job_server)
+    return _status_payload(video_id, snap["status"], snap["percent"], lang, job_id, job_server)
+
+
+def _registry_percent(js: Dict[str, Any]) -> int:
+    # 0 is real progress: only a missing value means "unknown"
+    p = js.get("percent")
+    return -1 if p is None else int(p)
+
+
+async def _watch_job(video_id: str, job_id: str, job_server: str, lang: Optional[str]) -> None:
+    async def _on_change(snap: Dict[str, Any]) -> None:
+        if snap["status"] != "ready":
+            await _set_job_state(video_id, status=snap["status"], percent=snap["percent"], job_id=job_id, job_server=job_server)
+
+    try:
+        # ytcms has no watch stream: backoff polling, registry written only on change
+        last = await watch_job(
+            poll=lambda: _fetch_ytcms_status(job_id, job_server),
+            is_final=lambda snap: snap["status"] in ("ready", "fail"),
+            on_change=_on_change,
+            heartbeat=lambda: job_registry.touch(KIND_CAPTIONS, video_id),
+            state_key="status",
+            timeout_sec=_WATCH_MAX_SEC,
+            label=f"ytcms {job_id}",
+        )
+        if last and last["status"] == "ready":
+            await _store_result(video_id, job_id, job_server, lang)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        print(f"[YTCMS] watch failed video_id={video_id} job_id={job_id}: {e}")
+    finally:
+        if _WATCHERS.get(video_id) is asyncio.current_task():
+            _WATCHERS.pop(video_id, None)
 
 
-def _clear_job_state(video_id: str) -> None:
+async def _submit_job(video_id: str, storage_rel: str, lang: str, log_tag: str) -> None:
     try:
-        del _JOB_STATE[video_id]
-    except Exception:
-        pass
+        job_id, job_server = await submit_storage_job(
+            video_id=video_id,
+            storage_rel=storage_rel,
+            lang=lang,
+            task="transcribe",
+        )
+        await _set_job_state(video_id, status="wait", percent=-1, job_id=job_id, job_server=job_server)
+        _stop_watcher(video_id)
+        _WATCHERS[video_id] = asyncio.create_task(_watch_job(video_id, job_id, job_server, lang))
+    except Exception as e:
+        print(f"[YTCMS] {log_tag} failed video_id={video_id}: {e}")
+        await _set_job_state(video_id, status="fail", percent=-1)
 
 
 @router.post("/manage/video/{video_id}/captions/process")
@@ -94,22 +204,11 @@ async def captions_process(
             return JSONResponse({"ok": False, "error": "storage_missing"}, status_code=404)
 
         await reset_video_captions(conn, video_id)
-        _clear_job_state(video_id)
+        await _clear_job_state(video_id)
     finally:
         await release_conn(conn)
 
-    try:
-        job_id, job_server = await asyncio.to_thread(
-            submit_storage_job,
-            video_id=video_id,
-            storage_rel=storage_rel,
-            lang=lang,
-            task="transcribe",
-        )
-        _set_job_state(video_id, status="wait", percent=-1, job_id=job_id, job_server=job_server)
-    except Exception as e:
-        print(f"[YTCMS] submit failed video_id={video_id}: {e}")
-        _set_job_state(video_id, status="fail", percent=-1, job_id=None, job_server=None)
+    await _submit_job(video_id, storage_rel, lang, "submit")
 
     return RedirectResponse(url=f"/manage/video/{video_id}/media", status_code=303)
 
@@ -146,115 +245,42 @@ async def captions_status(video_id: str = Query(...)):
         job_id = meta.get("ytcms_job_id") or meta.get("job_id")
         job_server = meta.get("ytcms_job_server") or meta.get("job_server")
 
-    js = _get_job_state(video_id) or {}
+    js = await _get_job_state(video_id) or {}
     job_id = job_id or js.get("job_id")
     job_server = job_server or js.get("job_server")
 
     if ready or rel_vtt:
-        return {
-            "ok": True,
-            "video_id": video_id,
-            "status": "done",
-            "percent": 100,
-            "has_vtt": True,
-            "rel_vtt": rel_vtt,
-            "lang": lang,
-            "job_id": job_id,
-            "job_server": job_server,
-        }
+        return _status_payload(video_id, "done", 100, lang, job_id, job_server, rel_vtt=rel_vtt)
+
+    # Registry is kept current by the watcher of whichever worker submitted the job;
+    # only poll ytcms here when nobody has reported for a while.
+    if js and (js.get("status") in _TERMINAL_STATUSES or not job_registry.is_stale(js, settings.JOBS_STALE_SEC)):
+        return _status_payload(
+            video_id,
+            js.get("status") or "wait",
+            _registry_percent(js),
+            lang,
+            js.get("job_id"),
+            js.get("job_server"),
+        )
 
     if job_id and job_server:
         try:
-            st = await asyncio.to_thread(ytcms_get_status, job_id=job_id, server_addr=job_server)
-            st_name = st.State.Name(st.state).lower()
-            pct = int(st.percent) if isinstance(getattr(st, "percent", None), (int, float)) else -1
-            pct = max(-1, min(100, pct))
-
-            if st_name in ("queued",):
-                ui_status = "wait"
-            elif st_name in ("running",):
-                ui_status = "process"
-            elif st_name in ("done",):
-                res = await asyncio.to_thread(ytcms_get_result, job_id=job_id, server_addr=job_server)
-                if res.state == ytcms_pb2.JobStatus.DONE:
-                    c = await get_conn()
-                    try:
-                        meta_to_store = {
-                            "ytcms_job_id": job_id,
-                            "ytcms_job_server": job_server,
-                            "lang": res.detected_lang or lang,
-                            "task": res.task,
-                            "model": res.model,
-                            "device": res.device,
-                            "compute_type": res.compute_type,
-                            "duration_sec": float(res.duration_sec or 0.0),
-                            "vtt_rel_path": res.vtt_rel_path,
-                            "meta_rel_path": res.meta_rel_path,
-                        }
-                        await set_video_captions(c, video_id, res.vtt_rel_path, res.detected_lang or lang, meta_to_store)
-                    finally:
-                        await release_conn(c)
-
-                    return {
-                        "ok": True,
-                        "video_id": video_id,
-                        "status": "done",
-                        "percent": 100,
-                        "has_vtt": True,
-                        "rel_vtt": res.vtt_rel_path,
-                        "lang": res.detected_lang or lang,
-                        "job_id": job_id,
-                        "job_server": job_server,
-                    }
-
-                ui_status = "fail"
-                pct = -1
-            elif st_name in ("failed", "canceled"):
-                ui_status = "fail"
-            else:
-                ui_status = "wait"
-
-            _set_job_state(video_id, status=ui_status, percent=pct, job_id=job_id, job_server=job_server)
-
-            return {
-                "ok": True,
-                "video_id": video_id,
-                "status": ui_status,
-                "percent": pct,
-                "has_vtt": False,
-                "rel_vtt": None,
-                "lang": lang,
-                "job_id": job_id,
-                "job_server": job_server,
-            }
+            return await _poll_ytcms(video_id, job_id, job_server, lang)
         except Exception:
             pass
 
-    js2 = _get_job_state(video_id)
-    if js2:
-        return {
-            "ok": True,
-            "video_id": video_id,
-            "status": js2.get("status") or "wait",
-            "percent": int(js2.get("percent", -1) or -1),
-            "has_vtt": False,
-            "rel_vtt": None,
-            "lang": lang,
-            "job_id": js2.get("job_id"),
-            "job_server": js2.get("job_server"),
-        }
+    if js:
+        return _status_payload(
+            video_id,
+            js.get("status") or "wait",
+            _registry_percent(js),
+            lang,
+            js.get("job_id"),
+            js.get("job_server"),
+        )
 
-    return {
-        "ok": True,
-        "video_id": video_id,
-        "status": "idle",
-        "percent": -1,
-        "has_vtt": False,
-        "rel_vtt": None,
-        "lang": lang,
-        "job_id": job_id,
-        "job_server": job_server,
-    }
+    return _status_payload(video_id, "idle", -1, lang, job_id, job_server)
 
 
 @router.post("/internal/ytcms/captions/retry")
@@ -279,22 +305,11 @@ async def captions_retry(
             raise HTTPException(status_code=404, detail="storage_missing")
 
         await reset_video_captions(conn, video_id)
-        _clear_job_state(video_id)
+        await _clear_job_state(video_id)
     finally:
         await release_conn(conn)
 
-    try:
-        job_id, job_server = await asyncio.to_thread(
-            submit_storage_job,
-            video_id=video_id,
-            storage_rel=storage_rel,
-            lang=lang,
-            task="transcribe",
-        )
-        _set_job_state(video_id, status="wait", percent=-1, job_id=job_id, job_server=job_server)
-    except Exception as e:
-        print(f"[YTCMS] retry submit failed video_id={video_id}: {e}")
-        _set_job_state(video_id, status="fail", percent=-1, job_id=None, job_server=None)
+    await _submit_job(video_id, storage_rel, lang, "retry submit")
 
     return RedirectResponse(url=f"/manage/video/{video_id}/media", status_code=303)
 
@@ -316,12 +331,12 @@ async def captions_delete(
             raise HTTPException(status_code=404, detail="video_not_ready")
 
         await reset_video_captions(conn, video_id)
-        _clear_job_state(video_id)
+        await _clear_job_state(video_id)
     finally:
         await release_conn(conn)
 
     try:
-        await asyncio.to_thread(ytcms_delete_captions, storage_rel=storage_rel)
+        await ytcms_delete_captions(storage_rel=storage_rel)
     except Exception as e:
         print(f"[YTCMS] delete failed video_id={video_id}: {e}")
 
@@ -12,6 +12,7 @@ from db import get_conn, release_conn
 from utils.security_ut import get_current_user
 from db.videos_query_db import get_owned_video_full as db_get_owned_video_full
 from db.ytconvert.ytconvert_jobs_db import get_ytconvert_job_by_video_id
+from services.job_registry_srv import job_registry, KIND_CONVERT
 
 
 router = APIRouter()
@@ -81,7 +82,10 @@ async def ytconvert_job_status(request: Request, video_id: str) -> Dict[str, Any
         if not owned:
             raise HTTPException(status_code=404, detail="Video not found")
 
-        job = await get_ytconvert_job_by_video_id(conn, video_id=video_id)
+        # live progress is reported by the runner into the job registry; DB row otherwise
+        job = await job_registry.get(KIND_CONVERT, video_id)
+        if job is None:
+            job = await get_ytconvert_job_by_video_id(conn, video_id=video_id)
     finally:
         await release_conn(conn)
 
@@ -1,10 +1,20 @@
-from typing import AsyncIterator, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 from fastapi import APIRouter, Request, Query, HTTPException, Path
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 import os
 import re
-
+import urllib.parse
+
+from config.ytstorage.ytstorage_cfg import (
+    YTSTORAGE_DELIVERY_MODE,
+    YTSTORAGE_URL_REQUIRE_SIG,
+    YTSTORAGE_ACCEL_PREFIX,
+    YTSTORAGE_OPEN_RANGE_BYTES,
+    YTSTORAGE_READAHEAD_BYTES,
+)
 from services.ytstorage.base_srv import StorageClient
+from services.ytstorage.range_stream_srv import range_streamer
+from utils.url_ut import sign_sprite_refs, storage_urls_signed, verify_storage_signature
 
 router = APIRouter(prefix="/internal/storage", tags=["storage"])
 
@@ -20,36 +30,34 @@ def _content_type_for(path: str) -> str:
     if low.endswith(".vtt"): return "text/vtt; charset=utf-8"
     if low.endswith(".webm"): return "video/webm"
     if low.endswith(".mp4"): return "video/mp4"
+    if low.endswith(".m4s"): return "video/iso.segment"
+    if low.endswith(".m3u8"): return "application/vnd.apple.mpegurl"
+    if low.endswith(".mpd"): return "application/dash+xml"
     return "application/octet-stream"
 
 
-def _cache_control_for(content_type: str) -> Optional[str]:
+# packaged streams: <storage_rel>/stream/v<ts>/..., a new package always gets a new directory
+_STREAM_RE = re.compile(r"/stream/v\d+/[^/]+$")
+
+
+def _cache_control_for(content_type: str, rel: str = "") -> Optional[str]:
     """
     Cache policy:
+    - Packaged stream segments/manifests: immutable (versioned directory).
     - For videos: keep downstream caching (unchanged).
     - For non-video assets (images, VTT, others): disable caching to ensure updates are visible immediately.
     """
+    if rel and _STREAM_RE.search(rel):
+        return "public, max-age=31536000, immutable"
     if content_type.startswith("video/"):
         return None  # let downstream (e.g. nginx) apply its own caching for videos
     # Disable caching for images/tracks/other small assets to avoid stale content
     return "no-store"
 
 
-async def _get_size(storage: StorageClient, rel: str) -> Optional[int]:
-    try:
-        st = storage.stat(rel)
-        if hasattr(st, "__await__"):  # async
-            st = await st
-        # st is a dict for remote, or tuple(size, mtime) for local
-        if isinstance(st, dict):
-            sz = int(st.get("size_bytes", -1))
-        elif isinstance(st, tuple) and len(st) >= 1:
-            sz = int(st[0])
-        else:
-            sz = -1
-        return sz if sz >= 0 else None
-    except Exception:
-        return None
+async def _get_meta(storage: StorageClient, rel: str) -> Optional[Dict[str, Any]]:
+    # cached size/etag: one Stat per file per TTL instead of per range request
+    return await range_streamer.meta(storage, rel)
 
 
 def _parse_range(hval: Optional[str], size: Optional[int]) -> Optional[Tuple[int, int]]:
@@ -90,103 +98,138 @@ def _parse_range(hval: Optional[str], size: Optional[int]) -> Optional[Tuple[int
         return (s, e)
 
 
-async def _stream_full(storage: StorageClient, rel: str, ct: str, size: Optional[int]) -> StreamingResponse:
-    async def _aiter() -> AsyncIterator[bytes]:
-        # Support both async and sync readers
-        try:
-            reader = await storage.open_reader(rel)  # async
-            async for chunk in reader:
-                if chunk:
-                    yield chunk
-        except TypeError:
-            reader = storage.open_reader(rel)        # sync
-            while True:
-                chunk = reader.read(256 * 1024)
-                if not chunk:
-                    break
-                yield chunk
-            try:
-                reader.close()
-            except Exception:
-                pass
-    headers = {}
-    if size is not None:
-        headers["Content-Length"] = str(size)
-    headers["Accept-Ranges"] = "bytes"
-    cc = _cache_control_for(ct)
+def _clamp_open_range(hval: Optional[str], rng: Tuple[int, int], ct: str) -> Tuple[int, int]:
+    """
+    Browsers ask for video as bytes=N- (to the end of file), which leaves read-ahead nothing to prefetch.
+    With read-ahead on, such ranges get a bounded window: a short 206 is valid, and the player's next
+    request starts where it ended, i.e. at the prefetched window.
+    """
+    if YTSTORAGE_READAHEAD_BYTES <= 0 or not ct.startswith("video/"):
+        return rng
+    m = _RANGE_RE.match((hval or "").strip())
+    if not m or m.group(1) == "" or m.group(2) != "":
+        return rng
+    start, end = rng
+    return (start, min(end, start + YTSTORAGE_OPEN_RANGE_BYTES - 1))
+
+
+def _base_headers(ct: str, etag: Optional[str], rel: str = "") -> Dict[str, str]:
+    headers = {"Accept-Ranges": "bytes"}
+    if etag:
+        headers["ETag"] = f'"{etag}"'
+    cc = _cache_control_for(ct, rel)
     if cc:
         headers["Cache-Control"] = cc
-    return StreamingResponse(_aiter(), media_type=ct, headers=headers, status_code=200)
+    return headers
+
+
+async def _stream_full(storage: StorageClient, rel: str, ct: str, size: Optional[int], etag: Optional[str] = None) -> StreamingResponse:
+    headers = _base_headers(ct, etag, rel)
+    if size is not None:
+        headers["Content-Length"] = str(size)
+    body = range_streamer.stream(storage, rel, 0, -1, size)
+    return StreamingResponse(body, media_type=ct, headers=headers, status_code=200)
 
 
-async def _stream_range(storage: StorageClient, rel: str, ct: str, size: int, rng: Tuple[int, int]) -> StreamingResponse:
+async def _stream_range(storage: StorageClient, rel: str, ct: str, size: int, rng: Tuple[int, int], etag: Optional[str] = None) -> StreamingResponse:
     start, end = rng
     length = end - start + 1
 
-    async def _aiter() -> AsyncIterator[bytes]:
-        try:
-            reader = await storage.open_reader(rel, offset=start, length=length)  # async
-            async for chunk in reader:
-                if chunk:
-                    yield chunk
-        except TypeError:
-            reader = storage.open_reader(rel)        # sync (no offset/length for local)
-            try:
-                reader.seek(start)
-            except Exception:
-                pass
-            remaining = length
-            while remaining > 0:
-                chunk = reader.read(min(256 * 1024, remaining))
-                if not chunk:
-                    break
-                remaining -= len(chunk)
-                yield chunk
-            try:
-                reader.close()
-            except Exception:
-                pass
-
-    headers = {
+    headers = _base_headers(ct, etag, rel)
+    headers.update({
         "Content-Type": ct,
         "Content-Length": str(length),
         "Content-Range": f"bytes {start}-{end}/{size}",
-        "Accept-Ranges": "bytes",
+    })
+    body = range_streamer.stream(storage, rel, start, length, size)
+    return StreamingResponse(body, media_type=ct, headers=headers, status_code=206)
+
+
+def _check_signature(request: Request, rel: str) -> None:
+    """
+    Signed URLs are verified whenever present; unsigned ones only pass while YTSTORAGE_URL_REQUIRE_SIG is off.
+    """
+    expires = request.query_params.get("expires")
+    sig = request.query_params.get("sig")
+    if not (expires or sig) and not YTSTORAGE_URL_REQUIRE_SIG:
+        return
+    if not verify_storage_signature(rel, expires, sig):
+        raise HTTPException(status_code=403, detail="invalid_or_expired_signature")
+
+
+def _accel_response(rel: str, ct: str) -> Response:
+    """
+    Offload byte delivery to nginx: it serves YTSTORAGE_ACCEL_PREFIX/<rel> from an `internal` location
+    (alias to storage root or proxy_pass to ytstorage HTTP). Range/206 handled by nginx.
+    """
+    headers = {
+        "X-Accel-Redirect": YTSTORAGE_ACCEL_PREFIX.rstrip("/") + "/" + urllib.parse.quote(rel),
+        "Content-Type": ct,
     }
-    cc = _cache_control_for(ct)
+    cc = _cache_control_for(ct, rel)
     if cc:
         headers["Cache-Control"] = cc
-    return StreamingResponse(_aiter(), media_type=ct, headers=headers, status_code=206)
+    return Response(status_code=200, headers=headers)
+
 
+# sprite VTTs are a few KB; anything bigger is not rewritten
+_VTT_REWRITE_MAX_BYTES = 2 * 1024 * 1024
 
-async def _serve(request: Request, raw_path: str) -> StreamingResponse:
+
+async def _signed_vtt_response(storage: StorageClient, rel: str, ct: str, size: Optional[int]) -> Response:
+    """
+    VTT with its relative sprite refs replaced by signed URLs (see utils.url_ut.build_sprites_vtt_url).
+    """
+    buf = bytearray()
+    async for chunk in range_streamer.stream(storage, rel, 0, -1, size):
+        buf.extend(chunk)
+        if len(buf) > _VTT_REWRITE_MAX_BYTES:
+            raise HTTPException(status_code=413, detail="vtt_too_large")
+    text = sign_sprite_refs(bytes(buf).decode("utf-8", errors="replace"), rel)
+    return Response(content=text.encode("utf-8"), media_type=ct, headers={"Cache-Control": "no-store"})
+
+
+async def _serve(request: Request, raw_path: str) -> Response:
     if not raw_path:
         raise HTTPException(status_code=400, detail="missing_path")
     rel = raw_path.strip().lstrip("/")
-    storage: StorageClient = request.app.state.storage
+    _check_signature(request, rel)
     ct = _content_type_for(rel)
 
-    size = await _get_size(storage, rel)
+    signed_vtt = rel.lower().endswith(".vtt") and storage_urls_signed()
+    if YTSTORAGE_DELIVERY_MODE == "accel" and not signed_vtt:
+        return _accel_response(rel, ct)
+
+    storage: StorageClient = request.app.state.storage
+
+    meta = await _get_meta(storage, rel)
+    size: Optional[int] = meta["size_bytes"] if meta else None
+    etag: Optional[str] = meta.get("etag") if meta else None
+    if signed_vtt:
+        if meta is None:
+            raise HTTPException(status_code=404, detail="not_found")
+        return await _signed_vtt_response(storage, rel, ct, size)
     # Parse Range if present and we know size
     rng_hdr = request.headers.get("range") or request.headers.get("Range")
     rng = _parse_range(rng_hdr, size)
 
     if rng and size is not None:
-        return await _stream_range(storage, rel, ct, size, rng)
+        rng = _clamp_open_range(rng_hdr, rng, ct)
+        return await _stream_range(storage, rel, ct, size, rng, etag)
 
     # Fallback: full stream
-    return await _stream_full(storage, rel, ct, size)
+    return await _stream_full(storage, rel, ct, size, etag)
 
 
 @router.get("/file")
-async def storage_file_query(request: Request, path: str = Query(...)) -> StreamingResponse:
+async def storage_file_query(request: Request, path: str = Query(...)) -> Response:
     """
     Form-1: /internal/storage/file?path=Fx/Fx8.../original.webm
     """
     return await _serve(request, path)
 
 @router.get("/file/{path:path}")
-async def storage_file_path(request: Request, path: str = Path(...)) -> StreamingResponse:
+async def storage_file_path(request: Request, path: str = Path(...)) -> Response:
     """
     Form-2: /internal/storage/file/Fx/Fx8.../sprites/sprite_0001.jpg
     """
@@ -3,17 +3,28 @@ import os
 import json
 import inspect
 import asyncio
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Request, HTTPException, Form, Query
 from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
 
 from config.config import settings
+from config.yttrans.yttrans_cfg import YTTRANS_WRITE_CONCURRENCY
 from db import get_conn, release_conn
 from db.videos_db import get_owned_video
+from db.yttrans.translations_db import (
+    get_translations_state,
+    start_translation_job,
+    update_translation_job,
+    upsert_caption_track,
+    delete_caption_tracks,
+    reset_translations,
+    import_translations_meta,
+)
 from utils.security_ut import get_current_user
 
+from services.job_registry_srv import job_registry, KIND_TRANSLATIONS
+from services.job_watch_srv import watch_job
 from services.ytstorage.base_srv import StorageClient
 from services.yttrans.yttrans_client_srv import (
     list_languages,
@@ -24,9 +35,9 @@ from services.yttrans.yttrans_client_srv import (
 )
 
 from utils.yttrans.yttrans_ut import lang_display_name_en
+from utils.templates_ut import templates
 
 router = APIRouter(tags=["yttrans"])
-templates = Jinja2Templates(directory="templates")
 
 
 def _csrf_cookie_name() -> str:
@@ -143,11 +154,94 @@ async def _read_translations_meta(storage_client: StorageClient, storage_rel: st
         }
 
 
-async def _write_translations_meta(storage_client: StorageClient, storage_rel: str, meta: Dict[str, Any]) -> None:
-    rel = os.path.join(storage_rel.rstrip("/"), "captions", "translations.meta.json")
-    await _touch_dir(storage_client, os.path.dirname(rel))
-    payload = json.dumps(meta, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
-    await _write_bytes(storage_client, rel, payload)
+async def _write_translations(
+    storage_client: StorageClient,
+    captions_dir: str,
+    entries: List[Tuple[str, str]],
+    video_id: str,
+    on_written: Callable[[str], Awaitable[None]],
+) -> List[str]:
+    """
+    Write <lang>.vtt files, YTTRANS_WRITE_CONCURRENCY at a time. Workers pop entries from the list,
+    so each VTT text is freed as soon as it is written. Returns langs written, in completion order.
+    """
+    wrote: List[str] = []
+    entries.reverse()
+
+    async def _worker() -> None:
+        while entries:
+            lang_code, vtt_text = entries.pop()
+            if not lang_code:
+                continue
+            rel = os.path.join(captions_dir, f"{lang_code}.vtt")
+            try:
+                await _write_bytes(storage_client, rel, (vtt_text or "").encode("utf-8"))
+            except Exception as e:
+                print(f"[YTTRANS] write failed lang={lang_code} video_id={video_id}: {e}")
+                continue
+            finally:
+                del vtt_text
+            wrote.append(lang_code)
+            await on_written(lang_code)
+
+    await asyncio.gather(*(_worker() for _ in range(max(1, min(YTTRANS_WRITE_CONCURRENCY, len(entries))))))
+    return wrote
+
+
+_FINAL_JOB_STATES = ("done", "failed")
+
+
+async def _load_translations_state(storage_client: StorageClient, storage_rel: str, video_id: str) -> Dict[str, Any]:
+    """
+    Langs and last job from video_caption_tracks / video_translation_jobs. A legacy
+    captions/translations.meta.json is imported on first access (an empty job row marks the video as checked).
+    """
+    conn = await get_conn()
+    try:
+        st = await get_translations_state(conn, video_id)
+        if st is None:
+            meta = await _read_translations_meta(storage_client, storage_rel)
+            await import_translations_meta(conn, video_id, meta, os.path.join(storage_rel, "captions"))
+            st = await get_translations_state(conn, video_id)
+    finally:
+        await release_conn(conn)
+    return st or {"langs": [], "default_lang": "", "job_id": "", "job_server": "", "state": "", "message": "", "result_fetched": False}
+
+
+async def _trans_job_state(storage_client: StorageClient, storage_rel: str, video_id: str) -> Dict[str, Any]:
+    """
+    Translation state from the job registry. Seeded once from the DB
+    (written langs, default lang, last job) when the registry has no entry for the video.
+    """
+    st = await job_registry.get(KIND_TRANSLATIONS, video_id)
+    if st is not None and "langs" in st:
+        return st
+    db_st = await _load_translations_state(storage_client, storage_rel, video_id)
+    seed: Dict[str, Any] = {
+        "langs": list(db_st.get("langs") or []),
+        "default_lang": db_st.get("default_lang") or "",
+        "job_id": db_st.get("job_id") or "",
+        "job_server": db_st.get("job_server") or "",
+        "state": db_st.get("state") or "",
+        "message": db_st.get("message") or "",
+    }
+    seed.update(st or {})
+    await job_registry.update(KIND_TRANSLATIONS, video_id, seed)
+    return seed
+
+
+async def _report_partial(video_id: str, pr: Dict[str, Any]) -> None:
+    await job_registry.update(
+        KIND_TRANSLATIONS,
+        video_id,
+        {
+            "state": pr.get("state") or "",
+            "percent": int(pr.get("percent", -1)),
+            "message": pr.get("message") or "",
+            "ready_langs": list(pr.get("ready_langs") or []),
+            "total_langs": int(pr.get("total_langs", 0) or 0),
+        },
+    )
 
 
 @router.get("/manage/video/{video_id}/translations", response_class=HTMLResponse)
@@ -183,7 +277,7 @@ async def video_translations_page(request: Request, video_id: str) -> Any:
                 default_src = "auto"
                 meta = {"error": f"{e}"}
 
-        trans_meta = await _read_translations_meta(storage_client, storage_rel)
+        trans_meta = await _load_translations_state(storage_client, storage_rel, video_id)
         existing_langs: List[str] = []
         try:
             existing_langs = list(trans_meta.get("langs") or [])
@@ -214,10 +308,6 @@ async def video_translations_page(request: Request, video_id: str) -> Any:
                 "trans_meta": trans_meta,
                 "existing_langs": existing_langs,
                 "csrf_token": csrf_token,
-                "brand_logo_url": settings.BRAND_LOGO_URL,
-                "brand_tagline": settings.BRAND_TAGLINE,
-                "favicon_url": settings.FAVICON_URL,
-                "apple_touch_icon_url": settings.APPLE_TOUCH_ICON_URL,
                 "storage_public_base_url": getattr(settings, "STORAGE_PUBLIC_BASE_URL", None),
             },
             headers={"Cache-Control": "no-store"},
@@ -279,55 +369,69 @@ async def translations_generate(
         return RedirectResponse(url=f"/manage/video/{video_id}/translations", status_code=303)
 
     # Persist job id immediately
+    await job_registry.update(
+        KIND_TRANSLATIONS,
+        video_id,
+        {
+            "job_id": job_id,
+            "job_server": job_server,
+            "state": "running",
+            "percent": -1,
+            "message": "",
+            "ready_langs": [],
+            "total_langs": len(target_langs),
+        },
+    )
     try:
-        trans_meta = await _read_translations_meta(storage_client, storage_rel)
-        trans_meta["video_id"] = video_id
-        trans_meta["job_id"] = job_id
-        trans_meta["job_server"] = job_server
-        trans_meta["job_state"] = "running"
-        trans_meta["job_message"] = ""
-        trans_meta["job_result_fetched"] = False
-        import time
-        trans_meta["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        await _write_translations_meta(storage_client, storage_rel, trans_meta)
+        # imports a legacy meta file first, so its langs are kept
+        await _load_translations_state(storage_client, storage_rel, video_id)
+        conn = await get_conn()
+        try:
+            await start_translation_job(conn, video_id, job_id, job_server)
+        finally:
+            await release_conn(conn)
     except Exception as e:
-        print(f"[YTTRANS] meta job_id write failed video_id={video_id}: {e}")
+        print(f"[YTTRANS] job row write failed video_id={video_id}: {e}")
 
     async def _bg_worker() -> None:
         print(f"[YTTRANS] job queued video_id={video_id} job_id={job_id} server={job_server} langs={target_langs}")
         try:
-            pr: Dict[str, Any] = {"state": "running", "percent": -1, "message": "", "ready_langs": [], "total_langs": 0}
-
-            # Poll partial until DONE/FAILED
-            for _ in range(900):  # ~15 min
-                pr = await get_partial_result(job_id, server=job_server)
-
-                # Persist last known status (optional, used by UI)
+            async def _poll() -> Dict[str, Any]:
+                return await get_partial_result(job_id, server=job_server)
+
+            async def _on_transition(prev_state: Any, snap: Dict[str, Any]) -> None:
+                # video_translation_jobs keeps the last job state; "running" was written on submit,
+                # "done" is written below together with the result
+                st = (snap.get("state") or "").lower()
+                if st == "done" or (prev_state is None and st == "running"):
+                    return
                 try:
-                    trans_meta2 = await _read_translations_meta(storage_client, storage_rel)
-                    trans_meta2["job_id"] = job_id
-                    trans_meta2["job_server"] = job_server
-                    trans_meta2["job_state"] = pr.get("state") or trans_meta2.get("job_state") or ""
-                    trans_meta2["job_message"] = pr.get("message") or trans_meta2.get("job_message") or ""
-                    import time
-                    trans_meta2["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-                    await _write_translations_meta(storage_client, storage_rel, trans_meta2)
+                    c = await get_conn()
+                    try:
+                        await update_translation_job(c, video_id, state=snap.get("state") or "", message=snap.get("message") or "")
+                    finally:
+                        await release_conn(c)
                 except Exception:
                     pass
 
-                st = (pr.get("state") or "").lower()
-                if st in ("done", "failed"):
-                    break
-
-                await asyncio.sleep(1.0)
+            # Progress goes to the job registry on every change, the DB only on state transitions
+            pr = await watch_job(
+                poll=_poll,
+                is_final=lambda snap: (snap.get("state") or "").lower() in _FINAL_JOB_STATES,
+                on_change=lambda snap: _report_partial(video_id, snap),
+                on_transition=_on_transition,
+                heartbeat=lambda: job_registry.touch(KIND_TRANSLATIONS, video_id),
+                timeout_sec=900.0,  # ~15 min
+                label=f"yttrans {job_id}",
+            ) or {}
 
             if (pr.get("state") or "").lower() != "done":
                 print(f"[YTTRANS] job failed video_id={video_id} job_id={job_id} server={job_server} msg={pr.get('message')}")
                 return
 
             # DONE: fetch VTT exactly once (one-shot contract)
-            trans_meta3 = await _read_translations_meta(storage_client, storage_rel)
-            if bool(trans_meta3.get("job_result_fetched")):
+            db_st = await _load_translations_state(storage_client, storage_rel, video_id)
+            if db_st.get("job_id") == job_id and bool(db_st.get("result_fetched")):
                 print(f"[YTTRANS] result already fetched (skip) video_id={video_id} job_id={job_id}")
                 return
 
@@ -336,36 +440,38 @@ async def translations_generate(
             captions_dir = os.path.join(storage_rel, "captions")
             await _touch_dir(storage_client, captions_dir)
 
-            wrote_langs: List[str] = []
-            for lang_code, vtt_text in entries:
-                if not lang_code:
-                    continue
-                rel = os.path.join(captions_dir, f"{lang_code}.vtt")
+            existing = set(db_st.get("langs") or [])
+
+            async def _on_written(lang_code: str) -> None:
+                # track row makes the language visible on the watch page right away
+                c = await get_conn()
                 try:
-                    await _write_bytes(storage_client, rel, (vtt_text or "").encode("utf-8"))
-                    wrote_langs.append(lang_code)
-                except Exception as e:
-                    print(f"[YTTRANS] write failed lang={lang_code} video_id={video_id}: {e}")
-
-            trans_meta = await _read_translations_meta(storage_client, storage_rel)
-            existing = set(trans_meta.get("langs") or [])
-            for l in wrote_langs:
-                existing.add(l)
-            trans_meta["langs"] = sorted(existing)
-            if default_lang:
-                trans_meta["default_lang"] = default_lang
-            elif not trans_meta.get("default_lang"):
-                trans_meta["default_lang"] = "auto"
-            trans_meta["video_id"] = video_id
-            trans_meta["engine"] = meta.get("engine") or trans_meta.get("engine") or ""
-            trans_meta["job_id"] = job_id
-            trans_meta["job_server"] = job_server
-            trans_meta["job_state"] = "done"
-            trans_meta["job_message"] = ""
-            trans_meta["job_result_fetched"] = True
-            import time
-            trans_meta["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-            await _write_translations_meta(storage_client, storage_rel, trans_meta)
+                    await upsert_caption_track(c, video_id, lang_code, os.path.join(captions_dir, f"{lang_code}.vtt"))
+                finally:
+                    await release_conn(c)
+                existing.add(lang_code)
+                await job_registry.update(KIND_TRANSLATIONS, video_id, {"langs": sorted(existing)})
+
+            wrote_langs = await _write_translations(storage_client, captions_dir, entries, video_id, _on_written)
+            final_default = default_lang or db_st.get("default_lang") or "auto"
+            c = await get_conn()
+            try:
+                await update_translation_job(
+                    c,
+                    video_id,
+                    state="done",
+                    message="",
+                    result_fetched=True,
+                    default_lang=final_default,
+                    engine=meta.get("engine") or db_st.get("engine") or "",
+                )
+            finally:
+                await release_conn(c)
+            await job_registry.update(
+                KIND_TRANSLATIONS,
+                video_id,
+                {"langs": sorted(existing), "default_lang": final_default, "state": "done", "message": ""},
+            )
             print(f"[YTTRANS] translations written video_id={video_id} langs={wrote_langs}")
         except Exception as e:
             print(f"[YTTRANS] worker failed video_id={video_id}: {e}")
@@ -413,23 +519,27 @@ async def translations_delete(
         except Exception:
             pass
 
-    trans_meta = await _read_translations_meta(storage_client, storage_rel)
-    exist = set(trans_meta.get("langs") or [])
-    for l in target_langs:
-        if l in exist:
-            exist.remove(l)
-    trans_meta["langs"] = sorted(exist)
-    if trans_meta.get("default_lang") in target_langs:
-        src_lang = trans_meta.get("source_lang") or ""
-        if src_lang and src_lang in trans_meta["langs"]:
-            trans_meta["default_lang"] = src_lang
-        elif trans_meta["langs"]:
-            trans_meta["default_lang"] = trans_meta["langs"][0]
-        else:
-            trans_meta["default_lang"] = "auto"
-    import time
-    trans_meta["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-    await _write_translations_meta(storage_client, storage_rel, trans_meta)
+    st = await _load_translations_state(storage_client, storage_rel, video_id)
+    conn = await get_conn()
+    try:
+        langs = await delete_caption_tracks(conn, video_id, target_langs)
+        default_lang = st.get("default_lang") or ""
+        if default_lang in target_langs:
+            src_lang = st.get("source_lang") or ""
+            if src_lang and src_lang in langs:
+                default_lang = src_lang
+            elif langs:
+                default_lang = langs[0]
+            else:
+                default_lang = "auto"
+            await update_translation_job(conn, video_id, default_lang=default_lang)
+    finally:
+        await release_conn(conn)
+    await job_registry.update(
+        KIND_TRANSLATIONS,
+        video_id,
+        {"langs": langs, "default_lang": default_lang},
+    )
 
     return RedirectResponse(url=f"/manage/video/{video_id}/translations", status_code=303)
 
@@ -443,7 +553,7 @@ async def translations_reset_all(
     """
     Hard reset translations state for video:
     - removes captions/*.vtt except captions.vtt
-    - removes captions/translations.meta.json
+    - removes caption tracks and clears the translation job row in db (and legacy captions/translations.meta.json)
     Fixes issues then service fail or redis was cleaned.. and job is removed on other side. Permit 502 errors.
     """
     user = get_current_user(request)
@@ -508,7 +618,7 @@ async def translations_reset_all(
         # if listing isn't supported, we still can at least delete meta
         pass
 
-    # 2) remove translations meta
+    # 2) remove legacy translations meta (otherwise it would be imported again on next page load)
     meta_rel = os.path.join(captions_dir, "translations.meta.json")
     try:
         rm = storage_client.remove(meta_rel)
@@ -516,23 +626,16 @@ async def translations_reset_all(
             await rm
         removed_any = True
     except Exception:
-        # Fallback: overwrite meta with empty reset structure (so UI stops polling job_id)
-        try:
-            trans_meta = await _read_translations_meta(storage_client, storage_rel)
-            trans_meta["video_id"] = video_id
-            trans_meta["langs"] = []
-            trans_meta["default_lang"] = "auto"
-            trans_meta["job_id"] = ""
-            trans_meta["job_server"] = ""
-            trans_meta["job_state"] = ""
-            trans_meta["job_message"] = ""
-            trans_meta["job_result_fetched"] = False
-            import time
-            trans_meta["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-            await _write_translations_meta(storage_client, storage_rel, trans_meta)
-            removed_any = True
-        except Exception:
-            pass
+        pass
+
+    # 3) tracks + job row
+    conn = await get_conn()
+    try:
+        await reset_translations(conn, video_id)
+    finally:
+        await release_conn(conn)
+
+    await job_registry.clear(KIND_TRANSLATIONS, video_id)
 
     return RedirectResponse(url=f"/manage/video/{video_id}/translations", status_code=303)
 
@@ -553,20 +656,15 @@ async def translations_status(request: Request, video_id: str = Query(...)) -> A
         await release_conn(conn)
 
     storage_client: StorageClient = request.app.state.storage
-    meta = await _read_translations_meta(storage_client, storage_rel)
-    langs = list(meta.get("langs") or [])
-    default_lang = meta.get("default_lang") or ""
-    job_id = meta.get("job_id") or ""
-    job_state = meta.get("job_state") or ""
-    job_message = meta.get("job_message") or ""
+    st = await _trans_job_state(storage_client, storage_rel, video_id)
     return JSONResponse(
         {
             "ok": True,
-            "langs": langs,
-            "default_lang": default_lang,
-            "job_id": job_id,
-            "job_state": job_state,
-            "job_message": job_message,
+            "langs": list(st.get("langs") or []),
+            "default_lang": st.get("default_lang") or "",
+            "job_id": st.get("job_id") or "",
+            "job_state": st.get("state") or "",
+            "job_message": st.get("message") or "",
         }
     )
 
@@ -577,7 +675,7 @@ async def translations_progress(request: Request, video_id: str = Query(...)) ->
     UI polling endpoint:
     - Uses GetPartialResult during QUEUED/RUNNING/DONE/FAILED
     - Never calls GetResult (one-shot)
-    - Also returns langs_written from translations.meta.json (actual stored VTT files)
+    - Also returns langs_written from video_caption_tracks (actual stored VTT files)
     """
     user = get_current_user(request)
     if not user:
@@ -593,21 +691,21 @@ async def translations_progress(request: Request, video_id: str = Query(...)) ->
         await release_conn(conn)
 
     storage_client: StorageClient = request.app.state.storage
-    meta = await _read_translations_meta(storage_client, storage_rel)
+    st = await _trans_job_state(storage_client, storage_rel, video_id)
 
-    saved_langs = list(meta.get("langs") or [])
-    job_id = (meta.get("job_id") or "").strip()
-    job_server = (meta.get("job_server") or "").strip()
-    default_lang = meta.get("default_lang") or ""
+    saved_langs = list(st.get("langs") or [])
+    job_id = (st.get("job_id") or "").strip()
+    job_server = (st.get("job_server") or "").strip()
+    default_lang = st.get("default_lang") or ""
 
     if not job_id:
         return JSONResponse(
             {
                 "ok": True,
                 "job_id": "",
-                "state": meta.get("job_state") or "",
+                "state": st.get("state") or "",
                 "percent": -1,
-                "message": meta.get("job_message") or "",
+                "message": st.get("message") or "",
                 "ready_langs": [],
                 "total_langs": 0,
                 "langs_written": saved_langs,
@@ -615,10 +713,16 @@ async def translations_progress(request: Request, video_id: str = Query(...)) ->
             }
         )
 
-    try:
-        pr = await get_partial_result(job_id, server=job_server or None)
-    except Exception as e:
-        return JSONResponse({"ok": False, "error": f"partial_failed:{e}"}, status_code=502)
+    # The submitting worker reports progress into the registry; ask yttrans directly
+    # only when an unfinished job has no report yet (seeded from the db) or none for a while.
+    pr: Dict[str, Any] = st
+    state = (st.get("state") or "").lower()
+    if state not in _FINAL_JOB_STATES and ("percent" not in st or job_registry.is_stale(st, settings.JOBS_STALE_SEC)):
+        try:
+            pr = await get_partial_result(job_id, server=job_server or None)
+        except Exception as e:
+            return JSONResponse({"ok": False, "error": f"partial_failed:{e}"}, status_code=502)
+        await _report_partial(video_id, pr)
 
     return JSONResponse(
         {
@@ -632,4 +736,4 @@ async def translations_progress(request: Request, video_id: str = Query(...)) ->
             "langs_written": saved_langs,
             "default_lang": default_lang,
         }
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,101 @@
+"""
+User avatar URLs shared by comments, notifications and listing pages.
+
+- avatar_small_url(path): avatar.png -> avatar_small.png storage URL (default picture if no avatar)
+- process-wide uid -> avatar path cache (TTL, negative results too); listing queries that
+  already joined user_assets prime it for free
+- get_avatar_small_urls(conn, uids): one `= ANY($1)` query for all cache misses
+- invalidate_avatar(uid): called after avatar upload/delete; other processes see the change after TTL
+"""
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+import asyncpg
+
+from config.config import settings
+from db.user_assets_db import get_user_avatar_paths
+from utils.url_ut import build_storage_url
+
+DEFAULT_AVATAR_URL = "/static/img/avatar_default.svg"
+
+_MISS = object()
+
+
+def avatar_small_url(avatar_path: Optional[str], user_uid: Optional[str] = None) -> str:
+    if user_uid:
+        avatar_path_cache.put(user_uid, avatar_path or None)
+    if not avatar_path:
+        return DEFAULT_AVATAR_URL
+    if avatar_path.endswith("avatar.png"):
+        small_rel = avatar_path[: -len("avatar.png")] + "avatar_small.png"
+    else:
+        small_rel = avatar_path
+    return build_storage_url(small_rel)
+
+
+class _AvatarPathCache:
+    """
+    LRU with TTL: user_uid -> avatar rel path or None. Single event loop use, no locking.
+    """
+
+    def __init__(self, ttl_sec: int, max_items: int) -> None:
+        self._ttl = float(ttl_sec)
+        self._max = int(max_items)
+        self._items: "OrderedDict[str, Tuple[float, Optional[str]]]" = OrderedDict()
+
+    def get(self, user_uid: str) -> object:
+        """
+        Cached path (may be None), or _MISS.
+        """
+        it = self._items.get(user_uid)
+        if it is None:
+            return _MISS
+        ts, path = it
+        if time.monotonic() - ts > self._ttl:
+            self._items.pop(user_uid, None)
+            return _MISS
+        self._items.move_to_end(user_uid)
+        return path
+
+    def put(self, user_uid: str, path: Optional[str]) -> None:
+        if self._ttl <= 0 or not user_uid:
+            return
+        self._items[user_uid] = (time.monotonic(), path)
+        self._items.move_to_end(user_uid)
+        while len(self._items) > self._max:
+            self._items.popitem(last=False)
+
+    def invalidate(self, user_uid: str) -> None:
+        self._items.pop(user_uid, None)
+
+
+avatar_path_cache = _AvatarPathCache(
+    int(getattr(settings, "AVATAR_CACHE_TTL_SEC", 300)),
+    int(getattr(settings, "AVATAR_CACHE_MAX", 50000)),
+)
+
+
+async def get_avatar_small_urls(conn: asyncpg.Connection, user_uids: Iterable[str]) -> Dict[str, str]:
+    """
+    uid -> small avatar URL for every uid, with a single DB query for cache misses.
+    """
+    paths: Dict[str, Optional[str]] = {}
+    missing = []
+    for uid in dict.fromkeys(u for u in user_uids if u):
+        p = avatar_path_cache.get(uid)
+        if p is _MISS:
+            missing.append(uid)
+        else:
+            paths[uid] = p  # type: ignore[assignment]
+    if missing:
+        fetched = await get_user_avatar_paths(conn, missing)
+        for uid in missing:
+            p = fetched.get(uid)
+            avatar_path_cache.put(uid, p)
+            paths[uid] = p
+    return {uid: avatar_small_url(p) for uid, p in paths.items()}
+
+
+def invalidate_avatar(user_uid: str) -> None:
+    avatar_path_cache.invalidate(user_uid)
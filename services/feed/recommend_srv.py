@@ -4,7 +4,7 @@ import hashlib
 from typing import Any, Dict, List, Optional, Tuple, Set
 
 from config.config import settings
-from db import get_conn, release_conn
+from db import get_read_conn, release_conn
 from db.recommend_db import fetch_video_brief, list_category_public_recent, list_recent_from_authors
 from db.videos_db import list_author_public_videos
 from db.search_db import fetch_video_assets_by_ids
@@ -151,7 +151,7 @@ async def fetch_rightbar_for_video(video_id: str, user_uid: Optional[str], limit
 
     if playlist_id:
         try:
-            conn = await get_conn()
+            conn = await get_read_conn()
             try:
                 rows = await list_playlist_items_with_assets(conn, playlist_id)
             finally:
@@ -193,7 +193,7 @@ async def fetch_rightbar_for_video(video_id: str, user_uid: Optional[str], limit
     q_same_author = max(3, int(getattr(settings, "RIGHTBAR_MAX_SAME_AUTHOR_TOP10", 3)))
     q_same_cat = max(4, int(getattr(settings, "RIGHTBAR_MAX_SAME_CATEGORY_TOP10", 6)))
 
-    conn = await get_conn()
+    conn = await get_read_conn()
     try:
         ctx = await fetch_video_brief(conn, video_id)
         if not ctx or ctx.get("status") != "public":
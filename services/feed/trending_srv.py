@@ -1,7 +1,7 @@
 import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
-from db import get_conn, release_conn
+from db import get_read_conn, release_conn
 from db.trending_db import count_public_videos_in_window, fetch_trending_rows, fetch_recent_public_rows
 from utils.url_ut import build_storage_url
 
@@ -23,7 +23,7 @@ async def fetch_trending_page(limit: int, offset: int, days: int) -> Tuple[List[
     offset = max(0, int(offset))
     days = max(1, min(int(days), 365))
 
-    conn = await get_conn()
+    conn = await get_read_conn()
     try:
         total = await count_public_videos_in_window(conn, days)
         if total == 0:
@@ -67,7 +67,7 @@ async def fetch_recent_public(limit: int = 12) -> List[Dict[str, Any]]:
     """
     limit = max(1, min(int(limit), 50))
 
-    conn = await get_conn()
+    conn = await get_read_conn()
     try:
         rows = await fetch_recent_public_rows(conn, limit)
     finally:
@@ -384,4 +384,78 @@ async def async_transcode_audio(
         out_path,
     ]
     rc = await _run_proc(cmd)
-    return rc == 0 and os.path.exists(out_path)
\ No newline at end of file
+    return rc == 0 and os.path.exists(out_path)
+
+# ---------------------------------------------
+# Adaptive streaming packaging (async)
+# ---------------------------------------------
+
+async def async_has_audio(input_path: str) -> bool:
+    if not _have("ffprobe"):
+        return False
+    proc = await asyncio.create_subprocess_exec(
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "a",
+        "-show_entries",
+        "stream=index",
+        "-of",
+        "csv=p=0",
+        input_path,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    out, _ = await proc.communicate()
+    return proc.returncode == 0 and bool(out.strip())
+
+
+async def async_package_dash_hls(input_paths: List[str], out_dir: str, segment_sec: int = 4) -> bool:
+    """
+    Remux renditions (no re-encode) into fMP4 segments with one DASH manifest (manifest.mpd)
+    and an HLS master playlist (master.m3u8) over the same segments.
+    Video of every input is one representation; audio is taken from the first input.
+    """
+    if not _have("ffmpeg"):
+        return False
+    if not input_paths or not all(os.path.exists(p) for p in input_paths):
+        return False
+    os.makedirs(out_dir, exist_ok=True)
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y"]
+    for p in input_paths:
+        cmd += ["-i", p]
+    for i in range(len(input_paths)):
+        cmd += ["-map", f"{i}:v:0"]
+    adaptation_sets = "id=0,streams=v"
+    if await async_has_audio(input_paths[0]):
+        cmd += ["-map", "0:a:0"]
+        adaptation_sets += " id=1,streams=a"
+    cmd += [
+        "-c",
+        "copy",
+        "-strict",
+        "experimental",
+        "-f",
+        "dash",
+        "-dash_segment_type",
+        "mp4",
+        "-seg_duration",
+        str(max(1, int(segment_sec))),
+        "-use_template",
+        "1",
+        "-use_timeline",
+        "1",
+        "-init_seg_name",
+        "init-$RepresentationID$.m4s",
+        "-media_seg_name",
+        "chunk-$RepresentationID$-$Number%05d$.m4s",
+        "-adaptation_sets",
+        adaptation_sets,
+        "-hls_playlist",
+        "1",
+        os.path.join(out_dir, "manifest.mpd"),
+    ]
+    rc = await _run_proc(cmd)
+    return rc == 0 and os.path.exists(os.path.join(out_dir, "manifest.mpd")) and os.path.exists(os.path.join(out_dir, "master.m3u8"))
@@ -0,0 +1,166 @@
+"""
+Avatar / playlist cover image processing.
+
+- render_variants(data, specs): one Pillow decode (EXIF orientation applied), every requested
+  size/format encoded from it; runs in a bounded thread pool (IMAGE_WORKERS), never on the loop
+- upload_variants(storage, {rel: bytes}): all outputs written to storage concurrently
+- read_upload(upload): the uploaded file, refused before buffering when over IMAGE_MAX_BYTES
+Bad or oversized (IMAGE_MAX_BYTES, IMAGE_MAX_PIXELS) input raises ImageError.
+"""
+import asyncio
+import inspect
+import io
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from PIL import Image, ImageOps
+
+from config.config import settings
+from services.ytstorage.base_srv import StorageClient
+
+
+class ImageError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class ImageVariant:
+    name: str  # file name of the output, e.g. "avatar_small.png"
+    width: int
+    height: int
+    fmt: str  # "PNG" | "WEBP" | "JPEG"
+    crop: bool = False  # False: fit into width x height keeping ratio; True: center-crop to exactly width x height
+    quality: int = 85
+
+
+AVATAR_VARIANTS = (
+    ImageVariant("avatar.png", 512, 512, "PNG"),
+    ImageVariant("avatar_small.png", 96, 96, "PNG"),
+)
+
+PLAYLIST_COVER_VARIANTS = (
+    ImageVariant("cover.webp", 480, 270, "WEBP", crop=True),
+)
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=max(1, int(settings.IMAGE_WORKERS or 1)),
+            thread_name_prefix="images",
+        )
+    return _executor
+
+
+async def read_upload(upload, max_bytes: Optional[int] = None) -> bytes:
+    """
+    Reads an UploadFile, at most max_bytes (IMAGE_MAX_BYTES): a larger file raises ImageError("file_too_large")
+    without being read into memory.
+    """
+    limit = int(max_bytes if max_bytes is not None else settings.IMAGE_MAX_BYTES)
+    size = getattr(upload, "size", None)
+    if size is not None and size > limit:
+        raise ImageError("file_too_large")
+    data = await upload.read(limit + 1)
+    if len(data) > limit:
+        raise ImageError("file_too_large")
+    return data
+
+
+def _decode(data: bytes, max_w: int, max_h: int) -> Image.Image:
+    try:
+        img = Image.open(io.BytesIO(data))
+        if img.width * img.height > int(settings.IMAGE_MAX_PIXELS):
+            raise ImageError("image_too_large")
+        # JPEG: let libjpeg decode at a reduced scale when the source is much larger than needed
+        img.draft("RGB", (max_w * 2, max_h * 2))
+        img = ImageOps.exif_transpose(img)
+        img.load()
+    except ImageError:
+        raise
+    except Exception as e:
+        raise ImageError(f"invalid_image: {e}") from e
+    has_alpha = img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info)
+    return img.convert("RGBA" if has_alpha else "RGB")
+
+
+def _resize(img: Image.Image, v: ImageVariant) -> Image.Image:
+    if v.crop:
+        return ImageOps.fit(img, (v.width, v.height), Image.LANCZOS)
+    if img.width <= v.width and img.height <= v.height:
+        return img
+    out = img.copy()
+    out.thumbnail((v.width, v.height), Image.LANCZOS)
+    return out
+
+
+def _encode(img: Image.Image, v: ImageVariant) -> bytes:
+    if v.fmt == "JPEG" and img.mode != "RGB":
+        img = img.convert("RGB")
+    buf = io.BytesIO()
+    if v.fmt == "PNG":
+        img.save(buf, format="PNG", optimize=True)
+    elif v.fmt == "WEBP":
+        img.save(buf, format="WEBP", quality=v.quality, method=4)
+    else:
+        img.save(buf, format=v.fmt, quality=v.quality)
+    return buf.getvalue()
+
+
+def render_variants_sync(data: bytes, specs: Iterable[ImageVariant]) -> Dict[str, bytes]:
+    specs = list(specs)
+    if not specs:
+        return {}
+    img = _decode(data, max(v.width for v in specs), max(v.height for v in specs))
+    resized: Dict[tuple, Image.Image] = {}
+    out: Dict[str, bytes] = {}
+    # largest first; same geometry (PNG + WEBP of one size) is resized once
+    for v in sorted(specs, key=lambda s: s.width * s.height, reverse=True):
+        key = (v.width, v.height, v.crop)
+        if key not in resized:
+            resized[key] = _resize(img, v)
+        out[v.name] = _encode(resized[key], v)
+    return out
+
+
+async def render_variants(data: bytes, specs: Iterable[ImageVariant]) -> Dict[str, bytes]:
+    loop = asyncio.get_running_loop()
+    specs = list(specs)
+    return await loop.run_in_executor(_get_executor(), render_variants_sync, data, specs)
+
+
+async def _write(storage: StorageClient, rel_path: str, data: bytes) -> None:
+    writer_ctx = storage.open_writer(rel_path, overwrite=True)
+    if inspect.isawaitable(writer_ctx):
+        writer_ctx = await writer_ctx
+    if hasattr(writer_ctx, "__aenter__"):
+        async with writer_ctx as w:  # type: ignore[union-attr]
+            wr = w.write(data)
+            if inspect.isawaitable(wr):
+                await wr
+    else:
+        with writer_ctx as w:
+            w.write(data)
+
+
+async def upload_variants(storage: StorageClient, rel_dir: str, outputs: Dict[str, bytes]) -> List[str]:
+    """
+    Write every output into rel_dir at once. Returns the rel paths in the order of outputs.
+    """
+    mk = storage.mkdirs(rel_dir, exist_ok=True)
+    if inspect.isawaitable(mk):
+        await mk
+    rels = [storage.join(rel_dir, name) for name in outputs]
+    await asyncio.gather(*(_write(storage, rel, data) for rel, data in zip(rels, outputs.values())))
+    return rels
+
+
+def shutdown() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
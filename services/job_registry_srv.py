@@ -0,0 +1,236 @@
+"""
+Shared registry of background job progress (captions, sprites, translations, conversions).
+
+- one Redis hash per (kind, key), usually key = video_id; field values are JSON, "ts" is set on every write
+- TTL is refreshed on every write, finished jobs simply expire
+- every write is announced on a pub/sub channel: {"kind", "key", "fields"} (fields=None after clear)
+- update() skips the round trip when nothing changed since the last write from this process,
+  except for a heartbeat every heartbeat_sec so readers can tell a live watcher from a dead one;
+  watchers also call touch() periodically while a job reports nothing new
+- if Redis is unreachable, state is kept in a process-local dict (the old per-route behaviour)
+
+All uvicorn workers read the same state, so status endpoints are a single HGETALL.
+"""
+import asyncio
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Tuple
+
+from config.config import settings
+
+log = logging.getLogger("job_registry")
+
+KIND_CAPTIONS = "captions"
+KIND_SPRITES = "sprites"
+KIND_TRANSLATIONS = "translations"
+KIND_CONVERT = "convert"
+KIND_BACKFILL = "backfill"
+
+_Key = Tuple[str, str]
+
+
+def _dumps(v: Any) -> str:
+    return json.dumps(v, ensure_ascii=False, separators=(",", ":"))
+
+
+def _loads(v: Any) -> Any:
+    try:
+        return json.loads(v)
+    except Exception:
+        return v
+
+
+class _JobRegistry:
+    def __init__(self, redis_url: str, ttl_sec: int, prefix: str, heartbeat_sec: float) -> None:
+        self._url = (redis_url or "").strip()
+        self._ttl = max(1, int(ttl_sec))
+        self._heartbeat = min(float(heartbeat_sec), self._ttl / 2)
+        self._prefix = prefix
+        self._channel = f"{prefix}events"
+        self._redis = None
+        self._down_until = 0.0
+        # (kind, key) -> (ts, fields): fallback store and last-written snapshot
+        self._local: Dict[_Key, Tuple[float, Dict[str, Any]]] = {}
+
+    def _rkey(self, kind: str, key: str) -> str:
+        return f"{self._prefix}{kind}:{key}"
+
+    def _client(self):
+        if not self._url or time.monotonic() < self._down_until:
+            return None
+        if self._redis is None:
+            from redis.asyncio import Redis
+
+            self._redis = Redis.from_url(self._url, decode_responses=True, socket_timeout=2.0, socket_connect_timeout=2.0)
+        return self._redis
+
+    async def ping(self) -> Optional[float]:
+        """
+        Redis PING round trip in seconds (None if no redis is configured). Ignores the down back-off
+        and clears it on success, raises on failure.
+        """
+        if not self._url:
+            return None
+        if self._redis is None:
+            from redis.asyncio import Redis
+
+            self._redis = Redis.from_url(self._url, decode_responses=True, socket_timeout=2.0, socket_connect_timeout=2.0)
+        t0 = time.perf_counter()
+        await self._redis.ping()
+        self._down_until = 0.0
+        return time.perf_counter() - t0
+
+    def _mark_down(self, e: Exception) -> None:
+        # back off for a while instead of paying a connect timeout on every status poll
+        if time.monotonic() >= self._down_until:
+            log.warning("job registry: redis unavailable, using process-local state: %s", e)
+        self._down_until = time.monotonic() + 30.0
+
+    def _local_get(self, k: _Key) -> Optional[Dict[str, Any]]:
+        it = self._local.get(k)
+        if it is None:
+            return None
+        ts, fields = it
+        if time.time() - ts > self._ttl:
+            self._local.pop(k, None)
+            return None
+        return fields
+
+    async def get(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        k = (kind, key)
+        r = self._client()
+        if r is not None:
+            try:
+                raw = await r.hgetall(self._rkey(kind, key))
+                if not raw:
+                    self._local.pop(k, None)
+                    return None
+                fields = {f: _loads(v) for f, v in raw.items()}
+                self._local[k] = (time.time(), dict(fields))
+                return fields
+            except Exception as e:
+                self._mark_down(e)
+        fields = self._local_get(k)
+        return dict(fields) if fields is not None else None
+
+    async def update(self, kind: str, key: str, fields: Dict[str, Any], *, replace: bool = False) -> bool:
+        """
+        Merge fields into the job entry (replace=True drops previous fields first).
+        Returns False when the write was skipped because nothing changed.
+        """
+        k = (kind, key)
+        prev = self._local_get(k)
+        if not replace and prev is not None and all(k2 in prev and prev[k2] == v for k2, v in fields.items()):
+            if time.time() - float(prev.get("ts") or 0) < self._heartbeat:
+                return False
+
+        now = time.time()
+        data = dict(fields)
+        data["ts"] = now
+        merged = data if (replace or prev is None) else {**prev, **data}
+        self._local[k] = (now, merged)
+
+        r = self._client()
+        if r is not None:
+            rk = self._rkey(kind, key)
+            try:
+                async with r.pipeline(transaction=True) as p:
+                    if replace:
+                        p.delete(rk)
+                    p.hset(rk, mapping={f: _dumps(v) for f, v in data.items()})
+                    p.expire(rk, self._ttl)
+                    p.publish(self._channel, _dumps({"kind": kind, "key": key, "fields": data}))
+                    await p.execute()
+            except Exception as e:
+                self._mark_down(e)
+        return True
+
+    async def touch(self, kind: str, key: str) -> None:
+        """
+        Refreshes "ts" and the TTL without changing or announcing fields: the watcher is alive, the job
+        just has nothing new (a long phase without progress must not look stale to readers).
+        """
+        k = (kind, key)
+        prev = self._local_get(k)
+        if prev is None:
+            return
+        now = time.time()
+        prev["ts"] = now
+        self._local[k] = (now, prev)
+        r = self._client()
+        if r is None:
+            return
+        rk = self._rkey(kind, key)
+        try:
+            # never recreate an entry another process cleared
+            if await r.exists(rk):
+                async with r.pipeline(transaction=True) as p:
+                    p.hset(rk, "ts", _dumps(now))
+                    p.expire(rk, self._ttl)
+                    await p.execute()
+        except Exception as e:
+            self._mark_down(e)
+
+    async def clear(self, kind: str, key: str) -> None:
+        self._local.pop((kind, key), None)
+        r = self._client()
+        if r is None:
+            return
+        try:
+            async with r.pipeline(transaction=True) as p:
+                p.delete(self._rkey(kind, key))
+                p.publish(self._channel, _dumps({"kind": kind, "key": key, "fields": None}))
+                await p.execute()
+        except Exception as e:
+            self._mark_down(e)
+
+    async def subscribe(self, kinds: Optional[Iterable[str]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Change feed: yields {"kind", "key", "fields"} for every write made by any process.
+        Ends when Redis is not available.
+        """
+        r = self._client()
+        if r is None:
+            return
+        want = set(kinds) if kinds else None
+        ps = r.pubsub()
+        try:
+            await ps.subscribe(self._channel)
+            async for msg in ps.listen():
+                if msg.get("type") != "message":
+                    continue
+                ev = _loads(msg.get("data"))
+                if not isinstance(ev, dict):
+                    continue
+                if want is not None and ev.get("kind") not in want:
+                    continue
+                yield ev
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._mark_down(e)
+        finally:
+            try:
+                await ps.aclose()
+            except Exception:
+                pass
+
+    def is_stale(self, fields: Optional[Dict[str, Any]], max_age_sec: float) -> bool:
+        """
+        True if the entry has not been written for max_age_sec (e.g. the worker that watched it died).
+        """
+        if not fields:
+            return True
+        try:
+            return time.time() - float(fields.get("ts") or 0) > float(max_age_sec)
+        except Exception:
+            return True
+
+
+job_registry = _JobRegistry(
+    settings.JOBS_REDIS_URL,
+    settings.JOBS_TTL_SEC,
+    settings.JOBS_REDIS_PREFIX,
+    heartbeat_sec=settings.JOBS_STALE_SEC / 2,
+)
@@ -0,0 +1,167 @@
+"""
+Follow an external job (ytcms, yttrans, ytsprites, ytconvert) until it reaches a final state.
+
+- stream: server-streaming watch RPC (ytconvert WatchJob, ytsprites WatchStatus) when the service has one;
+  if the stream ends or fails before a final state, watching continues by polling
+- poll: one status round trip; repeated with exponential backoff while nothing changes,
+  back to the minimal interval after every change
+- on_change(snap): called only when the snapshot differs from the previous one (registry / UI progress)
+- on_transition(prev_state, snap): called only when snap[state_key] changes (persistent meta, DB rows)
+- heartbeat(): called every JOBS_STALE_SEC/3 while watching (job_registry.touch), so a long phase without
+  progress does not look like a dead watcher to status endpoints
+
+Snapshots are plain dicts; volatile keys (e.g. timestamps) should be left out by the caller.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+from config.config import settings
+
+log = logging.getLogger("job_watch")
+
+Snapshot = Dict[str, Any]
+
+
+class _Backoff:
+    def __init__(self, min_sec: float, max_sec: float, factor: float) -> None:
+        self._min = max(0.05, float(min_sec))
+        self._max = max(self._min, float(max_sec))
+        self._factor = max(1.0, float(factor))
+        self.delay = self._min
+
+    def reset(self) -> None:
+        self.delay = self._min
+
+    def grow(self) -> None:
+        self.delay = min(self._max, self.delay * self._factor)
+
+
+async def _heartbeat_loop(heartbeat: Callable[[], Awaitable[None]], label: str) -> None:
+    interval = max(1.0, settings.JOBS_STALE_SEC / 3.0)
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await heartbeat()
+        except Exception as e:
+            log.debug("%s: heartbeat failed: %s", label, e)
+
+
+async def watch_job(
+    *,
+    is_final: Callable[[Snapshot], bool],
+    poll: Optional[Callable[[], Awaitable[Snapshot]]] = None,
+    stream: Optional[Callable[[], AsyncIterator[Snapshot]]] = None,
+    on_change: Optional[Callable[[Snapshot], Awaitable[None]]] = None,
+    on_transition: Optional[Callable[[Optional[Any], Snapshot], Awaitable[None]]] = None,
+    heartbeat: Optional[Callable[[], Awaitable[None]]] = None,
+    **kw: Any,
+) -> Optional[Snapshot]:
+    """
+    Returns the final snapshot, or the last one seen if the job did not finish in time
+    (or the service kept failing), None if nothing was received at all.
+    """
+    beat = asyncio.create_task(_heartbeat_loop(heartbeat, kw.get("label", "job"))) if heartbeat is not None else None
+    try:
+        return await _watch(
+            is_final=is_final, poll=poll, stream=stream, on_change=on_change, on_transition=on_transition, **kw
+        )
+    finally:
+        if beat is not None:
+            beat.cancel()
+            try:
+                await beat
+            except asyncio.CancelledError:
+                pass
+
+
+async def _watch(
+    *,
+    is_final: Callable[[Snapshot], bool],
+    poll: Optional[Callable[[], Awaitable[Snapshot]]] = None,
+    stream: Optional[Callable[[], AsyncIterator[Snapshot]]] = None,
+    on_change: Optional[Callable[[Snapshot], Awaitable[None]]] = None,
+    on_transition: Optional[Callable[[Optional[Any], Snapshot], Awaitable[None]]] = None,
+    state_key: str = "state",
+    timeout_sec: float = 3600.0,
+    min_interval_sec: Optional[float] = None,
+    max_interval_sec: Optional[float] = None,
+    max_errors: int = 10,
+    label: str = "job",
+) -> Optional[Snapshot]:
+    if poll is None and stream is None:
+        raise ValueError("watch_job needs poll or stream")
+
+    deadline = time.monotonic() + float(timeout_sec)
+    last: Optional[Snapshot] = None
+
+    async def _seen(snap: Snapshot) -> bool:
+        nonlocal last
+        if snap == last:
+            return False
+        prev_state = last.get(state_key) if last is not None else None
+        last = dict(snap)
+        if on_change is not None:
+            await on_change(snap)
+        if on_transition is not None and snap.get(state_key) != prev_state:
+            await on_transition(prev_state, snap)
+        return True
+
+    if stream is not None:
+        try:
+            async for snap in stream():
+                await _seen(snap)
+                if is_final(snap) or time.monotonic() >= deadline:
+                    return last
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.info("%s: watch stream ended (%s), falling back to polling", label, e)
+        if poll is None:
+            return last
+
+    backoff = _Backoff(
+        min_interval_sec if min_interval_sec is not None else settings.JOB_WATCH_MIN_INTERVAL_MS / 1000.0,
+        max_interval_sec if max_interval_sec is not None else settings.JOB_WATCH_MAX_INTERVAL_MS / 1000.0,
+        settings.JOB_WATCH_BACKOFF_FACTOR,
+    )
+    errors = 0
+    while time.monotonic() < deadline:
+        try:
+            snap = await poll()
+            errors = 0
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            errors += 1
+            if errors >= max_errors:
+                log.warning("%s: giving up after %d failed polls: %s", label, errors, e)
+                return last
+            backoff.grow()
+            await asyncio.sleep(backoff.delay)
+            continue
+
+        if await _seen(snap):
+            backoff.reset()
+        else:
+            backoff.grow()
+        if is_final(snap):
+            return last
+        await asyncio.sleep(min(backoff.delay, max(0.0, deadline - time.monotonic())))
+    return last
+
+
+def backoff_delays(min_sec: Optional[float] = None, max_sec: Optional[float] = None):
+    """
+    Endless delays for blocking (thread) pollers that cannot tell whether anything changed:
+    min, min*factor, ... capped at max.
+    """
+    b = _Backoff(
+        min_sec if min_sec is not None else settings.JOB_WATCH_MIN_INTERVAL_MS / 1000.0,
+        max_sec if max_sec is not None else settings.JOB_WATCH_MAX_INTERVAL_MS / 1000.0,
+        settings.JOB_WATCH_BACKOFF_FACTOR,
+    )
+    while True:
+        yield b.delay
+        b.grow()
@@ -0,0 +1,191 @@
+from __future__ import annotations
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.config import settings
+
+log = logging.getLogger("loop_monitor")
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROUTES_DIR = os.path.join(_ROOT, "routes") + os.sep
+_SELF = os.path.abspath(__file__)
+
+
+class _LoopMonitor:
+    """
+    Event loop lag / stall detector (opt-in, LOOP_MONITOR_ENABLED).
+
+    How it works:
+    - A heartbeat task sleeps LOOP_MONITOR_INTERVAL_MS and measures how late it wakes up (= loop lag).
+    - A watchdog thread checks the heartbeat; when the loop has not come back for LOOP_MONITOR_THRESHOLD_MS
+      it samples the stack of the loop thread, i.e. the code that is blocking right now.
+    - When the heartbeat finally wakes up, the stall is logged with its real duration and the sampled stack,
+      and counted per route: the route handler (routes/*.py function) found in the sample,
+      otherwise the innermost project frame, otherwise "unknown" (stall shorter than one watchdog tick).
+
+    Methods:
+    - start() / stop(): from app startup/shutdown.
+    - metrics(): flat {name: float} for ytadmin Info/All.
+    - snapshot(): full state for /internal/monitor/loop.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        self._interval = 0.05
+        self._threshold = 0.1
+        self._stack_limit = 30
+
+        self._beat = 0.0  # monotonic time of the last heartbeat wakeup
+        self._sample: Optional[Tuple[str, List[str]]] = None  # (route, stack) of the current stall
+
+        self._lag_ms = 0.0
+        self._lag_max_ms = 0.0
+        self._stalls = 0
+        self._stalled_ms = 0.0
+        self._routes: Dict[str, Dict[str, float]] = {}
+        self._recent: List[Dict[str, Any]] = []
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        if self._task is not None or not settings.LOOP_MONITOR_ENABLED:
+            return
+        self._interval = max(0.005, int(settings.LOOP_MONITOR_INTERVAL_MS) / 1000.0)
+        self._threshold = max(0.01, int(settings.LOOP_MONITOR_THRESHOLD_MS) / 1000.0)
+        self._stack_limit = max(1, int(settings.LOOP_MONITOR_STACK_LIMIT))
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watchdog, name="loop-monitor", daemon=True)
+        self._thread.start()
+        log.info(
+            "loop monitor started interval_ms=%.0f threshold_ms=%.0f",
+            self._interval * 1000, self._threshold * 1000,
+        )
+
+    async def stop(self) -> None:
+        self._stop.set()
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    async def _heartbeat(self) -> None:
+        while True:
+            t0 = time.monotonic()
+            await asyncio.sleep(self._interval)
+            now = time.monotonic()
+            lag = max(0.0, now - t0 - self._interval)
+            with self._lock:
+                self._beat = now
+                sample, self._sample = self._sample, None
+            self._record(lag, sample)
+
+    def _watchdog(self) -> None:
+        tick = min(self._interval, self._threshold / 2)
+        sampled_beat = -1.0
+        while not self._stop.wait(tick):
+            with self._lock:
+                beat = self._beat
+            if beat == sampled_beat or time.monotonic() - beat < self._interval + self._threshold:
+                continue
+            # loop is stuck: sample once per stall
+            sampled_beat = beat
+            frame = sys._current_frames().get(self._loop_thread_id)  # type: ignore[arg-type]
+            if frame is None:
+                continue
+            sample = self._describe(frame)
+            del frame
+            with self._lock:
+                if self._beat == beat:
+                    self._sample = sample
+
+    def _describe(self, frame: Any) -> Tuple[str, List[str]]:
+        summary = traceback.extract_stack(frame)
+        route = ""
+        project = ""
+        for fs in summary:
+            if fs.filename.startswith("<"):
+                continue
+            fn = os.path.abspath(fs.filename)
+            if fn.startswith(_ROUTES_DIR) and not route:
+                route = f"{os.path.relpath(fn, _ROOT)}:{fs.name}"
+            if fn.startswith(_ROOT + os.sep) and os.sep + ".venv" + os.sep not in fn and fn != _SELF:
+                project = f"{os.path.relpath(fn, _ROOT)}:{fs.name}"
+        stack = traceback.format_list(summary[-self._stack_limit:])
+        return route or project or "unknown", stack
+
+    def _record(self, lag: float, sample: Optional[Tuple[str, List[str]]]) -> None:
+        lag_ms = lag * 1000.0
+        self._lag_ms = lag_ms
+        if lag_ms > self._lag_max_ms:
+            self._lag_max_ms = lag_ms
+        if lag < self._threshold:
+            return
+
+        route, stack = sample or ("unknown", [])
+        self._stalls += 1
+        self._stalled_ms += lag_ms
+        r = self._routes.setdefault(route, {"stalls": 0, "total_ms": 0.0, "max_ms": 0.0})
+        r["stalls"] += 1
+        r["total_ms"] += lag_ms
+        r["max_ms"] = max(r["max_ms"], lag_ms)
+        self._recent.append({
+            "at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "ms": round(lag_ms, 1),
+            "route": route,
+            "stack": stack,
+        })
+        del self._recent[:-20]
+        log.warning("event loop blocked %.0f ms route=%s\n%s", lag_ms, route, "".join(stack).rstrip())
+
+    def metrics(self) -> Dict[str, float]:
+        if not self.running:
+            return {}
+        out: Dict[str, float] = {
+            "loop_lag_ms": round(self._lag_ms, 2),
+            "loop_lag_max_ms": round(self._lag_max_ms, 2),
+            "loop_stalls": float(self._stalls),
+            "loop_stalled_ms": round(self._stalled_ms, 1),
+        }
+        for route, r in self._routes.items():
+            out[f"loop_stalls:{route}"] = float(r["stalls"])
+        return out
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.running,
+            "interval_ms": round(self._interval * 1000),
+            "threshold_ms": round(self._threshold * 1000),
+            "lag_ms": round(self._lag_ms, 2),
+            "lag_max_ms": round(self._lag_max_ms, 2),
+            "stalls": self._stalls,
+            "stalled_ms": round(self._stalled_ms, 1),
+            "routes": {
+                k: {"stalls": int(v["stalls"]), "total_ms": round(v["total_ms"], 1), "max_ms": round(v["max_ms"], 1)}
+                for k, v in sorted(self._routes.items(), key=lambda kv: -kv[1]["total_ms"])
+            },
+            "recent": list(reversed(self._recent)),
+        }
+
+
+loop_monitor = _LoopMonitor()
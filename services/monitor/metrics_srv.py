@@ -0,0 +1,367 @@
+from __future__ import annotations
+import asyncio
+import bisect
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import grpc
+
+from config.config import settings
+
+_Labels = Tuple[Tuple[str, str], ...]
+
+# seconds; covers cheap queries (1ms) up to slow page renders / storage calls (10s)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _labels(kv: Dict[str, str]) -> _Labels:
+    return tuple(sorted((k, str(v)) for k, v in kv.items()))
+
+
+def _fmt_labels(labels: _Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(labels) + ([extra] if extra else [])
+    if not items:
+        return ""
+    body = ",".join('{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for k, v in items)
+    return "{" + body + "}"
+
+
+def _fmt_num(v: float) -> str:
+    if v == float("inf"):
+        return "+Inf"
+    return repr(float(v)) if isinstance(v, float) and not v.is_integer() else str(int(v))
+
+
+class _Histogram:
+    def __init__(self, name: str, help_text: str, buckets: Tuple[float, ...]) -> None:
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts..., +Inf count], sum
+        self.series: Dict[_Labels, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, labels: _Labels, value: float) -> None:
+        s = self.series.get(labels)
+        if s is None:
+            s = self.series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+        s[0][bisect.bisect_left(self.buckets, value)] += 1
+        s[1][0] += value
+
+    def render(self, out: List[str]) -> None:
+        out.append(f"# HELP {self.name} {self.help}")
+        out.append(f"# TYPE {self.name} histogram")
+        for labels, (counts, total) in sorted(self.series.items()):
+            acc = 0
+            for le, c in zip(self.buckets + (float("inf"),), counts):
+                acc += c
+                out.append(f"{self.name}_bucket{_fmt_labels(labels, ('le', _fmt_num(le)))} {acc}")
+            out.append(f"{self.name}_sum{_fmt_labels(labels)} {total[0]:.6f}")
+            out.append(f"{self.name}_count{_fmt_labels(labels)} {acc}")
+
+    def merged(self, match: Optional[Callable[[Dict[str, str]], bool]] = None) -> Tuple[List[int], float]:
+        counts = [0] * (len(self.buckets) + 1)
+        total = 0.0
+        for labels, (c, s) in self.series.items():
+            if match is not None and not match(dict(labels)):
+                continue
+            for i, n in enumerate(c):
+                counts[i] += n
+            total += s[0]
+        return counts, total
+
+    def quantile(self, q: float, match: Optional[Callable[[Dict[str, str]], bool]] = None) -> float:
+        """
+        Approximate quantile (upper bucket bound, seconds) over all matching series.
+        """
+        counts, _ = self.merged(match)
+        n = sum(counts)
+        if n == 0:
+            return 0.0
+        rank = q * n
+        acc = 0
+        for le, c in zip(self.buckets + (self.buckets[-1],), counts):
+            acc += c
+            if acc >= rank:
+                return le
+        return self.buckets[-1]
+
+
+class _Counter:
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = name
+        self.help = help_text
+        self.series: Dict[_Labels, float] = {}
+
+    def inc(self, labels: _Labels, value: float = 1.0) -> None:
+        self.series[labels] = self.series.get(labels, 0.0) + value
+
+    def total(self, match: Optional[Callable[[Dict[str, str]], bool]] = None) -> float:
+        return float(sum(v for lb, v in self.series.items() if match is None or match(dict(lb))))
+
+    def render(self, out: List[str]) -> None:
+        out.append(f"# HELP {self.name} {self.help}")
+        out.append(f"# TYPE {self.name} counter")
+        for labels, v in sorted(self.series.items()):
+            out.append(f"{self.name}{_fmt_labels(labels)} {_fmt_num(v)}")
+
+
+class _Metrics:
+    """
+    Process-local metrics registry (no external client library).
+
+    - observe()/inc() are called from the event loop and from sync gRPC callbacks (worker threads),
+      updates take a plain lock;
+    - gauges are callbacks evaluated at render time (e.g. db pool size);
+    - render(): Prometheus text format for /internal/metrics;
+    - summary(): flat {name: float} for ytadmin Info/All and PushHealth.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.enabled = bool(settings.METRICS_ENABLED)
+        self.http = _Histogram(
+            "http_request_duration_seconds", "HTTP request latency by route template.", DEFAULT_BUCKETS
+        )
+        self.db_acquire = _Histogram(
+            "db_pool_acquire_seconds", "Time spent waiting for a pooled DB connection.", DEFAULT_BUCKETS
+        )
+        self.db_query = _Histogram(
+            "db_query_duration_seconds", "asyncpg query latency by statement type.", DEFAULT_BUCKETS
+        )
+        self.db_errors = _Counter("db_errors_total", "Failed DB queries and pool acquires.")
+        self.db_hold = _Histogram(
+            "db_conn_hold_seconds", "Time a pooled DB connection was checked out, by call site.", DEFAULT_BUCKETS
+        )
+        self.db_hold_warnings = _Counter(
+            "db_conn_hold_warnings_total", "Checkouts held past DB_HOLD_WARN_MS outside queries, by call site."
+        )
+        self.db_reads = _Counter(
+            "db_read_conn_total", "Read-only checkouts by target (replica/primary) and why they went there."
+        )
+        self.page_cache = _Counter(
+            "page_cache_requests_total", "Page/fragment cache lookups by fragment and result (hit/stale/coalesced/miss)."
+        )
+        self.grpc = _Histogram(
+            "grpc_client_duration_seconds", "Outgoing gRPC call latency by service/method/status code.", DEFAULT_BUCKETS
+        )
+        self.grpc_errors = _Counter("grpc_client_errors_total", "Outgoing gRPC calls finished with non-OK status.")
+        self._gauges: Dict[str, Tuple[str, Callable[[], Dict[_Labels, float]]]] = {}
+
+    def observe_http(self, method: str, route: str, status: int, seconds: float) -> None:
+        labels = _labels({"method": method, "route": route, "status": f"{status // 100}xx"})
+        with self._lock:
+            self.http.observe(labels, seconds)
+
+    def observe_db_acquire(self, seconds: float, ok: bool = True) -> None:
+        with self._lock:
+            self.db_acquire.observe((), seconds)
+            if not ok:
+                self.db_errors.inc(_labels({"op": "acquire"}))
+
+    def observe_db_query(self, op: str, seconds: float, ok: bool = True) -> None:
+        labels = _labels({"op": op})
+        with self._lock:
+            self.db_query.observe(labels, seconds)
+            if not ok:
+                self.db_errors.inc(labels)
+
+    def observe_db_hold(self, site: str, seconds: float) -> None:
+        labels = _labels({"site": site})
+        with self._lock:
+            self.db_hold.observe(labels, seconds)
+
+    def inc_db_hold_warning(self, site: str) -> None:
+        with self._lock:
+            self.db_hold_warnings.inc(_labels({"site": site}))
+
+    def inc_db_read(self, target: str, reason: str) -> None:
+        with self._lock:
+            self.db_reads.inc(_labels({"target": target, "reason": reason}))
+
+    def inc_page_cache(self, name: str, result: str) -> None:
+        with self._lock:
+            self.page_cache.inc(_labels({"fragment": name, "result": result}))
+
+    def observe_grpc(self, full_method: str, code: str, seconds: float) -> None:
+        service, _, method = (full_method or "").lstrip("/").partition("/")
+        labels = _labels({"service": service or "unknown", "method": method or "unknown", "code": code})
+        with self._lock:
+            self.grpc.observe(labels, seconds)
+            if code != "OK":
+                self.grpc_errors.inc(labels)
+
+    def register_gauge(self, name: str, help_text: str, fn: Callable[[], Dict[_Labels, float]]) -> None:
+        self._gauges[name] = (help_text, fn)
+
+    def render(self) -> str:
+        out: List[str] = []
+        with self._lock:
+            for m in (
+                self.http, self.db_acquire, self.db_query, self.db_errors, self.db_hold, self.db_hold_warnings,
+                self.db_reads, self.page_cache, self.grpc, self.grpc_errors,
+            ):
+                m.render(out)
+        for name, (help_text, fn) in self._gauges.items():
+            try:
+                values = fn()
+            except Exception:
+                continue
+            out.append(f"# HELP {name} {help_text}")
+            out.append(f"# TYPE {name} gauge")
+            for labels, v in sorted(values.items()):
+                out.append(f"{name}{_fmt_labels(labels)} {_fmt_num(v)}")
+        return "\n".join(out) + "\n"
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Totals and approximate p50/p95 (ms, since process start).
+        """
+        if not self.enabled:
+            return {}
+        ms = 1000.0
+        with self._lock:
+            http_counts, _ = self.http.merged()
+            http_5xx, _ = self.http.merged(lambda lb: lb.get("status") == "5xx")
+            db_counts, _ = self.db_query.merged()
+            grpc_counts, _ = self.grpc.merged()
+            out = {
+                "http_requests": float(sum(http_counts)),
+                "http_5xx": float(sum(http_5xx)),
+                "http_p50_ms": self.http.quantile(0.5) * ms,
+                "http_p95_ms": self.http.quantile(0.95) * ms,
+                "db_queries": float(sum(db_counts)),
+                "db_errors": self.db_errors.total(),
+                "db_query_p95_ms": self.db_query.quantile(0.95) * ms,
+                "db_pool_wait_p95_ms": self.db_acquire.quantile(0.95) * ms,
+                "db_hold_p95_ms": self.db_hold.quantile(0.95) * ms,
+                "db_hold_warnings": self.db_hold_warnings.total(),
+                "db_reads_replica": self.db_reads.total(lambda lb: lb.get("target") == "replica"),
+                "db_reads_primary": self.db_reads.total(lambda lb: lb.get("target") == "primary"),
+                "page_cache_hits": self.page_cache.total(lambda lb: lb.get("result") != "miss"),
+                "page_cache_misses": self.page_cache.total(lambda lb: lb.get("result") == "miss"),
+                "grpc_calls": float(sum(grpc_counts)),
+                "grpc_errors": self.grpc_errors.total(),
+                "grpc_p95_ms": self.grpc.quantile(0.95) * ms,
+            }
+        for name, (_, fn) in self._gauges.items():
+            try:
+                values = fn()
+            except Exception:
+                continue
+            for labels, v in values.items():
+                key = name + (":" + ",".join(lv for _, lv in labels) if labels else "")
+                out[key] = float(v)
+        return out
+
+
+metrics = _Metrics()
+
+
+# ---------------------------------------------------------------------------
+# gRPC client interceptors: pass grpc_aio_interceptors() to grpc.aio.*_channel(interceptors=...),
+# wrap sync channels with grpc_intercept(channel)
+# ---------------------------------------------------------------------------
+
+def _code_name(code) -> str:
+    try:
+        return code.name  # grpc.StatusCode
+    except Exception:
+        return "UNKNOWN"
+
+
+async def _observe_aio_when_done(call, method: str, t0: float) -> None:
+    try:
+        code = _code_name(await call.code())
+    except Exception:
+        code = "UNKNOWN"
+    metrics.observe_grpc(method, code, time.perf_counter() - t0)
+
+
+def _method_name(details) -> str:
+    m = details.method
+    return m.decode() if isinstance(m, bytes) else str(m)
+
+
+class _AioUnaryUnary(grpc.aio.UnaryUnaryClientInterceptor):
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        t0 = time.perf_counter()
+        call = await continuation(client_call_details, request)
+        # code() waits for the call to finish and never raises
+        await _observe_aio_when_done(call, _method_name(client_call_details), t0)
+        return call
+
+
+class _AioStreaming(
+    grpc.aio.UnaryStreamClientInterceptor,
+    grpc.aio.StreamUnaryClientInterceptor,
+    grpc.aio.StreamStreamClientInterceptor,
+):
+    # streams are consumed by the caller: time them from a side task until the status arrives
+
+    def _track(self, call, details, t0: float):
+        asyncio.ensure_future(_observe_aio_when_done(call, _method_name(details), t0))
+        return call
+
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        t0 = time.perf_counter()
+        return self._track(await continuation(client_call_details, request), client_call_details, t0)
+
+    async def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        t0 = time.perf_counter()
+        return self._track(await continuation(client_call_details, request_iterator), client_call_details, t0)
+
+    async def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        t0 = time.perf_counter()
+        return self._track(await continuation(client_call_details, request_iterator), client_call_details, t0)
+
+
+class _SyncInterceptor(
+    grpc.UnaryUnaryClientInterceptor,
+    grpc.UnaryStreamClientInterceptor,
+    grpc.StreamUnaryClientInterceptor,
+    grpc.StreamStreamClientInterceptor,
+):
+    def _track(self, call, details, t0: float):
+        method = _method_name(details)
+
+        def _done(c) -> None:
+            try:
+                code = _code_name(c.code())
+            except Exception:
+                code = "UNKNOWN"
+            metrics.observe_grpc(method, code, time.perf_counter() - t0)
+
+        try:
+            call.add_done_callback(_done)
+        except Exception:
+            pass
+        return call
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        t0 = time.perf_counter()
+        return self._track(continuation(client_call_details, request), client_call_details, t0)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        t0 = time.perf_counter()
+        return self._track(continuation(client_call_details, request), client_call_details, t0)
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        t0 = time.perf_counter()
+        return self._track(continuation(client_call_details, request_iterator), client_call_details, t0)
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        t0 = time.perf_counter()
+        return self._track(continuation(client_call_details, request_iterator), client_call_details, t0)
+
+
+def grpc_aio_interceptors() -> Optional[list]:
+    if not metrics.enabled:
+        return None
+    return [_AioUnaryUnary(), _AioStreaming()]
+
+
+def grpc_intercept(channel: grpc.Channel) -> grpc.Channel:
+    if not metrics.enabled:
+        return channel
+    return grpc.intercept_channel(channel, _SyncInterceptor())
@@ -0,0 +1,215 @@
+"""
+Rendered page/fragment cache for listing HTML that is the same for every visitor.
+
+- values (HTML strings, right-bar item lists) are cached per (name, params) plus the current version
+  of every content scope they depend on; invalidate(scope) bumps the version, so old entries are never
+  served again and simply age out of the LRU
+- scopes: SCOPE_VIDEOS (publish/edit/delete/avatar changes), channel_scope(uid) for one channel's video grid,
+  counters_scope(video_id) for the right bar of one video (its view count crossed a threshold, see
+  counter_crossed); trending and the counts shown in grids follow view/like counts through the TTL only
+- renders read from the primary: right after an invalidation a lagging replica would still return the
+  old rows, and they would be cached for the whole TTL
+- scope versions are globally increasing numbers, dropped once nothing cached before the bump can be
+  fresh any more, so per-video scopes don't accumulate
+- single flight: concurrent misses for one key wait for a single render instead of each running the
+  same queries; an expired entry is served stale to everyone else while one request refreshes it
+- invalidations are announced through the job registry pub/sub, other workers bump their versions
+  when they see them (without Redis they only see the TTL)
+
+Callers stitch per-user chrome (current_user, notifications bell, CSRF) around cached fragments, or use
+a whole-page entry for anonymous visitors only.
+"""
+import asyncio
+import logging
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+from config.config import settings
+from db import ReadRouting, read_routing
+from services.job_registry_srv import job_registry
+from services.monitor.metrics_srv import metrics
+
+log = logging.getLogger("page_cache")
+
+SCOPE_VIDEOS = "videos"
+
+_KIND = "pagecache"
+_ORIGIN = secrets.token_hex(6)
+
+
+def channel_scope(user_uid: str) -> str:
+    return f"channel:{user_uid}"
+
+
+def counters_scope(video_id: str) -> str:
+    return f"counters:{video_id}"
+
+
+def counter_crossed(n: int) -> bool:
+    """
+    True when a counter reached 1, 2, 5, 10, 20, 50, 100, ...: counts change enough to re-render,
+    without invalidating on every single view.
+    """
+    if n <= 0:
+        return False
+    while n % 10 == 0:
+        n //= 10
+    return n in (1, 2, 5)
+
+
+_Entry = Tuple[float, float, Any]  # fresh_until, stale_until, value
+
+
+class _PageCache:
+    def __init__(self, enabled: bool, ttl_sec: int, max_items: int) -> None:
+        self.enabled = bool(enabled) and ttl_sec > 0
+        self._ttl = float(max(1, ttl_sec))
+        self._max = max(1, int(max_items))
+        self._items: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._versions: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()  # scope -> (version, bumped at)
+        self._seq = 0
+        self._max_ttl = self._ttl
+        self._task: Optional[asyncio.Task] = None
+
+    def _key(self, name: str, params: Tuple, scopes: Sequence[str]) -> Hashable:
+        return (name, params, tuple(self._versions.get(s, (0, 0.0))[0] for s in scopes))
+
+    async def get_or_render(
+        self,
+        name: str,
+        params: Tuple,
+        scopes: Sequence[str],
+        render: Callable[[], Awaitable[Any]],
+        ttl_sec: Optional[float] = None,
+    ) -> Any:
+        """
+        Cached value for (name, params) at the current versions of scopes, else await render().
+        render() must not depend on the current user.
+        """
+        if not self.enabled:
+            return await render()
+        key = self._key(name, params, scopes)
+        now = time.monotonic()
+        it = self._items.get(key)
+        if it is not None:
+            fresh_until, stale_until, value = it
+            if now < fresh_until:
+                self._items.move_to_end(key)
+                metrics.inc_page_cache(name, "hit")
+                return value
+            if now < stale_until and key in self._inflight:
+                metrics.inc_page_cache(name, "stale")
+                return value
+        fut = self._inflight.get(key)
+        if fut is not None:
+            metrics.inc_page_cache(name, "coalesced")
+            try:
+                return await asyncio.shield(fut)
+            except asyncio.CancelledError:
+                if not fut.cancelled():
+                    raise
+                # the request rendering it went away: render for ourselves
+                return await render()
+
+        metrics.inc_page_cache(name, "miss")
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        # pinned to the primary for the render only: the replica may not have the change behind the last bump yet
+        token = read_routing.set(ReadRouting(pinned=True))
+        try:
+            value = await render()
+        except Exception as e:
+            self._inflight.pop(key, None)
+            fut.set_exception(e)
+            # nobody else may be waiting: no "exception was never retrieved" warning
+            fut.exception()
+            raise
+        except BaseException:
+            self._inflight.pop(key, None)
+            fut.cancel()
+            raise
+        finally:
+            read_routing.reset(token)
+        ttl = float(ttl_sec) if ttl_sec else self._ttl
+        self._max_ttl = max(self._max_ttl, ttl)
+        done = time.monotonic()
+        self._items[key] = (done + ttl, done + 2 * ttl, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self._max:
+            self._items.popitem(last=False)
+        self._inflight.pop(key, None)
+        fut.set_result(value)
+        return value
+
+    def _bump(self, scopes: Sequence[str]) -> None:
+        now = time.monotonic()
+        for s in scopes:
+            self._seq += 1
+            self._versions[s] = (self._seq, now)
+            self._versions.move_to_end(s)
+        # anything cached before these bumps is past stale_until: the scope can fall back to version 0,
+        # versions are never reused, so no entry rendered before a bump becomes reachable again
+        horizon = now - 2 * self._max_ttl
+        while self._versions:
+            s, (_, at) = next(iter(self._versions.items()))
+            if at >= horizon:
+                break
+            self._versions.popitem(last=False)
+
+    async def invalidate(self, *scopes: str) -> None:
+        """
+        Bumps the scopes here and announces it to the other workers. Never raises.
+        """
+        if not self.enabled or not scopes:
+            return
+        self._bump(scopes)
+        try:
+            await job_registry.update(
+                _KIND, _ORIGIN, {"scopes": list(scopes), "nonce": secrets.token_hex(4)}, replace=True
+            )
+        except Exception as e:
+            log.warning("page cache: invalidation not announced: %s", e)
+
+    async def _listen(self) -> None:
+        while True:
+            async for ev in job_registry.subscribe([_KIND]):
+                if ev.get("key") == _ORIGIN:
+                    continue
+                scopes = (ev.get("fields") or {}).get("scopes") or []
+                self._bump([str(s) for s in scopes])
+            # no redis (or it went away): retry later, the TTL bounds staleness meanwhile
+            await asyncio.sleep(30.0)
+
+    def _gauges(self) -> Dict[tuple, float]:
+        return {(("state", "entries"),): float(len(self._items)), (("state", "rendering"),): float(len(self._inflight))}
+
+    def start(self) -> None:
+        if self.enabled and self._task is None:
+            metrics.register_gauge("page_cache_items", "Cached pages/fragments and renders in flight.", self._gauges)
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+page_cache = _PageCache(settings.PAGE_CACHE_ENABLED, settings.PAGE_CACHE_TTL_SEC, settings.PAGE_CACHE_MAX_ITEMS)
+
+
+async def invalidate_videos(author_uid: Optional[str] = None) -> None:
+    """
+    A video was published/edited/deleted or an author's avatar changed: listings and that channel's grid.
+    """
+    scopes = [SCOPE_VIDEOS]
+    if author_uid:
+        scopes.append(channel_scope(author_uid))
+    await page_cache.invalidate(*scopes)
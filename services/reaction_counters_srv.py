@@ -0,0 +1,66 @@
+"""
+Background reconcile of video like/dislike counters (video_reaction_counters).
+
+Every REACTION_RECONCILE_SEC one app worker (pg advisory xact lock) checks the videos whose
+counters moved since the previous tick: drift against the reactions table is corrected and
+likes are copied into videos.likes_count for listings, search and trending.
+"""
+import asyncio
+import logging
+from typing import Optional
+
+from config.config import settings
+from db import get_conn, release_conn
+from db.reactions_db import reconcile_reaction_counters
+
+log = logging.getLogger("reaction_counters")
+
+_LOCK_KEY = 0x7974726561  # pg advisory lock: one reconcile per tick across workers
+
+_task: Optional[asyncio.Task] = None
+
+
+async def reconcile_once(touched_within_sec: int) -> int:
+    conn = await get_conn()
+    try:
+        async with conn.transaction():
+            if not await conn.fetchval("SELECT pg_try_advisory_xact_lock($1)", _LOCK_KEY):
+                return 0
+            return int(await reconcile_reaction_counters(conn, touched_within_sec) or 0)
+    finally:
+        await release_conn(conn)
+
+
+async def _loop(every_sec: int) -> None:
+    # look back two periods so a tick skipped by a busy or restarting worker is still covered
+    while True:
+        await asyncio.sleep(every_sec)
+        try:
+            fixed = await reconcile_once(every_sec * 2)
+            if fixed:
+                # cached listings pick up the new likes_count within PAGE_CACHE_TTL_SEC
+                log.info("reaction counters reconciled rows=%s", fixed)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.warning("reaction counters reconcile failed: %s", e)
+
+
+def start() -> None:
+    global _task
+    every = int(settings.REACTION_RECONCILE_SEC or 0)
+    if every <= 0 or _task is not None:
+        return
+    _task = asyncio.create_task(_loop(every))
+
+
+async def stop() -> None:
+    global _task
+    if _task is None:
+        return
+    _task.cancel()
+    try:
+        await _task
+    except asyncio.CancelledError:
+        pass
+    _task = None
@@ -1,7 +1,7 @@
 import math
 from typing import Any, Dict, List, Tuple
 
-from db import get_conn, release_conn
+from db import get_read_conn, release_conn
 from services.search.settings_srch import settings
 from db.search_pg_db import (
     pg_search_videos,
@@ -34,7 +34,7 @@ class PostgresBackend:
         limit = max(1, min(int(limit or 10), 50))
         offset = max(0, int(offset or 0))
 
-        conn = await get_conn()
+        conn = await get_read_conn()
         try:
             rows = await pg_search_videos(
                 conn,
@@ -67,7 +67,7 @@ class PostgresBackend:
         if not s:
             return []
         limit = max(1, min(int(limit or 10), 25))
-        conn = await get_conn()
+        conn = await get_read_conn()
         try:
             rows = await pg_suggest_titles(conn, s, limit)
             return [{"video_id": r["video_id"], "title": r["title"] or ""} for r in rows]
@@ -0,0 +1,97 @@
+"""
+Profile of the signed-in user for page headers and comment authorship: username, channel_id, avatar path.
+
+- process-wide uid -> (username, channel_id, avatar path) LRU with TTL; names don't change after
+  sign-up, avatar upload/delete call invalidate_user_profile (other processes see it after the TTL)
+- current_user_profile(request): session user plus profile, resolved once per request into request.state
+- roles are not cached: admin checks keep reading the users row
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import Request
+
+from config.config import settings
+from db import db_conn
+from db.user_assets_db import get_user_avatar_paths
+from db.users_db import get_user_by_uid
+from utils.security_ut import get_current_user
+
+_UNRESOLVED = object()
+
+
+class _UserProfileCache:
+    """
+    LRU with TTL: user_uid -> profile dict. Single event loop use, no locking.
+    """
+
+    def __init__(self, ttl_sec: int, max_items: int) -> None:
+        self._ttl = float(ttl_sec)
+        self._max = int(max_items)
+        self._items: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, user_uid: str) -> Optional[Dict[str, Any]]:
+        it = self._items.get(user_uid)
+        if it is None:
+            return None
+        ts, profile = it
+        if time.monotonic() - ts > self._ttl:
+            self._items.pop(user_uid, None)
+            return None
+        self._items.move_to_end(user_uid)
+        return profile
+
+    def put(self, user_uid: str, profile: Dict[str, Any]) -> None:
+        if self._ttl <= 0 or not user_uid:
+            return
+        self._items[user_uid] = (time.monotonic(), profile)
+        self._items.move_to_end(user_uid)
+        while len(self._items) > self._max:
+            self._items.popitem(last=False)
+
+    def invalidate(self, user_uid: str) -> None:
+        self._items.pop(user_uid, None)
+
+
+user_profile_cache = _UserProfileCache(settings.USER_PROFILE_CACHE_TTL_SEC, settings.USER_PROFILE_CACHE_MAX)
+
+
+async def get_user_profile(user_uid: str) -> Optional[Dict[str, Any]]:
+    """
+    {"user_uid", "username", "channel_id", "avatar_rel"} or None for an unknown uid.
+    Cache hits (the common case) don't touch the DB.
+    """
+    profile = user_profile_cache.get(user_uid)
+    if profile is not None:
+        return dict(profile)
+    async with db_conn() as conn:
+        row = await get_user_by_uid(conn, user_uid)
+        if not row:
+            return None
+        avatar_rel = (await get_user_avatar_paths(conn, [user_uid])).get(user_uid)
+    profile = {
+        "user_uid": user_uid,
+        "username": str(row["username"] or ""),
+        "channel_id": str(row["channel_id"] or ""),
+        "avatar_rel": avatar_rel,
+    }
+    user_profile_cache.put(user_uid, profile)
+    return dict(profile)
+
+
+async def current_user_profile(request: Request) -> Optional[Dict[str, Any]]:
+    """
+    get_current_user() plus the profile fields, once per request.
+    """
+    profile = getattr(request.state, "current_user_profile", _UNRESOLVED)
+    if profile is not _UNRESOLVED:
+        return profile
+    user = get_current_user(request)
+    profile = await get_user_profile(user["user_uid"]) if user else None
+    request.state.current_user_profile = profile
+    return profile
+
+
+def invalidate_user_profile(user_uid: str) -> None:
+    user_profile_cache.invalidate(user_uid)
@@ -109,7 +109,7 @@ class YTAdminClient:
         """
         Pushes a single health snapshot to the admin ingest service.
         """
-        data = collect_health()
+        data = await collect_health()
         req = yurtube_pb2.PushHealthRequest(  # type: ignore
             identity=yurtube_pb2.ServiceIdentity(  # type: ignore
                 name=self.cfg.service_name,
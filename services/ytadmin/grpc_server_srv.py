@@ -8,6 +8,8 @@ from config.ytadmin.grpc_conf import load_grpc_config
 from config.ytadmin.ytadmin_cfg import load_config
 from services.ytadmin.health_srv import collect_health
 from services.monitor.uptime import uptime
+from services.monitor.loop_monitor import loop_monitor
+from services.monitor.metrics_srv import metrics
 
 # Standard gRPC Health-Check service (grpcio-health-checking)
 from grpc_health.v1 import health, health_pb2, health_pb2_grpc
@@ -35,7 +37,7 @@ if HAVE_INFO:
           so the admin service can fetch everything via grpcurl without local proto files.
 
         Data source:
-        - Values come from application config (config/ytadmin/ytadmin_cfg.py) and runtime state (uptime).
+        - Values come from application config (config/ytadmin/ytadmin_cfg.py) and runtime state (uptime, metrics, loop monitor).
         """
 
         def __init__(self) -> None:
@@ -52,7 +54,9 @@ if HAVE_INFO:
             - version: application version
             - uptime: seconds as a string
             - labels: optional key-value labels (e.g., environment)
-            - metrics: optional numerical metrics (e.g., uptime_sec)
+            - metrics: optional numerical metrics (uptime_sec; http/db/grpc totals and p95, see metrics_srv.summary();
+              loop_lag_ms, loop_lag_max_ms, loop_stalls, loop_stalled_ms and loop_stalls:<route> when the loop
+              monitor is enabled)
             """
             # Compute uptime once
             up_sec = float(uptime.uptime_sec())
@@ -69,7 +73,10 @@ if HAVE_INFO:
                 labels={"env": env} if env else {},
                 metrics={
                     "uptime_sec": up_sec,
-                    # Add more metrics when available, e.g. "cpu": cpu_usage, "latency_ms": latency
+                    # request/db/grpc totals and p95 (empty unless METRICS_ENABLED)
+                    **metrics.summary(),
+                    # event loop lag/stall counters, empty unless LOOP_MONITOR_ENABLED
+                    **loop_monitor.metrics(),
                 },
             )
 else:
@@ -192,7 +199,7 @@ class AppGrpcServer:
         while self._running:
             try:
                 # Collect local application health
-                data = collect_health()
+                data = await collect_health()
                 is_ok = bool(data.get("healthy", True))
 
                 # Map flag to Health status
@@ -1,66 +1,85 @@
 from __future__ import annotations
+import asyncio
 import time
 from typing import Dict, Any, Tuple, Optional
 
+from db import get_conn, release_conn
+from services.job_registry_srv import job_registry
+from services.monitor.loop_monitor import loop_monitor
+from services.monitor.metrics_srv import metrics
 from services.monitor.uptime import uptime
 
-def check_db() -> Tuple[bool, Optional[str]]:
+_CHECK_TIMEOUT_SEC = 2.0
+
+
+async def check_db() -> Tuple[bool, Optional[str], float]:
     """
-    Performs a minimal database liveness check.
-    Replace with a real query (e.g., SELECT 1) using your DB layer.
-    Returns (ok, error_message_if_any).
+    Database liveness: pool acquire + SELECT 1.
+    Returns (ok, error_message_if_any, latency_ms).
     """
+    t0 = time.perf_counter()
     try:
-        # ex.: db.execute("SELECT 1")
-        return True, None
+        conn = await asyncio.wait_for(get_conn(), timeout=_CHECK_TIMEOUT_SEC)
+        try:
+            await conn.fetchval("SELECT 1", timeout=_CHECK_TIMEOUT_SEC)
+        finally:
+            await release_conn(conn)
+        return True, None, (time.perf_counter() - t0) * 1000.0
     except Exception as e:
-        return False, f"db_error:{e}"
+        return False, f"db_error:{e.__class__.__name__}:{e}", (time.perf_counter() - t0) * 1000.0
 
 
-def check_cache() -> Tuple[bool, Optional[str]]:
+async def check_cache() -> Tuple[bool, Optional[str], float]:
     """
-    Performs a minimal cache liveness check.
-    Replace with real Redis/Memcached ping.
-    Returns (ok, error_message_if_any).
+    Redis (job registry) liveness: PING.
+    Returns (ok, error_message_if_any, latency_ms); ok with "disabled" message when no redis is configured.
     """
+    t0 = time.perf_counter()
     try:
-        # ex.: redis.ping()
-        return True, None
+        rtt = await asyncio.wait_for(job_registry.ping(), timeout=_CHECK_TIMEOUT_SEC)
+        if rtt is None:
+            return True, "disabled", 0.0
+        return True, None, rtt * 1000.0
     except Exception as e:
-        return False, f"cache_error:{e}"
+        return False, f"cache_error:{e.__class__.__name__}:{e}", (time.perf_counter() - t0) * 1000.0
 
 
-def collect_health() -> Dict[str, Any]:
+async def collect_health() -> Dict[str, Any]:
     """
     Collects a compact health snapshot of the application without secrets.
 
     Returns:
     {
       "timestamp": ISO8601 UTC string,
-      "checks": { "db": "ok"|"fail:...", "cache": "ok"|"fail:..." },
+      "checks": { "db": "ok"|"fail:...", "cache": "ok"|"disabled"|"fail:..." },
       "metrics": {
         "uptime_sec": float,
-        "uptime_started_iso": str,
-        // add more metrics on demand
+        "db_ping_ms": float,
+        "cache_ping_ms": float,
+        // request/db/grpc summaries (metrics_srv) and loop monitor counters when enabled
       },
       "healthy": bool
     }
+
+    Only the database decides "healthy": without redis the job registry keeps working on process-local state.
     """
-    ok_db, msg_db = check_db()
-    ok_cache, msg_cache = check_cache()
+    (ok_db, msg_db, db_ms), (ok_cache, msg_cache, cache_ms) = await asyncio.gather(check_db(), check_cache())
 
-    healthy = ok_db and ok_cache
+    healthy = ok_db
 
     status: Dict[str, Any] = {
         "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "checks": {
             "db": "ok" if ok_db else (msg_db or "fail"),
-            "cache": "ok" if ok_cache else (msg_cache or "fail"),
+            "cache": (msg_cache or "ok") if ok_cache else (msg_cache or "fail"),
         },
         "metrics": {
             "uptime_sec": float(uptime.uptime_sec()),
-            "uptime_started_iso": uptime.started_iso(),
+            "db_ping_ms": round(db_ms, 2),
+            "cache_ping_ms": round(cache_ms, 2),
+            **metrics.summary(),
+            **loop_monitor.metrics(),
         },
         "healthy": healthy,
     }
-    return status
\ No newline at end of file
+    return status
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
-from services.ytcms.ytcms_client_srv import submit_storage_job, poll_until_done
+from services.ytcms.ytcms_aio_client_srv import submit_storage_job, poll_until_done
 from services.ytcms.ytcms_proto import ytcms_pb2
 
 
@@ -20,10 +20,10 @@ async def generate_captions(
 
     New behavior:
     - Submit job by storage path (storage_rel/original.webm)
-    - Poll until done
+    - Poll until done (grpc.aio, backoff)
     - Return (vtt_rel_path, meta_dict)
     """
-    job_id, job_server = submit_storage_job(video_id=video_id, storage_rel=storage_rel, lang=lang, task="transcribe")
+    job_id, job_server = await submit_storage_job(video_id=video_id, storage_rel=storage_rel, lang=lang, task="transcribe")
 
     if on_status:
         try:
@@ -31,7 +31,7 @@ async def generate_captions(
         except Exception:
             pass
 
-    res = poll_until_done(job_id=job_id, server_addr=job_server)
+    res = await poll_until_done(job_id=job_id, server_addr=job_server)
 
     # Normalize result
     state_name = ytcms_pb2.JobStatus.State.Name(res.state) if hasattr(ytcms_pb2.JobStatus, "State") else str(res.state)
@@ -0,0 +1,173 @@
+"""
+grpc.aio client for ytcms with the same surface as ytcms_client_srv (submit, status, result, delete, health).
+
+- one channel per server address, reused for the process lifetime
+- no executor threads: waits are awaitable and can be cancelled
+- watch_status() is an async stream of status changes (ytcms has no watch RPC: backoff polling)
+"""
+import asyncio
+import time
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+import grpc
+from grpc_health.v1 import health_pb2, health_pb2_grpc  # type: ignore
+
+from config.ytcms.ytcms_cfg import (
+    load_ytcms_config,
+    YTCMS_SUBMIT_TIMEOUT,
+    YTCMS_STATUS_TIMEOUT,
+    YTCMS_RESULT_TIMEOUT,
+)
+from services.job_watch_srv import backoff_delays
+from services.ytcms.ytcms_client_srv import (
+    _YTCMS_HEALTH_TIMEOUT_SEC,
+    _YTCMS_SERVER_TTL_SEC,
+    _last_good,
+    _auth_md,
+    _build_submit_request,
+    _build_delete_request,
+)
+from services.ytcms.ytcms_proto import ytcms_pb2, ytcms_pb2_grpc
+from services.monitor.metrics_srv import grpc_aio_interceptors
+
+_channels: Dict[str, grpc.aio.Channel] = {}
+
+
+def _channel(addr: str) -> grpc.aio.Channel:
+    ch = _channels.get(addr)
+    if ch is None:
+        ch = grpc.aio.insecure_channel(addr, interceptors=grpc_aio_interceptors())
+        _channels[addr] = ch
+    return ch
+
+
+def _stub(addr: str) -> ytcms_pb2_grpc.CaptionsServiceStub:
+    return ytcms_pb2_grpc.CaptionsServiceStub(_channel(addr))
+
+
+async def close_channels() -> None:
+    chans = list(_channels.values())
+    _channels.clear()
+    for ch in chans:
+        try:
+            await ch.close()
+        except Exception:
+            pass
+
+
+async def health_check(addr: str) -> bool:
+    stub = health_pb2_grpc.HealthStub(_channel(addr))
+    md = _auth_md()
+    for service in ("ytcms.v1.CaptionsService", ""):
+        try:
+            resp = await stub.Check(
+                health_pb2.HealthCheckRequest(service=service),
+                metadata=md,
+                timeout=_YTCMS_HEALTH_TIMEOUT_SEC,
+            )
+            if resp.status == health_pb2.HealthCheckResponse.SERVING:
+                return True
+        except Exception:
+            continue
+    return False
+
+
+async def pick_ytcms_server_addr() -> str:
+    cfg = load_ytcms_config()
+    servers = list(cfg.servers or [])
+    if not servers:
+        return f"{cfg.host}:{cfg.port}"
+
+    now = time.time()
+    cached = _last_good.get("addr")
+    ts = float(_last_good.get("ts") or 0.0)
+    if cached and (now - ts) < _YTCMS_SERVER_TTL_SEC:
+        return str(cached)
+
+    for s in servers:
+        addr = f"{s.host}:{s.port}"
+        if await health_check(addr):
+            _last_good["addr"] = addr
+            _last_good["ts"] = now
+            return addr
+
+    addr0 = f"{servers[0].host}:{servers[0].port}"
+    _last_good["addr"] = addr0
+    _last_good["ts"] = now
+    return addr0
+
+
+async def submit_storage_job(
+    *,
+    video_id: str,
+    storage_rel: str,
+    lang: Optional[str] = None,
+    task: Optional[str] = None,
+    idempotency_key: Optional[str] = None,
+    submit_timeout: float = YTCMS_SUBMIT_TIMEOUT,
+) -> Tuple[str, str]:
+    addr = await pick_ytcms_server_addr()
+    req = _build_submit_request(
+        video_id=video_id,
+        storage_rel=storage_rel,
+        lang=lang,
+        task=task,
+        idempotency_key=idempotency_key,
+    )
+    ack = await _stub(addr).SubmitJob(req, metadata=_auth_md(), timeout=submit_timeout)
+    if not ack.accepted:
+        raise RuntimeError(f"Submit rejected: {ack.message}")
+    if not ack.job_id:
+        raise RuntimeError("Submit returned empty job_id")
+    return ack.job_id, addr
+
+
+async def get_status(*, job_id: str, server_addr: str, timeout: float = YTCMS_STATUS_TIMEOUT) -> ytcms_pb2.JobStatus:
+    rep = await _stub(server_addr).GetStatus(ytcms_pb2.GetStatusRequest(job_id=job_id), metadata=_auth_md(), timeout=timeout)
+    return rep.status
+
+
+async def get_result(*, job_id: str, server_addr: str, timeout: float = YTCMS_RESULT_TIMEOUT) -> ytcms_pb2.JobResult:
+    return await _stub(server_addr).GetResult(ytcms_pb2.GetResultRequest(job_id=job_id), metadata=_auth_md(), timeout=timeout)
+
+
+async def delete_captions(*, storage_rel: str, server_addr: Optional[str] = None, timeout: float = 30.0) -> None:
+    addr = server_addr or await pick_ytcms_server_addr()
+    rep = await _stub(addr).DeleteCaptions(_build_delete_request(storage_rel), metadata=_auth_md(), timeout=timeout)
+    if not rep.ok:
+        raise RuntimeError(rep.message or "DeleteCaptions failed")
+
+
+def _is_final(st: ytcms_pb2.JobStatus) -> bool:
+    return st.state in (st.DONE, st.FAILED, st.CANCELED)
+
+
+async def watch_status(*, job_id: str, server_addr: str, timeout_sec: float = 600.0) -> AsyncIterator[ytcms_pb2.JobStatus]:
+    """
+    Yields JobStatus whenever state or percent changes, ends after a final state (or timeout).
+    Polls GetStatus with backoff, reset after every change.
+    """
+    deadline = time.monotonic() + float(timeout_sec)
+    delays = backoff_delays()
+    last = None
+    while time.monotonic() < deadline:
+        st = await get_status(job_id=job_id, server_addr=server_addr)
+        key = (int(st.state), int(st.percent))
+        if key != last:
+            last = key
+            delays = backoff_delays()
+            yield st
+        if _is_final(st):
+            return
+        await asyncio.sleep(min(next(delays), max(0.0, deadline - time.monotonic())))
+
+
+async def poll_until_done(
+    *,
+    job_id: str,
+    server_addr: str,
+    timeout_sec: float = 600.0,
+) -> ytcms_pb2.JobResult:
+    async for _st in watch_status(job_id=job_id, server_addr=server_addr, timeout_sec=timeout_sec):
+        pass
+    return await get_result(job_id=job_id, server_addr=server_addr)
@@ -21,7 +21,9 @@ from config.ytstorage.ytstorage_cfg import (
     YTSTORAGE_GRPC_TOKEN,
 )
 
+from services.job_watch_srv import backoff_delays
 from services.ytcms.ytcms_proto import ytcms_pb2, ytcms_pb2_grpc
+from services.monitor.metrics_srv import grpc_intercept
 
 
 _YTCMS_HEALTH_TIMEOUT_SEC = float((os.getenv("YTCMS_HEALTH_TIMEOUT", "") or "0.7").strip() or "0.7")
@@ -37,7 +39,7 @@ def _auth_md() -> List[Tuple[str, str]]:
 
 
 def _healthcheck_addr(addr: str) -> bool:
-    channel = grpc.insecure_channel(addr)
+    channel = grpc_intercept(grpc.insecure_channel(addr))
     try:
         stub = health_pb2_grpc.HealthStub(channel)
         md = _auth_md()
@@ -97,16 +99,22 @@ def pick_ytcms_server_addr() -> str:
     return addr0
 
 
-def submit_storage_job(
+def _storage_ref() -> ytcms_pb2.StorageRef:
+    return ytcms_pb2.StorageRef(
+        address=str(YTSTORAGE_GRPC_ADDRESS),
+        tls=bool(YTSTORAGE_GRPC_TLS),
+        token=str(YTSTORAGE_GRPC_TOKEN or ""),
+    )
+
+
+def _build_submit_request(
     *,
     video_id: str,
     storage_rel: str,
-    lang: Optional[str] = None,
-    task: Optional[str] = None,
-    idempotency_key: Optional[str] = None,
-    submit_timeout: float = YTCMS_SUBMIT_TIMEOUT,
-) -> Tuple[str, str]:
-    addr = pick_ytcms_server_addr()
+    lang: Optional[str],
+    task: Optional[str],
+    idempotency_key: Optional[str],
+) -> ytcms_pb2.SubmitJobRequest:
     lang2 = (lang or YTCMS_DEFAULT_LANG).strip() or "auto"
     task2 = (task or YTCMS_DEFAULT_TASK).strip() or "transcribe"
 
@@ -116,34 +124,50 @@ def submit_storage_job(
 
     idem = (idempotency_key or f"yurtube:{video_id}:{task2}:{lang2}:{source_rel_path}").strip()
 
+    return ytcms_pb2.SubmitJobRequest(
+        video_id=video_id,
+        idempotency_key=idem,
+        lang=lang2,
+        task=task2,
+        source=ytcms_pb2.SourceRef(
+            storage=_storage_ref(),
+            rel_path=source_rel_path,
+            mime="video/webm",
+            filename="original.webm",
+        ),
+        output=ytcms_pb2.OutputRef(
+            storage=_storage_ref(),
+            base_rel_dir=output_base_rel_dir,
+        ),
+    )
+
+
+def _build_delete_request(storage_rel: str) -> ytcms_pb2.DeleteCaptionsRequest:
+    storage_rel_n = (storage_rel or "").replace("\\", "/").strip().lstrip("/")
+    return ytcms_pb2.DeleteCaptionsRequest(storage=_storage_ref(), storage_rel=storage_rel_n)
+
+
+def submit_storage_job(
+    *,
+    video_id: str,
+    storage_rel: str,
+    lang: Optional[str] = None,
+    task: Optional[str] = None,
+    idempotency_key: Optional[str] = None,
+    submit_timeout: float = YTCMS_SUBMIT_TIMEOUT,
+) -> Tuple[str, str]:
+    addr = pick_ytcms_server_addr()
     md = _auth_md()
-    channel = grpc.insecure_channel(addr)
+    channel = grpc_intercept(grpc.insecure_channel(addr))
     stub = ytcms_pb2_grpc.CaptionsServiceStub(channel)
 
     try:
-        req = ytcms_pb2.SubmitJobRequest(
+        req = _build_submit_request(
             video_id=video_id,
-            idempotency_key=idem,
-            lang=lang2,
-            task=task2,
-            source=ytcms_pb2.SourceRef(
-                storage=ytcms_pb2.StorageRef(
-                    address=str(YTSTORAGE_GRPC_ADDRESS),
-                    tls=bool(YTSTORAGE_GRPC_TLS),
-                    token=str(YTSTORAGE_GRPC_TOKEN or ""),
-                ),
-                rel_path=source_rel_path,
-                mime="video/webm",
-                filename="original.webm",
-            ),
-            output=ytcms_pb2.OutputRef(
-                storage=ytcms_pb2.StorageRef(
-                    address=str(YTSTORAGE_GRPC_ADDRESS),
-                    tls=bool(YTSTORAGE_GRPC_TLS),
-                    token=str(YTSTORAGE_GRPC_TOKEN or ""),
-                ),
-                base_rel_dir=output_base_rel_dir,
-            ),
+            storage_rel=storage_rel,
+            lang=lang,
+            task=task,
+            idempotency_key=idempotency_key,
         )
 
         ack = stub.SubmitJob(req, metadata=md, timeout=submit_timeout)
@@ -162,7 +186,7 @@ def submit_storage_job(
 
 def get_status(*, job_id: str, server_addr: str, timeout: float = YTCMS_STATUS_TIMEOUT) -> ytcms_pb2.JobStatus:
     md = _auth_md()
-    channel = grpc.insecure_channel(server_addr)
+    channel = grpc_intercept(grpc.insecure_channel(server_addr))
     stub = ytcms_pb2_grpc.CaptionsServiceStub(channel)
     try:
         rep = stub.GetStatus(ytcms_pb2.GetStatusRequest(job_id=job_id), metadata=md, timeout=timeout)
@@ -176,7 +200,7 @@ def get_status(*, job_id: str, server_addr: str, timeout: float = YTCMS_STATUS_T
 
 def get_result(*, job_id: str, server_addr: str, timeout: float = YTCMS_RESULT_TIMEOUT) -> ytcms_pb2.JobResult:
     md = _auth_md()
-    channel = grpc.insecure_channel(server_addr)
+    channel = grpc_intercept(grpc.insecure_channel(server_addr))
     stub = ytcms_pb2_grpc.CaptionsServiceStub(channel)
     try:
         return stub.GetResult(ytcms_pb2.GetResultRequest(job_id=job_id), metadata=md, timeout=timeout)
@@ -190,23 +214,11 @@ def get_result(*, job_id: str, server_addr: str, timeout: float = YTCMS_RESULT_T
 def delete_captions(*, storage_rel: str, server_addr: Optional[str] = None, timeout: float = 30.0) -> None:
     addr = server_addr or pick_ytcms_server_addr()
     md = _auth_md()
-    channel = grpc.insecure_channel(addr)
+    channel = grpc_intercept(grpc.insecure_channel(addr))
     stub = ytcms_pb2_grpc.CaptionsServiceStub(channel)
 
-    storage_rel_n = (storage_rel or "").replace("\\", "/").strip().lstrip("/")
     try:
-        rep = stub.DeleteCaptions(
-            ytcms_pb2.DeleteCaptionsRequest(
-                storage=ytcms_pb2.StorageRef(
-                    address=str(YTSTORAGE_GRPC_ADDRESS),
-                    tls=bool(YTSTORAGE_GRPC_TLS),
-                    token=str(YTSTORAGE_GRPC_TOKEN or ""),
-                ),
-                storage_rel=storage_rel_n,
-            ),
-            metadata=md,
-            timeout=timeout,
-        )
+        rep = stub.DeleteCaptions(_build_delete_request(storage_rel), metadata=md, timeout=timeout)
         if not rep.ok:
             raise RuntimeError(rep.message or "DeleteCaptions failed")
     finally:
@@ -221,12 +233,18 @@ def poll_until_done(
     job_id: str,
     server_addr: str,
     timeout_sec: float = 600.0,
-    poll_interval_sec: float = 1.0,
+    poll_interval_sec: Optional[float] = None,
 ) -> ytcms_pb2.JobResult:
+    """
+    Blocking wait for a final state. Polls with exponential backoff starting at poll_interval_sec
+    (JOB_WATCH_MIN_INTERVAL_MS by default) up to JOB_WATCH_MAX_INTERVAL_MS.
+    """
     deadline = time.time() + float(timeout_sec)
-    while time.time() < deadline:
+    for delay in backoff_delays(poll_interval_sec):
+        if time.time() >= deadline:
+            break
         st = get_status(job_id=job_id, server_addr=server_addr)
         if st.state in (st.DONE, st.FAILED, st.CANCELED):
             break
-        time.sleep(float(poll_interval_sec))
-    return get_result(job_id=job_id, server_addr=server_addr)
\ No newline at end of file
+        time.sleep(min(delay, max(0.0, deadline - time.time())))
+    return get_result(job_id=job_id, server_addr=server_addr)
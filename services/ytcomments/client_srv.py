@@ -5,6 +5,8 @@ from typing import Dict, List, Optional, Literal
 import logging
 
 from config.config import settings
+from services.ytcomments.tree_cache_srv import comment_tree_cache
+from services.monitor.metrics_srv import grpc_aio_interceptors
 
 log = logging.getLogger("ytcomments_client")
 
@@ -69,6 +71,8 @@ class GrpcCommentsClient:
         self._tls_enabled = bool(tls_enabled)
         self._channel = None
         self._stub = None
+        # None = unknown yet; False once server answered UNIMPLEMENTED
+        self._subtree_supported: Optional[bool] = None
 
     async def _ensure(self):
         if grpc is None or pb is None or pbg is None:
@@ -108,9 +112,9 @@ class GrpcCommentsClient:
 
         if self._tls_enabled:
             creds = grpc.ssl_channel_credentials()  # type: ignore
-            self._channel = grpc.aio.secure_channel(self._target, creds, options=options)  # type: ignore
+            self._channel = grpc.aio.secure_channel(self._target, creds, options=options, interceptors=grpc_aio_interceptors())  # type: ignore
         else:
-            self._channel = grpc.aio.insecure_channel(self._target, options=options)  # type: ignore
+            self._channel = grpc.aio.insecure_channel(self._target, options=options, interceptors=grpc_aio_interceptors())  # type: ignore
 
         self._stub = pbg.YtCommentsStub(self._channel)  # type: ignore
         log.info("client: channel opened to %s", self._target)
@@ -233,6 +237,47 @@ class GrpcCommentsClient:
         items = [self._to_dto(c) for c in res.items]
         return ListPage(items=items, next_page_token=res.next_page_token or "", total_count=int(res.total_count))
 
+    async def list_subtree(
+        self,
+        video_id: str,
+        root_ids: List[str],
+        max_depth: int = 8,
+        include_deleted: bool = False,
+        ctx: Optional[UserContext] = None,
+    ) -> Optional[List[CommentDTO]]:
+        """
+        All replies under root_ids in one call (flat, parent_id set).
+        None if the server has no ListSubtree or the call failed - caller falls back to ListReplies.
+        """
+        if self._subtree_supported is False or not root_ids:
+            return None
+        try:
+            await self._ensure()
+        except Exception as e:
+            print(f"ytcomments_client: ensure failed in list_subtree: {e}")
+            return None
+
+        req = pb.ListSubtreeRequest(  # type: ignore
+            video_id=video_id,
+            root_ids=list(root_ids),
+            max_depth=int(max_depth),
+            include_deleted=bool(include_deleted),
+            ctx=self._ctx_to_pb(ctx),
+        )
+        try:
+            print(f"ytcomments_client: invoking ListSubtree roots={len(root_ids)}")
+            res = await asyncio.wait_for(self._stub.ListSubtree(req), timeout=self._timeout / 1000.0)  # type: ignore
+        except Exception as e:
+            if grpc is not None and isinstance(e, grpc.aio.AioRpcError) and e.code() == grpc.StatusCode.UNIMPLEMENTED:  # type: ignore[attr-defined]
+                self._subtree_supported = False
+                print("ytcomments_client: ListSubtree not implemented by server, using ListReplies")
+            else:
+                print(f"ytcomments_client: ListSubtree failed: {type(e).__name__}: {e}")
+            return None
+
+        self._subtree_supported = True
+        return [self._to_dto(c) for c in res.items]
+
     async def create_comment(
         self,
         video_id: str,
@@ -257,6 +302,7 @@ class GrpcCommentsClient:
         try:
             print("ytcomments_client: invoking Create")
             res = await asyncio.wait_for(self._stub.Create(req), timeout=self._timeout / 1000.0)  # type: ignore
+            comment_tree_cache.invalidate(video_id)
             if not res or not getattr(res, "comment", None):
                 return None
             return self._to_dto(res.comment)
@@ -286,6 +332,7 @@ class GrpcCommentsClient:
         try:
             print("ytcomments_client: invoking Edit")
             res = await asyncio.wait_for(self._stub.Edit(req), timeout=self._timeout / 1000.0)  # type: ignore
+            comment_tree_cache.invalidate(video_id)
             if not res or not getattr(res, "comment", None):
                 return None
             return self._to_dto(res.comment)
@@ -315,6 +362,7 @@ class GrpcCommentsClient:
         try:
             print("ytcomments_client: invoking Delete")
             res = await asyncio.wait_for(self._stub.Delete(req), timeout=self._timeout / 1000.0)  # type: ignore
+            comment_tree_cache.invalidate(video_id)
             if not res or not getattr(res, "comment", None):
                 return None
             return self._to_dto(res.comment)
@@ -361,6 +409,7 @@ class GrpcCommentsClient:
         try:
             print("ytcomments_client: invoking Vote")
             res = await asyncio.wait_for(self._stub.Vote(req), timeout=self._timeout / 1000.0)  # type: ignore
+            comment_tree_cache.invalidate(video_id)
             return {
                 "likes": int(res.likes),
                 "dislikes": int(res.dislikes),
@@ -0,0 +1,77 @@
+"""
+Short-TTL per-video cache of assembled comment trees (ytcomments_adapter payloads).
+
+- key: (video_id, page_size_top, sort_top, include_deleted)
+- get() hands out a copy: routes mutate per-viewer fields (my_vote, cached_text) in place
+- concurrent misses for the same key share one load
+- GrpcCommentsClient invalidates a video after create/edit/delete/vote
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from config.config import settings
+
+_Key = Tuple[str, int, str, bool]
+
+
+def _clone_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    out = dict(payload)
+    out["comments"] = {cid: dict(meta) for cid, meta in (payload.get("comments") or {}).items()}
+    out["roots"] = list(payload.get("roots") or [])
+    out["children_map"] = {pid: list(arr) for pid, arr in (payload.get("children_map") or {}).items()}
+    out["totals"] = dict(payload.get("totals") or {})
+    return out
+
+
+class _CommentTreeCache:
+    def __init__(self, ttl_sec: int, max_items: int = 512) -> None:
+        self._ttl = float(ttl_sec)
+        self._max = int(max_items)
+        self._items: "OrderedDict[_Key, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+        self._inflight: Dict[_Key, "asyncio.Future[Dict[str, Any]]"] = {}
+        # bumped on invalidate, so a load started before a write is not stored afterwards
+        self._gen: Dict[str, int] = {}
+
+    async def get_or_load(self, key: _Key, loader: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        if self._ttl <= 0:
+            return await loader()
+        it = self._items.get(key)
+        if it is not None:
+            ts, gen, payload = it
+            if time.monotonic() - ts <= self._ttl and gen == self._gen.get(key[0], 0):
+                self._items.move_to_end(key)
+                return _clone_payload(payload)
+            self._items.pop(key, None)
+
+        fut = self._inflight.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(self._load(key, loader))
+            self._inflight[key] = fut
+        return _clone_payload(await asyncio.shield(fut))
+
+    async def _load(self, key: _Key, loader: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        gen = self._gen.get(key[0], 0)
+        try:
+            payload = await loader()
+        finally:
+            self._inflight.pop(key, None)
+        if gen == self._gen.get(key[0], 0):
+            self._items[key] = (time.monotonic(), gen, payload)
+            self._items.move_to_end(key)
+            while len(self._items) > self._max:
+                self._items.popitem(last=False)
+        return payload
+
+    def invalidate(self, video_id: str) -> None:
+        if not video_id:
+            return
+        self._gen[video_id] = self._gen.get(video_id, 0) + 1
+        for k in [k for k in self._items if k[0] == video_id]:
+            self._items.pop(k, None)
+        if len(self._gen) > self._max * 4:
+            self._gen = {v: g for v, g in self._gen.items() if any(k[0] == v for k in self._items)}
+
+
+comment_tree_cache = _CommentTreeCache(int(getattr(settings, "YTCOMMENTS_TREE_CACHE_TTL_SEC", 5)))
@@ -1,9 +1,11 @@
 from typing import Any, Dict, List, Optional
+import asyncio
 import logging
 import os
-import collections
 
-from services.ytcomments.client_srv import get_ytcomments_client, CommentDTO
+from config.config import settings
+from services.ytcomments.client_srv import get_ytcomments_client, CommentDTO, ListPage
+from services.ytcomments.tree_cache_srv import comment_tree_cache
 
 log = logging.getLogger("ytcomments_adapter")
 
@@ -45,16 +47,28 @@ def _sort_ids_by_created(ids: List[str], comments: Dict[str, Dict[str, Any]], ne
 
 
 async def _fetch_via_service(video_id: str, page_size_top: int, sort_top: str, include_deleted: bool) -> Dict[str, Any]:
+    """
+    Tree load:
+    - ListTop and GetCounts run concurrently
+    - replies: one ListSubtree call if the server supports it, otherwise ListReplies
+      per BFS level in parallel (bounded by YTCOMMENTS_TREE_CONCURRENCY)
+    - nodes with reply_count == 0 are not queried
+    """
     client = get_ytcomments_client()
 
-    top_page = await client.list_top(
-        video_id=video_id,
-        page_size=page_size_top,
-        page_token="",
-        sort=("newest_first" if sort_top == "newest_first" else "oldest_first"),
-        include_deleted=bool(include_deleted),
-        ctx=None,
-    )
+    counts_task = asyncio.ensure_future(client.get_counts(video_id, ctx=None))
+    try:
+        top_page = await client.list_top(
+            video_id=video_id,
+            page_size=page_size_top,
+            page_token="",
+            sort=("newest_first" if sort_top == "newest_first" else "oldest_first"),
+            include_deleted=bool(include_deleted),
+            ctx=None,
+        )
+    except BaseException:
+        counts_task.cancel()
+        raise
 
     comments: Dict[str, Dict[str, Any]] = {}
     children_map: Dict[Optional[str], List[str]] = {}
@@ -72,36 +86,58 @@ async def _fetch_via_service(video_id: str, page_size_top: int, sort_top: str, i
     except Exception:
         max_depth = 8
 
-    queue = collections.deque([(rid, 1) for rid in roots])
-    visited = set()
-    while queue:
-        parent_id, depth = queue.popleft()
-        if parent_id in visited:
-            continue
-        visited.add(parent_id)
-
-        if depth > max_depth:
-            continue
+    def _attach(parent_id: str, rc: CommentDTO) -> None:
+        if rc.id not in comments:
+            comments[rc.id] = _meta_from_dto(rc)
+        comments[rc.id]["parent_id"] = parent_id
+        children_map.setdefault(parent_id, []).append(rc.id)
 
-        rep_page = await client.list_replies(
+    expandable = [rid for rid in roots if comments[rid]["reply_count"] > 0]
+    subtree = None
+    if expandable and max_depth >= 1:
+        subtree = await client.list_subtree(
             video_id=video_id,
-            parent_id=parent_id,
-            page_size=500,
-            page_token="",
-            sort="oldest_first",
+            root_ids=expandable,
+            max_depth=max_depth,
             include_deleted=bool(include_deleted),
             ctx=None,
         )
 
-        if not rep_page.items:
-            continue
-
-        for rc in rep_page.items:
-            if rc.id not in comments:
-                comments[rc.id] = _meta_from_dto(rc)
-            comments[rc.id]["parent_id"] = parent_id
-            children_map.setdefault(parent_id, []).append(rc.id)
-            queue.append((rc.id, depth + 1))
+    if subtree is not None:
+        for rc in subtree:
+            if rc.parent_id and rc.id not in comments:
+                _attach(rc.parent_id, rc)
+    elif expandable:
+        sem = asyncio.Semaphore(max(1, int(getattr(settings, "YTCOMMENTS_TREE_CONCURRENCY", 8))))
+
+        async def _replies(parent_id: str) -> ListPage:
+            async with sem:
+                return await client.list_replies(
+                    video_id=video_id,
+                    parent_id=parent_id,
+                    page_size=500,
+                    page_token="",
+                    sort="oldest_first",
+                    include_deleted=bool(include_deleted),
+                    ctx=None,
+                )
+
+        visited = set(roots)
+        level = expandable
+        depth = 1
+        while level and depth <= max_depth:
+            pages = await asyncio.gather(*[_replies(pid) for pid in level])
+            nxt: List[str] = []
+            for parent_id, rep_page in zip(level, pages):
+                for rc in rep_page.items:
+                    if rc.id in visited:
+                        continue
+                    visited.add(rc.id)
+                    _attach(parent_id, rc)
+                    if rc.reply_count > 0:
+                        nxt.append(rc.id)
+            level = nxt
+            depth += 1
 
     newest = (sort_top == "newest_first")
     for pid, arr in list(children_map.items()):
@@ -111,7 +147,7 @@ async def _fetch_via_service(video_id: str, page_size_top: int, sort_top: str, i
             newest_first=(pid is None and newest) or (pid is not None and False),
         )
 
-    counts = await client.get_counts(video_id, ctx=None)
+    counts = await counts_task
 
     return {
         "video_id": video_id,
@@ -135,7 +171,10 @@ async def fetch_root(
     No legacy fallback: always use ytcomments service.
     """
     log.info("ytcomments_adapter: fetch_root(video_id=%s)", video_id)
-    return await _fetch_via_service(video_id, page_size_top, sort_top, include_deleted)
+    return await comment_tree_cache.get_or_load(
+        (video_id, int(page_size_top), sort_top, bool(include_deleted)),
+        lambda: _fetch_via_service(video_id, page_size_top, sort_top, include_deleted),
+    )
 
 
 def build_tree_payload(
@@ -24,15 +24,15 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10ytcomments.proto\x12\rytcomments.v1\"\x93\x01\n\x0bUserContext\x12\x10\n\x08user_uid\x18\x01 \x01(\t\x12\x10\n\x08username\x18\x02 \x01(\t\x12\x12\n\nchannel_id\x18\x03 \x01(\t\x12\x16\n\x0eis_video_owner\x18\x04 \x01(\x08\x12\x14\n\x0cis_moderator\x18\x05 \x01(\x08\x12\n\n\x02ip\x18\x06 \x01(\t\x12\x12\n\nuser_agent\x18\x07 \x01(\t\"\x9f\x02\n\x07\x43omment\x12\n\n\x02id\x18\x01 \x01(\t\x12\x10\n\x08video_id\x18\x02 \x01(\t\x12\x11\n\tparent_id\x18\x03 \x01(\t\x12\x13\n\x0b\x63ontent_raw\x18\x04 \x01(\t\x12\x14\n\x0c\x63ontent_html\x18\x05 \x01(\t\x12\x12\n\nis_deleted\x18\x06 \x01(\x08\x12\x0e\n\x06\x65\x64ited\x18\x07 \x01(\x08\x12\x12\n\ncreated_at\x18\x08 \x01(\x03\x12\x12\n\nupdated_at\x18\t \x01(\x03\x12\x10\n\x08user_uid\x18\n \x01(\t\x12\x10\n\x08username\x18\x0b \x01(\t\x12\x12\n\nchannel_id\x18\x0c \x01(\t\x12\x13\n\x0breply_count\x18\r \x01(\x05\x12\r\n\x05likes\x18\x0e \x01(\x05\x12\x10\n\x08\x64islikes\x18\x0f \x01(\x05\"\xb3\x01\n\x0eListTopRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12&\n\x04sort\x18\x04 \x01(\x0e\x32\x18.ytcomments.v1.SortOrder\x12\x17\n\x0finclude_deleted\x18\x05 \x01(\x08\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\"f\n\x0fListTopResponse\x12%\n\x05items\x18\x01 \x03(\x0b\x32\x16.ytcomments.v1.Comment\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"\xca\x01\n\x12ListRepliesRequest\x12\x10\n\x08video_id\x18\n \x01(\t\x12\x11\n\tparent_id\x18\x01 \x01(\t\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12&\n\x04sort\x18\x04 \x01(\x0e\x32\x18.ytcomments.v1.SortOrder\x12\x17\n\x0finclude_deleted\x18\x05 \x01(\x08\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\"j\n\x13ListRepliesResponse\x12%\n\x05items\x18\x01 \x03(\x0b\x32\x16.ytcomments.v1.Comment\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"\x92\x01\n\x14\x43reateCommentRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x11\n\tparent_id\x18\x02 \x01(\t\x12\x13\n\x0b\x63ontent_raw\x18\x03 \x01(\t\x12\x17\n\x0fidempotency_key\x18\x04 \x01(\t\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\"@\n\x15\x43reateCommentResponse\x12\'\n\x07\x63omment\x18\x01 \x01(\x0b\x32\x16.ytcomments.v1.Comment\"x\n\x12\x45\x64itCommentRequest\x12\x10\n\x08video_id\x18\n \x01(\t\x12\x12\n\ncomment_id\x18\x01 \x01(\t\x12\x13\n\x0b\x63ontent_raw\x18\x02 \x01(\t\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\">\n\x13\x45\x64itCommentResponse\x12\'\n\x07\x63omment\x18\x01 \x01(\x0b\x32\x16.ytcomments.v1.Comment\"z\n\x14\x44\x65leteCommentRequest\x12\x10\n\x08video_id\x18\n \x01(\t\x12\x12\n\ncomment_id\x18\x01 \x01(\t\x12\x13\n\x0bhard_delete\x18\x02 \x01(\x08\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\"@\n\x15\x44\x65leteCommentResponse\x12\'\n\x07\x63omment\x18\x01 \x01(\x0b\x32\x16.ytcomments.v1.Comment\"f\n\x15RestoreCommentRequest\x12\x10\n\x08video_id\x18\n \x01(\t\x12\x12\n\ncomment_id\x18\x01 \x01(\t\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\"A\n\x16RestoreCommentResponse\x12\'\n\x07\x63omment\x18\x01 \x01(\x0b\x32\x16.ytcomments.v1.Comment\"M\n\x10GetCountsRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\"A\n\x11GetCountsResponse\x12\x17\n\x0ftop_level_count\x18\x01 \x01(\x05\x12\x13\n\x0btotal_count\x18\x02 \x01(\x05\"j\n\x0bVoteRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x12\n\ncomment_id\x18\x02 \x01(\t\x12\x0c\n\x04vote\x18\x03 \x01(\x05\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\"]\n\x0cVoteResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\r\n\x05likes\x18\x02 \x01(\x05\x12\x10\n\x08\x64islikes\x18\x03 \x01(\x05\x12\x0f\n\x07my_vote\x18\x04 \x01(\x05\x12\x0f\n\x07user_id\x18\x05 \x01(\t\"c\n\x11GetMyVotesRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x13\n\x0b\x63omment_ids\x18\x02 \x03(\t\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\"/\n\x0b\x43ommentVote\x12\x12\n\ncomment_id\x18\x01 \x01(\t\x12\x0c\n\x04vote\x18\x02 \x01(\x05\"?\n\x12GetMyVotesResponse\x12)\n\x05votes\x18\x01 \x03(\x0b\x32\x1a.ytcomments.v1.CommentVote*E\n\tSortOrder\x12\x14\n\x10SORT_UNSPECIFIED\x10\x00\x12\x10\n\x0cNEWEST_FIRST\x10\x01\x12\x10\n\x0cOLDEST_FIRST\x10\x02\x32\xe1\x05\n\nYtComments\x12H\n\x07ListTop\x12\x1d.ytcomments.v1.ListTopRequest\x1a\x1e.ytcomments.v1.ListTopResponse\x12T\n\x0bListReplies\x12!.ytcomments.v1.ListRepliesRequest\x1a\".ytcomments.v1.ListRepliesResponse\x12S\n\x06\x43reate\x12#.ytcomments.v1.CreateCommentRequest\x1a$.ytcomments.v1.CreateCommentResponse\x12M\n\x04\x45\x64it\x12!.ytcomments.v1.EditCommentRequest\x1a\".ytcomments.v1.EditCommentResponse\x12S\n\x06\x44\x65lete\x12#.ytcomments.v1.DeleteCommentRequest\x1a$.ytcomments.v1.DeleteCommentResponse\x12V\n\x07Restore\x12$.ytcomments.v1.RestoreCommentRequest\x1a%.ytcomments.v1.RestoreCommentResponse\x12N\n\tGetCounts\x12\x1f.ytcomments.v1.GetCountsRequest\x1a .ytcomments.v1.GetCountsResponse\x12?\n\x04Vote\x12\x1a.ytcomments.v1.VoteRequest\x1a\x1b.ytcomments.v1.VoteResponse\x12Q\n\nGetMyVotes\x12 .ytcomments.v1.GetMyVotesRequest\x1a!.ytcomments.v1.GetMyVotesResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10ytcomments.proto\x12\rytcomments.v1\"\x93\x01\n\x0bUserContext\x12\x10\n\x08user_uid\x18\x01 \x01(\t\x12\x10\n\x08username\x18\x02 \x01(\t\x12\x12\n\nchannel_id\x18\x03 \x01(\t\x12\x16\n\x0eis_video_owner\x18\x04 \x01(\x08\x12\x14\n\x0cis_moderator\x18\x05 \x01(\x08\x12\n\n\x02ip\x18\x06 \x01(\t\x12\x12\n\nuser_agent\x18\x07 \x01(\t\"\x9f\x02\n\x07\x43omment\x12\n\n\x02id\x18\x01 \x01(\t\x12\x10\n\x08video_id\x18\x02 \x01(\t\x12\x11\n\tparent_id\x18\x03 \x01(\t\x12\x13\n\x0b\x63ontent_raw\x18\x04 \x01(\t\x12\x14\n\x0c\x63ontent_html\x18\x05 \x01(\t\x12\x12\n\nis_deleted\x18\x06 \x01(\x08\x12\x0e\n\x06\x65\x64ited\x18\x07 \x01(\x08\x12\x12\n\ncreated_at\x18\x08 \x01(\x03\x12\x12\n\nupdated_at\x18\t \x01(\x03\x12\x10\n\x08user_uid\x18\n \x01(\t\x12\x10\n\x08username\x18\x0b \x01(\t\x12\x12\n\nchannel_id\x18\x0c \x01(\t\x12\x13\n\x0breply_count\x18\r \x01(\x05\x12\r\n\x05likes\x18\x0e \x01(\x05\x12\x10\n\x08\x64islikes\x18\x0f \x01(\x05\"\xb3\x01\n\x0eListTopRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12&\n\x04sort\x18\x04 \x01(\x0e\x32\x18.ytcomments.v1.SortOrder\x12\x17\n\x0finclude_deleted\x18\x05 \x01(\x08\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\"f\n\x0fListTopResponse\x12%\n\x05items\x18\x01 \x03(\x0b\x32\x16.ytcomments.v1.Comment\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"\xca\x01\n\x12ListRepliesRequest\x12\x10\n\x08video_id\x18\n \x01(\t\x12\x11\n\tparent_id\x18\x01 \x01(\t\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12&\n\x04sort\x18\x04 \x01(\x0e\x32\x18.ytcomments.v1.SortOrder\x12\x17\n\x0finclude_deleted\x18\x05 \x01(\x08\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\"j\n\x13ListRepliesResponse\x12%\n\x05items\x18\x01 \x03(\x0b\x32\x16.ytcomments.v1.Comment\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"\x8d\x01\n\x12ListSubtreeRequest\x12\x10\n\x08video_id\x18\n \x01(\t\x12\x10\n\x08root_ids\x18\x01 \x03(\t\x12\x11\n\tmax_depth\x18\x02 \x01(\x05\x12\x17\n\x0finclude_deleted\x18\x05 \x01(\x08\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\"<\n\x13ListSubtreeResponse\x12%\n\x05items\x18\x01 \x03(\x0b\x32\x16.ytcomments.v1.Comment\"\x92\x01\n\x14\x43reateCommentRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x11\n\tparent_id\x18\x02 \x01(\t\x12\x13\n\x0b\x63ontent_raw\x18\x03 \x01(\t\x12\x17\n\x0fidempotency_key\x18\x04 \x01(\t\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\"@\n\x15\x43reateCommentResponse\x12\'\n\x07\x63omment\x18\x01 \x01(\x0b\x32\x16.ytcomments.v1.Comment\"x\n\x12\x45\x64itCommentRequest\x12\x10\n\x08video_id\x18\n \x01(\t\x12\x12\n\ncomment_id\x18\x01 \x01(\t\x12\x13\n\x0b\x63ontent_raw\x18\x02 \x01(\t\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\">\n\x13\x45\x64itCommentResponse\x12\'\n\x07\x63omment\x18\x01 \x01(\x0b\x32\x16.ytcomments.v1.Comment\"z\n\x14\x44\x65leteCommentRequest\x12\x10\n\x08video_id\x18\n \x01(\t\x12\x12\n\ncomment_id\x18\x01 \x01(\t\x12\x13\n\x0bhard_delete\x18\x02 \x01(\x08\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\"@\n\x15\x44\x65leteCommentResponse\x12\'\n\x07\x63omment\x18\x01 \x01(\x0b\x32\x16.ytcomments.v1.Comment\"f\n\x15RestoreCommentRequest\x12\x10\n\x08video_id\x18\n \x01(\t\x12\x12\n\ncomment_id\x18\x01 \x01(\t\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\"A\n\x16RestoreCommentResponse\x12\'\n\x07\x63omment\x18\x01 \x01(\x0b\x32\x16.ytcomments.v1.Comment\"M\n\x10GetCountsRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\"A\n\x11GetCountsResponse\x12\x17\n\x0ftop_level_count\x18\x01 \x01(\x05\x12\x13\n\x0btotal_count\x18\x02 \x01(\x05\"j\n\x0bVoteRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x12\n\ncomment_id\x18\x02 \x01(\t\x12\x0c\n\x04vote\x18\x03 \x01(\x05\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\"]\n\x0cVoteResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\r\n\x05likes\x18\x02 \x01(\x05\x12\x10\n\x08\x64islikes\x18\x03 \x01(\x05\x12\x0f\n\x07my_vote\x18\x04 \x01(\x05\x12\x0f\n\x07user_id\x18\x05 \x01(\t\"c\n\x11GetMyVotesRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x13\n\x0b\x63omment_ids\x18\x02 \x03(\t\x12\'\n\x03\x63tx\x18\x64 \x01(\x0b\x32\x1a.ytcomments.v1.UserContext\"/\n\x0b\x43ommentVote\x12\x12\n\ncomment_id\x18\x01 \x01(\t\x12\x0c\n\x04vote\x18\x02 \x01(\x05\"?\n\x12GetMyVotesResponse\x12)\n\x05votes\x18\x01 \x03(\x0b\x32\x1a.ytcomments.v1.CommentVote*E\n\tSortOrder\x12\x14\n\x10SORT_UNSPECIFIED\x10\x00\x12\x10\n\x0cNEWEST_FIRST\x10\x01\x12\x10\n\x0cOLDEST_FIRST\x10\x02\x32\xb7\x06\n\nYtComments\x12H\n\x07ListTop\x12\x1d.ytcomments.v1.ListTopRequest\x1a\x1e.ytcomments.v1.ListTopResponse\x12T\n\x0bListReplies\x12!.ytcomments.v1.ListRepliesRequest\x1a\".ytcomments.v1.ListRepliesResponse\x12T\n\x0bListSubtree\x12!.ytcomments.v1.ListSubtreeRequest\x1a\".ytcomments.v1.ListSubtreeResponse\x12S\n\x06\x43reate\x12#.ytcomments.v1.CreateCommentRequest\x1a$.ytcomments.v1.CreateCommentResponse\x12M\n\x04\x45\x64it\x12!.ytcomments.v1.EditCommentRequest\x1a\".ytcomments.v1.EditCommentResponse\x12S\n\x06\x44\x65lete\x12#.ytcomments.v1.DeleteCommentRequest\x1a$.ytcomments.v1.DeleteCommentResponse\x12V\n\x07Restore\x12$.ytcomments.v1.RestoreCommentRequest\x1a%.ytcomments.v1.RestoreCommentResponse\x12N\n\tGetCounts\x12\x1f.ytcomments.v1.GetCountsRequest\x1a .ytcomments.v1.GetCountsResponse\x12?\n\x04Vote\x12\x1a.ytcomments.v1.VoteRequest\x1a\x1b.ytcomments.v1.VoteResponse\x12Q\n\nGetMyVotes\x12 .ytcomments.v1.GetMyVotesRequest\x1a!.ytcomments.v1.GetMyVotesResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ytcomments_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_SORTORDER']._serialized_start=2400
-  _globals['_SORTORDER']._serialized_end=2469
+  _globals['_SORTORDER']._serialized_start=2606
+  _globals['_SORTORDER']._serialized_end=2675
   _globals['_USERCONTEXT']._serialized_start=36
   _globals['_USERCONTEXT']._serialized_end=183
   _globals['_COMMENT']._serialized_start=186
@@ -45,36 +45,40 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_LISTREPLIESREQUEST']._serialized_end=964
   _globals['_LISTREPLIESRESPONSE']._serialized_start=966
   _globals['_LISTREPLIESRESPONSE']._serialized_end=1072
-  _globals['_CREATECOMMENTREQUEST']._serialized_start=1075
-  _globals['_CREATECOMMENTREQUEST']._serialized_end=1221
-  _globals['_CREATECOMMENTRESPONSE']._serialized_start=1223
-  _globals['_CREATECOMMENTRESPONSE']._serialized_end=1287
-  _globals['_EDITCOMMENTREQUEST']._serialized_start=1289
-  _globals['_EDITCOMMENTREQUEST']._serialized_end=1409
-  _globals['_EDITCOMMENTRESPONSE']._serialized_start=1411
-  _globals['_EDITCOMMENTRESPONSE']._serialized_end=1473
-  _globals['_DELETECOMMENTREQUEST']._serialized_start=1475
-  _globals['_DELETECOMMENTREQUEST']._serialized_end=1597
-  _globals['_DELETECOMMENTRESPONSE']._serialized_start=1599
-  _globals['_DELETECOMMENTRESPONSE']._serialized_end=1663
-  _globals['_RESTORECOMMENTREQUEST']._serialized_start=1665
-  _globals['_RESTORECOMMENTREQUEST']._serialized_end=1767
-  _globals['_RESTORECOMMENTRESPONSE']._serialized_start=1769
-  _globals['_RESTORECOMMENTRESPONSE']._serialized_end=1834
-  _globals['_GETCOUNTSREQUEST']._serialized_start=1836
-  _globals['_GETCOUNTSREQUEST']._serialized_end=1913
-  _globals['_GETCOUNTSRESPONSE']._serialized_start=1915
-  _globals['_GETCOUNTSRESPONSE']._serialized_end=1980
-  _globals['_VOTEREQUEST']._serialized_start=1982
-  _globals['_VOTEREQUEST']._serialized_end=2088
-  _globals['_VOTERESPONSE']._serialized_start=2090
-  _globals['_VOTERESPONSE']._serialized_end=2183
-  _globals['_GETMYVOTESREQUEST']._serialized_start=2185
-  _globals['_GETMYVOTESREQUEST']._serialized_end=2284
-  _globals['_COMMENTVOTE']._serialized_start=2286
-  _globals['_COMMENTVOTE']._serialized_end=2333
-  _globals['_GETMYVOTESRESPONSE']._serialized_start=2335
-  _globals['_GETMYVOTESRESPONSE']._serialized_end=2398
-  _globals['_YTCOMMENTS']._serialized_start=2472
-  _globals['_YTCOMMENTS']._serialized_end=3209
+  _globals['_LISTSUBTREEREQUEST']._serialized_start=1075
+  _globals['_LISTSUBTREEREQUEST']._serialized_end=1216
+  _globals['_LISTSUBTREERESPONSE']._serialized_start=1218
+  _globals['_LISTSUBTREERESPONSE']._serialized_end=1278
+  _globals['_CREATECOMMENTREQUEST']._serialized_start=1281
+  _globals['_CREATECOMMENTREQUEST']._serialized_end=1427
+  _globals['_CREATECOMMENTRESPONSE']._serialized_start=1429
+  _globals['_CREATECOMMENTRESPONSE']._serialized_end=1493
+  _globals['_EDITCOMMENTREQUEST']._serialized_start=1495
+  _globals['_EDITCOMMENTREQUEST']._serialized_end=1615
+  _globals['_EDITCOMMENTRESPONSE']._serialized_start=1617
+  _globals['_EDITCOMMENTRESPONSE']._serialized_end=1679
+  _globals['_DELETECOMMENTREQUEST']._serialized_start=1681
+  _globals['_DELETECOMMENTREQUEST']._serialized_end=1803
+  _globals['_DELETECOMMENTRESPONSE']._serialized_start=1805
+  _globals['_DELETECOMMENTRESPONSE']._serialized_end=1869
+  _globals['_RESTORECOMMENTREQUEST']._serialized_start=1871
+  _globals['_RESTORECOMMENTREQUEST']._serialized_end=1973
+  _globals['_RESTORECOMMENTRESPONSE']._serialized_start=1975
+  _globals['_RESTORECOMMENTRESPONSE']._serialized_end=2040
+  _globals['_GETCOUNTSREQUEST']._serialized_start=2042
+  _globals['_GETCOUNTSREQUEST']._serialized_end=2119
+  _globals['_GETCOUNTSRESPONSE']._serialized_start=2121
+  _globals['_GETCOUNTSRESPONSE']._serialized_end=2186
+  _globals['_VOTEREQUEST']._serialized_start=2188
+  _globals['_VOTEREQUEST']._serialized_end=2294
+  _globals['_VOTERESPONSE']._serialized_start=2296
+  _globals['_VOTERESPONSE']._serialized_end=2389
+  _globals['_GETMYVOTESREQUEST']._serialized_start=2391
+  _globals['_GETMYVOTESREQUEST']._serialized_end=2490
+  _globals['_COMMENTVOTE']._serialized_start=2492
+  _globals['_COMMENTVOTE']._serialized_end=2539
+  _globals['_GETMYVOTESRESPONSE']._serialized_start=2541
+  _globals['_GETMYVOTESRESPONSE']._serialized_end=2604
+  _globals['_YTCOMMENTS']._serialized_start=2678
+  _globals['_YTCOMMENTS']._serialized_end=3501
 # @@protoc_insertion_point(module_scope)
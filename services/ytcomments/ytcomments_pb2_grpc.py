@@ -44,6 +44,11 @@ class YtCommentsStub(object):
                 request_serializer=ytcomments__pb2.ListRepliesRequest.SerializeToString,
                 response_deserializer=ytcomments__pb2.ListRepliesResponse.FromString,
                 _registered_method=True)
+        self.ListSubtree = channel.unary_unary(
+                '/ytcomments.v1.YtComments/ListSubtree',
+                request_serializer=ytcomments__pb2.ListSubtreeRequest.SerializeToString,
+                response_deserializer=ytcomments__pb2.ListSubtreeResponse.FromString,
+                _registered_method=True)
         self.Create = channel.unary_unary(
                 '/ytcomments.v1.YtComments/Create',
                 request_serializer=ytcomments__pb2.CreateCommentRequest.SerializeToString,
@@ -96,6 +101,12 @@ class YtCommentsServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ListSubtree(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def Create(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -151,6 +162,11 @@ def add_YtCommentsServicer_to_server(servicer, server):
                     request_deserializer=ytcomments__pb2.ListRepliesRequest.FromString,
                     response_serializer=ytcomments__pb2.ListRepliesResponse.SerializeToString,
             ),
+            'ListSubtree': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListSubtree,
+                    request_deserializer=ytcomments__pb2.ListSubtreeRequest.FromString,
+                    response_serializer=ytcomments__pb2.ListSubtreeResponse.SerializeToString,
+            ),
             'Create': grpc.unary_unary_rpc_method_handler(
                     servicer.Create,
                     request_deserializer=ytcomments__pb2.CreateCommentRequest.FromString,
@@ -251,6 +267,33 @@ class YtComments(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ListSubtree(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/ytcomments.v1.YtComments/ListSubtree',
+            ytcomments__pb2.ListSubtreeRequest.SerializeToString,
+            ytcomments__pb2.ListSubtreeResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def Create(request,
             target,
@@ -6,6 +6,7 @@ import grpc
 
 from utils.ytconvert.ytconvert_servers_ut import YtconvertServer
 from services.ytconvert.ytconvert_proto import ytconvert_pb2, ytconvert_pb2_grpc
+from services.monitor.metrics_srv import grpc_aio_interceptors
 
 
 def _auth_md(token: Optional[str]) -> List[Tuple[str, str]]:
@@ -21,7 +22,7 @@ class YtconvertClient:
         self._stub: Optional[ytconvert_pb2_grpc.ConverterStub] = None
 
     async def __aenter__(self) -> "YtconvertClient":
-        self._channel = grpc.aio.insecure_channel(self.server.hostport)
+        self._channel = grpc.aio.insecure_channel(self.server.hostport, interceptors=grpc_aio_interceptors())
         self._stub = ytconvert_pb2_grpc.ConverterStub(self._channel)
         return self
 
@@ -0,0 +1,180 @@
+"""
+Adaptive streaming packaging of ytconvert renditions.
+
+Ready WebM renditions of one codec are remuxed (no re-encode) into fMP4 segments with a DASH
+manifest and an HLS master playlist over the same segments. Output goes to
+<storage_rel>/stream/v<unix_ts>/, so every published file is immutable; manifests are uploaded
+after all segments, then the video_assets rows (stream_hls / stream_dash) are switched to the new
+directory. Superseded directories are not removed at the switch: players that loaded the old manifest
+keep fetching its segments. A later repackage of the video removes those superseded more than
+YTCONVERT_PACKAGE_KEEP_OLD_SEC ago (never less than the page cache TTL).
+
+No DB connection is held while downloading, running ffmpeg or uploading; local file I/O runs in the
+default executor.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import re
+import shutil
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from config.config import settings
+from config.ytconvert.ytconvert_cfg import (
+    YTCONVERT_PACKAGE_SEGMENT_SEC,
+    YTCONVERT_PACKAGE_UPLOAD_CONCURRENCY,
+    YTCONVERT_PACKAGE_KEEP_OLD_SEC,
+)
+from db import db_conn
+from db.video_renditions_db import list_video_renditions
+from db.ytconvert.video_assets_db import upsert_video_asset_path
+from services.ffmpeg_srv import async_package_dash_hls
+from services.ytstorage.base_srv import StorageClient
+
+log = logging.getLogger("ytconvert_package")
+
+ASSET_HLS = "stream_hls"
+ASSET_DASH = "stream_dash"
+
+_MANIFESTS = ("manifest.mpd", "master.m3u8")
+_READY = ("ok", "ready", "done", "success")
+_PRESET_RE = re.compile(r"(\d+)")
+_STREAM_DIR_RE = re.compile(r"^v(\d+)$")
+_CHUNK = 1024 * 1024
+
+
+def _height(preset: str) -> int:
+    m = _PRESET_RE.search(preset or "")
+    return int(m.group(1)) if m else 0
+
+
+def pick_renditions(renditions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Ready .webm renditions, highest first, all of the codec of the highest one
+    (one codec per adaptation set, so the player can switch without re-init).
+    """
+    ready = [
+        r for r in renditions
+        if str(r.get("status") or "").strip().lower() in _READY
+        and str(r.get("storage_path") or "").lower().endswith(".webm")
+    ]
+    if not ready:
+        return []
+    ready.sort(key=lambda r: _height(str(r.get("preset") or "")), reverse=True)
+    codec = ready[0].get("codec")
+    out: List[Dict[str, Any]] = []
+    seen = set()
+    for r in ready:
+        preset = str(r.get("preset") or "")
+        if r.get("codec") != codec or preset in seen:
+            continue
+        seen.add(preset)
+        out.append(r)
+    return out
+
+
+async def _download(storage_client: StorageClient, rel: str, dst: str) -> None:
+    loop = asyncio.get_running_loop()
+    reader = await storage_client.open_reader(rel)  # type: ignore
+    f = await loop.run_in_executor(None, open, dst, "wb")
+    try:
+        async for chunk in reader:
+            if chunk:
+                await loop.run_in_executor(None, f.write, chunk)
+    finally:
+        await loop.run_in_executor(None, f.close)
+
+
+async def _upload(storage_client: StorageClient, src: str, rel: str) -> None:
+    loop = asyncio.get_running_loop()
+    rf = await loop.run_in_executor(None, open, src, "rb")
+    try:
+        writer = await storage_client.open_writer(rel, overwrite=True)  # type: ignore
+        async with writer as w:  # type: ignore
+            while True:
+                chunk = await loop.run_in_executor(None, rf.read, _CHUNK)
+                if not chunk:
+                    break
+                await w.write(chunk)
+    finally:
+        await loop.run_in_executor(None, rf.close)
+
+
+async def _remove_superseded(storage_client: StorageClient, video_id: str, stream_root: str, current: str) -> None:
+    """
+    Remove stream/v<ts> dirs superseded long enough ago. Dir names are creation times, so a dir was
+    superseded when the next newer one was created.
+    """
+    keep_sec = max(int(YTCONVERT_PACKAGE_KEEP_OLD_SEC), int(settings.PAGE_CACHE_TTL_SEC))
+    res = await storage_client.listdir(stream_root)  # type: ignore
+    dirs = []
+    for e in res.get("entries") or []:
+        m = _STREAM_DIR_RE.match(str(e.get("name") or ""))
+        if m:
+            dirs.append((int(m.group(1)), f"{stream_root}/{e['name']}"))
+    dirs.sort()
+    now = time.time()
+    for (_, rel), (superseded_at, _) in zip(dirs, dirs[1:]):
+        if rel == current or now - superseded_at < keep_sec:
+            continue
+        try:
+            await storage_client.remove(rel, recursive=True)  # type: ignore
+        except Exception as e:
+            log.warning("old stream dir not removed video_id=%s dir=%s: %s", video_id, rel, e)
+
+
+async def package_video(storage_client: StorageClient, video_id: str, storage_rel: str) -> Optional[Dict[str, str]]:
+    """
+    Package the ready renditions of the video. Returns {"hls": rel, "dash": rel}, None if nothing to package.
+    Raises on ffmpeg/storage failure (previous package, if any, stays in place).
+    """
+    async with db_conn() as conn:
+        renditions = await list_video_renditions(conn, video_id)
+    picked = pick_renditions(renditions)
+    if not picked:
+        return None
+
+    tmp = tempfile.mkdtemp(prefix="yt_pkg_")
+    try:
+        inputs = [os.path.join(tmp, f"in_{i}.webm") for i in range(len(picked))]
+        await asyncio.gather(*(_download(storage_client, r["storage_path"], p) for r, p in zip(picked, inputs)))
+
+        out_dir = os.path.join(tmp, "out")
+        if not await async_package_dash_hls(inputs, out_dir, YTCONVERT_PACKAGE_SEGMENT_SEC):
+            raise RuntimeError("ffmpeg packaging failed")
+
+        stream_root = f"{storage_rel.strip('/')}/stream"
+        stream_rel = f"{stream_root}/v{int(time.time())}"
+        names = sorted(os.listdir(out_dir))
+        segments = [n for n in names if n not in _MANIFESTS]
+
+        sem = asyncio.Semaphore(max(1, YTCONVERT_PACKAGE_UPLOAD_CONCURRENCY))
+
+        async def _put(name: str) -> None:
+            async with sem:
+                await _upload(storage_client, os.path.join(out_dir, name), f"{stream_rel}/{name}")
+
+        # manifests last: a published manifest never points at a missing segment
+        await asyncio.gather(*(_put(n) for n in segments))
+        await asyncio.gather(*(_put(n) for n in _MANIFESTS))
+    finally:
+        await asyncio.get_running_loop().run_in_executor(None, lambda: shutil.rmtree(tmp, ignore_errors=True))
+
+    hls_rel = f"{stream_rel}/master.m3u8"
+    dash_rel = f"{stream_rel}/manifest.mpd"
+    async with db_conn() as conn:
+        async with conn.transaction():
+            await upsert_video_asset_path(conn, video_id=video_id, asset_type=ASSET_HLS, path=hls_rel)
+            await upsert_video_asset_path(conn, video_id=video_id, asset_type=ASSET_DASH, path=dash_rel)
+
+    try:
+        await _remove_superseded(storage_client, video_id, stream_root, stream_rel)
+    except Exception as e:
+        log.warning("old stream dirs not listed video_id=%s: %s", video_id, e)
+
+    log.info("packaged video_id=%s renditions=%s segments=%s dir=%s", video_id, len(picked), len(segments), stream_rel)
+    return {"hls": hls_rel, "dash": dash_rel}
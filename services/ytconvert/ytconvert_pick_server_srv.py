@@ -5,6 +5,7 @@ from grpc_health.v1 import health_pb2, health_pb2_grpc
 
 from config.ytconvert.ytconvert_cfg import load_ytconvert_config
 from utils.ytconvert.ytconvert_servers_ut import YtconvertServer
+from services.monitor.metrics_srv import grpc_aio_interceptors
 
 
 async def pick_server_with_healthcheck() -> YtconvertServer:
@@ -19,7 +20,7 @@ async def pick_server_with_healthcheck() -> YtconvertServer:
     last_err = None
     for srv in cfg.servers:
         try:
-            async with grpc.aio.insecure_channel(srv.hostport) as ch:
+            async with grpc.aio.insecure_channel(srv.hostport, interceptors=grpc_aio_interceptors()) as ch:
                 stub = health_pb2_grpc.HealthStub(ch)
                 resp = await stub.Check(health_pb2.HealthCheckRequest(service=""), timeout=2.0)
                 if resp.status == health_pb2.HealthCheckResponse.SERVING:
@@ -8,8 +8,8 @@ from typing import Any, Dict, List, Optional, Tuple
 import grpc
 from google.protobuf.json_format import MessageToDict
 
-from config.ytconvert.ytconvert_cfg import load_ytconvert_config
-from db import get_conn, release_conn
+from config.ytconvert.ytconvert_cfg import load_ytconvert_config, YTCONVERT_PACKAGE_ENABLED
+from db import db_conn, get_conn, release_conn
 from db.ytconvert.video_assets_db import upsert_video_asset_path
 from db.ytconvert.video_renditions_db import upsert_video_rendition
 from db.ytconvert.ytconvert_jobs_db import (
@@ -18,10 +18,18 @@ from db.ytconvert.ytconvert_jobs_db import (
     set_ytconvert_job_done,
     update_ytconvert_job_state,
 )
+from services.job_registry_srv import job_registry, KIND_CONVERT
+from services.job_watch_srv import watch_job
+from services.ytconvert.ytconvert_package_srv import package_video
 from services.ytconvert.ytconvert_pick_server_srv import pick_server_with_healthcheck
 from services.ytconvert.ytconvert_proto import ytconvert_pb2, ytconvert_pb2_grpc
 from services.ytstorage.base_srv import StorageClient
 from utils.ytconvert.variants_ut import expand_requested_variant_ids
+from services.monitor.metrics_srv import grpc_aio_interceptors
+
+
+# upper bound for following one conversion job
+_WATCH_TIMEOUT_SEC = 24 * 3600
 
 
 def _auth_md(token: Optional[str]) -> List[Tuple[str, str]]:
@@ -95,6 +103,23 @@ def _get_storage_grpc_ref(storage_client: StorageClient) -> Dict[str, object]:
     return {"address": addr, "token": token, "tls": tls}
 
 
+async def _report(video_id: str, local_job_id: str, state: str, percent: int, message: str) -> None:
+    """
+    Mirror job progress into the shared job registry (read by /internal/ytconvert/job-status).
+    """
+    await job_registry.update(
+        KIND_CONVERT,
+        video_id,
+        {
+            "job_id": local_job_id,
+            "video_id": video_id,
+            "state": state,
+            "progress_percent": max(0, min(100, int(percent or 0))),
+            "message": message or "",
+        },
+    )
+
+
 async def _run_job(
     *,
     storage_client: StorageClient,
@@ -104,6 +129,9 @@ async def _run_job(
     original_rel_path: str,
     requested_variant_ids: List[str],
 ) -> None:
+    # drop the previous job's entry; until the first report status reads fall back to the DB row
+    await job_registry.clear(KIND_CONVERT, video_id)
+    converted: Optional[Dict[str, Any]] = None
     conn = await get_conn()
     try:
         cfg = load_ytconvert_config()
@@ -123,13 +151,14 @@ async def _run_job(
             message="Submitting to ytconvert",
             meta={"server": srv.hostport},
         )
+        await _report(video_id, local_job_id, "SUBMITTING", 0, "Submitting to ytconvert")
 
         storage_ref = _get_storage_grpc_ref(storage_client)
 
         source_rel_path = original_rel_path  # already full rel path in storage
         output_base_rel_dir = storage_rel    # same folder as original (as requested)
 
-        async with grpc.aio.insecure_channel(srv.hostport) as channel:
+        async with grpc.aio.insecure_channel(srv.hostport, interceptors=grpc_aio_interceptors()) as channel:
             stub = ytconvert_pb2_grpc.ConverterStub(channel)
 
             submit_req = ytconvert_pb2.SubmitConvertRequest(
@@ -162,6 +191,7 @@ async def _run_job(
                     message=f"Rejected: {ack.message}",
                     meta={"ack_meta": _struct_to_dict(ack.meta)},
                 )
+                await _report(video_id, local_job_id, "FAILED", 0, f"Rejected: {ack.message}")
                 return
 
             grpc_job_id = ack.job_id
@@ -178,30 +208,59 @@ async def _run_job(
                     "output_base_rel_dir": output_base_rel_dir,
                 },
             )
+            await _report(video_id, local_job_id, "QUEUED", 0, "Queued")
+
+            # Watch progress: WatchJob stream, GetStatus polling (with backoff) if the stream breaks.
+            # Registry gets every change, the DB row only state transitions.
+            def _snap(st) -> Dict[str, Any]:
+                return {
+                    "state": ytconvert_pb2.Status.State.Name(st.state),
+                    "percent": int(st.percent or 0),
+                    "message": st.message,
+                    "status_meta": _struct_to_dict(st.meta) if st.meta else None,
+                }
+
+            async def _stream():
+                watch_req = ytconvert_pb2.WatchJobRequest(job_id=grpc_job_id, send_initial=True)
+                async for ev in stub.WatchJob(watch_req, metadata=md):
+                    if ev.status and ev.status.job_id:
+                        yield _snap(ev.status)
+
+            async def _poll() -> Dict[str, Any]:
+                st = await stub.GetStatus(ytconvert_pb2.GetStatusRequest(job_id=grpc_job_id), metadata=md, timeout=10.0)
+                return _snap(st)
+
+            async def _on_change(snap: Dict[str, Any]) -> None:
+                await _report(video_id, local_job_id, snap["state"], snap["percent"], snap["message"])
+
+            async def _on_transition(prev_state: Any, snap: Dict[str, Any]) -> None:
+                await update_ytconvert_job_state(
+                    conn,
+                    local_job_id,
+                    state=snap["state"],
+                    progress_percent=snap["percent"],
+                    message=snap["message"],
+                    meta={"status_meta": snap["status_meta"]} if snap["status_meta"] else None,
+                )
 
-            # Watch progress
-            watch_req = ytconvert_pb2.WatchJobRequest(job_id=grpc_job_id, send_initial=True)
-            final_state = None
-            async for ev in stub.WatchJob(watch_req, metadata=md):
-                if ev.status and ev.status.job_id:
-                    st = ev.status
-                    final_state = st.state
-                    await update_ytconvert_job_state(
-                        conn,
-                        local_job_id,
-                        state=ytconvert_pb2.Status.State.Name(st.state),
-                        progress_percent=int(st.percent or 0),
-                        message=st.message,
-                        meta={"status_meta": _struct_to_dict(st.meta)} if st.meta else None,
-                    )
-                    if st.state in (ytconvert_pb2.Status.DONE, ytconvert_pb2.Status.FAILED, ytconvert_pb2.Status.CANCELED):
-                        break
+            last = await watch_job(
+                stream=_stream,
+                poll=_poll,
+                is_final=lambda snap: snap["state"] in ("DONE", "FAILED", "CANCELED"),
+                on_change=_on_change,
+                on_transition=_on_transition,
+                heartbeat=lambda: job_registry.touch(KIND_CONVERT, video_id),
+                timeout_sec=_WATCH_TIMEOUT_SEC,
+                label=f"ytconvert {grpc_job_id}",
+            )
+            final_state = ytconvert_pb2.Status.State.Value(last["state"]) if last else None
 
             # Fetch final result
             res = await stub.GetResult(ytconvert_pb2.GetResultRequest(job_id=grpc_job_id), metadata=md, timeout=60.0)
             if res.state != ytconvert_pb2.Status.DONE:
                 err_msg = res.message or (res.error.message if res.error else "") or f"ytconvert failed (state={res.state})"
                 await set_ytconvert_job_failed(conn, local_job_id, message=err_msg, meta={"result_meta": _struct_to_dict(res.meta)})
+                await _report(video_id, local_job_id, "FAILED", 0, err_msg)
                 return
 
             persisted: List[Dict[str, Any]] = []
@@ -221,6 +280,7 @@ async def _run_job(
                             message="ytconvert returned artifact without rel_path",
                             meta={"variant_id": variant_id, "artifact": str(art)},
                         )
+                        await _report(video_id, local_job_id, "FAILED", 0, "ytconvert returned artifact without rel_path")
                         return
 
                     # Persist to DB (video -> video_renditions, audio-only -> video_assets)
@@ -251,13 +311,64 @@ async def _run_job(
                         }
                     )
 
-            await set_ytconvert_job_done(conn, local_job_id, message="Done", meta={"persisted": persisted, "final_state": str(final_state)})
+            converted = {"persisted": persisted, "final_state": str(final_state)}
 
     except Exception as e:
         await set_ytconvert_job_failed(conn, local_job_id, message=f"ytconvert integration error: {e}", meta={"exc": repr(e)})
+        await _report(video_id, local_job_id, "FAILED", 0, f"ytconvert integration error: {e}")
     finally:
         await release_conn(conn)
 
+    if converted is not None:
+        await _finish_job(
+            storage_client=storage_client,
+            local_job_id=local_job_id,
+            video_id=video_id,
+            storage_rel=storage_rel,
+            **converted,
+        )
+
+
+async def _finish_job(
+    *,
+    storage_client: StorageClient,
+    local_job_id: str,
+    video_id: str,
+    storage_rel: str,
+    persisted: List[Dict[str, Any]],
+    final_state: str,
+) -> None:
+    """
+    Packaging and the final job state, after the job's connection is back in the pool:
+    ffmpeg and segment uploads can take minutes, DB work here is a few short statements.
+    """
+    try:
+        # Segments + DASH/HLS manifests for the player; conversion results stay valid if this fails
+        done_msg = "Done"
+        packaged: Optional[Dict[str, str]] = None
+        if YTCONVERT_PACKAGE_ENABLED and any(_parse_variant_id(p["variant_id"]).get("type") == "v" for p in persisted):
+            async with db_conn() as conn:
+                await update_ytconvert_job_state(conn, local_job_id, state="PACKAGING", progress_percent=100, message="Packaging for streaming")
+            await _report(video_id, local_job_id, "PACKAGING", 100, "Packaging for streaming")
+            try:
+                packaged = await package_video(storage_client, video_id, storage_rel)
+            except Exception as e:
+                print(f"[YTCONVERT] packaging failed video_id={video_id}: {e}")
+                done_msg = f"Done (streaming packaging failed: {e})"
+
+        async with db_conn() as conn:
+            await set_ytconvert_job_done(
+                conn,
+                local_job_id,
+                message=done_msg,
+                meta={"persisted": persisted, "packaged": packaged, "final_state": final_state},
+            )
+        await _report(video_id, local_job_id, "DONE", 100, done_msg)
+    except Exception as e:
+        async with db_conn() as conn:
+            await set_ytconvert_job_failed(conn, local_job_id, message=f"ytconvert integration error: {e}", meta={"exc": repr(e)})
+        await _report(video_id, local_job_id, "FAILED", 0, f"ytconvert integration error: {e}")
+
 
 def schedule_ytconvert_job(
     *,
@@ -0,0 +1,525 @@
+"""
+Sprites backfill: generate sprites for every ready video that has none, several jobs at a time across all ytsprites servers.
+
+- progress is checkpointed in ytsprites_backfill (one row per submitted video): after a restart running jobs
+  are re-attached, done videos are never submitted again, failed ones up to YTSPRITES_BACKFILL_MAX_ATTEMPTS
+- per-server limit starts at 1 and grows by one after each job that started without queueing
+  (up to YTSPRITES_BACKFILL_PER_SERVER); it is halved when the server rejects a job or a job sat queued
+  longer than YTSPRITES_BACKFILL_QUEUE_WAIT_SEC; an unreachable server is skipped for a while
+- one run at a time across app workers and the CLI (pg advisory lock); run status with throughput
+  and ETA is published in the job registry (kind "backfill", key "sprites")
+
+Started by install/ytsprites_backfill.py or POST /internal/ytsprites/thumbnails/backfill.
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Set
+
+import asyncpg
+import grpc
+
+from config.config import settings
+from config.ytsprites.ytsprites_cfg import (
+    ytsprites_servers,
+    YTSPRITES_BACKFILL_CONCURRENCY,
+    YTSPRITES_BACKFILL_PER_SERVER,
+    YTSPRITES_BACKFILL_MAX_ATTEMPTS,
+    YTSPRITES_BACKFILL_JOB_TIMEOUT,
+    YTSPRITES_BACKFILL_QUEUE_WAIT_SEC,
+)
+from config.ytstorage.ytstorage_cfg import YTSTORAGE_GRPC_ADDRESS, YTSTORAGE_GRPC_TOKEN
+from db import get_conn, release_conn
+from db.assets_db import upsert_video_asset
+from db.ytsprites.ytsprites_db import (
+    mark_thumbnails_ready,
+    list_backfill_candidates,
+    count_backfill_remaining,
+    list_backfill_running,
+    claim_backfill_item,
+    finish_backfill_item,
+    backfill_state_counts,
+)
+from services.job_registry_srv import job_registry, KIND_SPRITES, KIND_BACKFILL
+from services.ytsprites import ytsprites_aio_client_srv as sprites
+from services.ytsprites.ytsprites_client_srv import pb
+
+log = logging.getLogger("sprites_backfill")
+
+_LOCK_KEY = 0x7974737072  # pg advisory lock: one backfill run at a time
+_STATUS_KEY = "sprites"
+_FETCH_BATCH = 100
+_DOWN_SEC = 30.0
+_REJECT_COOLDOWN_SEC = 5.0
+_RATE_WINDOW = 50
+_RECOUNT_SEC = 60.0
+_STOP_CHECK_SEC = 2.0
+
+_FINAL_STATES = (pb.JOB_STATE_DONE, pb.JOB_STATE_FAILED, pb.JOB_STATE_CANCELED)
+
+
+class _Server:
+    def __init__(self, addr: str, max_limit: int, accept_new: bool = True) -> None:
+        self.addr = addr
+        self.max_limit = max(1, int(max_limit))
+        self.accept_new = accept_new
+        self.limit = 1
+        self.inflight = 0
+        self.blocked_until = 0.0
+        self.done = 0
+        self.failed = 0
+
+    def free(self, now: float) -> int:
+        if not self.accept_new or now < self.blocked_until:
+            return 0
+        return max(0, self.limit - self.inflight)
+
+    def grow(self) -> None:
+        self.limit = min(self.max_limit, self.limit + 1)
+
+    def shrink(self, cooldown_sec: float) -> None:
+        self.limit = max(1, self.limit // 2)
+        self.blocked_until = max(self.blocked_until, time.monotonic() + cooldown_sec)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "addr": self.addr,
+            "limit": self.limit,
+            "inflight": self.inflight,
+            "done": self.done,
+            "failed": self.failed,
+            "blocked": time.monotonic() < self.blocked_until,
+        }
+
+
+class SpritesBackfill:
+    def __init__(
+        self,
+        *,
+        concurrency: int = YTSPRITES_BACKFILL_CONCURRENCY,
+        per_server: int = YTSPRITES_BACKFILL_PER_SERVER,
+        max_attempts: int = YTSPRITES_BACKFILL_MAX_ATTEMPTS,
+        limit: int = 0,
+    ) -> None:
+        """
+        limit: max videos to submit in this run (0 = all); re-attached jobs do not count.
+        """
+        self.concurrency = max(1, int(concurrency))
+        self.per_server = max(1, int(per_server))
+        self.max_attempts = max(1, int(max_attempts))
+        self.limit = max(0, int(limit or 0))
+
+        self._servers: Dict[str, _Server] = {s.target: _Server(s.target, self.per_server) for s in ytsprites_servers()}
+        self._tasks: Dict[str, "asyncio.Task[None]"] = {}
+        self._skip: Set[str] = set()
+        self._wake = asyncio.Event()
+        self._stop = False
+        self._lock_conn = None
+
+        self._state = "idle"
+        self._error: Optional[str] = None
+        self._started = 0.0
+        self._submitted = 0
+        self._done = 0
+        self._failed = 0
+        self._remaining = 0
+        self._finished: Deque[float] = deque(maxlen=_RATE_WINDOW)
+
+    # ---------- run control ----------
+
+    async def try_lock(self) -> bool:
+        """
+        Take the cluster-wide backfill lock, held until run() ends. The session-level lock lives on its own
+        connection opened outside the pool, so a run never keeps a pooled connection checked out.
+        """
+        if self._lock_conn is not None:
+            return True
+        conn = await asyncpg.connect(dsn=settings.DATABASE_URL)
+        try:
+            if await conn.fetchval("SELECT pg_try_advisory_lock($1)", _LOCK_KEY):
+                self._lock_conn = conn
+                return True
+        except BaseException:
+            conn.terminate()
+            raise
+        await conn.close()
+        return False
+
+    async def _unlock(self) -> None:
+        conn, self._lock_conn = self._lock_conn, None
+        if conn is None:
+            return
+        # closing the session would release the lock as well; unlock first so it is gone at once
+        try:
+            await conn.execute("SELECT pg_advisory_unlock($1)", _LOCK_KEY)
+            await conn.close()
+        except Exception:
+            conn.terminate()
+
+    def request_stop(self) -> None:
+        """
+        No new submissions; jobs in flight are followed to the end.
+        """
+        self._stop = True
+        self._wake.set()
+
+    async def run(self) -> Dict[str, Any]:
+        if not await self.try_lock():
+            raise RuntimeError("sprites backfill is already running")
+        try:
+            await self._run()
+        except asyncio.CancelledError:
+            # rows of unfinished jobs stay 'running' and are re-attached by the next run
+            self._state = "stopped"
+            for t in list(self._tasks.values()):
+                t.cancel()
+            raise
+        except Exception as e:
+            self._state = "failed"
+            self._error = str(e)
+            log.exception("sprites backfill failed: %s", e)
+        finally:
+            try:
+                await self._publish(extra={"finished_at": time.time()})
+            except Exception:
+                pass
+            await self._unlock()
+        return self.status()
+
+    async def _run(self) -> None:
+        self._state = "running"
+        self._started = time.time()
+        await job_registry.update(KIND_BACKFILL, _STATUS_KEY, self.status(), replace=True)
+        if not self._servers:
+            # nothing could ever be submitted: the loop below would wait for a free server forever
+            raise RuntimeError("no ytsprites servers configured")
+
+        conn = await get_conn()
+        try:
+            running = await list_backfill_running(conn)
+            self._remaining = await count_backfill_remaining(conn, self.max_attempts)
+        finally:
+            await release_conn(conn)
+
+        for r in running:
+            addr = r["job_server"] or ""
+            if not r["job_id"] or not addr:
+                continue
+            srv = self._servers.get(addr)
+            if srv is None:
+                # job on a server that is no longer configured: follow it, send nothing new there
+                srv = self._servers[addr] = _Server(addr, 1, accept_new=False)
+            self._launch(srv, r["video_id"], r["storage_path"] or "", job_id=r["job_id"])
+        if running:
+            log.info("sprites backfill: re-attached %d running jobs", len(self._tasks))
+
+        buffer: Deque[Any] = deque()
+        exhausted = False
+        last_count = last_stop_check = time.monotonic()
+
+        while True:
+            now = time.monotonic()
+            if now - last_stop_check >= _STOP_CHECK_SEC:
+                last_stop_check = now
+                await self._check_stop_flag()
+
+            if not self._stop and not buffer and not exhausted and self._can_submit():
+                conn = await get_conn()
+                try:
+                    exclude = list(self._tasks.keys()) + list(self._skip)
+                    rows = await list_backfill_candidates(conn, _FETCH_BATCH, self.max_attempts, exclude)
+                finally:
+                    await release_conn(conn)
+                buffer.extend(rows)
+                exhausted = not rows
+
+            while buffer and not self._stop and self._can_submit():
+                srv = self._pick_server()
+                if srv is None:
+                    break
+                row = buffer.popleft()
+                vid = row["video_id"]
+                if vid in self._tasks:
+                    continue
+                cur = await job_registry.get(KIND_SPRITES, vid)
+                if (
+                    cur
+                    and int(cur.get("state") or 0) not in _FINAL_STATES
+                    and not job_registry.is_stale(cur, settings.JOBS_STALE_SEC)
+                ):
+                    # retried by hand right now, leave it alone in this run
+                    self._skip.add(vid)
+                    continue
+                self._launch(srv, vid, (row["storage_path"] or "").rstrip("/"))
+
+            if not self._tasks and (self._stop or (exhausted and not buffer) or not self._can_submit()):
+                break
+
+            if now - last_count >= _RECOUNT_SEC:
+                last_count = now
+                conn = await get_conn()
+                try:
+                    self._remaining = await count_backfill_remaining(conn, self.max_attempts)
+                finally:
+                    await release_conn(conn)
+
+            await self._publish()
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=_STOP_CHECK_SEC)
+            except asyncio.TimeoutError:
+                pass
+            # a finished (possibly failed, retryable) job can make new candidates appear
+            if self._wake.is_set():
+                exhausted = False
+
+        self._state = "stopped" if self._stop else "done"
+        log.info(
+            "sprites backfill %s: submitted=%d done=%d failed=%d in %.0fs",
+            self._state, self._submitted, self._done, self._failed, time.time() - self._started,
+        )
+
+    async def _check_stop_flag(self) -> None:
+        # stop may be requested from another worker through the registry
+        st = await job_registry.get(KIND_BACKFILL, _STATUS_KEY)
+        if st and st.get("stop") and not self._stop:
+            log.info("sprites backfill: stop requested")
+            self._stop = True
+
+    # ---------- scheduling ----------
+
+    def _can_submit(self) -> bool:
+        if self.limit and self._submitted >= self.limit:
+            return False
+        return len(self._tasks) < self.concurrency
+
+    def _pick_server(self) -> Optional[_Server]:
+        now = time.monotonic()
+        best: Optional[_Server] = None
+        for srv in self._servers.values():
+            free = srv.free(now)
+            if free <= 0:
+                continue
+            if best is None or free > best.free(now) or (free == best.free(now) and srv.inflight < best.inflight):
+                best = srv
+        return best
+
+    def _launch(self, srv: _Server, video_id: str, storage_rel: str, job_id: Optional[str] = None) -> None:
+        srv.inflight += 1
+        self._tasks[video_id] = asyncio.create_task(self._job(srv, video_id, storage_rel, job_id))
+
+    # ---------- one video ----------
+
+    async def _job(self, srv: _Server, video_id: str, storage_rel: str, job_id: Optional[str]) -> None:
+        try:
+            if job_id is None:
+                job_id = await self._submit(srv, video_id, storage_rel)
+                if job_id is None:
+                    return
+                rep = await self._follow(srv, video_id, job_id, fresh=True)
+            else:
+                rep = await self._reattach(srv, video_id, job_id)
+            if rep is None:
+                return
+            await self._finish(srv, video_id, job_id, rep)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.warning("sprites backfill: video_id=%s failed: %s", video_id, e)
+            await self._record_failure(srv, video_id, str(e))
+        finally:
+            srv.inflight -= 1
+            self._tasks.pop(video_id, None)
+            self._wake.set()
+
+    async def _submit(self, srv: _Server, video_id: str, storage_rel: str) -> Optional[str]:
+        """
+        CreateJob on srv; None when the server refused (the video is picked up again by a later fetch).
+        """
+        if not storage_rel:
+            conn = await get_conn()
+            try:
+                await claim_backfill_item(conn, video_id, "", "")
+                await finish_backfill_item(conn, video_id, "failed", "missing_storage_path")
+            finally:
+                await release_conn(conn)
+            self._failed += 1
+            return None
+
+        try:
+            job_id, _ = await sprites.create_job_storage_driven(
+                video_id=video_id,
+                source_storage_addr=YTSTORAGE_GRPC_ADDRESS,
+                source_rel_path=f"{storage_rel}/original.webm".lstrip("/"),
+                out_storage_addr=YTSTORAGE_GRPC_ADDRESS,
+                out_base_rel_dir=storage_rel,
+                video_mime="video/webm",
+                filename="original.webm",
+                storage_token=YTSTORAGE_GRPC_TOKEN,
+                server_addr=srv.addr,
+            )
+        except grpc.RpcError as e:
+            down = e.code() in (grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED)
+            srv.shrink(_DOWN_SEC if down else _REJECT_COOLDOWN_SEC)
+            log.info("sprites backfill: %s refused video_id=%s (%s), limit=%d", srv.addr, video_id, e.code(), srv.limit)
+            return None
+        except RuntimeError as e:
+            srv.shrink(_REJECT_COOLDOWN_SEC)
+            log.info("sprites backfill: %s rejected video_id=%s: %s", srv.addr, video_id, e)
+            return None
+
+        self._submitted += 1
+        conn = await get_conn()
+        try:
+            await claim_backfill_item(conn, video_id, job_id, srv.addr)
+        finally:
+            await release_conn(conn)
+        await self._progress(video_id, job_id, srv.addr, int(pb.JOB_STATE_QUEUED), 0, "Queued")
+        return job_id
+
+    async def _follow(self, srv: _Server, video_id: str, job_id: str, fresh: bool) -> Any:
+        created = time.monotonic()
+        started = not fresh
+        async for upd in sprites.watch_status(job_id, srv.addr):
+            await self._progress(video_id, job_id, srv.addr, int(upd.state), int(upd.percent), upd.message or "")
+            if not started and upd.state != pb.JOB_STATE_QUEUED:
+                started = True
+                if time.monotonic() - created > YTSPRITES_BACKFILL_QUEUE_WAIT_SEC:
+                    srv.shrink(0.0)
+                    fresh = False
+        rep = await sprites.wait_result_done(job_id, srv.addr, YTSPRITES_BACKFILL_JOB_TIMEOUT)
+        if fresh and rep.state == pb.JOB_STATE_DONE:
+            srv.grow()
+        return rep
+
+    async def _reattach(self, srv: _Server, video_id: str, job_id: str) -> Any:
+        try:
+            rep = await sprites.get_result(job_id, srv.addr)
+            if rep.state in _FINAL_STATES:
+                return rep
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.FAILED_PRECONDITION:
+                # server restarted (job lost) or is gone: count as a failed attempt, resubmitted later
+                await self._record_failure(srv, video_id, f"job lost: {e.code()}")
+                await self._progress(video_id, job_id, srv.addr, int(pb.JOB_STATE_FAILED), -1, "job lost")
+                return None
+        return await self._follow(srv, video_id, job_id, fresh=False)
+
+    async def _finish(self, srv: _Server, video_id: str, job_id: str, rep: Any) -> None:
+        if rep.state != pb.JOB_STATE_DONE:
+            await self._record_failure(srv, video_id, rep.message or "failed")
+            await self._progress(video_id, job_id, srv.addr, int(rep.state), -1, rep.message or "failed")
+            return
+
+        conn = await get_conn()
+        try:
+            async with conn.transaction():
+                if rep.vtt and rep.vtt.rel_path:
+                    await upsert_video_asset(conn, video_id, "thumbs_vtt", rep.vtt.rel_path)
+                for idx, art in enumerate(rep.sprites, start=1):
+                    if art.rel_path:
+                        await upsert_video_asset(conn, video_id, f"sprite:{idx}", art.rel_path)
+                await mark_thumbnails_ready(conn, video_id)
+                await finish_backfill_item(conn, video_id, "done")
+        finally:
+            await release_conn(conn)
+
+        srv.done += 1
+        self._done += 1
+        self._remaining = max(0, self._remaining - 1)
+        self._finished.append(time.monotonic())
+        await self._progress(video_id, job_id, srv.addr, int(pb.JOB_STATE_DONE), 100, "Done")
+
+    async def _record_failure(self, srv: _Server, video_id: str, error: str) -> None:
+        srv.failed += 1
+        self._failed += 1
+        conn = await get_conn()
+        try:
+            await finish_backfill_item(conn, video_id, "failed", error[:1000])
+        finally:
+            await release_conn(conn)
+
+    async def _progress(self, video_id: str, job_id: str, job_server: str, state: int, percent: int, message: str) -> None:
+        # same entry the media page polls (routes/ytsprites/ytsprites_rout.py)
+        await job_registry.update(
+            KIND_SPRITES,
+            video_id,
+            {"job_id": job_id, "job_server": job_server, "state": state, "percent": percent, "message": message},
+        )
+
+    # ---------- reporting ----------
+
+    def _rate_per_sec(self) -> float:
+        n = len(self._finished)
+        if n >= 2:
+            span = self._finished[-1] - self._finished[0]
+            if span > 0:
+                return (n - 1) / span
+        elapsed = time.time() - self._started if self._started else 0.0
+        return self._done / elapsed if elapsed > 0 else 0.0
+
+    def status(self) -> Dict[str, Any]:
+        rate = self._rate_per_sec()
+        remaining = self._remaining
+        if self.limit:
+            remaining = min(remaining, max(0, self.limit - self._submitted) + len(self._tasks))
+        return {
+            "state": "stopping" if (self._stop and self._state == "running") else self._state,
+            "error": self._error,
+            "pid": os.getpid(),
+            "started_at": self._started,
+            "concurrency": self.concurrency,
+            "submitted": self._submitted,
+            "done": self._done,
+            "failed": self._failed,
+            "in_flight": len(self._tasks),
+            "remaining": remaining,
+            "rate_per_min": round(rate * 60.0, 2),
+            "eta_sec": int(remaining / rate) if rate > 0 else None,
+            "servers": [s.snapshot() for s in self._servers.values()],
+        }
+
+    async def _publish(self, extra: Optional[Dict[str, Any]] = None) -> None:
+        data = self.status()
+        if extra:
+            data.update(extra)
+        await job_registry.update(KIND_BACKFILL, _STATUS_KEY, data)
+
+
+# ---------- app entry points (one run per process, one per cluster via the lock) ----------
+
+_current: Optional[SpritesBackfill] = None
+_current_task: Optional["asyncio.Task[Dict[str, Any]]"] = None
+
+
+async def start_backfill(**opts: Any) -> bool:
+    """
+    Start a run in the background of this process; False if one is already running anywhere.
+    """
+    global _current, _current_task
+    if _current_task is not None and not _current_task.done():
+        return False
+    bf = SpritesBackfill(**opts)
+    if not await bf.try_lock():
+        return False
+    _current = bf
+    _current_task = asyncio.create_task(bf.run())
+    return True
+
+
+async def stop_backfill() -> None:
+    if _current is not None and _current_task is not None and not _current_task.done():
+        _current.request_stop()
+    await job_registry.update(KIND_BACKFILL, _STATUS_KEY, {"stop": True})
+
+
+async def backfill_status() -> Dict[str, Any]:
+    run = await job_registry.get(KIND_BACKFILL, _STATUS_KEY)
+    conn = await get_conn()
+    try:
+        counts = await backfill_state_counts(conn)
+    finally:
+        await release_conn(conn)
+    return {"run": run or None, "checkpoint": counts}
@@ -0,0 +1,114 @@
+"""
+Follow one sprites job in the background and record its result (upload pipeline, media page retry).
+
+- progress goes to the job registry (kind "sprites", the entry the media page polls), with a heartbeat
+- on DONE the VTT and sprite sheets are upserted as video assets and the video is marked ready,
+  in one short transaction; no DB connection is held while the job runs
+- the request that submitted the job returns right away; tasks are kept referenced until they finish
+"""
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Set
+
+from config.config import settings
+from db import db_conn
+from db.assets_db import upsert_video_asset
+from db.ytsprites.ytsprites_db import mark_thumbnails_ready
+from services.job_registry_srv import job_registry, KIND_SPRITES
+from services.job_watch_srv import watch_job
+from services.ytsprites import ytsprites_aio_client_srv as sprites
+from services.ytsprites.ytsprites_client_srv import pb
+
+log = logging.getLogger("sprites_job")
+
+_JOB_TIMEOUT_SEC = 1800.0
+_FINAL_STATES = (int(pb.JOB_STATE_DONE), int(pb.JOB_STATE_FAILED), int(pb.JOB_STATE_CANCELED))
+
+_tasks: Set["asyncio.Task[None]"] = set()
+
+
+async def _progress(video_id: str, job_id: str, job_server: str, state: int, percent: int, message: str, **extra: Any) -> None:
+    fields: Dict[str, Any] = {
+        "job_id": job_id,
+        "job_server": job_server,
+        "state": int(state),
+        "percent": int(percent),
+        "message": message,
+    }
+    fields.update(extra)
+    await job_registry.update(KIND_SPRITES, video_id, fields)
+
+
+async def _record_result(video_id: str, rep: Any) -> None:
+    async with db_conn() as conn:
+        async with conn.transaction():
+            if rep.vtt and rep.vtt.rel_path:
+                await upsert_video_asset(conn, video_id, "thumbs_vtt", rep.vtt.rel_path)
+            for idx, art in enumerate(rep.sprites, start=1):
+                if art.rel_path:
+                    await upsert_video_asset(conn, video_id, f"sprite:{idx}", art.rel_path)
+            await mark_thumbnails_ready(conn, video_id)
+
+
+async def _follow(video_id: str, job_id: str, job_server: str) -> None:
+    await _progress(video_id, job_id, job_server, int(pb.JOB_STATE_QUEUED), 0, "Queued")
+
+    async def _stream():
+        async for upd in sprites.watch_status(job_id, job_server):
+            yield {
+                "state": int(upd.state),
+                "percent": int(upd.percent),
+                "message": str(upd.message or ""),
+                "bytes_processed": int(getattr(upd, "bytes_processed", 0) or 0),
+            }
+
+    async def _on_change(snap: Dict[str, Any]) -> None:
+        if snap["state"] != int(pb.JOB_STATE_DONE):  # "Done" is reported once the assets are recorded
+            await _progress(video_id, job_id, job_server, **snap)
+
+    try:
+        last = await watch_job(
+            stream=_stream,
+            is_final=lambda snap: snap["state"] in _FINAL_STATES,
+            on_change=_on_change,
+            heartbeat=lambda: job_registry.touch(KIND_SPRITES, video_id),
+            timeout_sec=_JOB_TIMEOUT_SEC,
+            label=f"ytsprites {job_id}",
+        )
+        if last is not None and last["state"] in _FINAL_STATES and last["state"] != int(pb.JOB_STATE_DONE):
+            return
+        # the stream ended without a final state (or DONE): GetResult, polling as a fallback
+        rep = await sprites.wait_result_done(job_id, job_server, _JOB_TIMEOUT_SEC)
+        if rep.state != pb.JOB_STATE_DONE:
+            await _progress(video_id, job_id, job_server, int(rep.state), -1, rep.message or "failed")
+            return
+        await _record_result(video_id, rep)
+        await _progress(video_id, job_id, job_server, int(pb.JOB_STATE_DONE), 100, "Done")
+        log.info("sprites ready video_id=%s job_id=%s", video_id, job_id)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        log.warning("sprites job failed video_id=%s job_id=%s: %s", video_id, job_id, e)
+        await _progress(video_id, job_id, job_server, int(pb.JOB_STATE_FAILED), 0, f"watch failed: {e}")
+
+
+def follow_sprites_job(video_id: str, job_id: str, job_server: str) -> "asyncio.Task[None]":
+    """
+    Starts following a submitted job; returns at once. Does nothing when a live watcher is already
+    reporting this job.
+    """
+    async def _runner() -> None:
+        cur: Optional[Dict[str, Any]] = await job_registry.get(KIND_SPRITES, video_id)
+        if (
+            cur
+            and cur.get("job_id") == job_id
+            and int(cur.get("state") or 0) not in _FINAL_STATES
+            and not job_registry.is_stale(cur, settings.JOBS_STALE_SEC)
+        ):
+            return
+        await _follow(video_id, job_id, job_server)
+
+    task = asyncio.create_task(_runner())
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return task
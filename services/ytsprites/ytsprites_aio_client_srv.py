@@ -0,0 +1,173 @@
+"""
+grpc.aio client for ytsprites with the same surface as ytsprites_client_srv (create job, watch, result, health).
+
+- one channel per server address, reused for the process lifetime
+- watch_status() is an async iterator over the WatchStatus stream
+- wait_result_done() is awaitable, nothing occupies an executor thread while a job runs
+"""
+import asyncio
+import time
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+import grpc
+
+from config.ytsprites.ytsprites_cfg import (
+    ytsprites_servers,
+    YTSPRITES_STATUS_TIMEOUT,
+    YTSPRITES_RESULT_TIMEOUT,
+    YTSPRITES_HEALTH_TIMEOUT,
+    YTSPRITES_SERVER_TTL,
+)
+from services.job_watch_srv import backoff_delays
+from services.ytsprites.ytsprites_client_srv import (
+    _last_good,
+    _auth_metadata,
+    _channel_args,
+    _build_create_request,
+    pb,
+    pbg,
+)
+from services.monitor.metrics_srv import grpc_aio_interceptors
+
+_channels: Dict[str, grpc.aio.Channel] = {}
+
+_FINAL_STATES = (pb.JOB_STATE_DONE, pb.JOB_STATE_FAILED, pb.JOB_STATE_CANCELED)
+
+
+def _stub(addr: str) -> pbg.SpritesStub:
+    ch = _channels.get(addr)
+    if ch is None:
+        options, compression = _channel_args()
+        ch = grpc.aio.insecure_channel(addr, options=options, compression=compression, interceptors=grpc_aio_interceptors())
+        _channels[addr] = ch
+    return pbg.SpritesStub(ch)
+
+
+async def close_channels() -> None:
+    chans = list(_channels.values())
+    _channels.clear()
+    for ch in chans:
+        try:
+            await ch.close()
+        except Exception:
+            pass
+
+
+async def health_check(addr: Optional[str] = None) -> bool:
+    if not addr:
+        cached = _last_good.get("addr")
+        addr = str(cached) if cached else ytsprites_servers()[0].target
+    try:
+        rep = await _stub(addr).Health(pb.HealthRequest(), timeout=float(YTSPRITES_HEALTH_TIMEOUT), metadata=_auth_metadata())
+        return (rep.status or "").lower() == "ok"
+    except Exception:
+        return False
+
+
+async def pick_ytsprites_addr() -> str:
+    servers = ytsprites_servers()
+    if not servers:
+        return "127.0.0.1:9094"
+
+    now = time.time()
+    cached = _last_good.get("addr")
+    ts = float(_last_good.get("ts") or 0.0)
+    if cached and (now - ts) < float(YTSPRITES_SERVER_TTL):
+        return str(cached)
+
+    for s in servers:
+        addr = s.target
+        if await health_check(addr):
+            _last_good["addr"] = addr
+            _last_good["ts"] = now
+            return addr
+
+    addr0 = servers[0].target
+    _last_good["addr"] = addr0
+    _last_good["ts"] = now
+    return addr0
+
+
+async def create_job_storage_driven(
+    *,
+    video_id: str,
+    source_storage_addr: str,
+    source_rel_path: str,
+    out_storage_addr: str,
+    out_base_rel_dir: str,
+    video_mime: Optional[str] = None,
+    filename: str = "original.webm",
+    storage_token: str = "",
+    server_addr: Optional[str] = None,
+) -> Tuple[str, str]:
+    """
+    server_addr pins the job to one server (backfill spreads jobs itself); default: first healthy one.
+    """
+    addr = server_addr or await pick_ytsprites_addr()
+    req = _build_create_request(
+        video_id=video_id,
+        source_storage_addr=source_storage_addr,
+        source_rel_path=source_rel_path,
+        out_storage_addr=out_storage_addr,
+        out_base_rel_dir=out_base_rel_dir,
+        video_mime=video_mime,
+        filename=filename,
+        storage_token=storage_token,
+    )
+    rep = await _stub(addr).CreateJob(req, timeout=10.0, metadata=_auth_metadata())
+    if not rep.accepted or not rep.job_id:
+        raise RuntimeError(f"CreateJob rejected for video_id={video_id}: {rep.message}")
+    return rep.job_id, addr
+
+
+async def watch_status(job_id: str, job_server: str) -> AsyncIterator[pb.StatusUpdate]:
+    """
+    Yields StatusUpdate messages until a final state. Stream errors end the iteration
+    (like the sync client); the final wait is done via wait_result_done().
+    """
+    call = _stub(job_server).WatchStatus(
+        pb.StatusRequest(job_id=job_id),
+        timeout=YTSPRITES_STATUS_TIMEOUT,
+        metadata=_auth_metadata(),
+    )
+    try:
+        async for upd in call:
+            yield upd
+            if upd.state in _FINAL_STATES:
+                break
+    except grpc.RpcError:
+        pass
+    finally:
+        call.cancel()
+
+
+async def get_result(job_id: str, job_server: str) -> pb.ResultReply:
+    return await _stub(job_server).GetResult(
+        pb.GetResultRequest(job_id=job_id),
+        timeout=YTSPRITES_RESULT_TIMEOUT,
+        metadata=_auth_metadata(),
+    )
+
+
+async def wait_result_done(
+    job_id: str,
+    job_server: str,
+    timeout_sec: float = 1800.0,
+    poll_sec: Optional[float] = None,
+) -> pb.ResultReply:
+    """
+    Poll GetResult (with backoff) until the job is final; FAILED_PRECONDITION / NOT_FOUND mean "not ready yet".
+    """
+    deadline = time.monotonic() + float(timeout_sec)
+    for delay in backoff_delays(poll_sec):
+        if time.monotonic() > deadline:
+            break
+        try:
+            rep = await get_result(job_id, job_server)
+            if rep.state in _FINAL_STATES:
+                return rep
+        except grpc.RpcError as e:
+            if e.code() not in (grpc.StatusCode.FAILED_PRECONDITION, grpc.StatusCode.NOT_FOUND):
+                raise
+        await asyncio.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+    raise TimeoutError("Timed out waiting for ytsprites result")
@@ -2,7 +2,6 @@ import os
 import sys
 import time
 import pathlib
-import asyncio
 import grpc
 from typing import Callable, Dict, List, Optional, Tuple, Any
 
@@ -23,6 +22,8 @@ from config.ytsprites.ytsprites_cfg import (
     YTSPRITES_HEALTH_TIMEOUT,
     YTSPRITES_SERVER_TTL,
 )
+from services.job_watch_srv import backoff_delays
+from services.monitor.metrics_srv import grpc_intercept
 
 # Import protobuf stubs from ytsprites_proto/
 sys.path.append(str(pathlib.Path(__file__).resolve().parent / "ytsprites_proto"))
@@ -50,21 +51,22 @@ def _build_options() -> pb.SpriteOptions:
     )
 
 
-def _channel_for_addr(addr: str) -> grpc.Channel:
+def _channel_args() -> Tuple[List[Tuple[str, int]], Optional[grpc.Compression]]:
     max_send = int(YTSPRITES_GRPC_MAX_SEND_MB) * 1024 * 1024
     max_recv = int(YTSPRITES_GRPC_MAX_RECV_MB) * 1024 * 1024
     compression = None
     if (YTSPRITES_GRPC_COMPRESSION or "").lower() == "gzip":
         compression = grpc.Compression.Gzip
+    options = [
+        ("grpc.max_send_message_length", max_send),
+        ("grpc.max_receive_message_length", max_recv),
+    ]
+    return options, compression
 
-    return grpc.insecure_channel(
-        addr,
-        options=[
-            ("grpc.max_send_message_length", max_send),
-            ("grpc.max_receive_message_length", max_recv),
-        ],
-        compression=compression,
-    )
+
+def _channel_for_addr(addr: str) -> grpc.Channel:
+    options, compression = _channel_args()
+    return grpc_intercept(grpc.insecure_channel(addr, options=options, compression=compression))
 
 
 def _open_stub(addr: str) -> pbg.SpritesStub:
@@ -112,22 +114,19 @@ def pick_ytsprites_addr() -> str:
     return addr0
 
 
-def create_job_storage_driven(
+def _build_create_request(
     *,
     video_id: str,
     source_storage_addr: str,
     source_rel_path: str,
     out_storage_addr: str,
     out_base_rel_dir: str,
-    video_mime: Optional[str] = None,
-    filename: str = "original.webm",
-    storage_token: str = "",
-) -> Tuple[str, str]:
+    video_mime: Optional[str],
+    filename: str,
+    storage_token: str,
+) -> pb.CreateJobRequest:
     mime = (video_mime or YTSPRITES_DEFAULT_MIME).strip() or YTSPRITES_DEFAULT_MIME
-    addr = pick_ytsprites_addr()
-    stub = _open_stub(addr)
-
-    req = pb.CreateJobRequest(
+    return pb.CreateJobRequest(
         video_id=video_id,
         filename=filename or "",
         video_mime=mime,
@@ -144,6 +143,32 @@ def create_job_storage_driven(
         ),
     )
 
+
+def create_job_storage_driven(
+    *,
+    video_id: str,
+    source_storage_addr: str,
+    source_rel_path: str,
+    out_storage_addr: str,
+    out_base_rel_dir: str,
+    video_mime: Optional[str] = None,
+    filename: str = "original.webm",
+    storage_token: str = "",
+) -> Tuple[str, str]:
+    addr = pick_ytsprites_addr()
+    stub = _open_stub(addr)
+
+    req = _build_create_request(
+        video_id=video_id,
+        source_storage_addr=source_storage_addr,
+        source_rel_path=source_rel_path,
+        out_storage_addr=out_storage_addr,
+        out_base_rel_dir=out_base_rel_dir,
+        video_mime=video_mime,
+        filename=filename,
+        storage_token=storage_token,
+    )
+
     rep = stub.CreateJob(req, timeout=10.0, metadata=_auth_metadata())
     if not rep.accepted or not rep.job_id:
         raise RuntimeError(f"CreateJob rejected for video_id={video_id}: {rep.message}")
@@ -201,14 +226,16 @@ def wait_result_done(
     job_id: str,
     job_server: str,
     timeout_sec: float = 1800.0,
-    poll_sec: float = 1.0,
+    poll_sec: Optional[float] = None,
 ) -> pb.ResultReply:
     """
     Robust wait: poll GetResult until it becomes available.
     Eliminates FAILED_PRECONDITION 'Job not ready' issues.
+    Polls with exponential backoff from poll_sec (JOB_WATCH_MIN_INTERVAL_MS by default);
+    callers that followed WatchStatus to the end normally get the result on the first call.
     """
     start = time.time()
-    while True:
+    for delay in backoff_delays(poll_sec):
         if (time.time() - start) > float(timeout_sec):
             raise TimeoutError("Timed out waiting for ytsprites result")
 
@@ -217,17 +244,18 @@ def wait_result_done(
             # if service returns final state - accept
             if rep.state in (pb.JOB_STATE_DONE, pb.JOB_STATE_FAILED, pb.JOB_STATE_CANCELED):
                 return rep
-            time.sleep(poll_sec)
+            time.sleep(delay)
             continue
         except grpc.RpcError as e:
             code = e.code()
             if code == grpc.StatusCode.FAILED_PRECONDITION:
-                time.sleep(poll_sec)
+                time.sleep(delay)
                 continue
             if code == grpc.StatusCode.NOT_FOUND:
-                time.sleep(poll_sec)
+                time.sleep(delay)
                 continue
             raise
+    raise TimeoutError("Timed out waiting for ytsprites result")
 
 
 async def create_thumbnails_job(
@@ -251,8 +279,9 @@ async def create_thumbnails_job(
     if not storage_addr or not source_rel_path or not out_base_rel_dir:
         raise ValueError("extra must include storage_addr, source_rel_path, out_base_rel_dir")
 
-    job_id, job_server = await asyncio.to_thread(
-        create_job_storage_driven,
+    from services.ytsprites import ytsprites_aio_client_srv as aio
+
+    job_id, job_server = await aio.create_job_storage_driven(
         video_id=video_id,
         source_storage_addr=storage_addr,
         source_rel_path=source_rel_path,
@@ -264,10 +293,11 @@ async def create_thumbnails_job(
     )
 
     # watcher (best-effort)
-    await asyncio.to_thread(watch_status, job_id, job_server)
+    async for _upd in aio.watch_status(job_id, job_server):
+        pass
 
     # FIX: robust final wait
-    rep = await asyncio.to_thread(wait_result_done, job_id, job_server, 1800.0, 1.0)
+    rep = await aio.wait_result_done(job_id, job_server, 1800.0)
 
     # FIX: enum is in pb, not in reply instance
     if rep.state != pb.JOB_STATE_DONE:
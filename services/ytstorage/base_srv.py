@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import Optional, Iterable, BinaryIO, Protocol, Tuple
+import asyncio
+import inspect
+from typing import Dict, Optional, Iterable, BinaryIO, Protocol, Tuple
 
 
 class StorageError(Exception):
@@ -17,6 +19,7 @@ class StorageClient(Protocol):
 
     # CRUD
     def exists(self, rel_path: str) -> bool: ...
+    async def exists_many(self, rel_paths: Iterable[str]) -> Dict[str, bool]: ...
     def stat(self, rel_path: str) -> Tuple[int, float]: ...
     def listdir(self, rel_dir: str) -> Iterable[str]: ...
     def mkdirs(self, rel_dir: str, exist_ok: bool = True) -> None: ...
@@ -42,4 +45,34 @@ def ensure_rel_path(rel_path: str) -> str:
     p = (rel_path or "").replace("\\", "/")
     if p.startswith("/"):
         p = p[1:]
-    return p
\ No newline at end of file
+    return p
+
+
+async def storage_exists_many(storage: StorageClient, rel_paths: Iterable[str]) -> Dict[str, bool]:
+    """
+    Batched exists for listing pages: {normalized rel_path: bool}.
+    Uses client's exists_many() (one RPC + TTL cache) when available,
+    otherwise falls back to concurrent per-path exists().
+    """
+    paths = [ensure_rel_path(p) for p in rel_paths if p]
+    if not paths:
+        return {}
+    fn = getattr(storage, "exists_many", None)
+    if callable(fn):
+        try:
+            return await fn(paths)
+        except Exception:
+            return {p: False for p in paths}
+
+    async def _one(p: str) -> bool:
+        try:
+            res = storage.exists(p)
+            if inspect.isawaitable(res):
+                res = await res
+            return bool(res)
+        except Exception:
+            return False
+
+    uniq = list(dict.fromkeys(paths))
+    res = await asyncio.gather(*[_one(p) for p in uniq])
+    return dict(zip(uniq, res))
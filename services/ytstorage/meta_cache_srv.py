@@ -0,0 +1,126 @@
+"""
+Process-local caches of storage file metadata.
+
+- storage_meta_cache: size/etag, used by proxy streaming to skip a Stat round trip per HTTP range request
+- storage_exists_cache: positive/negative exists results, used by batched checks on listing pages
+
+RemoteStorageClient invalidates entries on write/rename/remove done by this process;
+changes made by other processes (e.g. ytsprites writing into storage) become visible after TTL.
+"""
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from config.ytstorage.ytstorage_cfg import (
+    YTSTORAGE_META_CACHE_TTL_SEC,
+    YTSTORAGE_META_CACHE_MAX,
+    YTSTORAGE_EXISTS_CACHE_POS_TTL_SEC,
+    YTSTORAGE_EXISTS_CACHE_NEG_TTL_SEC,
+    YTSTORAGE_EXISTS_CACHE_MAX,
+)
+
+
+def _key(rel_path: str) -> str:
+    return (rel_path or "").strip().replace("\\", "/").lstrip("/")
+
+
+class _StorageMetaCache:
+    """
+    Small LRU with TTL: rel_path -> {"size_bytes": int, "etag": str|None}.
+    Single event loop use, no locking.
+    """
+
+    def __init__(self, ttl_sec: int, max_items: int) -> None:
+        self._ttl = float(ttl_sec)
+        self._max = int(max_items)
+        self._items: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, rel_path: str) -> Optional[Dict[str, Any]]:
+        if self._ttl <= 0:
+            return None
+        k = _key(rel_path)
+        it = self._items.get(k)
+        if it is None:
+            return None
+        ts, meta = it
+        if time.monotonic() - ts > self._ttl:
+            self._items.pop(k, None)
+            return None
+        self._items.move_to_end(k)
+        return meta
+
+    def put(self, rel_path: str, size_bytes: int, etag: Optional[str] = None) -> Dict[str, Any]:
+        meta = {"size_bytes": int(size_bytes), "etag": etag or None}
+        if self._ttl <= 0:
+            return meta
+        k = _key(rel_path)
+        self._items[k] = (time.monotonic(), meta)
+        self._items.move_to_end(k)
+        while len(self._items) > self._max:
+            self._items.popitem(last=False)
+        return meta
+
+    def invalidate(self, rel_path: str, recursive: bool = False) -> None:
+        k = _key(rel_path)
+        self._items.pop(k, None)
+        if recursive and k:
+            prefix = k.rstrip("/") + "/"
+            for x in [x for x in self._items if x.startswith(prefix)]:
+                self._items.pop(x, None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+
+class _StorageExistsCache:
+    """
+    LRU with separate TTLs for positive and negative results: rel_path -> bool.
+    """
+
+    def __init__(self, pos_ttl_sec: int, neg_ttl_sec: int, max_items: int) -> None:
+        self._pos_ttl = float(pos_ttl_sec)
+        self._neg_ttl = float(neg_ttl_sec)
+        self._max = int(max_items)
+        self._items: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
+
+    def get(self, rel_path: str) -> Optional[bool]:
+        k = _key(rel_path)
+        it = self._items.get(k)
+        if it is None:
+            return None
+        ts, ex = it
+        if time.monotonic() - ts > (self._pos_ttl if ex else self._neg_ttl):
+            self._items.pop(k, None)
+            return None
+        self._items.move_to_end(k)
+        return ex
+
+    def put(self, rel_path: str, exists: bool) -> None:
+        if (self._pos_ttl if exists else self._neg_ttl) <= 0:
+            return
+        k = _key(rel_path)
+        self._items[k] = (time.monotonic(), bool(exists))
+        self._items.move_to_end(k)
+        while len(self._items) > self._max:
+            self._items.popitem(last=False)
+
+    def invalidate(self, rel_path: str, recursive: bool = False) -> None:
+        k = _key(rel_path)
+        self._items.pop(k, None)
+        if recursive and k:
+            prefix = k.rstrip("/") + "/"
+            for x in [x for x in self._items if x.startswith(prefix)]:
+                self._items.pop(x, None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+
+storage_meta_cache = _StorageMetaCache(YTSTORAGE_META_CACHE_TTL_SEC, YTSTORAGE_META_CACHE_MAX)
+storage_exists_cache = _StorageExistsCache(
+    YTSTORAGE_EXISTS_CACHE_POS_TTL_SEC,
+    YTSTORAGE_EXISTS_CACHE_NEG_TTL_SEC,
+    YTSTORAGE_EXISTS_CACHE_MAX,
+)
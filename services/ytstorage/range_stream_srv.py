@@ -0,0 +1,271 @@
+"""
+Range streaming engine for proxy delivery of storage files.
+
+- size/etag from storage_meta_cache (one Stat per file per TTL instead of per HTTP range)
+- gRPC Read is pumped by a producer task into a bounded queue, so a slow client
+  stalls the producer (and gRPC flow control) instead of buffering the file in RAM
+- output re-chunked to YTSTORAGE_STREAM_CHUNK_BYTES
+- optional read-ahead: when a range starts where the previous one on the same file ended,
+  the next window is prefetched (bounded by YTSTORAGE_READAHEAD_MAX_BYTES in total, counting
+  buffered windows and the full size of prefetches still in flight)
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from config.ytstorage.ytstorage_cfg import (
+    YTSTORAGE_STREAM_CHUNK_BYTES,
+    YTSTORAGE_STREAM_QUEUE_CHUNKS,
+    YTSTORAGE_READAHEAD_BYTES,
+    YTSTORAGE_READAHEAD_MAX_BYTES,
+)
+from services.ytstorage.base_srv import StorageClient
+from services.ytstorage.meta_cache_srv import storage_meta_cache
+
+log = logging.getLogger(__name__)
+
+_EOF = object()
+_PREFETCH_TTL_SEC = 30.0
+_SEQ_TRACK_MAX = 1024
+
+
+async def _open_reader(storage: StorageClient, rel: str, offset: int, length: int) -> Any:
+    reader = storage.open_reader(rel, offset=offset, length=length)
+    if inspect.isawaitable(reader):
+        reader = await reader
+    return reader
+
+
+async def _iter_raw(storage: StorageClient, rel: str, offset: int, length: int) -> AsyncIterator[bytes]:
+    reader = await _open_reader(storage, rel, offset, length)
+    if hasattr(reader, "__aiter__"):
+        async for chunk in reader:
+            if chunk:
+                yield chunk
+        return
+    # sync file-like (legacy local storage)
+    try:
+        try:
+            reader.seek(offset)
+        except Exception:
+            pass
+        remaining = length
+        while remaining != 0:
+            chunk = reader.read(min(YTSTORAGE_STREAM_CHUNK_BYTES, remaining) if remaining > 0 else YTSTORAGE_STREAM_CHUNK_BYTES)
+            if not chunk:
+                break
+            if remaining > 0:
+                remaining -= len(chunk)
+            yield chunk
+    finally:
+        try:
+            reader.close()
+        except Exception:
+            pass
+
+
+class RangeStreamer:
+    def __init__(
+        self,
+        chunk_bytes: int = YTSTORAGE_STREAM_CHUNK_BYTES,
+        queue_chunks: int = YTSTORAGE_STREAM_QUEUE_CHUNKS,
+        readahead_bytes: int = YTSTORAGE_READAHEAD_BYTES,
+        readahead_max_bytes: int = YTSTORAGE_READAHEAD_MAX_BYTES,
+    ) -> None:
+        self._chunk = int(chunk_bytes)
+        self._queue_chunks = int(queue_chunks)
+        self._ra_bytes = int(readahead_bytes)
+        self._ra_max = int(readahead_max_bytes)
+        # (rel, offset) -> (ts, data)
+        self._windows: "OrderedDict[Tuple[str, int], Tuple[float, bytes]]" = OrderedDict()
+        self._windows_bytes = 0
+        self._inflight: Dict[Tuple[str, int], asyncio.Task] = {}
+        # bytes requested by prefetches not finished yet (reserved against _ra_max up front)
+        self._inflight_bytes = 0
+        # rel -> end offset (exclusive) of last served range
+        self._last_end: "OrderedDict[str, int]" = OrderedDict()
+
+    # ---- metadata ----
+
+    async def meta(self, storage: StorageClient, rel: str) -> Optional[Dict[str, Any]]:
+        """
+        {"size_bytes": int, "etag": str|None} or None if unknown.
+        """
+        cached = storage_meta_cache.get(rel)
+        if cached is not None:
+            return cached
+        try:
+            st = storage.stat(rel)
+            if inspect.isawaitable(st):
+                st = await st
+            # st is a dict for remote, or tuple(size, mtime) for local
+            if isinstance(st, dict):
+                sz = int(st.get("size_bytes", -1))
+                etag = st.get("etag")
+            elif isinstance(st, tuple) and len(st) >= 1:
+                sz = int(st[0])
+                etag = None
+            else:
+                return None
+            if sz < 0:
+                return None
+            return storage_meta_cache.put(rel, sz, etag)
+        except Exception:
+            return None
+
+    # ---- streaming ----
+
+    async def _pump(self, storage: StorageClient, rel: str, offset: int, length: int) -> AsyncIterator[bytes]:
+        """
+        Bounded producer/consumer: at most queue_chunks * chunk_bytes are buffered per response.
+        """
+        q: asyncio.Queue = asyncio.Queue(maxsize=self._queue_chunks)
+        chunk_size = self._chunk
+
+        async def _producer() -> None:
+            try:
+                pending = bytearray()
+                async for data in _iter_raw(storage, rel, offset, length):
+                    if not pending and len(data) == chunk_size:
+                        await q.put(data)
+                        continue
+                    pending += data
+                    while len(pending) >= chunk_size:
+                        await q.put(bytes(pending[:chunk_size]))
+                        del pending[:chunk_size]
+                if pending:
+                    await q.put(bytes(pending))
+                await q.put(_EOF)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await q.put(e)
+
+        task = asyncio.create_task(_producer())
+        try:
+            while True:
+                item = await q.get()
+                if item is _EOF:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            if not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+
+    async def stream(self, storage: StorageClient, rel: str, start: int, length: int, size: Optional[int] = None) -> AsyncIterator[bytes]:
+        """
+        Yield `length` bytes from `start` (length < 0 means to the end of file).
+        """
+        if length is None or length < 0:
+            length = (size - start) if size is not None else -1
+        end = start + length if length >= 0 else None
+
+        if end is not None and self._ra_bytes > 0:
+            sequential = self._note_access(rel, start, end)
+            data = await self._take_window(rel, start, length)
+            if sequential:
+                # prefetch right after what is already buffered for the next range
+                nxt = end
+                while (rel, nxt) in self._windows:
+                    nxt += len(self._windows[(rel, nxt)][1])
+                if size is None or nxt < size:
+                    win = self._ra_bytes if size is None else min(self._ra_bytes, size - nxt)
+                    self._schedule_prefetch(storage, rel, nxt, win)
+
+            if data:
+                for i in range(0, len(data), self._chunk):
+                    yield data[i:i + self._chunk]
+                start += len(data)
+                length -= len(data)
+                if length <= 0:
+                    return
+
+        async for chunk in self._pump(storage, rel, start, length):
+            yield chunk
+
+    # ---- read-ahead ----
+
+    def _note_access(self, rel: str, start: int, end: int) -> bool:
+        prev = self._last_end.pop(rel, None)
+        self._last_end[rel] = end
+        while len(self._last_end) > _SEQ_TRACK_MAX:
+            self._last_end.popitem(last=False)
+        return prev is not None and prev == start
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for k in [k for k, (ts, _) in self._windows.items() if now - ts > _PREFETCH_TTL_SEC]:
+            _, data = self._windows.pop(k)
+            self._windows_bytes -= len(data)
+
+    def _schedule_prefetch(self, storage: StorageClient, rel: str, offset: int, length: int) -> None:
+        key = (rel, offset)
+        if length <= 0 or key in self._windows or key in self._inflight:
+            return
+        self._evict_expired()
+        if self._windows_bytes + self._inflight_bytes + length > self._ra_max:
+            return
+
+        async def _fetch() -> None:
+            buf = bytearray()
+            try:
+                async for chunk in _iter_raw(storage, rel, offset, length):
+                    buf += chunk
+                if buf:
+                    old = self._windows.pop(key, None)
+                    if old is not None:
+                        self._windows_bytes -= len(old[1])
+                    self._windows[key] = (time.monotonic(), bytes(buf))
+                    self._windows_bytes += len(buf)
+            except Exception as e:
+                log.debug("readahead failed rel=%s off=%s: %s", rel, offset, e)
+            finally:
+                self._inflight.pop(key, None)
+                self._inflight_bytes -= length
+
+        self._inflight_bytes += length
+        self._inflight[key] = asyncio.create_task(_fetch())
+
+    async def _take_window(self, rel: str, start: int, length: int) -> bytes:
+        key = (rel, start)
+        task = self._inflight.get(key)
+        if task is not None:
+            try:
+                await asyncio.shield(task)
+            except Exception:
+                pass
+        it = self._windows.pop(key, None)
+        if it is None:
+            return b""
+        _, data = it
+        self._windows_bytes -= len(data)
+        if len(data) > length:
+            # keep the tail for the next sequential range
+            rest = data[length:]
+            old = self._windows.pop((rel, start + length), None)
+            if old is not None:
+                self._windows_bytes -= len(old[1])
+            self._windows[(rel, start + length)] = (time.monotonic(), rest)
+            self._windows_bytes += len(rest)
+            data = data[:length]
+        return data
+
+    def invalidate(self, rel: str) -> None:
+        for k in [k for k in self._windows if k[0] == rel]:
+            _, data = self._windows.pop(k)
+            self._windows_bytes -= len(data)
+        self._last_end.pop(rel, None)
+
+
+range_streamer = RangeStreamer()
@@ -3,7 +3,9 @@ RemoteStorageClient: gRPC-based storage provider.
 """
 import os
 import asyncio
-from typing import AsyncIterator, List, Optional, Dict, Any
+import hashlib
+import logging
+from typing import AsyncIterator, Iterable, List, Optional, Dict, Any
 
 import grpc
 
@@ -14,18 +16,33 @@ from config.ytstorage.ytstorage_cfg import (
     YTSTORAGE_GRPC_TOKEN,
     YTSTORAGE_BASE_PREFIX,
     YTSTORAGE_GRPC_MAX_MSG_MB,
+    YTSTORAGE_STATMANY_FALLBACK_CONCURRENCY,
+    YTSTORAGE_WRITE_INFLIGHT_BYTES,
+    YTSTORAGE_WRITE_HASH,
 )
+from services.monitor.metrics_srv import grpc_aio_interceptors
 from services.ytstorage.base_srv import StorageClient
+from services.ytstorage.meta_cache_srv import storage_meta_cache, storage_exists_cache
+from services.ytstorage.range_stream_srv import range_streamer
 
 # Generated stubs
 from services.ytstorage.ytstorage_proto import ytstorage_pb2 as pb
 from services.ytstorage.ytstorage_proto import ytstorage_pb2_grpc as pb_grpc
 
+log = logging.getLogger(__name__)
+
 
 def _norm(rel: str) -> str:
     return (rel or "").strip().replace("\\", "/").lstrip("/")
 
 
+def _invalidate(rel: str, recursive: bool = False) -> None:
+    # drop cached size/etag and prefetched windows after local mutations
+    storage_meta_cache.invalidate(rel, recursive=recursive)
+    storage_exists_cache.invalidate(rel, recursive=recursive)
+    range_streamer.invalidate(_norm(rel))
+
+
 def _cfg_str(name: str, default: str) -> str:
     v = getattr(settings, name, None)
     if isinstance(v, str) and v.strip() != "":
@@ -77,8 +94,20 @@ def _grpc_channel() -> grpc.aio.Channel:
     ]
     if use_tls:
         creds = grpc.ssl_channel_credentials()
-        return grpc.aio.secure_channel(target, creds, options=opts)
-    return grpc.aio.insecure_channel(target, options=opts)
+        return grpc.aio.secure_channel(target, creds, options=opts, interceptors=grpc_aio_interceptors())
+    return grpc.aio.insecure_channel(target, options=opts, interceptors=grpc_aio_interceptors())
+
+
+def _new_hasher(algo: Optional[str]) -> Any:
+    if not algo:
+        return None
+    if algo == "xxhash":
+        try:
+            import xxhash  # type: ignore
+            return xxhash.xxh3_128()
+        except ImportError:
+            log.warning("xxhash is not installed, using sha256 for storage writes")
+    return hashlib.sha256()
 
 
 class _AsyncWriter:
@@ -86,18 +115,59 @@ class _AsyncWriter:
     Async writer helper:
     - async with client.open_writer(path) as w: await w.write(...); ...
     - bidirectional stream: header -> data chunks; server streams acks
+    - write() waits while more than inflight_bytes are queued (backpressure instead of buffering the file)
+    - bytes are passed through as is; bytearray/memoryview are copied once (protobuf takes immutable bytes only)
+    - acks are folded into counters (acks, bytes_written, etag), first failed ack fails the write
+    - optional digest over written bytes (hexdigest after close)
+    - exception inside the block cancels the stream instead of committing a truncated file
     """
-    def __init__(self, stub: pb_grpc.StorageServiceStub, path: str, overwrite: bool, append: bool, md: List[tuple]):
+    def __init__(
+        self,
+        stub: pb_grpc.StorageServiceStub,
+        path: str,
+        overwrite: bool,
+        append: bool,
+        md: List[tuple],
+        hash_algo: Optional[str] = None,
+        inflight_bytes: int = YTSTORAGE_WRITE_INFLIGHT_BYTES,
+        expected_size: int = 0,
+    ):
         self._stub = stub
         self._path = path
         self._overwrite = overwrite
         self._append = append
         self._md = md
+        self._expected_size = int(expected_size or 0)
         self._q: asyncio.Queue = asyncio.Queue()
-        self._acks: List[pb.WriteAck] = []
+        self._limit = max(1, int(inflight_bytes))
+        self._inflight = 0
+        self._cond = asyncio.Condition()
+        self._hasher = _new_hasher(hash_algo)
         self._done = asyncio.Event()
         self._task: Optional[asyncio.Task] = None
         self._err: Optional[Exception] = None
+        self._ack_error: Optional[str] = None
+        self.bytes_sent = 0
+        self.bytes_written = 0
+        self.acks = 0
+        self.etag = ""
+
+    @property
+    def hexdigest(self) -> Optional[str]:
+        return self._hasher.hexdigest() if self._hasher is not None else None
+
+    async def _notify(self) -> None:
+        async with self._cond:
+            self._cond.notify_all()
+
+    def _on_ack(self, ack: pb.WriteAck) -> None:
+        self.acks += 1
+        if ack.bytes_written:
+            self.bytes_written = int(ack.bytes_written)
+        if ack.etag:
+            self.etag = ack.etag
+        if not ack.ok and self._ack_error is None:
+            self._ack_error = ack.error or "unknown error"
 
     async def __aenter__(self):
         async def _producer():
@@ -105,35 +175,71 @@ class _AsyncWriter:
                 path=pb.Path(rel_path=self._path),
                 overwrite=self._overwrite,
                 append=self._append,
-                expected_size=0,
+                expected_size=self._expected_size,
             )
             yield pb.WriteEnvelope(header=header)
             while True:
                 item = await self._q.get()
                 if item is None:
                     break
+                # gRPC pulls the next message only when it can send it, so this is the release point
+                self._inflight -= len(item)
+                await self._notify()
                 yield pb.WriteEnvelope(data=pb.WriteData(data=item))
 
         async def _runner():
             try:
                 async for ack in self._stub.Write(_producer(), metadata=self._md):
-                    self._acks.append(ack)
-                self._done.set()
+                    self._on_ack(ack)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 self._err = e
+            finally:
                 self._done.set()
+                await self._notify()
 
         self._task = asyncio.create_task(_runner())
         return self
 
-    async def write(self, data: bytes) -> None:
-        if not isinstance(data, (bytes, bytearray)):
+    async def write(self, data: Any) -> None:
+        if isinstance(data, bytes):
+            buf = data
+        elif isinstance(data, (bytearray, memoryview)):
+            buf = bytes(data)
+        else:
             raise TypeError("write() expects bytes")
-        await self._q.put(bytes(data))
+        n = len(buf)
+        if not n:
+            return
+        async with self._cond:
+            # a single chunk larger than the limit is still let through when nothing is queued
+            await self._cond.wait_for(
+                lambda: self._done.is_set() or self._inflight == 0 or self._inflight + n <= self._limit
+            )
+        if self._err:
+            raise self._err
+        if self._done.is_set():
+            raise RuntimeError(f"remote write failed: {self._ack_error or 'stream closed'}")
+        if self._hasher is not None:
+            self._hasher.update(buf)
+        self._inflight += n
+        self.bytes_sent += n
+        self._q.put_nowait(buf)
 
     async def __aexit__(self, exc_type, exc, tb):
-        await self._q.put(None)
+        if exc_type is not None:
+            if self._task and not self._task.done():
+                self._task.cancel()
+                try:
+                    await self._task
+                except (asyncio.CancelledError, Exception):
+                    pass
+            _invalidate(self._path)
+            return False
+        self._q.put_nowait(None)
         await self._done.wait()
+        _invalidate(self._path)
         if self._task:
             try:
                 await self._task
@@ -141,10 +247,8 @@ class _AsyncWriter:
                 pass
         if self._err:
             raise self._err
-        if self._acks:
-            last = self._acks[-1]
-            if not last.ok:
-                raise RuntimeError(f"remote write failed: {last.error or 'unknown error'}")
+        if self._ack_error:
+            raise RuntimeError(f"remote write failed: {self._ack_error}")
 
 
 class RemoteStorageClient(StorageClient):
@@ -156,6 +260,8 @@ class RemoteStorageClient(StorageClient):
         self._channel = _grpc_channel()
         self._stub = pb_grpc.StorageServiceStub(self._channel)
         self._base_prefix = _cfg_str("YTSTORAGE_BASE_PREFIX", YTSTORAGE_BASE_PREFIX)
+        # None = unknown yet; False once server answered UNIMPLEMENTED
+        self._stat_many_supported: Optional[bool] = None
 
     def join(self, base: str, *parts: str) -> str:
         p = "/".join([_norm(base)] + [_norm(x) for x in parts])
@@ -187,6 +293,84 @@ class RemoteStorageClient(StorageClient):
             "etag": resp.etag or None,
         }
 
+    async def stat_many(self, rel_paths: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Batched Stat: {rel_path: stat dict | None (missing)} in one StatMany round trip.
+        Falls back to bounded concurrent Exists (stat is then {} for existing files)
+        when ytstorage does not implement StatMany.
+        """
+        paths = list(dict.fromkeys(_norm(p) for p in rel_paths if p))
+        if not paths:
+            return {}
+        if self._stat_many_supported is not False:
+            try:
+                resp = await self._stub.StatMany(
+                    pb.StatManyRequest(paths=[pb.Path(rel_path=p) for p in paths]),
+                    metadata=_auth_md(),
+                )
+                self._stat_many_supported = True
+                out: Dict[str, Optional[Dict[str, Any]]] = {p: None for p in paths}
+                for e in resp.entries:
+                    rp = _norm(e.rel_path)
+                    if not e.exists:
+                        out[rp] = None
+                        continue
+                    st = e.stat
+                    out[rp] = {
+                        "name": st.name,
+                        "rel_path": st.rel_path,
+                        "file_type": int(st.file_type),
+                        "size_bytes": int(st.size_bytes),
+                        "created_at_ms": int(st.created_at_ms),
+                        "updated_at_ms": int(st.updated_at_ms),
+                        "etag": st.etag or None,
+                    }
+                return out
+            except grpc.RpcError as e:
+                if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                    raise
+                self._stat_many_supported = False
+
+        sem = asyncio.Semaphore(YTSTORAGE_STATMANY_FALLBACK_CONCURRENCY)
+
+        async def _one(p: str) -> Optional[Dict[str, Any]]:
+            async with sem:
+                return {} if await self.exists(p) else None
+
+        res = await asyncio.gather(*[_one(p) for p in paths])
+        return dict(zip(paths, res))
+
+    async def exists_many(self, rel_paths: Iterable[str]) -> Dict[str, bool]:
+        """
+        Batched exists with TTL cache of positive/negative results.
+        Cached paths cost nothing; the rest is resolved by a single stat_many().
+        """
+        out: Dict[str, bool] = {}
+        missing: List[str] = []
+        for p in rel_paths:
+            if not p:
+                continue
+            rp = _norm(p)
+            hit = storage_exists_cache.get(rp)
+            if hit is None:
+                missing.append(rp)
+            else:
+                out[rp] = hit
+        if missing:
+            try:
+                stats = await self.stat_many(missing)
+            except grpc.RpcError:
+                stats = {}
+            for rp in missing:
+                ex = stats.get(rp) is not None
+                out[rp] = ex
+                if rp in stats:
+                    storage_exists_cache.put(rp, ex)
+                    st = stats[rp]
+                    if st and "size_bytes" in st:
+                        storage_meta_cache.put(rp, st["size_bytes"], st.get("etag"))
+        return out
+
     async def mkdirs(self, rel_path: str, exist_ok: bool = True) -> None:
         await self._stub.Mkdirs(pb.MkdirsRequest(path=pb.Path(rel_path=_norm(rel_path)), exist_ok=bool(exist_ok)), metadata=_auth_md())
 
@@ -221,11 +405,14 @@ class RemoteStorageClient(StorageClient):
             ),
             metadata=_auth_md(),
         )
+        _invalidate(src_rel, recursive=True)
+        _invalidate(dst_rel, recursive=True)
         if not resp.ok:
             raise RuntimeError("remote rename failed")
 
     async def remove(self, rel_path: str, recursive: bool = False) -> None:
         resp = await self._stub.Remove(pb.RemoveRequest(path=pb.Path(rel_path=_norm(rel_path)), recursive=bool(recursive)), metadata=_auth_md())
+        _invalidate(rel_path, recursive=bool(recursive))
         if not resp.ok:
             raise RuntimeError("remote remove failed")
 
@@ -245,8 +432,26 @@ class RemoteStorageClient(StorageClient):
 
         return _aiter()
 
-    async def open_writer(self, rel_path: str, overwrite: bool = True, append: bool = False):
-        return _AsyncWriter(self._stub, _norm(rel_path), overwrite, append, _auth_md())
+    async def open_writer(
+        self,
+        rel_path: str,
+        overwrite: bool = True,
+        append: bool = False,
+        hash_algo: Optional[str] = None,
+        expected_size: int = 0,
+    ):
+        """
+        hash_algo: "sha256" | "xxhash" | None (None = YTSTORAGE_WRITE_HASH); digest is in writer.hexdigest after close.
+        """
+        return _AsyncWriter(
+            self._stub,
+            _norm(rel_path),
+            overwrite,
+            append,
+            _auth_md(),
+            hash_algo=hash_algo if hash_algo is not None else (YTSTORAGE_WRITE_HASH or None),
+            expected_size=expected_size,
+        )
 
     async def enqueue_put(self, rel_path: str, expected_size: int = 0, overwrite: bool = True) -> str:
         ref = await self._stub.EnqueuePut(
@@ -24,19 +24,19 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0fytstorage.proto\x12\tytstorage\"\x18\n\x04Path\x12\x10\n\x08rel_path\x18\x01 \x01(\t\",\n\x0bStatRequest\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\"\xa6\x01\n\x0cStatResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08rel_path\x18\x02 \x01(\t\x12&\n\tfile_type\x18\x03 \x01(\x0e\x32\x13.ytstorage.FileType\x12\x12\n\nsize_bytes\x18\x04 \x01(\x03\x12\x15\n\rcreated_at_ms\x18\x05 \x01(\x03\x12\x15\n\rupdated_at_ms\x18\x06 \x01(\x03\x12\x0c\n\x04\x65tag\x18\x07 \x01(\t\".\n\rExistsRequest\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\"H\n\x0e\x45xistsResponse\x12\x0e\n\x06\x65xists\x18\x01 \x01(\x08\x12&\n\tfile_type\x18\x02 \x01(\x0e\x32\x13.ytstorage.FileType\"@\n\rMkdirsRequest\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\x12\x10\n\x08\x65xist_ok\x18\x02 \x01(\x08\"\x1c\n\x0eMkdirsResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\"e\n\x0eListdirRequest\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\x12\x11\n\trecursive\x18\x02 \x01(\x08\x12\r\n\x05limit\x18\x03 \x01(\x05\x12\x12\n\npage_token\x18\x04 \x01(\t\"\x95\x01\n\tFileEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08rel_path\x18\x02 \x01(\t\x12&\n\tfile_type\x18\x03 \x01(\x0e\x32\x13.ytstorage.FileType\x12\x12\n\nsize_bytes\x18\x04 \x01(\x03\x12\x15\n\rcreated_at_ms\x18\x05 \x01(\x03\x12\x15\n\rupdated_at_ms\x18\x06 \x01(\x03\"Q\n\x0fListdirResponse\x12%\n\x07\x65ntries\x18\x01 \x03(\x0b\x32\x14.ytstorage.FileEntry\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"^\n\rRenameRequest\x12\x1c\n\x03src\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\x12\x1c\n\x03\x64st\x18\x02 \x01(\x0b\x32\x0f.ytstorage.Path\x12\x11\n\toverwrite\x18\x03 \x01(\x08\"\x1c\n\x0eRenameResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\"A\n\rRemoveRequest\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\x12\x11\n\trecursive\x18\x02 \x01(\x08\"\x1c\n\x0eRemoveResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\"L\n\x0bReadRequest\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\x12\x0e\n\x06offset\x18\x02 \x01(\x03\x12\x0e\n\x06length\x18\x03 \x01(\x03\"\x19\n\tReadChunk\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"t\n\x0bWriteHeader\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\x12\x11\n\toverwrite\x18\x02 \x01(\x08\x12\x0e\n\x06\x61ppend\x18\x03 \x01(\x08\x12\x15\n\rexpected_size\x18\x04 \x01(\x03\x12\x0c\n\x04\x65tag\x18\x05 \x01(\t\"\x19\n\tWriteData\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"J\n\x08WriteAck\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x15\n\rbytes_written\x18\x02 \x01(\x03\x12\x0c\n\x04\x65tag\x18\x03 \x01(\t\x12\r\n\x05\x65rror\x18\x04 \x01(\t\"g\n\rWriteEnvelope\x12(\n\x06header\x18\x01 \x01(\x0b\x32\x16.ytstorage.WriteHeaderH\x00\x12$\n\x04\x64\x61ta\x18\x02 \x01(\x0b\x32\x14.ytstorage.WriteDataH\x00\x42\x06\n\x04kind\"\x0f\n\rHealthRequest\"1\n\x0eHealthResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\"u\n\x12GenerateUrlRequest\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\x12$\n\x06method\x18\x02 \x01(\x0e\x32\x14.ytstorage.UrlMethod\x12\x1a\n\x12\x65xpiration_seconds\x18\x03 \x01(\x05\"L\n\x13GenerateUrlResponse\x12\x11\n\tsupported\x18\x01 \x01(\x08\x12\x0b\n\x03url\x18\x02 \x01(\t\x12\x15\n\rexpires_at_ms\x18\x03 \x01(\x03\"\\\n\x11\x45nqueuePutRequest\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\x12\x11\n\toverwrite\x18\x02 \x01(\x08\x12\x15\n\rexpected_size\x18\x03 \x01(\x03\"2\n\x11\x45nqueueGetRequest\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\"\x18\n\x06JobRef\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\"\n\x10JobStatusRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"v\n\x11JobStatusResponse\x12(\n\x06status\x18\x01 \x01(\x0e\x32\x18.ytstorage.JobStatusCode\x12\x0f\n\x07percent\x18\x02 \x01(\x05\x12\x17\n\x0f\x62ytes_processed\x18\x03 \x01(\x03\x12\r\n\x05\x65rror\x18\x04 \x01(\t\"\"\n\x10\x43\x61ncelJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\x1f\n\x11\x43\x61ncelJobResponse\x12\n\n\x02ok\x18\x01 \x01(\x08*[\n\x08\x46ileType\x12\x14\n\x10\x46ILETYPE_UNKNOWN\x10\x00\x12\x11\n\rFILETYPE_FILE\x10\x01\x12\x10\n\x0c\x46ILETYPE_DIR\x10\x02\x12\x14\n\x10\x46ILETYPE_SYMLINK\x10\x03*3\n\tUrlMethod\x12\x12\n\x0eURL_METHOD_GET\x10\x00\x12\x12\n\x0eURL_METHOD_PUT\x10\x01*p\n\rJobStatusCode\x12\x0f\n\x0bJOB_UNKNOWN\x10\x00\x12\x0e\n\nJOB_QUEUED\x10\x01\x12\x0f\n\x0bJOB_RUNNING\x10\x02\x12\x0c\n\x08JOB_DONE\x10\x03\x12\x0c\n\x08JOB_FAIL\x10\x04\x12\x11\n\rJOB_CANCELLED\x10\x05\x32\x9f\x07\n\x0eStorageService\x12=\n\x06Health\x12\x18.ytstorage.HealthRequest\x1a\x19.ytstorage.HealthResponse\x12\x37\n\x04Stat\x12\x16.ytstorage.StatRequest\x1a\x17.ytstorage.StatResponse\x12=\n\x06\x45xists\x12\x18.ytstorage.ExistsRequest\x1a\x19.ytstorage.ExistsResponse\x12=\n\x06Mkdirs\x12\x18.ytstorage.MkdirsRequest\x1a\x19.ytstorage.MkdirsResponse\x12@\n\x07Listdir\x12\x19.ytstorage.ListdirRequest\x1a\x1a.ytstorage.ListdirResponse\x12=\n\x06Rename\x12\x18.ytstorage.RenameRequest\x1a\x19.ytstorage.RenameResponse\x12=\n\x06Remove\x12\x18.ytstorage.RemoveRequest\x1a\x19.ytstorage.RemoveResponse\x12\x36\n\x04Read\x12\x16.ytstorage.ReadRequest\x1a\x14.ytstorage.ReadChunk0\x01\x12:\n\x05Write\x12\x18.ytstorage.WriteEnvelope\x1a\x13.ytstorage.WriteAck(\x01\x30\x01\x12U\n\x14GeneratePresignedUrl\x12\x1d.ytstorage.GenerateUrlRequest\x1a\x1e.ytstorage.GenerateUrlResponse\x12=\n\nEnqueuePut\x12\x1c.ytstorage.EnqueuePutRequest\x1a\x11.ytstorage.JobRef\x12=\n\nEnqueueGet\x12\x1c.ytstorage.EnqueueGetRequest\x1a\x11.ytstorage.JobRef\x12\x46\n\tJobStatus\x12\x1b.ytstorage.JobStatusRequest\x1a\x1c.ytstorage.JobStatusResponse\x12\x46\n\tCancelJob\x12\x1b.ytstorage.CancelJobRequest\x1a\x1c.ytstorage.CancelJobResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0fytstorage.proto\x12\tytstorage\"\x18\n\x04Path\x12\x10\n\x08rel_path\x18\x01 \x01(\t\",\n\x0bStatRequest\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\"\xa6\x01\n\x0cStatResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08rel_path\x18\x02 \x01(\t\x12&\n\tfile_type\x18\x03 \x01(\x0e\x32\x13.ytstorage.FileType\x12\x12\n\nsize_bytes\x18\x04 \x01(\x03\x12\x15\n\rcreated_at_ms\x18\x05 \x01(\x03\x12\x15\n\rupdated_at_ms\x18\x06 \x01(\x03\x12\x0c\n\x04\x65tag\x18\x07 \x01(\t\".\n\rExistsRequest\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\"H\n\x0e\x45xistsResponse\x12\x0e\n\x06\x65xists\x18\x01 \x01(\x08\x12&\n\tfile_type\x18\x02 \x01(\x0e\x32\x13.ytstorage.FileType\"1\n\x0fStatManyRequest\x12\x1e\n\x05paths\x18\x01 \x03(\x0b\x32\x0f.ytstorage.Path\"X\n\rStatManyEntry\x12\x10\n\x08rel_path\x18\x01 \x01(\t\x12\x0e\n\x06\x65xists\x18\x02 \x01(\x08\x12%\n\x04stat\x18\x03 \x01(\x0b\x32\x17.ytstorage.StatResponse\"=\n\x10StatManyResponse\x12)\n\x07\x65ntries\x18\x01 \x03(\x0b\x32\x18.ytstorage.StatManyEntry\"@\n\rMkdirsRequest\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\x12\x10\n\x08\x65xist_ok\x18\x02 \x01(\x08\"\x1c\n\x0eMkdirsResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\"e\n\x0eListdirRequest\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\x12\x11\n\trecursive\x18\x02 \x01(\x08\x12\r\n\x05limit\x18\x03 \x01(\x05\x12\x12\n\npage_token\x18\x04 \x01(\t\"\x95\x01\n\tFileEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08rel_path\x18\x02 \x01(\t\x12&\n\tfile_type\x18\x03 \x01(\x0e\x32\x13.ytstorage.FileType\x12\x12\n\nsize_bytes\x18\x04 \x01(\x03\x12\x15\n\rcreated_at_ms\x18\x05 \x01(\x03\x12\x15\n\rupdated_at_ms\x18\x06 \x01(\x03\"Q\n\x0fListdirResponse\x12%\n\x07\x65ntries\x18\x01 \x03(\x0b\x32\x14.ytstorage.FileEntry\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"^\n\rRenameRequest\x12\x1c\n\x03src\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\x12\x1c\n\x03\x64st\x18\x02 \x01(\x0b\x32\x0f.ytstorage.Path\x12\x11\n\toverwrite\x18\x03 \x01(\x08\"\x1c\n\x0eRenameResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\"A\n\rRemoveRequest\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\x12\x11\n\trecursive\x18\x02 \x01(\x08\"\x1c\n\x0eRemoveResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\"L\n\x0bReadRequest\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\x12\x0e\n\x06offset\x18\x02 \x01(\x03\x12\x0e\n\x06length\x18\x03 \x01(\x03\"\x19\n\tReadChunk\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"t\n\x0bWriteHeader\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\x12\x11\n\toverwrite\x18\x02 \x01(\x08\x12\x0e\n\x06\x61ppend\x18\x03 \x01(\x08\x12\x15\n\rexpected_size\x18\x04 \x01(\x03\x12\x0c\n\x04\x65tag\x18\x05 \x01(\t\"\x19\n\tWriteData\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"J\n\x08WriteAck\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x15\n\rbytes_written\x18\x02 \x01(\x03\x12\x0c\n\x04\x65tag\x18\x03 \x01(\t\x12\r\n\x05\x65rror\x18\x04 \x01(\t\"g\n\rWriteEnvelope\x12(\n\x06header\x18\x01 \x01(\x0b\x32\x16.ytstorage.WriteHeaderH\x00\x12$\n\x04\x64\x61ta\x18\x02 \x01(\x0b\x32\x14.ytstorage.WriteDataH\x00\x42\x06\n\x04kind\"\x0f\n\rHealthRequest\"1\n\x0eHealthResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\"u\n\x12GenerateUrlRequest\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\x12$\n\x06method\x18\x02 \x01(\x0e\x32\x14.ytstorage.UrlMethod\x12\x1a\n\x12\x65xpiration_seconds\x18\x03 \x01(\x05\"L\n\x13GenerateUrlResponse\x12\x11\n\tsupported\x18\x01 \x01(\x08\x12\x0b\n\x03url\x18\x02 \x01(\t\x12\x15\n\rexpires_at_ms\x18\x03 \x01(\x03\"\\\n\x11\x45nqueuePutRequest\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\x12\x11\n\toverwrite\x18\x02 \x01(\x08\x12\x15\n\rexpected_size\x18\x03 \x01(\x03\"2\n\x11\x45nqueueGetRequest\x12\x1d\n\x04path\x18\x01 \x01(\x0b\x32\x0f.ytstorage.Path\"\x18\n\x06JobRef\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\"\n\x10JobStatusRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"v\n\x11JobStatusResponse\x12(\n\x06status\x18\x01 \x01(\x0e\x32\x18.ytstorage.JobStatusCode\x12\x0f\n\x07percent\x18\x02 \x01(\x05\x12\x17\n\x0f\x62ytes_processed\x18\x03 \x01(\x03\x12\r\n\x05\x65rror\x18\x04 \x01(\t\"\"\n\x10\x43\x61ncelJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\x1f\n\x11\x43\x61ncelJobResponse\x12\n\n\x02ok\x18\x01 \x01(\x08*[\n\x08\x46ileType\x12\x14\n\x10\x46ILETYPE_UNKNOWN\x10\x00\x12\x11\n\rFILETYPE_FILE\x10\x01\x12\x10\n\x0c\x46ILETYPE_DIR\x10\x02\x12\x14\n\x10\x46ILETYPE_SYMLINK\x10\x03*3\n\tUrlMethod\x12\x12\n\x0eURL_METHOD_GET\x10\x00\x12\x12\n\x0eURL_METHOD_PUT\x10\x01*p\n\rJobStatusCode\x12\x0f\n\x0bJOB_UNKNOWN\x10\x00\x12\x0e\n\nJOB_QUEUED\x10\x01\x12\x0f\n\x0bJOB_RUNNING\x10\x02\x12\x0c\n\x08JOB_DONE\x10\x03\x12\x0c\n\x08JOB_FAIL\x10\x04\x12\x11\n\rJOB_CANCELLED\x10\x05\x32\xe4\x07\n\x0eStorageService\x12=\n\x06Health\x12\x18.ytstorage.HealthRequest\x1a\x19.ytstorage.HealthResponse\x12\x37\n\x04Stat\x12\x16.ytstorage.StatRequest\x1a\x17.ytstorage.StatResponse\x12=\n\x06\x45xists\x12\x18.ytstorage.ExistsRequest\x1a\x19.ytstorage.ExistsResponse\x12\x43\n\x08StatMany\x12\x1a.ytstorage.StatManyRequest\x1a\x1b.ytstorage.StatManyResponse\x12=\n\x06Mkdirs\x12\x18.ytstorage.MkdirsRequest\x1a\x19.ytstorage.MkdirsResponse\x12@\n\x07Listdir\x12\x19.ytstorage.ListdirRequest\x1a\x1a.ytstorage.ListdirResponse\x12=\n\x06Rename\x12\x18.ytstorage.RenameRequest\x1a\x19.ytstorage.RenameResponse\x12=\n\x06Remove\x12\x18.ytstorage.RemoveRequest\x1a\x19.ytstorage.RemoveResponse\x12\x36\n\x04Read\x12\x16.ytstorage.ReadRequest\x1a\x14.ytstorage.ReadChunk0\x01\x12:\n\x05Write\x12\x18.ytstorage.WriteEnvelope\x1a\x13.ytstorage.WriteAck(\x01\x30\x01\x12U\n\x14GeneratePresignedUrl\x12\x1d.ytstorage.GenerateUrlRequest\x1a\x1e.ytstorage.GenerateUrlResponse\x12=\n\nEnqueuePut\x12\x1c.ytstorage.EnqueuePutRequest\x1a\x11.ytstorage.JobRef\x12=\n\nEnqueueGet\x12\x1c.ytstorage.EnqueueGetRequest\x1a\x11.ytstorage.JobRef\x12\x46\n\tJobStatus\x12\x1b.ytstorage.JobStatusRequest\x1a\x1c.ytstorage.JobStatusResponse\x12\x46\n\tCancelJob\x12\x1b.ytstorage.CancelJobRequest\x1a\x1c.ytstorage.CancelJobResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ytstorage_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_FILETYPE']._serialized_start=2143
-  _globals['_FILETYPE']._serialized_end=2234
-  _globals['_URLMETHOD']._serialized_start=2236
-  _globals['_URLMETHOD']._serialized_end=2287
-  _globals['_JOBSTATUSCODE']._serialized_start=2289
-  _globals['_JOBSTATUSCODE']._serialized_end=2401
+  _globals['_FILETYPE']._serialized_start=2347
+  _globals['_FILETYPE']._serialized_end=2438
+  _globals['_URLMETHOD']._serialized_start=2440
+  _globals['_URLMETHOD']._serialized_end=2491
+  _globals['_JOBSTATUSCODE']._serialized_start=2493
+  _globals['_JOBSTATUSCODE']._serialized_end=2605
   _globals['_PATH']._serialized_start=30
   _globals['_PATH']._serialized_end=54
   _globals['_STATREQUEST']._serialized_start=56
@@ -47,58 +47,64 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_EXISTSREQUEST']._serialized_end=317
   _globals['_EXISTSRESPONSE']._serialized_start=319
   _globals['_EXISTSRESPONSE']._serialized_end=391
-  _globals['_MKDIRSREQUEST']._serialized_start=393
-  _globals['_MKDIRSREQUEST']._serialized_end=457
-  _globals['_MKDIRSRESPONSE']._serialized_start=459
-  _globals['_MKDIRSRESPONSE']._serialized_end=487
-  _globals['_LISTDIRREQUEST']._serialized_start=489
-  _globals['_LISTDIRREQUEST']._serialized_end=590
-  _globals['_FILEENTRY']._serialized_start=593
-  _globals['_FILEENTRY']._serialized_end=742
-  _globals['_LISTDIRRESPONSE']._serialized_start=744
-  _globals['_LISTDIRRESPONSE']._serialized_end=825
-  _globals['_RENAMEREQUEST']._serialized_start=827
-  _globals['_RENAMEREQUEST']._serialized_end=921
-  _globals['_RENAMERESPONSE']._serialized_start=923
-  _globals['_RENAMERESPONSE']._serialized_end=951
-  _globals['_REMOVEREQUEST']._serialized_start=953
-  _globals['_REMOVEREQUEST']._serialized_end=1018
-  _globals['_REMOVERESPONSE']._serialized_start=1020
-  _globals['_REMOVERESPONSE']._serialized_end=1048
-  _globals['_READREQUEST']._serialized_start=1050
-  _globals['_READREQUEST']._serialized_end=1126
-  _globals['_READCHUNK']._serialized_start=1128
-  _globals['_READCHUNK']._serialized_end=1153
-  _globals['_WRITEHEADER']._serialized_start=1155
-  _globals['_WRITEHEADER']._serialized_end=1271
-  _globals['_WRITEDATA']._serialized_start=1273
-  _globals['_WRITEDATA']._serialized_end=1298
-  _globals['_WRITEACK']._serialized_start=1300
-  _globals['_WRITEACK']._serialized_end=1374
-  _globals['_WRITEENVELOPE']._serialized_start=1376
-  _globals['_WRITEENVELOPE']._serialized_end=1479
-  _globals['_HEALTHREQUEST']._serialized_start=1481
-  _globals['_HEALTHREQUEST']._serialized_end=1496
-  _globals['_HEALTHRESPONSE']._serialized_start=1498
-  _globals['_HEALTHRESPONSE']._serialized_end=1547
-  _globals['_GENERATEURLREQUEST']._serialized_start=1549
-  _globals['_GENERATEURLREQUEST']._serialized_end=1666
-  _globals['_GENERATEURLRESPONSE']._serialized_start=1668
-  _globals['_GENERATEURLRESPONSE']._serialized_end=1744
-  _globals['_ENQUEUEPUTREQUEST']._serialized_start=1746
-  _globals['_ENQUEUEPUTREQUEST']._serialized_end=1838
-  _globals['_ENQUEUEGETREQUEST']._serialized_start=1840
-  _globals['_ENQUEUEGETREQUEST']._serialized_end=1890
-  _globals['_JOBREF']._serialized_start=1892
-  _globals['_JOBREF']._serialized_end=1916
-  _globals['_JOBSTATUSREQUEST']._serialized_start=1918
-  _globals['_JOBSTATUSREQUEST']._serialized_end=1952
-  _globals['_JOBSTATUSRESPONSE']._serialized_start=1954
-  _globals['_JOBSTATUSRESPONSE']._serialized_end=2072
-  _globals['_CANCELJOBREQUEST']._serialized_start=2074
-  _globals['_CANCELJOBREQUEST']._serialized_end=2108
-  _globals['_CANCELJOBRESPONSE']._serialized_start=2110
-  _globals['_CANCELJOBRESPONSE']._serialized_end=2141
-  _globals['_STORAGESERVICE']._serialized_start=2404
-  _globals['_STORAGESERVICE']._serialized_end=3331
+  _globals['_STATMANYREQUEST']._serialized_start=393
+  _globals['_STATMANYREQUEST']._serialized_end=442
+  _globals['_STATMANYENTRY']._serialized_start=444
+  _globals['_STATMANYENTRY']._serialized_end=532
+  _globals['_STATMANYRESPONSE']._serialized_start=534
+  _globals['_STATMANYRESPONSE']._serialized_end=595
+  _globals['_MKDIRSREQUEST']._serialized_start=597
+  _globals['_MKDIRSREQUEST']._serialized_end=661
+  _globals['_MKDIRSRESPONSE']._serialized_start=663
+  _globals['_MKDIRSRESPONSE']._serialized_end=691
+  _globals['_LISTDIRREQUEST']._serialized_start=693
+  _globals['_LISTDIRREQUEST']._serialized_end=794
+  _globals['_FILEENTRY']._serialized_start=797
+  _globals['_FILEENTRY']._serialized_end=946
+  _globals['_LISTDIRRESPONSE']._serialized_start=948
+  _globals['_LISTDIRRESPONSE']._serialized_end=1029
+  _globals['_RENAMEREQUEST']._serialized_start=1031
+  _globals['_RENAMEREQUEST']._serialized_end=1125
+  _globals['_RENAMERESPONSE']._serialized_start=1127
+  _globals['_RENAMERESPONSE']._serialized_end=1155
+  _globals['_REMOVEREQUEST']._serialized_start=1157
+  _globals['_REMOVEREQUEST']._serialized_end=1222
+  _globals['_REMOVERESPONSE']._serialized_start=1224
+  _globals['_REMOVERESPONSE']._serialized_end=1252
+  _globals['_READREQUEST']._serialized_start=1254
+  _globals['_READREQUEST']._serialized_end=1330
+  _globals['_READCHUNK']._serialized_start=1332
+  _globals['_READCHUNK']._serialized_end=1357
+  _globals['_WRITEHEADER']._serialized_start=1359
+  _globals['_WRITEHEADER']._serialized_end=1475
+  _globals['_WRITEDATA']._serialized_start=1477
+  _globals['_WRITEDATA']._serialized_end=1502
+  _globals['_WRITEACK']._serialized_start=1504
+  _globals['_WRITEACK']._serialized_end=1578
+  _globals['_WRITEENVELOPE']._serialized_start=1580
+  _globals['_WRITEENVELOPE']._serialized_end=1683
+  _globals['_HEALTHREQUEST']._serialized_start=1685
+  _globals['_HEALTHREQUEST']._serialized_end=1700
+  _globals['_HEALTHRESPONSE']._serialized_start=1702
+  _globals['_HEALTHRESPONSE']._serialized_end=1751
+  _globals['_GENERATEURLREQUEST']._serialized_start=1753
+  _globals['_GENERATEURLREQUEST']._serialized_end=1870
+  _globals['_GENERATEURLRESPONSE']._serialized_start=1872
+  _globals['_GENERATEURLRESPONSE']._serialized_end=1948
+  _globals['_ENQUEUEPUTREQUEST']._serialized_start=1950
+  _globals['_ENQUEUEPUTREQUEST']._serialized_end=2042
+  _globals['_ENQUEUEGETREQUEST']._serialized_start=2044
+  _globals['_ENQUEUEGETREQUEST']._serialized_end=2094
+  _globals['_JOBREF']._serialized_start=2096
+  _globals['_JOBREF']._serialized_end=2120
+  _globals['_JOBSTATUSREQUEST']._serialized_start=2122
+  _globals['_JOBSTATUSREQUEST']._serialized_end=2156
+  _globals['_JOBSTATUSRESPONSE']._serialized_start=2158
+  _globals['_JOBSTATUSRESPONSE']._serialized_end=2276
+  _globals['_CANCELJOBREQUEST']._serialized_start=2278
+  _globals['_CANCELJOBREQUEST']._serialized_end=2312
+  _globals['_CANCELJOBRESPONSE']._serialized_start=2314
+  _globals['_CANCELJOBRESPONSE']._serialized_end=2345
+  _globals['_STORAGESERVICE']._serialized_start=2608
+  _globals['_STORAGESERVICE']._serialized_end=3604
 # @@protoc_insertion_point(module_scope)
@@ -49,6 +49,11 @@ class StorageServiceStub(object):
                 request_serializer=ytstorage__pb2.ExistsRequest.SerializeToString,
                 response_deserializer=ytstorage__pb2.ExistsResponse.FromString,
                 _registered_method=True)
+        self.StatMany = channel.unary_unary(
+                '/ytstorage.StorageService/StatMany',
+                request_serializer=ytstorage__pb2.StatManyRequest.SerializeToString,
+                response_deserializer=ytstorage__pb2.StatManyResponse.FromString,
+                _registered_method=True)
         self.Mkdirs = channel.unary_unary(
                 '/ytstorage.StorageService/Mkdirs',
                 request_serializer=ytstorage__pb2.MkdirsRequest.SerializeToString,
@@ -127,6 +132,12 @@ class StorageServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StatMany(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def Mkdirs(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -214,6 +225,11 @@ def add_StorageServiceServicer_to_server(servicer, server):
                     request_deserializer=ytstorage__pb2.ExistsRequest.FromString,
                     response_serializer=ytstorage__pb2.ExistsResponse.SerializeToString,
             ),
+            'StatMany': grpc.unary_unary_rpc_method_handler(
+                    servicer.StatMany,
+                    request_deserializer=ytstorage__pb2.StatManyRequest.FromString,
+                    response_serializer=ytstorage__pb2.StatManyResponse.SerializeToString,
+            ),
             'Mkdirs': grpc.unary_unary_rpc_method_handler(
                     servicer.Mkdirs,
                     request_deserializer=ytstorage__pb2.MkdirsRequest.FromString,
@@ -361,6 +377,33 @@ class StorageService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StatMany(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/ytstorage.StorageService/StatMany',
+            ytstorage__pb2.StatManyRequest.SerializeToString,
+            ytstorage__pb2.StatManyResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def Mkdirs(request,
             target,
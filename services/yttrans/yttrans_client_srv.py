@@ -7,6 +7,7 @@ from typing import Tuple, List, Dict, Any, Optional
 
 from config.yttrans.yttrans_cfg import load_yttrans_config, YTTransServer
 from grpc_health.v1 import health_pb2, health_pb2_grpc  # type: ignore
+from services.monitor.metrics_srv import grpc_aio_interceptors
 
 try:
     from services.yttrans.yttrans_proto import yttrans_pb2, yttrans_pb2_grpc  # type: ignore
@@ -72,7 +73,7 @@ def _parse_target_to_server(target: str) -> YTTransServer:
 
 
 async def _healthcheck_server(server: YTTransServer) -> bool:
-    channel = grpc.aio.insecure_channel(server.target)
+    channel = grpc.aio.insecure_channel(server.target, interceptors=grpc_aio_interceptors())
     try:
         stub = health_pb2_grpc.HealthStub(channel)
 
@@ -137,7 +138,7 @@ async def list_languages() -> Tuple[List[str], str, Dict[str, Any]]:
         )
 
     server = await pick_yttrans_server()
-    channel = grpc.aio.insecure_channel(server.target)
+    channel = grpc.aio.insecure_channel(server.target, interceptors=grpc_aio_interceptors())
     try:
         stub = yttrans_pb2_grpc.TranslatorStub(channel)  # type: ignore
         req = yttrans_pb2.ListLanguagesRequest()  # type: ignore
@@ -175,7 +176,7 @@ async def submit_translate(
         )
 
     server = await pick_yttrans_server()
-    channel = grpc.aio.insecure_channel(server.target)
+    channel = grpc.aio.insecure_channel(server.target, interceptors=grpc_aio_interceptors())
     try:
         stub = yttrans_pb2_grpc.TranslatorStub(channel)  # type: ignore
         req = yttrans_pb2.SubmitTranslateRequest(  # type: ignore
@@ -206,7 +207,7 @@ async def get_status(job_id: str, server: Optional[str] = None) -> Dict[str, Any
         )
 
     s = _parse_target_to_server(server) if server else await pick_yttrans_server()
-    channel = grpc.aio.insecure_channel(s.target)
+    channel = grpc.aio.insecure_channel(s.target, interceptors=grpc_aio_interceptors())
     try:
         stub = yttrans_pb2_grpc.TranslatorStub(channel)  # type: ignore
         req = yttrans_pb2.GetStatusRequest(job_id=job_id)  # type: ignore
@@ -237,7 +238,7 @@ async def get_partial_result(job_id: str, server: Optional[str] = None) -> Dict[
         )
 
     s = _parse_target_to_server(server) if server else await pick_yttrans_server()
-    channel = grpc.aio.insecure_channel(s.target)
+    channel = grpc.aio.insecure_channel(s.target, interceptors=grpc_aio_interceptors())
     try:
         stub = yttrans_pb2_grpc.TranslatorStub(channel)  # type: ignore
         req = yttrans_pb2.GetPartialResultRequest(job_id=job_id)  # type: ignore
@@ -280,7 +281,7 @@ async def get_result(job_id: str, server: Optional[str] = None) -> Tuple[str, st
         )
 
     s = _parse_target_to_server(server) if server else await pick_yttrans_server()
-    channel = grpc.aio.insecure_channel(s.target)
+    channel = grpc.aio.insecure_channel(s.target, interceptors=grpc_aio_interceptors())
     try:
         stub = yttrans_pb2_grpc.TranslatorStub(channel)  # type: ignore
         req = yttrans_pb2.GetResultRequest(job_id=job_id)  # type: ignore
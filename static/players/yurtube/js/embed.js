@@ -1,4 +1,4 @@
-(()=>{function dt(n){(!isFinite(n)||n<0)&&(n=0),n=Math.floor(n);let i=Math.floor(n/3600),e=Math.floor(n%3600/60),a=n%60,o=l=>(l<10?"0":"")+l;return i>0?`${i}:${o(e)}:${o(a)}`:`${e}:${o(a)}`}function te(n,i){let e=0,a=!1,o=null;return function(...l){o=l;let y=Date.now();!e||y-e>=i?(e=y,n.apply(null,o)):a||(a=!0,setTimeout(()=>{a=!1,n.apply(null,o)},i-(y-e)))}}function z(n,i,e){let a=n.getAttribute(i);if(!a)return e;try{return JSON.parse(a)}catch(o){return e}}function ft(n){if(navigator.clipboard&&navigator.clipboard.writeText)navigator.clipboard.writeText(n).catch(function(){});else{let i=document.createElement("textarea");i.value=n,i.style.position="fixed",i.style.left="-9999px",document.body.appendChild(i),i.select();try{document.execCommand("copy")}catch(e){}document.body.removeChild(i)}}var ee="/static/img/fallback_video_notfound.gif";function ne(n,i,e){let a=!1,o=null;function l(g){if(!a){a=!0,e&&e("fallback: applying",g);try{i?i.setAttribute("src",ee):n.src=ee,n.load()}catch(E){}}}function y(){o&&(clearTimeout(o),o=null)}n.addEventListener("loadstart",function(){y(),o=setTimeout(function(){!a&&n.readyState<1&&l("watchdog-timeout")},4e3)}),["loadeddata","canplay","canplaythrough","play","playing"].forEach(function(g){n.addEventListener(g,y)}),n.addEventListener("error",function(){a||l("error-event")}),setTimeout(function(){let g=i?i.getAttribute("src")||"":n.currentSrc||n.src||"";!a&&!g&&l("empty-src")},0)}var mt=null;function Ee(){if(mt)return mt;try{typeof Intl!="undefined"&&Intl.DisplayNames&&(mt=new Intl.DisplayNames(["en"],{type:"language"}))}catch(n){}return mt}function Ae(n,i){let e=String(n||"").trim();if(!e)return String(i||"");if(e.toLowerCase()==="auto")return"Auto";let a=e.split("-",1)[0].toLowerCase();try{let o=Ee();if(o&&typeof o.of=="function"){let l=o.of(a);if(l)return l.charAt(0).toUpperCase()+l.slice(1)}}catch(o){}return String(i||e)}function yt(n){try{return n.textTracks?Array.prototype.filter.call(n.textTracks,function(i){return i.kind==="subtitles"||i.kind==="captions"}):[]}catch(i){return[]}}function it(n){return yt(n).length>0}function ht(n,i){let e=yt(n);if(e.length===0)return null;let a=i<0||i>=e.length?0:i;return e[a]}function qt(n,i,e){yt(n).forEach(function(o,l){o.mode=l===i&&e?"hidden":"disabled"})}function Me(n,i){if(!i||!i.cues||i.cues.length===0)return"";let e=n.currentTime||0;for(let a=0;a<i.cues.length;a++){let o=i.cues[a];if(e>=o.startTime&&e<=o.endTime)return(o.text||"").replace(/\r/g,"")}return""}function re(n){return yt(n).map(function(e,a){let o=String(e.language||e.srclang||"").toLowerCase(),l=String(e.label||o||"Lang "+(a+1)),y=Ae(o,l);return{index:a,lang:o,label:y}})}function Nt(n,i){let e=String(i||"").toLowerCase(),a=re(n);for(let o=0;o<a.length;o++)if(a[o].lang===e||a[o].label.toLowerCase()===e)return a[o].index;return-1}function Ht(n,i,e,a){if(!n)return;for(;n.firstChild;)n.removeChild(n.firstChild);let o=document.createElement("button");o.type="button",o.className="yrp-menu-item",o.setAttribute("data-action","back"),o.textContent="\u2190 Back",e(o),n.appendChild(o);let l=document.createElement("button");l.type="button",l.className="yrp-menu-item",l.setAttribute("data-action","subs-on"),l.textContent="On"+(i?" \u2713":""),a(l),n.appendChild(l);let y=document.createElement("button");y.type="button",y.className="yrp-menu-item",y.setAttribute("data-action","subs-off"),y.textContent="Off"+(i?"":" \u2713"),a(y),n.appendChild(y)}function Ft(n,i,e,a,o,l){if(!n)return;for(;n.firstChild;)n.removeChild(n.firstChild);let y=document.createElement("button");y.type="button",y.className="yrp-menu-item",y.setAttribute("data-action","back"),y.textContent="\u2190 Back",a(y),n.appendChild(y);let g=l(y,n);n.appendChild(g);let E=re(i),M=ht(i,e),P=M&&(M.language||M.srclang)?String(M.language||M.srclang).toLowerCase():"",D=E.slice().sort(function(L,C){let I=(L.lang||"").toLowerCase(),V=(C.lang||"").toLowerCase();return I==="auto"&&V!=="auto"?-1:V==="auto"&&I!=="auto"?1:(L.label||"").localeCompare(C.label||"")});if(D.forEach(function(L){let C=document.createElement("button");C.type="button",C.className="yrp-menu-item",C.setAttribute("data-action","select-lang"),C.setAttribute("data-lang",L.lang||"");let I=L.lang?` (${L.lang})`:"",V=L.index===e||L.lang&&P&&L.lang===P;C.textContent=L.label+I+(V?" \u2713":""),o(C),g.appendChild(C)}),!D.length){let L=document.createElement("div");L.className="yrp-menu-title",L.style.marginTop="6px",L.style.fontSize="12px",L.style.opacity="0.8",L.textContent="No subtitles tracks",g.appendChild(L)}}function ie(n,i,e){if(!n)return;let a=it(i);n.disabled=!a,n.style.visibility=a?"visible":"hidden",n.classList.toggle("no-tracks",!a),n.classList.toggle("has-tracks",a),n.classList.toggle("active",a&&e),n.classList.toggle("disabled-track",a&&!e),n.setAttribute("aria-pressed",e?"true":"false"),n.title=e?"Subtitles: on":"Subtitles: off",n.setAttribute("aria-label",e?"Subtitles enabled":"Subtitles disabled")}function ae(n,i,e,a){if(!n||!n.box)return;let o=ht(i,e);qt(i,e,a),n.box.textContent=a?Me(i,o):"",n.layer.style.display=a?"":"none"}function F(n){if(n)try{n.style.background="transparent",n.style.backgroundColor="transparent",n.style.border="none",n.style.boxShadow="none",n.style.color="inherit",n.style.textAlign="left",n.style.width="100%",n.style.display="block"}catch(i){}}function j(n){F(n);try{n.style.background="rgba(255,255,255,0.12)",n.style.backgroundColor="rgba(255,255,255,0.12)",n.style.borderRadius="4px",n.style.fontWeight="700",n.style.marginBottom="6px",n.style.paddingLeft="8px",n.style.paddingRight="8px"}catch(i){}}function ve(n){try{n.classList.add("has-submenu")}catch(i){}}function at(n,i){let e=document.createElement("div");e.className="yrp-menu-scroll";let a=300;if(i)try{let l=i.closest(".yrp-container");if(l){let y=l.querySelector(".yrp-video-wrap");if(y){let g=y.getBoundingClientRect().height,E=Math.floor(g*2/3)-34-50-20;E>150&&(a=E)}}}catch(l){}Object.assign(e.style,{overflowY:"scroll",overflowX:"hidden",maxHeight:a+"px",minHeight:"100px",height:"auto",paddingRight:"8px",paddingLeft:"2px",marginTop:"4px",pointerEvents:"auto",position:"relative",display:"block",boxSizing:"border-box",WebkitOverflowScrolling:"touch"});let o=document.createElement("style");return o.textContent=`
+(()=>{function yt(t){if(!isFinite(t)||t<0)t=0;t=Math.floor(t);let a=Math.floor(t/3600),e=Math.floor(t%3600/60),i=t%60,o=(c)=>(c<10?"0":"")+c;return a>0?`${a}:${o(e)}:${o(i)}`:`${e}:${o(i)}`}function re(t,a){let e=0,i=!1,o=null;return function(...c){o=c;let y=Date.now();if(!e||y-e>=a)e=y,t.apply(null,o);else if(!i)i=!0,setTimeout(()=>{i=!1,t.apply(null,o)},a-(y-e))}}function Z(t,a,e){let i=t.getAttribute(a);if(!i)return e;try{return JSON.parse(i)}catch(o){return e}}function ht(t){if(navigator.clipboard&&navigator.clipboard.writeText)navigator.clipboard.writeText(t).catch(function(){});else{let a=document.createElement("textarea");a.value=t,a.style.position="fixed",a.style.left="-9999px",document.body.appendChild(a),a.select();try{document.execCommand("copy")}catch(e){}document.body.removeChild(a)}}function ie(t,a,e){let i=!1,o=null;function c(d){if(i)return;i=!0,e&&e("fallback: applying",d);try{if(a)a.setAttribute("src","/static/img/fallback_video_notfound.gif");else t.src="/static/img/fallback_video_notfound.gif";t.load()}catch(_ce){}}function y(){if(o)clearTimeout(o),o=null}t.addEventListener("loadstart",function(){y(),o=setTimeout(function(){if(!i&&t.readyState<1)c("watchdog-timeout")},4000)}),["loadeddata","canplay","canplaythrough","play","playing"].forEach(function(d){t.addEventListener(d,y)}),t.addEventListener("error",function(){if(!i)c("error-event")}),setTimeout(function(){let d=a?a.getAttribute("src")||"":t.currentSrc||t.src||"";if(!i&&!d)c("empty-src")},0)}var qt=null;function De(t){if(window.Hls)return Promise.resolve(window.Hls);if(!t)return Promise.reject(Error("no hls.js url"));if(!qt)qt=new Promise(function(a,e){let i=document.createElement("script");i.src=t,i.async=!0,i.onload=function(){window.Hls?a(window.Hls):e(Error("hls.js not loaded"))},i.onerror=function(){e(Error("hls.js load failed"))},document.head.appendChild(i)});return qt}function ae(t){return{hlsSrc:t.getAttribute("data-hls-src")||"",hlsJsUrl:t.getAttribute("data-hls-js")||""}}function se(t){try{return!!t.canPlayType("application/vnd.apple.mpegurl")}catch(_ce){return!1}}function Ie(){return!!(window.MediaSource||window.ManagedMediaSource)}function oe(t,a){if(!a||!a.hlsSrc)return!1;return se(t)||!!a.hlsJsUrl&&Ie()}function ce(t,a,e,i){let o=a&&a.getAttribute("src")||"",c=null;function y(d){i&&i("abr: fallback to progressive",d);let w=t.currentTime||0,k=!t.paused;try{if(c)c.destroy()}catch(_ce){}c=null;try{if(t.removeAttribute("src"),a)a.setAttribute("src",o);if(t.load(),w>0)t.addEventListener("loadedmetadata",function(){t.currentTime=w},{once:!0});if(k)t.play().catch(function(){})}catch(_ce){}}if(se(t)){if(i&&i("abr: native hls",e.hlsSrc),a)a.setAttribute("src",e.hlsSrc);let d=function(){t.removeEventListener("error",d),y("native hls error")};t.addEventListener("error",d);return}De(e.hlsJsUrl).then(function(d){if(!d.isSupported()){i&&i("abr: hls.js unsupported");return}let w=t.currentTime||0;c=new d({startPosition:w>0?w:-1,capLevelToPlayerSize:!0}),c.on(d.Events.ERROR,function(k,A){if(A&&A.fatal)y("hls.js fatal: "+A.type+"/"+A.details)}),c.loadSource(e.hlsSrc),c.attachMedia(t),i&&i("abr: hls.js attached",e.hlsSrc)}).catch(function(d){i&&i("abr: hls.js unavailable",d)})}var gt=null;function Ve(){if(gt)return gt;try{if(typeof Intl<"u"&&Intl.DisplayNames)gt=new Intl.DisplayNames(["en"],{type:"language"})}catch(_ce){}return gt}function le(t,a){let e=String(t||"").trim();if(!e)return String(a||"");if(e.toLowerCase()==="auto")return"Auto";let i=e.split("-",1)[0].toLowerCase();try{let o=Ve();if(o&&typeof o.of==="function"){let c=o.of(i);if(c)return c.charAt(0).toUpperCase()+c.slice(1)}}catch(_ce){}return String(a||e)}function st(t){try{return t.textTracks?Array.prototype.filter.call(t.textTracks,function(a){return a.kind==="subtitles"||a.kind==="captions"}):[]}catch(_ce){return[]}}function ot(t){return st(t).length>0}function bt(t,a){let e=st(t);if(e.length===0)return null;let i=a<0||a>=e.length?0:a;return e[i]}function Ht(t,a,e){st(t).forEach(function(o,c){o.mode=c===a&&e?"hidden":"disabled"})}function ue(t,a){if(!a||!a.cues||a.cues.length===0)return"";let e=t.currentTime||0;for(let i=0;i<a.cues.length;i++){let o=a.cues[i];if(e>=o.startTime&&e<=o.endTime)return(o.text||"").replace(/\r/g,"")}return""}function Nt(t){return st(t).map(function(e,i){let o=String(e.language||e.srclang||"").toLowerCase(),c=String(e.label||o||"Lang "+(i+1)),y=le(o,c);return{index:i,lang:o,label:y}})}function Ft(t,a){let e=String(a||"").toLowerCase(),i=Nt(t);for(let o=0;o<i.length;o++){if(i[o].lang===e)return i[o].index;if(i[o].label.toLowerCase()===e)return i[o].index}return-1}function Dt(t,a,e,i){if(!t)return;while(t.firstChild)t.removeChild(t.firstChild);let o=document.createElement("button");o.type="button",o.className="yrp-menu-item",o.setAttribute("data-action","back"),o.textContent="← Back",e(o),t.appendChild(o);let c=document.createElement("button");c.type="button",c.className="yrp-menu-item",c.setAttribute("data-action","subs-on"),c.textContent="On"+(a?" ✓":""),i(c),t.appendChild(c);let y=document.createElement("button");y.type="button",y.className="yrp-menu-item",y.setAttribute("data-action","subs-off"),y.textContent="Off"+(!a?" ✓":""),i(y),t.appendChild(y)}function It(t,a,e,i,o,c){if(!t)return;while(t.firstChild)t.removeChild(t.firstChild);let y=document.createElement("button");y.type="button",y.className="yrp-menu-item",y.setAttribute("data-action","back"),y.textContent="← Back",i(y),t.appendChild(y);let d=c(y,t);t.appendChild(d);let w=Nt(a),k=bt(a,e),A=k&&(k.language||k.srclang)?String(k.language||k.srclang).toLowerCase():"",D=w.slice().sort(function(L,C){let V=(L.lang||"").toLowerCase(),R=(C.lang||"").toLowerCase();if(V==="auto"&&R!=="auto")return-1;if(R==="auto"&&V!=="auto")return 1;return(L.label||"").localeCompare(C.label||"")});if(D.forEach(function(L){let C=document.createElement("button");C.type="button",C.className="yrp-menu-item",C.setAttribute("data-action","select-lang"),C.setAttribute("data-lang",L.lang||"");let V=L.lang?` (${L.lang})`:"",R=L.index===e||L.lang&&A&&L.lang===A;C.textContent=L.label+V+(R?" ✓":""),o(C),d.appendChild(C)}),!D.length){let L=document.createElement("div");L.className="yrp-menu-title",L.style.marginTop="6px",L.style.fontSize="12px",L.style.opacity="0.8",L.textContent="No subtitles tracks",d.appendChild(L)}}function pe(t,a,e){if(!t)return;let i=ot(a);t.disabled=!i,t.style.visibility=i?"visible":"hidden",t.classList.toggle("no-tracks",!i),t.classList.toggle("has-tracks",i),t.classList.toggle("active",i&&e),t.classList.toggle("disabled-track",i&&!e),t.setAttribute("aria-pressed",e?"true":"false"),t.title=e?"Subtitles: on":"Subtitles: off",t.setAttribute("aria-label",e?"Subtitles enabled":"Subtitles disabled")}function de(t,a,e,i){if(!t||!t.box)return;let o=bt(a,e);Ht(a,e,i),t.box.textContent=i?ue(a,o):"",t.layer.style.display=i?"":"none"}function I(t){if(!t)return;try{t.style.background="transparent",t.style.backgroundColor="transparent",t.style.border="none",t.style.boxShadow="none",t.style.color="inherit",t.style.textAlign="left",t.style.width="100%",t.style.display="block"}catch(_ce){}}function U(t){I(t);try{t.style.background="rgba(255,255,255,0.12)",t.style.backgroundColor="rgba(255,255,255,0.12)",t.style.borderRadius="4px",t.style.fontWeight="700",t.style.marginBottom="6px",t.style.paddingLeft="8px",t.style.paddingRight="8px"}catch(_ce){}}function fe(t){try{t.classList.add("has-submenu")}catch(_ce){}}function ct(t,a){let e=document.createElement("div");e.className="yrp-menu-scroll";let i=300;if(a)try{let c=a.closest(".yrp-container");if(c){let y=c.querySelector(".yrp-video-wrap");if(y){let d=y.getBoundingClientRect().height,w=Math.floor(d*2/3)-34-50-20;if(w>150)i=w}}}catch(_ce){}Object.assign(e.style,{overflowY:"scroll",overflowX:"hidden",maxHeight:i+"px",minHeight:"100px",height:"auto",paddingRight:"8px",paddingLeft:"2px",marginTop:"4px",pointerEvents:"auto",position:"relative",display:"block",boxSizing:"border-box",WebkitOverflowScrolling:"touch"});let o=document.createElement("style");if(o.textContent=`
     .yrp-menu-scroll {
       scrollbar-width: thin;
       scrollbar-color: rgba(255,255,255,0.4) rgba(255,255,255,0.1);
@@ -26,4 +26,4 @@
       background: rgba(255,255,255,0.8);
       background-clip: padding-box;
     }
-  `,document.querySelector("#yrp-embed-menu-scroll-style")||(o.id="yrp-embed-menu-scroll-style",document.head.appendChild(o)),e.addEventListener("wheel",function(l){let y=e.scrollTop===0,g=e.scrollTop+e.clientHeight>=e.scrollHeight-1;(l.deltaY<0&&!y||l.deltaY>0&&!g||!y&&!g)&&l.stopPropagation()},{passive:!1}),e}function Te(n){if(n)try{let i=n.querySelector('.yrp-menu-section[data-section="subtitles"]');i&&i.parentNode&&i.parentNode.removeChild(i)}catch(i){}}function G(n,i,e,a={}){if(!n)return null;let o=n.querySelector(".yrp-menu-section")||null,l=document.createElement("button");return l.type="button",l.className="yrp-menu-item",l.setAttribute("data-action",e),l.textContent=i,F(l),a.disabled===!0&&(l.disabled=!0,l.style.opacity="0.6"),a.hasSubmenu===!0&&ve(l),o&&o.parentNode===n?n.insertBefore(l,o):n.appendChild(l),l}function Pe(){return[.5,.75,1,1.25,1.5,2]}function Dt(n,i,e,a){if(!n)return;for(;n.firstChild;)n.removeChild(n.firstChild);let o=document.createElement("button");o.type="button",o.className="yrp-menu-item",o.setAttribute("data-action","back"),o.textContent="\u2190 Back",e(o),n.appendChild(o);let l=isFinite(i.playbackRate)?i.playbackRate:1;Pe().forEach(function(y){let g=document.createElement("button");g.type="button",g.className="yrp-menu-item",g.setAttribute("data-action","set-speed"),g.setAttribute("data-speed",String(y)),g.textContent=(y===1?"1.0x":String(y)+"x")+(Math.abs(y-l)<.001?" \u2713":""),a(g),n.appendChild(g)})}function It(n,i){let e=parseFloat(String(i));if(!(!isFinite(e)||e<=0)){n.playbackRate=e;try{localStorage.setItem("playback_speed",String(e))}catch(a){}}}var gt=class{constructor(i){this.menu=i,this.menuView="main",this.menuMainHTML="",this.menuFixedMinHeight=0}ensureMainSnapshot(){this.menu&&(this.menuMainHTML||(this.menuMainHTML=this.menu.innerHTML||""))}lockHeightFromCurrent(){if(this.menu&&!(this.menuFixedMinHeight>0))try{let i=this.menu.getBoundingClientRect();this.menuFixedMinHeight=Math.ceil(i.height||0),this.menuFixedMinHeight>0&&(this.menu.style.minHeight=this.menuFixedMinHeight+"px")}catch(i){}}resetHeightLock(){this.menu&&(this.menuFixedMinHeight=0,this.menu.style.minHeight="")}setView(i){this.menuView=i}getView(){return this.menuView}openMainView(i){if(this.menu){this.ensureMainSnapshot(),this.menu.innerHTML=this.menuMainHTML,this.menuView="main",this.menu.style.maxHeight="";try{let e=this.menu.querySelector('.yrp-menu-section[data-section="speed"]');e&&e.parentNode&&e.parentNode.removeChild(e)}catch(e){}Te(this.menu),i&&(i.injectSpeed&&i.injectSpeed(),i.injectLanguages&&i.injectLanguages(),i.injectSubtitles&&i.injectSubtitles(),i.injectQuality&&i.injectQuality(),i.injectDownload&&i.injectDownload())}}constrainToPlayerHeight(i=2/3){if(this.menu)try{let e=this.menu.closest(".yrp-container");if(e){let a=e.querySelector(".yrp-video-wrap");if(a){let o=a.getBoundingClientRect().height,l=Math.floor(o*i)-34;l>100&&(this.menu.style.maxHeight=l+"px")}}}catch(e){}}};var Fe={};function qe(){try{let i=new URL(Fe.url).pathname.match(/\/static\/players\/([^\/]+)\//);if(i)return i[1]}catch(n){}try{let i=(document.currentScript&&document.currentScript.src||"").match(/\/static\/players\/([^\/]+)\//);if(i)return i[1]}catch(n){}try{let n=document.querySelector(".player-host[data-player]");if(n){let i=String(n.getAttribute("data-player")||"").trim();if(i)return i}}catch(n){}return"yurtube"}function Vt(){let n=qe(),i="/static/players/"+n,e=document.querySelectorAll('.player-host[data-player="'+n+'"]');e.length!==0&&fetch(i+"/templates/player.html",{credentials:"same-origin"}).then(a=>a.text()).then(function(a){for(let o=0;o<e.length;o++)Ne(e[o],a,i)}).catch(function(){})}function Ne(n,i,e){n.innerHTML=i;let a=n.querySelector(".yrp-container"),o=a.querySelector(".yrp-video-wrap"),l=a.querySelector(".yrp-video"),y=a.querySelector(".yrp-controls"),g=l.querySelector("source"),E=a.querySelector(".yrp-autoplay");E&&(E.style.display="none");let M=z(n,"data-options",{}),P=/\byrpdebug=1\b/i.test(location.search)||!!(M&&M.debug);function D(){if(P)try{}catch(x){}}a.classList.add("yrp-embed"),a.setAttribute("tabindex","0");let L=n.getAttribute("data-video-src")||"",C=n.getAttribute("data-poster-url")||"",I=n.getAttribute("data-video-id")||"",V=z(n,"data-subtitles",[]),H=n.getAttribute("data-sprites-vtt")||"",_=n.getAttribute("data-caption-vtt")||"",Z=n.getAttribute("data-caption-lang")||"",tt=z(n,"data-sources",[]),st=String(n.getAttribute("data-permit-download")||"").trim()==="1",J=z(n,"data-download-items",[]);g&&g.setAttribute("src",L),C&&l.setAttribute("poster",C),M&&M.autoplay&&l.setAttribute("autoplay",""),M&&M.muted&&l.setAttribute("muted",""),M&&M.loop&&l.setAttribute("loop",""),I&&a.setAttribute("data-video-id",I),H&&a.setAttribute("data-sprites-vtt",H),l.setAttribute("playsinline",""),Array.isArray(V)&&V.forEach(function(x){if(!x||!x.src)return;let A=document.createElement("track");A.setAttribute("kind","subtitles"),x.srclang&&A.setAttribute("srclang",String(x.srclang)),x.label&&A.setAttribute("label",String(x.label)),A.setAttribute("src",String(x.src)),x.default&&A.setAttribute("default",""),l.appendChild(A)});let v=a.querySelector(".yrp-subtitles");if(_)try{let x=document.createElement("track");x.setAttribute("kind","subtitles"),x.setAttribute("src",_),x.setAttribute("srclang",Z||"auto"),x.setAttribute("label",Z||"Original"),x.setAttribute("default",""),l.appendChild(x)}catch(x){D("caption track append failed",x)}try{l.load(),D("video.load() called",{src:L})}catch(x){D("video.load() error",x)}ne(l,g,D);let c=e+"/img/buttons";a.style.setProperty("--icon-play",'url("'+c+'/play.svg")'),a.style.setProperty("--icon-pause",'url("'+c+'/pause.svg")'),a.style.setProperty("--icon-prev",'url("'+c+'/prev.svg")'),a.style.setProperty("--icon-next",'url("'+c+'/next.svg")'),a.style.setProperty("--icon-vol",'url("'+c+'/volume.svg")'),a.style.setProperty("--icon-mute",'url("'+c+'/mute.svg")'),a.style.setProperty("--icon-cc",'url("'+c+'/cc.svg")'),a.style.setProperty("--icon-mini",'url("'+c+'/mini.svg")'),a.style.setProperty("--icon-settings",'url("'+c+'/settings.svg")'),a.style.setProperty("--icon-theater",'url("'+c+'/theater.svg")'),a.style.setProperty("--icon-full",'url("'+c+'/full.svg")'),a.classList.add("yrp-icons-ready");let K=a.querySelector(".yrp-center-logo");K&&K.setAttribute("src",e+"/img/logo.png"),He(a,o,l,y,H,P,v,{sources:Array.isArray(tt)?tt:[],permitDownload:!!st,downloadItems:Array.isArray(J)?J:[]})}function He(n,i,e,a,o,l,y,g){function E(){if(l)try{}catch(t){}}let M=n.querySelector(".yrp-center-play"),P=n.querySelector(".yrp-play"),D=n.querySelector(".yrp-vol-btn"),L=n.querySelector(".yrp-volume"),C=n.querySelector(".yrp-vol-slider"),I=n.querySelector(".yrp-time-current"),V=n.querySelector(".yrp-time-total"),H=n.querySelector(".yrp-progress"),_=n.querySelector(".yrp-progress-rail"),Z=n.querySelector(".yrp-progress-buffer"),tt=n.querySelector(".yrp-progress-played"),st=n.querySelector(".yrp-progress-handle"),J=n.querySelector(".yrp-progress-tooltip"),v=n.querySelector(".yrp-settings"),c=n.querySelector(".yrp-menu"),K=n.querySelector(".yrp-fullscreen"),x=n.querySelector(".yrp-pip"),A=n.querySelector(".yrp-context"),bt=!1,U=0,xt=null,$=!1,se=!1,X=g&&Array.isArray(g.sources)?g.sources:[],oe=!!(g&&g.permitDownload),wt=g&&Array.isArray(g.downloadItems)?g.downloadItems:[],m=new gt(c),O=!0,Y=0,Rt=function(){try{return String(localStorage.getItem("subtitle_lang")||"")}catch(t){return""}}(),St=function(){try{return parseFloat(localStorage.getItem("playback_speed")||"")}catch(t){return NaN}}(),Ot=n.getAttribute("data-video-id")||"",Bt=Ot?"yrp:quality:"+Ot:"yrp:quality",jt=function(){try{return String(localStorage.getItem(Bt)||"")}catch(t){return""}}();function ce(t){let r=document.createElement("div");r.className="yrp-embed-captions-layer",Object.assign(r.style,{position:"absolute",left:"50%",top:"80%",transform:"translate(-50%,-50%)",zIndex:"21",pointerEvents:"auto",userSelect:"none",touchAction:"none"});let s=document.createElement("div");s.className="yrp-embed-captions-text",r.appendChild(s),getComputedStyle(t).position==="static"&&(t.style.position="relative"),t.appendChild(r);let u={active:!1,sx:0,sy:0},d=null;function f(){return t.getBoundingClientRect()}function S(b){if(u.active){if(u.active=!1,d&&(clearTimeout(d),d=null),b&&b.preventDefault)try{b.preventDefault()}catch(N){}if(b&&b.stopPropagation)try{b.stopPropagation()}catch(N){}}}function h(b){u.active=!0,u.sx=b.clientX,u.sy=b.clientY;try{r.setPointerCapture&&r.setPointerCapture(b.pointerId)}catch(N){}d&&(clearTimeout(d),d=null),b.preventDefault(),b.stopPropagation()}function k(b){if(!u.active)return;let N=b.clientX-u.sx,W=b.clientY-u.sy,R=f(),q=r.getBoundingClientRect(),Tt=q.left+q.width/2+N,Pt=q.top+q.height/2+W,Gt=q.width/2,Zt=q.height/2;Tt=Math.min(Math.max(Tt,R.left+Gt),R.right-Gt),Pt=Math.min(Math.max(Pt,R.top+Zt),R.bottom-Zt);let Ce=(Tt-R.left)/R.width*100,ke=(Pt-R.top)/R.height*100;r.style.left=Ce+"%",r.style.top=ke+"%",r.style.transform="translate(-50%,-50%)",u.sx=b.clientX,u.sy=b.clientY,b.preventDefault(),b.stopPropagation()}function w(){d&&clearTimeout(d),d=setTimeout(function(){S(new Event("leaveguard"))},200)}return r.addEventListener("pointerdown",h),document.addEventListener("pointermove",k),document.addEventListener("pointerup",S),document.addEventListener("pointercancel",S),document.addEventListener("mouseup",S),document.addEventListener("touchend",S),t.addEventListener("pointerleave",w),r.addEventListener("click",function(b){b.stopPropagation()}),{layer:r,box:s}}let ue=ce(i);function le(){return ht(e,Y)}function Lt(){qt(e,Y,O)}function Q(){ae(ue,e,Y,O)}function ot(){ie(y,e,O)}function pe(t){let r=Nt(e,t);if(r>=0){Y=r,O=!0;try{localStorage.setItem("subtitle_lang",String(t||""))}catch(s){}Lt(),Q(),ot()}}function _t(t){O=!!t,Lt(),Q(),ot()}function Kt(){try{let t=e.querySelector("source");return t&&t.getAttribute("src")?String(t.getAttribute("src")||""):""}catch(t){return""}}function Ut(t,r){if(!t)return;let s=Kt();if(s&&s===t)return;let p=!e.paused,u=Math.max(0,e.currentTime||0),d=isFinite(e.playbackRate)&&e.playbackRate>0?e.playbackRate:1,f=isFinite(e.volume)?e.volume:1,S=!!e.muted,h=e.querySelector("source");if(!h)return;try{localStorage.setItem(Bt,String(t))}catch(w){}try{h.setAttribute("src",String(t));try{h.src=String(t)}catch(w){}e.load()}catch(w){}let k=function(){e.removeEventListener("loadedmetadata",k);try{e.playbackRate=d}catch(w){}try{e.volume=f}catch(w){}try{e.muted=S}catch(w){}try{let w=isFinite(e.duration)?e.duration:0;if(w>0){let b=Math.min(u,Math.max(0,w-.25));e.currentTime=b}}catch(w){}if(p)try{e.play().catch(function(){})}catch(w){}};e.addEventListener("loadedmetadata",k),r&&E("switch quality",{src:t,label:r})}function de(){if(!(!X||X.length<2)&&jt)for(let t=0;t<X.length;t++){let r=X[t];if(!r)continue;let s=String(r.src||"");if(s&&s===jt){Ut(s,r.label||"");return}}}let et=[],ct=!1,ut=!1,B=null,lt=0;function Xt(t){let r=String(t||"").match(/^(\d{2}):(\d{2}):(\d{2}\.\d{3})$/);if(!r)return 0;let s=parseInt(r[1],10),p=parseInt(r[2],10),u=parseFloat(r[3]);return s*3600+p*60+u}function fe(t){if(!t)return"";if(/^https?:\/\//i.test(t)||t.startsWith("/"))return t;try{return new URL(o,window.location.origin).pathname.replace(/\/sprites\.vtt$/,"")+"/"+t.replace(/^\/+/,"")}catch(r){return t}}function me(){return B||(H?(B=document.createElement("div"),B.className="yrp-sprite-pop",Object.assign(B.style,{position:"absolute",bottom:"calc(100% + 30px)",left:"0",display:"none",width:"160px",height:"90px",border:"1px solid #333",background:"#000",overflow:"hidden",zIndex:"5"}),getComputedStyle(H).position==="static"&&(H.style.position="relative"),H.appendChild(B),B):null)}function Yt(){!o||ct||ut||fetch(o,{credentials:"same-origin"}).then(t=>t.text()).then(function(t){let r=t.split(/\r?\n/);for(let s=0;s<r.length;s++){let p=r[s].trim();if(p&&p.indexOf("-->")>=0){let u=p.split("-->").map(q=>q.trim());if(u.length<2)continue;let d=Xt(u[0]),f=Xt(u[1]),S=(r[s+1]||"").trim(),h="",k=0,w=0,b=0,N=0,W=S.indexOf("#xywh=");if(W>0){h=S.substring(0,W);let q=S.substring(W+6).split(",");q.length===4&&(k=parseInt(q[0],10),w=parseInt(q[1],10),b=parseInt(q[2],10),N=parseInt(q[3],10))}let R=fe(h);et.push({start:d,end:f,spriteUrl:R,x:k,y:w,w:b,h:N}),f>lt&&(lt=f),s++}}ct=!0,E("embed sprites VTT loaded",{cues:et.length,durationApprox:lt})}).catch(function(t){ut=!0,E("embed sprites VTT load failed",t)})}function ye(t){if(!o||!et.length||!_)return;let r=_.getBoundingClientRect(),s=Math.max(0,Math.min(t-r.left,r.width)),p=r.width>0?s/r.width:0,u=(U||lt||0)*p,d=null;for(let k=0;k<et.length;k++){let w=et[k];if(u>=w.start&&u<w.end){d=w;break}}let f=me();if(!f)return;if(!d||!d.spriteUrl||d.w<=0||d.h<=0){f.style.display="none";return}for(;f.firstChild;)f.removeChild(f.firstChild);let S=document.createElement("img");S.src=d.spriteUrl,Object.assign(S.style,{position:"absolute",left:-d.x+"px",top:-d.y+"px"}),f.appendChild(S),f.style.display="block";let h=Math.max(0,Math.min(r.width-d.w,s-d.w/2));f.style.left=h+"px",f.style.width=d.w+"px",f.style.height=d.h+"px"}function T(){n.classList.remove("autohide"),xt&&clearTimeout(xt),xt=setTimeout(function(){n.classList.add("autohide")},1800)}function he(){try{let t=window.innerHeight||document.documentElement.clientHeight||n.clientHeight||0;if(t<=0)return;i.style.height=t+"px",e.style.height="100%",e.style.width="100%",e.style.objectFit="contain"}catch(t){}}function Qt(){try{U=isFinite(e.duration)?e.duration:0}catch(t){U=0}V&&(V.textContent=dt(U)),I&&(I.textContent=dt(e.currentTime||0))}function Ct(){let t=U||0,r=e.currentTime||0,s=t>0?Math.max(0,Math.min(r/t,1)):0;tt&&(tt.style.width=(s*100).toFixed(3)+"%"),st&&(st.style.left=(s*100).toFixed(3)+"%");let p=0;if(e.buffered&&e.buffered.length>0)try{p=e.buffered.end(e.buffered.length-1)}catch(d){p=0}let u=t>0?Math.max(0,Math.min(p/t,1)):0;Z&&(Z.style.width=(u*100).toFixed(3)+"%")}function nt(){let t=e.muted?0:e.volume,r=e.muted||t===0?"Mute":"Vol",s=n.querySelector(".yrp-vol-btn");s&&(s.textContent=r,s.classList.toggle("icon-mute",r==="Mute"),s.classList.toggle("icon-vol",r!=="Mute"))}function kt(){e.muted=!e.muted,nt()}function Et(){e.paused?e.play().catch(function(){}):e.pause()}function Wt(t){let r=_.getBoundingClientRect(),s=Math.max(0,Math.min(t-r.left,r.width)),p=r.width>0?s/r.width:0,u=(U||0)*p;e.currentTime=u}function ge(t){let r=J;if(!r)return;let s=_.getBoundingClientRect(),p=Math.max(0,Math.min(t-s.left,s.width)),u=s.width>0?p/s.width:0,d=(U||0)*u;r.textContent=dt(d),r.style.left=(u*100).toFixed(3)+"%",r.hidden=!1}function Jt(){if(!c)return;for(;c.firstChild;)c.removeChild(c.firstChild);let t=document.createElement("button");t.type="button",t.className="yrp-menu-item",t.setAttribute("data-action","back"),t.textContent="\u2190 Back",j(t),c.appendChild(t);let r=Kt(),s=at(t,c);c.appendChild(s),X.forEach(function(p){if(!p)return;let u=String(p.src||"");if(!u)return;let d=String(p.label||p.preset||"Quality"),f=document.createElement("button");f.type="button",f.className="yrp-menu-item",f.setAttribute("data-action","set-quality"),f.setAttribute("data-src",u),f.textContent=d+(r===u?" \u2713":""),F(f),s.appendChild(f)}),m.setView("quality"),m.constrainToPlayerHeight(2/3)}function $t(){if(!c)return;for(;c.firstChild;)c.removeChild(c.firstChild);let t=document.createElement("button");t.type="button",t.className="yrp-menu-item",t.setAttribute("data-action","back"),t.textContent="\u2190 Back",j(t),c.appendChild(t);let r=at(t,c);c.appendChild(r),(wt||[]).forEach(function(s){if(!s)return;let p=String(s.url||"");if(!p)return;let u=String(s.label||"Download"),d=String(s.filename||""),f=document.createElement("button");f.type="button",f.className="yrp-menu-item",f.setAttribute("data-action","do-download"),f.setAttribute("data-url",p),d&&f.setAttribute("data-filename",d),f.textContent=u,F(f),r.appendChild(f)}),m.setView("download"),m.constrainToPlayerHeight(2/3)}function At(){m.openMainView({injectSpeed:function(){c.querySelector('.yrp-menu-item[data-action="open-speed"]')||G(c,"Speed","open-speed",{hasSubmenu:!0})},injectLanguages:function(){c.querySelector('.yrp-menu-item[data-action="open-langs"]')||G(c,"Languages","open-langs",{hasSubmenu:!0})},injectSubtitles:function(){let t=it(e);if(!c.querySelector('.yrp-menu-item[data-action="open-subs"]')){let r=G(c,"Subtitles","open-subs",{hasSubmenu:!0,disabled:!t});r&&!t&&(r.title="No subtitles tracks")}},injectQuality:function(){c.querySelector('.yrp-menu-item[data-action="open-quality"]')||!X||X.length<2||G(c,"Quality","open-quality",{hasSubmenu:!0})},injectDownload:function(){c.querySelector('.yrp-menu-item[data-action="open-download"]')||oe&&(!wt||wt.length===0||G(c,"Download","open-download",{hasSubmenu:!0}))}});try{let t=c.querySelector('.yrp-menu-section[data-section="quality"]');t&&t.parentNode&&t.parentNode.removeChild(t)}catch(t){}try{let t=c.querySelector(".yrp-menu-item.quality-future");t&&t.parentNode&&t.parentNode.removeChild(t)}catch(t){}}let zt="",rt=0;function be(){c&&(zt||(zt=c.innerHTML||""))}function xe(){if(c&&!(rt>0))try{let t=c.getBoundingClientRect();rt=Math.ceil(t.height||0),rt>0&&(c.style.minHeight=rt+"px")}catch(t){}}function we(){c&&(rt=0,c.style.minHeight="")}function Mt(){c&&(c.hidden=!0,v&&v.setAttribute("aria-expanded","false")),A&&(A.hidden=!0),n.classList.remove("vol-open"),m.setView("main"),m.resetHeightLock()}function vt(){if(!P)return;let t=!e.paused;P.classList.toggle("icon-play",!t),P.classList.toggle("icon-pause",t),P.setAttribute("aria-label",t?"Pause (Space, K)":"Play (Space, K)"),P.title=t?"Pause (Space, K)":"Play (Space, K)",P.textContent=""}(function(){let t=function(){try{let r=localStorage.getItem("yrp:volume");return r?JSON.parse(r):null}catch(r){return null}}();t&&typeof t.v=="number"&&(e.volume=Math.max(0,Math.min(t.v,1))),t&&typeof t.m=="boolean"&&(e.muted=!!t.m),C&&(C.value=String(e.volume||1)),nt(),e.addEventListener("volumechange",function(){if(!(se&&e.muted&&!$))try{localStorage.setItem("yrp:volume",JSON.stringify({v:Math.max(0,Math.min(e.volume||0,1)),m:!!e.muted}))}catch(r){}}),e.addEventListener("loadedmetadata",function r(){if(e.removeEventListener("loadedmetadata",r),$)return;let s=function(){try{let p=localStorage.getItem("yrp:volume");return p?JSON.parse(p):null}catch(p){return null}}();s&&(typeof s.v=="number"&&(e.volume=Math.max(0,Math.min(s.v,1))),typeof s.m=="boolean"&&(e.muted=!!s.m),C&&(C.value=String(e.volume||1)),nt())})})(),function(){try{let t=localStorage.getItem("yrp:speed");if(t){let r=parseFloat(t);isFinite(r)&&r>0&&(e.playbackRate=r)}}catch(t){}isFinite(St)&&St>0&&It(St),e.addEventListener("ratechange",function(){try{localStorage.setItem("yrp:speed",String(e.playbackRate))}catch(t){}try{localStorage.setItem("playback_speed",String(e.playbackRate))}catch(t){}})}(),function(){let t=n.getAttribute("data-video-id")||"";if(!t)return;function r(){try{let h=localStorage.getItem("yrp:resume");return h?JSON.parse(h):{}}catch(h){return{}}}function s(h){try{localStorage.setItem("yrp:resume",JSON.stringify(h))}catch(k){}}let p=r(),u=p[t],d=Date.now();function f(h){let k=isFinite(e.duration)?e.duration:0;if(k&&h>10&&h<k-5)try{e.currentTime=h}catch(w){}}if(u&&typeof u.t=="number"&&d-(u.ts||0)<180*24*3600*1e3){let h=Math.max(0,u.t|0);isFinite(e.duration)&&e.duration>0?f(h):e.addEventListener("loadedmetadata",function k(){e.removeEventListener("loadedmetadata",k),f(h)})}let S=te(function(){let h=isFinite(e.duration)?e.duration:0,k=Math.max(0,Math.floor(e.currentTime||0)),w=r();w[t]={t:k,ts:Date.now(),d:h};let b=Object.keys(w);if(b.length>200){b.sort(function(N,W){return(w[N].ts||0)-(w[W].ts||0)});for(let N=0;N<b.length-200;N++)delete w[b[N]]}s(w)},3e3);e.addEventListener("timeupdate",function(){!e.paused&&!e.seeking&&S()}),e.addEventListener("ended",function(){let h=r();delete h[t],s(h)})}(),function(){let t=n.closest(".player-host")||n,r=z(t,"data-options",null),s=!!(r&&Object.prototype.hasOwnProperty.call(r,"autoplay")&&r.autoplay);if(E("autoplay check (embed)",{WANT:s,opt:r}),!s)return;function p(f){E("tryPlaySequence",{reason:f,muted:e.muted,rs:e.readyState});let S=null;try{S=e.play()}catch(h){E("play() threw sync",h),S=null}S&&typeof S.then=="function"?S.then(function(){E("play() resolved")}).catch(function(h){if(E("play() rejected",{name:h&&h.name,msg:h&&h.message}),!e.muted){e.muted=!0,e.setAttribute("muted","");try{e.play().catch(function(k){E("retry rejected",k)})}catch(k){E("retry threw sync",k)}}}):setTimeout(function(){if(e.paused){e.muted=!0,e.setAttribute("muted","");try{e.play().catch(function(h){E("no-promise fallback rejected",h)})}catch(h){E("no-promise fallback threw",h)}}},0)}let u=!1;function d(f){u||(u=!0,p(f))}e.readyState>=1&&d("readyState>=1"),["loadedmetadata","loadeddata","canplay","canplaythrough"].forEach(function(f){let S=function(){e.removeEventListener(f,S),d(f)};e.addEventListener(f,S)}),setTimeout(function(){e.paused&&p("watchdog")},1200)}(),M&&M.addEventListener("click",function(){Et()}),P&&P.addEventListener("click",function(){Et()}),e.addEventListener("click",function(){Et()}),e.addEventListener("play",function(){n.classList.add("playing"),vt()}),e.addEventListener("pause",function(){n.classList.remove("playing"),vt()}),D&&D.addEventListener("click",function(t){t.preventDefault(),t.stopPropagation(),$=!0,kt(),n.classList.add("vol-open"),T(),setTimeout(function(){n.classList.remove("vol-open")},800)}),a&&a.addEventListener("click",function(t){let r=t.target;r&&r.nodeType===3&&r.parentNode&&(r=r.parentNode),r&&r.classList&&r.classList.contains("yrp-vol-btn")&&(t.preventDefault(),t.stopPropagation(),$=!0,kt(),n.classList.add("vol-open"),T(),setTimeout(function(){n.classList.remove("vol-open")},800))},!0),C&&C.addEventListener("input",function(){$=!0;let t=parseFloat(C.value||"1");isFinite(t)||(t=1),t=Math.max(0,Math.min(t,1)),e.volume=t,t>0&&(e.muted=!1),nt(),n.classList.add("vol-open"),T()}),L&&L.addEventListener("wheel",function(t){t.preventDefault(),$=!0;let r=.05,s=e.muted?0:e.volume,p=Math.max(0,Math.min(s+(t.deltaY<0?r:-r),1));e.volume=p,p>0&&(e.muted=!1),C&&(C.value=String(p)),nt(),n.classList.add("vol-open"),T()},{passive:!1}),H&&_&&(H.addEventListener("mousedown",function(t){bt=!0,Wt(t.clientX),T()}),window.addEventListener("mousemove",function(t){bt&&Wt(t.clientX)}),window.addEventListener("mouseup",function(){bt=!1}),H.addEventListener("mousemove",function(t){ge(t.clientX),o&&ct&&!ut?ye(t.clientX):o&&!ct&&!ut&&Yt()}),H.addEventListener("mouseleave",function(){J&&(J.hidden=!0),B&&(B.style.display="none")})),v&&c&&(be(),v.addEventListener("click",function(t){t.preventDefault(),t.stopPropagation(),!c.hidden?(c.hidden=!0,v.setAttribute("aria-expanded","false"),m.setView("main"),we()):(Mt(),At(),c.hidden=!1,v.setAttribute("aria-expanded","true"),n.classList.add("vol-open"),T(),xe())}),c.addEventListener("click",function(t){let r=t.target&&t.target.closest?t.target.closest(".yrp-menu-item"):null;if(!r||!c.contains(r))return;let s=r.getAttribute("data-action")||"",p=r.getAttribute("data-lang")||"";if(m.getView()==="main"){if(s==="open-speed"){t.preventDefault(),t.stopPropagation(),Dt(c,e,j,F),m.setView("speed"),m.lockHeightFromCurrent(),n.classList.add("vol-open"),T();return}if(s==="open-langs"){t.preventDefault(),t.stopPropagation(),Ft(c,e,Y,j,F,at),m.setView("langs"),m.lockHeightFromCurrent(),n.classList.add("vol-open"),T();return}if(s==="open-subs"){if(t.preventDefault(),t.stopPropagation(),!it(e))return;Ht(c,O,j,F),m.setView("subs"),m.lockHeightFromCurrent(),n.classList.add("vol-open"),T();return}if(s==="open-quality"){t.preventDefault(),t.stopPropagation(),Jt(),m.lockHeightFromCurrent(),n.classList.add("vol-open"),T();return}if(s==="open-download"){t.preventDefault(),t.stopPropagation(),$t(),m.lockHeightFromCurrent(),n.classList.add("vol-open"),T();return}return}if(s==="back"){t.preventDefault(),t.stopPropagation(),At(),m.lockHeightFromCurrent(),n.classList.add("vol-open"),T();return}if(m.getView()==="speed"&&s==="set-speed"){let u=parseFloat(r.getAttribute("data-speed")||"NaN");if(!isNaN(u)){t.preventDefault(),t.stopPropagation(),It(e,u),c.hidden=!0,v.setAttribute("aria-expanded","false"),m.setView("main"),m.resetHeightLock();return}}if(m.getView()==="langs"&&s==="select-lang"&&p){t.preventDefault(),t.stopPropagation(),pe(p),c.hidden=!0,v.setAttribute("aria-expanded","false"),m.setView("main"),m.resetHeightLock();return}if(m.getView()==="subs"){if(s==="subs-on"){t.preventDefault(),t.stopPropagation(),_t(!0),c.hidden=!0,v.setAttribute("aria-expanded","false"),m.setView("main"),m.resetHeightLock();return}if(s==="subs-off"){t.preventDefault(),t.stopPropagation(),_t(!1),c.hidden=!0,v.setAttribute("aria-expanded","false"),m.setView("main"),m.resetHeightLock();return}}if(m.getView()==="quality"&&s==="set-quality"){t.preventDefault(),t.stopPropagation();let u=String(r.getAttribute("data-src")||""),d=String(r.textContent||"").replace(/\s*✓\s*$/,"");u&&Ut(u,d),c.hidden=!0,v.setAttribute("aria-expanded","false"),m.setView("main"),m.resetHeightLock();return}if(m.getView()==="download"&&s==="do-download"){t.preventDefault(),t.stopPropagation();let u=String(r.getAttribute("data-url")||"");if(u)try{window.open(u,"_blank","noopener")}catch(d){window.location.href=u}c.hidden=!0,v.setAttribute("aria-expanded","false"),m.setView("main"),m.resetHeightLock();return}}),document.addEventListener("click",function(t){!c.hidden&&!c.contains(t.target)&&t.target!==v&&(c.hidden=!0,v.setAttribute("aria-expanded","false"),m.setView("main"),m.resetHeightLock())}),document.addEventListener("keydown",function(t){(t.code==="Escape"||(t.key||"").toLowerCase()==="escape")&&(c.hidden||(c.hidden=!0,v.setAttribute("aria-expanded","false"),m.setView("main"),m.resetHeightLock()))})),K&&K.addEventListener("click",function(){document.fullscreenElement?document.exitFullscreen().catch(function(){}):n.requestFullscreen&&n.requestFullscreen().catch(function(){})}),x&&x.addEventListener("click",function(t){t.preventDefault(),t.stopPropagation();try{if(document.pictureInPictureEnabled&&e.requestPictureInPicture&&!e.disablePictureInPicture)if(document.pictureInPictureElement===e)document.exitPictureInPicture().catch(function(){});else{let r=e.paused,s=e.muted,p=Promise.resolve();r&&(e.muted=!0,p=e.play().catch(function(){})),p.then(function(){return e.requestPictureInPicture()}).catch(function(){}).then(function(){r&&(e.pause(),e.muted=s)})}}catch(r){}}),n.addEventListener("contextmenu",function(t){if(t.preventDefault(),Mt(),!A)return;let r=n.getBoundingClientRect();A.style.left=t.clientX-r.left+"px",A.style.top=t.clientY-r.top+"px",A.hidden=!1,n.classList.add("vol-open"),T()}),A&&(A.addEventListener("click",function(t){let r=t.target&&t.target.getAttribute("data-action"),s=Math.floor(e.currentTime||0),p=n.getAttribute("data-video-id")||"";if(r==="pip")x&&x.click();else if(r==="copy-url"){let u=new URL(window.location.href);u.searchParams.delete("t"),ft(u.toString())}else if(r==="copy-url-time"){let u=new URL(window.location.href);u.searchParams.set("t",String(s)),ft(u.toString())}else if(r==="copy-embed"){let d='<iframe width="560" height="315" src="'+((window.location.origin||"")+"/embed?v="+encodeURIComponent(p||""))+'" frameborder="0" allow="autoplay; encrypted-media; clipboard-write" allowfullscreen></iframe>';ft(d)}A.hidden=!0}),document.addEventListener("click",function(t){!A.hidden&&!A.contains(t.target)&&(A.hidden=!0)}),document.addEventListener("keydown",function(r){(r.code==="Escape"||(r.key||"").toLowerCase()==="escape")&&(A.hidden||(A.hidden=!0))}));function Se(t){let r=t.target,s=r&&r.tagName?r.tagName.toUpperCase():"";if(r&&(r.isContentEditable||s==="INPUT"||s==="TEXTAREA")||t.ctrlKey||t.metaKey||t.altKey)return;let p=t.code,u=(t.key||"").toLowerCase();if(p==="Space"||p==="Enter"||p==="NumpadEnter"||p==="MediaPlayPause"||p==="KeyK"||u==="k"){t.preventDefault(),e.paused?e.play().catch(function(){}):e.pause();return}if(p==="ArrowLeft"||p==="KeyJ"||u==="j"){t.preventDefault(),e.currentTime=Math.max(0,(e.currentTime||0)-5);return}if(p==="ArrowRight"||p==="KeyL"||u==="l"){t.preventDefault();let d=isFinite(e.duration)?e.duration:1e9;e.currentTime=Math.min((e.currentTime||0)+5,d);return}if(p==="KeyM"||u==="m"){t.preventDefault(),kt();return}if(p==="KeyF"||u==="f"){t.preventDefault(),K&&K.click();return}if(p==="KeyI"||u==="i"){t.preventDefault(),x&&x.click();return}if(p==="Escape"||u==="escape"){Mt();return}}document.addEventListener("keydown",Se),["mouseenter","mousemove","pointermove","touchstart"].forEach(function(t){(a||n).addEventListener(t,function(){try{n.focus()}catch(r){}T()},{passive:!0})}),n.addEventListener("mouseleave",function(){setTimeout(function(){n.classList.add("autohide")},600)});function pt(){he()}window.addEventListener("resize",pt),setTimeout(pt,0),setTimeout(pt,100);function Le(){try{let t=le();if(!t)return;t.addEventListener("cuechange",Q),t.addEventListener("load",Q)}catch(t){}}e.addEventListener("loadedmetadata",function(){if(Rt){let t=Nt(e,Rt);t>=0&&(Y=t)}if(Lt(),Q(),ot(),Le(),Qt(),Ct(),pt(),Yt(),vt(),c&&!c.hidden){let t=m.getView();t==="main"?At():t==="langs"?(Ft(c,e,Y,j,F,at),m.setView("langs")):t==="speed"?(Dt(c,e,j,F),m.setView("speed")):t==="subs"?(Ht(c,O,j,F),m.setView("subs")):t==="quality"?Jt():t==="download"&&$t()}}),setTimeout(de,0),e.addEventListener("timeupdate",function(){Qt(),Ct(),Q()}),e.addEventListener("progress",function(){Ct()}),y&&y.addEventListener("click",function(t){t.preventDefault(),t.stopPropagation(),it(e)&&(O=!O,Q(),ot(),T())})}document.readyState==="loading"?document.addEventListener("DOMContentLoaded",Vt):Vt();})();
+  `,!document.querySelector("#yrp-embed-menu-scroll-style"))o.id="yrp-embed-menu-scroll-style",document.head.appendChild(o);return e.addEventListener("wheel",function(c){let y=e.scrollTop===0,d=e.scrollTop+e.clientHeight>=e.scrollHeight-1;if(c.deltaY<0&&!y||c.deltaY>0&&!d)c.stopPropagation();else if(!y&&!d)c.stopPropagation()},{passive:!1}),e}function me(t){if(!t)return;try{let a=t.querySelector('.yrp-menu-section[data-section="subtitles"]');if(a&&a.parentNode)a.parentNode.removeChild(a)}catch(_ce){}}function tt(t,a,e,i={}){if(!t)return null;let o=t.querySelector(".yrp-menu-section")||null,c=document.createElement("button");if(c.type="button",c.className="yrp-menu-item",c.setAttribute("data-action",e),c.textContent=a,I(c),i.disabled===!0)c.disabled=!0,c.style.opacity="0.6";if(i.hasSubmenu===!0)fe(c);if(o&&o.parentNode===t)t.insertBefore(c,o);else t.appendChild(c);return c}function ye(){return[0.5,0.75,1,1.25,1.5,2]}function Vt(t,a,e,i){if(!t)return;while(t.firstChild)t.removeChild(t.firstChild);let o=document.createElement("button");o.type="button",o.className="yrp-menu-item",o.setAttribute("data-action","back"),o.textContent="← Back",e(o),t.appendChild(o);let c=isFinite(a.playbackRate)?a.playbackRate:1;ye().forEach(function(y){let d=document.createElement("button");d.type="button",d.className="yrp-menu-item",d.setAttribute("data-action","set-speed"),d.setAttribute("data-speed",String(y)),d.textContent=(y===1?"1.0x":String(y)+"x")+(Math.abs(y-c)<0.001?" ✓":""),i(d),t.appendChild(d)})}function Rt(t,a){let e=parseFloat(String(a));if(!isFinite(e)||e<=0)return;t.playbackRate=e;try{localStorage.setItem("playback_speed",String(e))}catch(_ce){}}class jt{constructor(t){this.menu=t,this.menuView="main",this.menuMainHTML="",this.menuFixedMinHeight=0}ensureMainSnapshot(){if(!this.menu)return;if(!this.menuMainHTML)this.menuMainHTML=this.menu.innerHTML||""}lockHeightFromCurrent(){if(!this.menu)return;if(this.menuFixedMinHeight>0)return;try{let t=this.menu.getBoundingClientRect();if(this.menuFixedMinHeight=Math.ceil(t.height||0),this.menuFixedMinHeight>0)this.menu.style.minHeight=this.menuFixedMinHeight+"px"}catch(_ce){}}resetHeightLock(){if(!this.menu)return;this.menuFixedMinHeight=0,this.menu.style.minHeight=""}setView(t){this.menuView=t}getView(){return this.menuView}openMainView(t){if(!this.menu)return;this.ensureMainSnapshot(),this.menu.innerHTML=this.menuMainHTML,this.menuView="main",this.menu.style.maxHeight="";try{let a=this.menu.querySelector('.yrp-menu-section[data-section="speed"]');if(a&&a.parentNode)a.parentNode.removeChild(a)}catch(_ce){}if(me(this.menu),t)t.injectSpeed&&t.injectSpeed(),t.injectLanguages&&t.injectLanguages(),t.injectSubtitles&&t.injectSubtitles(),t.injectQuality&&t.injectQuality(),t.injectDownload&&t.injectDownload()}constrainToPlayerHeight(t=0.6666666666666666){if(!this.menu)return;try{let a=this.menu.closest(".yrp-container");if(a){let e=a.querySelector(".yrp-video-wrap");if(e){let i=e.getBoundingClientRect().height,o=Math.floor(i*t)-34;if(o>100)this.menu.style.maxHeight=o+"px"}}}catch(_ce){}}}function Re(){try{let a=new URL(void 0).pathname.match(/\/static\/players\/([^\/]+)\//);if(a)return a[1]}catch(_ce){}try{let a=(document.currentScript&&document.currentScript.src||"").match(/\/static\/players\/([^\/]+)\//);if(a)return a[1]}catch(_ce){}try{let t=document.querySelector(".player-host[data-player]");if(t){let a=String(t.getAttribute("data-player")||"").trim();if(a)return a}}catch(_ce){}return"yurtube"}function Ot(){let t=Re(),a="/static/players/"+t,e=document.querySelectorAll('.player-host[data-player="'+t+'"]');if(e.length===0)return;fetch(a+"/templates/player.html",{credentials:"same-origin"}).then((i)=>i.text()).then(function(i){for(let o=0;o<e.length;o++)je(e[o],i,a)}).catch(function(){})}function je(t,a,e){t.innerHTML=a;let i=t.querySelector(".yrp-container"),o=i.querySelector(".yrp-video-wrap"),c=i.querySelector(".yrp-video"),y=i.querySelector(".yrp-controls"),d=c.querySelector("source"),w=i.querySelector(".yrp-autoplay");if(w)w.style.display="none";let k=Z(t,"data-options",{}),A=/\byrpdebug=1\b/i.test(location.search)||!!(k&&k.debug);function D(){if(!A)return;try{}catch(x){}}i.classList.add("yrp-embed"),i.setAttribute("tabindex","0");let L=t.getAttribute("data-video-src")||"",C=t.getAttribute("data-poster-url")||"",V=t.getAttribute("data-video-id")||"",R=Z(t,"data-subtitles",[]),F=t.getAttribute("data-sprites-vtt")||"",K=t.getAttribute("data-caption-vtt")||"",et=t.getAttribute("data-caption-lang")||"",nt=Z(t,"data-sources",[]),lt=String(t.getAttribute("data-permit-download")||"").trim()==="1",W=Z(t,"data-download-items",[]),M=ae(t),u=oe(c,M);if(d)d.setAttribute("src",L);if(C)c.setAttribute("poster",C);if(k&&k.autoplay)c.setAttribute("autoplay","");if(k&&k.muted)c.setAttribute("muted","");if(k&&k.loop)c.setAttribute("loop","");if(V)i.setAttribute("data-video-id",V);if(F)i.setAttribute("data-sprites-vtt",F);if(c.setAttribute("playsinline",""),Array.isArray(R))R.forEach(function(x){if(!x||!x.src)return;let H=document.createElement("track");if(H.setAttribute("kind","subtitles"),x.srclang)H.setAttribute("srclang",String(x.srclang));if(x.label)H.setAttribute("label",String(x.label));if(H.setAttribute("src",String(x.src)),x.default)H.setAttribute("default","");c.appendChild(H)});let z=i.querySelector(".yrp-subtitles");if(K)try{let x=document.createElement("track");x.setAttribute("kind","subtitles"),x.setAttribute("src",K),x.setAttribute("srclang",et||"auto"),x.setAttribute("label",et||"Original"),x.setAttribute("default",""),c.appendChild(x)}catch(x){D("caption track append failed",x)}if(u)ce(c,d,M,D);try{c.load(),D("video.load() called",{src:L})}catch(x){D("video.load() error",x)}ie(c,d,D);let v=e+"/img/buttons";i.style.setProperty("--icon-play",'url("'+v+'/play.svg")'),i.style.setProperty("--icon-pause",'url("'+v+'/pause.svg")'),i.style.setProperty("--icon-prev",'url("'+v+'/prev.svg")'),i.style.setProperty("--icon-next",'url("'+v+'/next.svg")'),i.style.setProperty("--icon-vol",'url("'+v+'/volume.svg")'),i.style.setProperty("--icon-mute",'url("'+v+'/mute.svg")'),i.style.setProperty("--icon-cc",'url("'+v+'/cc.svg")'),i.style.setProperty("--icon-mini",'url("'+v+'/mini.svg")'),i.style.setProperty("--icon-settings",'url("'+v+'/settings.svg")'),i.style.setProperty("--icon-theater",'url("'+v+'/theater.svg")'),i.style.setProperty("--icon-full",'url("'+v+'/full.svg")'),i.classList.add("yrp-icons-ready");let P=i.querySelector(".yrp-center-logo");if(P)P.setAttribute("src",e+"/img/logo.png");Oe(i,o,c,y,F,A,z,{sources:!u&&Array.isArray(nt)?nt:[],permitDownload:!!lt,downloadItems:Array.isArray(W)?W:[]})}function Oe(t,a,e,i,o,c,y,d){function w(){if(!c)return;try{}catch(n){}}let k=t.querySelector(".yrp-center-play"),A=t.querySelector(".yrp-play"),D=t.querySelector(".yrp-vol-btn"),L=t.querySelector(".yrp-volume"),C=t.querySelector(".yrp-vol-slider"),V=t.querySelector(".yrp-time-current"),R=t.querySelector(".yrp-time-total"),F=t.querySelector(".yrp-progress"),K=t.querySelector(".yrp-progress-rail"),et=t.querySelector(".yrp-progress-buffer"),nt=t.querySelector(".yrp-progress-played"),lt=t.querySelector(".yrp-progress-handle"),W=t.querySelector(".yrp-progress-tooltip"),M=t.querySelector(".yrp-settings"),u=t.querySelector(".yrp-menu"),z=t.querySelector(".yrp-fullscreen"),v=t.querySelector(".yrp-pip"),P=t.querySelector(".yrp-context"),x=!1,H=0,wt=null,G=!1,he=!1,J=d&&Array.isArray(d.sources)?d.sources:[],ge=!!(d&&d.permitDownload),St=d&&Array.isArray(d.downloadItems)?d.downloadItems:[],h=new jt(u),B=!0,X=0,Bt=function(){try{return String(localStorage.getItem("subtitle_lang")||"")}catch(n){return""}}(),xt=function(){try{return parseFloat(localStorage.getItem("playback_speed")||"")}catch(n){return NaN}}(),_t=t.getAttribute("data-video-id")||"",Ut=_t?"yrp:quality:"+_t:"yrp:quality",Kt=function(){try{return String(localStorage.getItem(Ut)||"")}catch(n){return""}}();function be(n){let r=document.createElement("div");r.className="yrp-embed-captions-layer",Object.assign(r.style,{position:"absolute",left:"50%",top:"80%",transform:"translate(-50%,-50%)",zIndex:"21",pointerEvents:"auto",userSelect:"none",touchAction:"none"});let s=document.createElement("div");if(s.className="yrp-embed-captions-text",r.appendChild(s),getComputedStyle(n).position==="static")n.style.position="relative";n.appendChild(r);let l={active:!1,sx:0,sy:0},m=null;function f(){return n.getBoundingClientRect()}function S(b){if(!l.active)return;if(l.active=!1,m)clearTimeout(m),m=null;if(b&&b.preventDefault)try{b.preventDefault()}catch(_ce){}if(b&&b.stopPropagation)try{b.stopPropagation()}catch(_ce){}}function g(b){l.active=!0,l.sx=b.clientX,l.sy=b.clientY;try{r.setPointerCapture&&r.setPointerCapture(b.pointerId)}catch(_ce){}if(m)clearTimeout(m),m=null;b.preventDefault(),b.stopPropagation()}function E(b){if(!l.active)return;let j=b.clientX-l.sx,Q=b.clientY-l.sy,O=f(),N=r.getBoundingClientRect(),Tt=N.left+N.width/2+j,Pt=N.top+N.height/2+Q,ee=N.width/2,ne=N.height/2;Tt=Math.min(Math.max(Tt,O.left+ee),O.right-ee),Pt=Math.min(Math.max(Pt,O.top+ne),O.bottom-ne);let Ne=(Tt-O.left)/O.width*100,Fe=(Pt-O.top)/O.height*100;r.style.left=Ne+"%",r.style.top=Fe+"%",r.style.transform="translate(-50%,-50%)",l.sx=b.clientX,l.sy=b.clientY,b.preventDefault(),b.stopPropagation()}function T(){if(m)clearTimeout(m);m=setTimeout(function(){S(new Event("leaveguard"))},200)}return r.addEventListener("pointerdown",g),document.addEventListener("pointermove",E),document.addEventListener("pointerup",S),document.addEventListener("pointercancel",S),document.addEventListener("mouseup",S),document.addEventListener("touchend",S),n.addEventListener("pointerleave",T),r.addEventListener("click",function(b){b.stopPropagation()}),{layer:r,box:s}}let we=be(a);function Se(){return bt(e,X)}function Lt(){Ht(e,X,B)}function Y(){de(we,e,X,B)}function ut(){pe(y,e,B)}function xe(n){let r=Ft(e,n);if(r>=0){X=r,B=!0;try{localStorage.setItem("subtitle_lang",String(n||""))}catch(s){}Lt(),Y(),ut()}}function Jt(n){B=!!n,Lt(),Y(),ut()}function Xt(){try{let n=e.querySelector("source");return n&&n.getAttribute("src")?String(n.getAttribute("src")||""):""}catch(_ce){return""}}function Yt(n,r){if(!n)return;let s=Xt();if(s&&s===n)return;let p=!e.paused,l=Math.max(0,e.currentTime||0),m=isFinite(e.playbackRate)&&e.playbackRate>0?e.playbackRate:1,f=isFinite(e.volume)?e.volume:1,S=!!e.muted,g=e.querySelector("source");if(!g)return;try{localStorage.setItem(Ut,String(n))}catch(_ce){}try{g.setAttribute("src",String(n));try{g.src=String(n)}catch(_ce){}e.load()}catch(_ce){}let E=function(){e.removeEventListener("loadedmetadata",E);try{e.playbackRate=m}catch(_ce){}try{e.volume=f}catch(_ce){}try{e.muted=S}catch(_ce){}try{let T=isFinite(e.duration)?e.duration:0;if(T>0){let b=Math.min(l,Math.max(0,T-0.25));e.currentTime=b}}catch(_ce){}if(p)try{e.play().catch(function(){})}catch(_ce){}};if(e.addEventListener("loadedmetadata",E),r)w("switch quality",{src:n,label:r})}function Le(){if(!J||J.length<2)return;if(!Kt)return;for(let n=0;n<J.length;n++){let r=J[n];if(!r)continue;let s=String(r.src||"");if(s&&s===Kt){Yt(s,r.label||"");return}}}let rt=[],pt=!1,dt=!1,_=null,ft=0;function Qt(n){let r=String(n||"").match(/^(\d{2}):(\d{2}):(\d{2}\.\d{3})$/);if(!r)return 0;let s=parseInt(r[1],10),p=parseInt(r[2],10),l=parseFloat(r[3]);return s*3600+p*60+l}function Ce(n){if(!n)return"";if(/^https?:\/\//i.test(n)||n.startsWith("/"))return n;try{return new URL(o,window.location.origin).pathname.replace(/\/sprites\.vtt$/,"")+"/"+n.replace(/^\/+/,"")}catch(_ce){return n}}function Ee(){if(_)return _;if(!F)return null;if(_=document.createElement("div"),_.className="yrp-sprite-pop",Object.assign(_.style,{position:"absolute",bottom:"calc(100% + 30px)",left:"0",display:"none",width:"160px",height:"90px",border:"1px solid #333",background:"#000",overflow:"hidden",zIndex:"5"}),getComputedStyle(F).position==="static")F.style.position="relative";return F.appendChild(_),_}function Wt(){if(!o||pt||dt)return;fetch(o,{credentials:"same-origin"}).then((n)=>n.text()).then(function(n){let r=n.split(/\r?\n/);for(let s=0;s<r.length;s++){let p=r[s].trim();if(!p)continue;if(p.indexOf("-->")>=0){let l=p.split("-->").map((N)=>N.trim());if(l.length<2)continue;let m=Qt(l[0]),f=Qt(l[1]),S=(r[s+1]||"").trim(),g="",E=0,T=0,b=0,j=0,Q=S.indexOf("#xywh=");if(Q>0){g=S.substring(0,Q);let N=S.substring(Q+6).split(",");if(N.length===4)E=parseInt(N[0],10),T=parseInt(N[1],10),b=parseInt(N[2],10),j=parseInt(N[3],10)}let O=Ce(g);if(rt.push({start:m,end:f,spriteUrl:O,x:E,y:T,w:b,h:j}),f>ft)ft=f;s++}}pt=!0,w("embed sprites VTT loaded",{cues:rt.length,durationApprox:ft})}).catch(function(n){dt=!0,w("embed sprites VTT load failed",n)})}function ke(n){if(!o||!rt.length||!K)return;let r=K.getBoundingClientRect(),s=Math.max(0,Math.min(n-r.left,r.width)),p=r.width>0?s/r.width:0,l=(H||ft||0)*p,m=null;for(let E=0;E<rt.length;E++){let T=rt[E];if(l>=T.start&&l<T.end){m=T;break}}let f=Ee();if(!f)return;if(!m||!m.spriteUrl||m.w<=0||m.h<=0){f.style.display="none";return}while(f.firstChild)f.removeChild(f.firstChild);let S=document.createElement("img");S.src=m.spriteUrl,Object.assign(S.style,{position:"absolute",left:-m.x+"px",top:-m.y+"px"}),f.appendChild(S),f.style.display="block";let g=Math.max(0,Math.min(r.width-m.w,s-m.w/2));f.style.left=g+"px",f.style.width=m.w+"px",f.style.height=m.h+"px"}function q(){if(t.classList.remove("autohide"),wt)clearTimeout(wt);wt=setTimeout(function(){t.classList.add("autohide")},1800)}function Ae(){try{let n=window.innerHeight||document.documentElement.clientHeight||t.clientHeight||0;if(n<=0)return;a.style.height=n+"px",e.style.height="100%",e.style.width="100%",e.style.objectFit="contain"}catch(_ce){}}function $t(){try{H=isFinite(e.duration)?e.duration:0}catch(_ce){H=0}if(R)R.textContent=yt(H);if(V)V.textContent=yt(e.currentTime||0)}function Ct(){let n=H||0,r=e.currentTime||0,s=n>0?Math.max(0,Math.min(r/n,1)):0;if(nt)nt.style.width=(s*100).toFixed(3)+"%";if(lt)lt.style.left=(s*100).toFixed(3)+"%";let p=0;if(e.buffered&&e.buffered.length>0)try{p=e.buffered.end(e.buffered.length-1)}catch(_ce){p=0}let l=n>0?Math.max(0,Math.min(p/n,1)):0;if(et)et.style.width=(l*100).toFixed(3)+"%"}function it(){let n=e.muted?0:e.volume,r=e.muted||n===0?"Mute":"Vol",s=t.querySelector(".yrp-vol-btn");if(s)s.textContent=r,s.classList.toggle("icon-mute",r==="Mute"),s.classList.toggle("icon-vol",r!=="Mute")}function Et(){e.muted=!e.muted,it()}function kt(){if(e.paused)e.play().catch(function(){});else e.pause()}function zt(n){let r=K.getBoundingClientRect(),s=Math.max(0,Math.min(n-r.left,r.width)),p=r.width>0?s/r.width:0,l=(H||0)*p;e.currentTime=l}function Me(n){let r=W;if(!r)return;let s=K.getBoundingClientRect(),p=Math.max(0,Math.min(n-s.left,s.width)),l=s.width>0?p/s.width:0,m=(H||0)*l;r.textContent=yt(m),r.style.left=(l*100).toFixed(3)+"%",r.hidden=!1}function Gt(){if(!u)return;while(u.firstChild)u.removeChild(u.firstChild);let n=document.createElement("button");n.type="button",n.className="yrp-menu-item",n.setAttribute("data-action","back"),n.textContent="← Back",U(n),u.appendChild(n);let r=Xt(),s=ct(n,u);u.appendChild(s),J.forEach(function(p){if(!p)return;let l=String(p.src||"");if(!l)return;let m=String(p.label||p.preset||"Quality"),f=document.createElement("button");f.type="button",f.className="yrp-menu-item",f.setAttribute("data-action","set-quality"),f.setAttribute("data-src",l),f.textContent=m+(r===l?" ✓":""),I(f),s.appendChild(f)}),h.setView("quality"),h.constrainToPlayerHeight(0.6666666666666666)}function Zt(){if(!u)return;while(u.firstChild)u.removeChild(u.firstChild);let n=document.createElement("button");n.type="button",n.className="yrp-menu-item",n.setAttribute("data-action","back"),n.textContent="← Back",U(n),u.appendChild(n);let r=ct(n,u);u.appendChild(r),(St||[]).forEach(function(s){if(!s)return;let p=String(s.url||"");if(!p)return;let l=String(s.label||"Download"),m=String(s.filename||""),f=document.createElement("button");if(f.type="button",f.className="yrp-menu-item",f.setAttribute("data-action","do-download"),f.setAttribute("data-url",p),m)f.setAttribute("data-filename",m);f.textContent=l,I(f),r.appendChild(f)}),h.setView("download"),h.constrainToPlayerHeight(0.6666666666666666)}function At(){h.openMainView({injectSpeed:function(){if(!u.querySelector('.yrp-menu-item[data-action="open-speed"]'))tt(u,"Speed","open-speed",{hasSubmenu:!0})},injectLanguages:function(){if(!u.querySelector('.yrp-menu-item[data-action="open-langs"]'))tt(u,"Languages","open-langs",{hasSubmenu:!0})},injectSubtitles:function(){let n=ot(e);if(!u.querySelector('.yrp-menu-item[data-action="open-subs"]')){let r=tt(u,"Subtitles","open-subs",{hasSubmenu:!0,disabled:!n});if(r&&!n)r.title="No subtitles tracks"}},injectQuality:function(){if(u.querySelector('.yrp-menu-item[data-action="open-quality"]'))return;if(!J||J.length<2)return;tt(u,"Quality","open-quality",{hasSubmenu:!0})},injectDownload:function(){if(u.querySelector('.yrp-menu-item[data-action="open-download"]'))return;if(!ge)return;if(!St||St.length===0)return;tt(u,"Download","open-download",{hasSubmenu:!0})}});try{let n=u.querySelector('.yrp-menu-section[data-section="quality"]');if(n&&n.parentNode)n.parentNode.removeChild(n)}catch(_ce){}try{let n=u.querySelector(".yrp-menu-item.quality-future");if(n&&n.parentNode)n.parentNode.removeChild(n)}catch(_ce){}}let te="",at=0;function ve(){if(!u)return;if(!te)te=u.innerHTML||""}function Te(){if(!u)return;if(at>0)return;try{let n=u.getBoundingClientRect();if(at=Math.ceil(n.height||0),at>0)u.style.minHeight=at+"px"}catch(_ce){}}function Pe(){if(!u)return;at=0,u.style.minHeight=""}function Mt(){if(u){if(u.hidden=!0,M)M.setAttribute("aria-expanded","false")}if(P)P.hidden=!0;t.classList.remove("vol-open"),h.setView("main"),h.resetHeightLock()}function vt(){if(!A)return;let n=!e.paused;A.classList.toggle("icon-play",!n),A.classList.toggle("icon-pause",n),A.setAttribute("aria-label",n?"Pause (Space, K)":"Play (Space, K)"),A.title=n?"Pause (Space, K)":"Play (Space, K)",A.textContent=""}if(function(){let n=function(){try{let r=localStorage.getItem("yrp:volume");return r?JSON.parse(r):null}catch(_ce){return null}}();if(n&&typeof n.v==="number")e.volume=Math.max(0,Math.min(n.v,1));if(n&&typeof n.m==="boolean")e.muted=!!n.m;if(C)C.value=String(e.volume||1);it(),e.addEventListener("volumechange",function(){if(he&&e.muted&&!G)return;try{localStorage.setItem("yrp:volume",JSON.stringify({v:Math.max(0,Math.min(e.volume||0,1)),m:!!e.muted}))}catch(_ce){}}),e.addEventListener("loadedmetadata",function r(){if(e.removeEventListener("loadedmetadata",r),G)return;let s=function(){try{let p=localStorage.getItem("yrp:volume");return p?JSON.parse(p):null}catch(_ce){return null}}();if(s){if(typeof s.v==="number")e.volume=Math.max(0,Math.min(s.v,1));if(typeof s.m==="boolean")e.muted=!!s.m;if(C)C.value=String(e.volume||1);it()}})}(),function(){try{let n=localStorage.getItem("yrp:speed");if(n){let r=parseFloat(n);if(isFinite(r)&&r>0)e.playbackRate=r}}catch(_ce){}if(isFinite(xt)&&xt>0)Rt(xt);e.addEventListener("ratechange",function(){try{localStorage.setItem("yrp:speed",String(e.playbackRate))}catch(_ce){}try{localStorage.setItem("playback_speed",String(e.playbackRate))}catch(_ce){}})}(),function(){let n=t.getAttribute("data-video-id")||"";if(!n)return;function r(){try{let g=localStorage.getItem("yrp:resume");return g?JSON.parse(g):{}}catch(_ce){return{}}}function s(g){try{localStorage.setItem("yrp:resume",JSON.stringify(g))}catch(_ce){}}let p=r(),l=p[n],m=Date.now();function f(g){let E=isFinite(e.duration)?e.duration:0;if(E&&g>10&&g<E-5)try{e.currentTime=g}catch(_ce){}}if(l&&typeof l.t==="number"&&m-(l.ts||0)<15552000000){let g=Math.max(0,l.t|0);if(isFinite(e.duration)&&e.duration>0)f(g);else e.addEventListener("loadedmetadata",function E(){e.removeEventListener("loadedmetadata",E),f(g)})}let S=re(function(){let g=isFinite(e.duration)?e.duration:0,E=Math.max(0,Math.floor(e.currentTime||0)),T=r();T[n]={t:E,ts:Date.now(),d:g};let b=Object.keys(T);if(b.length>200){b.sort(function(j,Q){return(T[j].ts||0)-(T[Q].ts||0)});for(let j=0;j<b.length-200;j++)delete T[b[j]]}s(T)},3000);e.addEventListener("timeupdate",function(){if(!e.paused&&!e.seeking)S()}),e.addEventListener("ended",function(){let g=r();delete g[n],s(g)})}(),function(){let n=t.closest(".player-host")||t,r=Z(n,"data-options",null),s=!!(r&&Object.prototype.hasOwnProperty.call(r,"autoplay")&&r.autoplay);if(w("autoplay check (embed)",{WANT:s,opt:r}),!s)return;function p(f){w("tryPlaySequence",{reason:f,muted:e.muted,rs:e.readyState});let S=null;try{S=e.play()}catch(g){w("play() threw sync",g),S=null}if(S&&typeof S.then==="function")S.then(function(){w("play() resolved")}).catch(function(g){if(w("play() rejected",{name:g&&g.name,msg:g&&g.message}),!e.muted){e.muted=!0,e.setAttribute("muted","");try{e.play().catch(function(E){w("retry rejected",E)})}catch(E){w("retry threw sync",E)}}});else setTimeout(function(){if(e.paused){e.muted=!0,e.setAttribute("muted","");try{e.play().catch(function(g){w("no-promise fallback rejected",g)})}catch(g){w("no-promise fallback threw",g)}}},0)}let l=!1;function m(f){if(l)return;l=!0,p(f)}if(e.readyState>=1)m("readyState>=1");["loadedmetadata","loadeddata","canplay","canplaythrough"].forEach(function(f){let S=function(){e.removeEventListener(f,S),m(f)};e.addEventListener(f,S)}),setTimeout(function(){if(e.paused)p("watchdog")},1200)}(),k)k.addEventListener("click",function(){kt()});if(A)A.addEventListener("click",function(){kt()});if(e.addEventListener("click",function(){kt()}),e.addEventListener("play",function(){t.classList.add("playing"),vt()}),e.addEventListener("pause",function(){t.classList.remove("playing"),vt()}),D)D.addEventListener("click",function(n){n.preventDefault(),n.stopPropagation(),G=!0,Et(),t.classList.add("vol-open"),q(),setTimeout(function(){t.classList.remove("vol-open")},800)});if(i)i.addEventListener("click",function(n){let r=n.target;if(r&&r.nodeType===3&&r.parentNode)r=r.parentNode;if(r&&r.classList&&r.classList.contains("yrp-vol-btn"))n.preventDefault(),n.stopPropagation(),G=!0,Et(),t.classList.add("vol-open"),q(),setTimeout(function(){t.classList.remove("vol-open")},800)},!0);if(C)C.addEventListener("input",function(){G=!0;let n=parseFloat(C.value||"1");if(!isFinite(n))n=1;if(n=Math.max(0,Math.min(n,1)),e.volume=n,n>0)e.muted=!1;it(),t.classList.add("vol-open"),q()});if(L)L.addEventListener("wheel",function(n){n.preventDefault(),G=!0;let r=0.05,s=e.muted?0:e.volume,p=Math.max(0,Math.min(s+(n.deltaY<0?r:-r),1));if(e.volume=p,p>0)e.muted=!1;if(C)C.value=String(p);it(),t.classList.add("vol-open"),q()},{passive:!1});if(F&&K)F.addEventListener("mousedown",function(n){x=!0,zt(n.clientX),q()}),window.addEventListener("mousemove",function(n){if(x)zt(n.clientX)}),window.addEventListener("mouseup",function(){x=!1}),F.addEventListener("mousemove",function(n){if(Me(n.clientX),o&&pt&&!dt)ke(n.clientX);else if(o&&!pt&&!dt)Wt()}),F.addEventListener("mouseleave",function(){if(W)W.hidden=!0;if(_)_.style.display="none"});if(M&&u)ve(),M.addEventListener("click",function(n){if(n.preventDefault(),n.stopPropagation(),!u.hidden)u.hidden=!0,M.setAttribute("aria-expanded","false"),h.setView("main"),Pe();else Mt(),At(),u.hidden=!1,M.setAttribute("aria-expanded","true"),t.classList.add("vol-open"),q(),Te()}),u.addEventListener("click",function(n){let r=n.target&&n.target.closest?n.target.closest(".yrp-menu-item"):null;if(!r||!u.contains(r))return;let s=r.getAttribute("data-action")||"",p=r.getAttribute("data-lang")||"";if(h.getView()==="main"){if(s==="open-speed"){n.preventDefault(),n.stopPropagation(),Vt(u,e,U,I),h.setView("speed"),h.lockHeightFromCurrent(),t.classList.add("vol-open"),q();return}if(s==="open-langs"){n.preventDefault(),n.stopPropagation(),It(u,e,X,U,I,ct),h.setView("langs"),h.lockHeightFromCurrent(),t.classList.add("vol-open"),q();return}if(s==="open-subs"){if(n.preventDefault(),n.stopPropagation(),!ot(e))return;Dt(u,B,U,I),h.setView("subs"),h.lockHeightFromCurrent(),t.classList.add("vol-open"),q();return}if(s==="open-quality"){n.preventDefault(),n.stopPropagation(),Gt(),h.lockHeightFromCurrent(),t.classList.add("vol-open"),q();return}if(s==="open-download"){n.preventDefault(),n.stopPropagation(),Zt(),h.lockHeightFromCurrent(),t.classList.add("vol-open"),q();return}return}if(s==="back"){n.preventDefault(),n.stopPropagation(),At(),h.lockHeightFromCurrent(),t.classList.add("vol-open"),q();return}if(h.getView()==="speed"){if(s==="set-speed"){let l=parseFloat(r.getAttribute("data-speed")||"NaN");if(!isNaN(l)){n.preventDefault(),n.stopPropagation(),Rt(e,l),u.hidden=!0,M.setAttribute("aria-expanded","false"),h.setView("main"),h.resetHeightLock();return}}}if(h.getView()==="langs"){if(s==="select-lang"&&p){n.preventDefault(),n.stopPropagation(),xe(p),u.hidden=!0,M.setAttribute("aria-expanded","false"),h.setView("main"),h.resetHeightLock();return}}if(h.getView()==="subs"){if(s==="subs-on"){n.preventDefault(),n.stopPropagation(),Jt(!0),u.hidden=!0,M.setAttribute("aria-expanded","false"),h.setView("main"),h.resetHeightLock();return}if(s==="subs-off"){n.preventDefault(),n.stopPropagation(),Jt(!1),u.hidden=!0,M.setAttribute("aria-expanded","false"),h.setView("main"),h.resetHeightLock();return}}if(h.getView()==="quality"){if(s==="set-quality"){n.preventDefault(),n.stopPropagation();let l=String(r.getAttribute("data-src")||""),m=String(r.textContent||"").replace(/\s*✓\s*$/,"");if(l)Yt(l,m);u.hidden=!0,M.setAttribute("aria-expanded","false"),h.setView("main"),h.resetHeightLock();return}}if(h.getView()==="download"){if(s==="do-download"){n.preventDefault(),n.stopPropagation();let l=String(r.getAttribute("data-url")||"");if(l)try{window.open(l,"_blank","noopener")}catch(_ce){window.location.href=l}u.hidden=!0,M.setAttribute("aria-expanded","false"),h.setView("main"),h.resetHeightLock();return}}}),document.addEventListener("click",function(n){if(!u.hidden&&!u.contains(n.target)&&n.target!==M)u.hidden=!0,M.setAttribute("aria-expanded","false"),h.setView("main"),h.resetHeightLock()}),document.addEventListener("keydown",function(n){if(n.code==="Escape"||(n.key||"").toLowerCase()==="escape"){if(!u.hidden)u.hidden=!0,M.setAttribute("aria-expanded","false"),h.setView("main"),h.resetHeightLock()}});if(z)z.addEventListener("click",function(){if(document.fullscreenElement)document.exitFullscreen().catch(function(){});else t.requestFullscreen&&t.requestFullscreen().catch(function(){})});if(v)v.addEventListener("click",function(n){n.preventDefault(),n.stopPropagation();try{if(document.pictureInPictureEnabled&&e.requestPictureInPicture&&!e.disablePictureInPicture)if(document.pictureInPictureElement===e)document.exitPictureInPicture().catch(function(){});else{let{paused:r,muted:s}=e,p=Promise.resolve();if(r)e.muted=!0,p=e.play().catch(function(){});p.then(function(){return e.requestPictureInPicture()}).catch(function(){}).then(function(){if(r)e.pause(),e.muted=s})}}catch(_ce){}});if(t.addEventListener("contextmenu",function(n){if(n.preventDefault(),Mt(),!P)return;let r=t.getBoundingClientRect();P.style.left=n.clientX-r.left+"px",P.style.top=n.clientY-r.top+"px",P.hidden=!1,t.classList.add("vol-open"),q()}),P)P.addEventListener("click",function(n){let r=n.target&&n.target.getAttribute("data-action"),s=Math.floor(e.currentTime||0),p=t.getAttribute("data-video-id")||"";if(r==="pip")v&&v.click();else if(r==="copy-url"){let l=new URL(window.location.href);l.searchParams.delete("t"),ht(l.toString())}else if(r==="copy-url-time"){let l=new URL(window.location.href);l.searchParams.set("t",String(s)),ht(l.toString())}else if(r==="copy-embed"){let m='<iframe width="560" height="315" src="'+((window.location.origin||"")+"/embed?v="+encodeURIComponent(p||""))+'" frameborder="0" allow="autoplay; encrypted-media; clipboard-write" allowfullscreen></iframe>';ht(m)}P.hidden=!0}),document.addEventListener("click",function(n){if(!P.hidden&&!P.contains(n.target))P.hidden=!0}),document.addEventListener("keydown",function(r){if(r.code==="Escape"||(r.key||"").toLowerCase()==="escape"){if(!P.hidden)P.hidden=!0}});function qe(n){let r=n.target,s=r&&r.tagName?r.tagName.toUpperCase():"";if(r&&(r.isContentEditable||s==="INPUT"||s==="TEXTAREA"))return;if(n.ctrlKey||n.metaKey||n.altKey)return;let p=n.code,l=(n.key||"").toLowerCase();if(p==="Space"||p==="Enter"||p==="NumpadEnter"||p==="MediaPlayPause"||p==="KeyK"||l==="k"){n.preventDefault(),e.paused?e.play().catch(function(){}):e.pause();return}if(p==="ArrowLeft"||p==="KeyJ"||l==="j"){n.preventDefault(),e.currentTime=Math.max(0,(e.currentTime||0)-5);return}if(p==="ArrowRight"||p==="KeyL"||l==="l"){n.preventDefault();let m=isFinite(e.duration)?e.duration:1e9;e.currentTime=Math.min((e.currentTime||0)+5,m);return}if(p==="KeyM"||l==="m"){n.preventDefault(),Et();return}if(p==="KeyF"||l==="f"){if(n.preventDefault(),z)z.click();return}if(p==="KeyI"||l==="i"){if(n.preventDefault(),v)v.click();return}if(p==="Escape"||l==="escape"){Mt();return}}document.addEventListener("keydown",qe),["mouseenter","mousemove","pointermove","touchstart"].forEach(function(n){(i||t).addEventListener(n,function(){try{t.focus()}catch(_ce){}q()},{passive:!0})}),t.addEventListener("mouseleave",function(){setTimeout(function(){t.classList.add("autohide")},600)});function mt(){Ae()}window.addEventListener("resize",mt),setTimeout(mt,0),setTimeout(mt,100);function He(){try{let n=Se();if(!n)return;n.addEventListener("cuechange",Y),n.addEventListener("load",Y)}catch(_ce){}}if(e.addEventListener("loadedmetadata",function(){if(Bt){let n=Ft(e,Bt);if(n>=0)X=n}if(Lt(),Y(),ut(),He(),$t(),Ct(),mt(),Wt(),vt(),u&&!u.hidden){let n=h.getView();if(n==="main")At();else if(n==="langs")It(u,e,X,U,I,ct),h.setView("langs");else if(n==="speed")Vt(u,e,U,I),h.setView("speed");else if(n==="subs")Dt(u,B,U,I),h.setView("subs");else if(n==="quality")Gt();else if(n==="download")Zt()}}),setTimeout(Le,0),e.addEventListener("timeupdate",function(){$t(),Ct(),Y()}),e.addEventListener("progress",function(){Ct()}),y)y.addEventListener("click",function(n){if(n.preventDefault(),n.stopPropagation(),!ot(e))return;B=!B,Y(),ut(),q()})}if(document.readyState==="loading")document.addEventListener("DOMContentLoaded",Ot);else Ot();})();
@@ -0,0 +1,87 @@
+// Adaptive streaming (HLS manifest of packaged renditions).
+// Native HLS where the browser has it, hls.js (loaded on demand) over MSE elsewhere.
+// The progressive <source> stays in place: on any fatal error the player falls back to it.
+
+let hlsJsPromise = null;
+
+function loadHlsJs(url) {
+  if (window.Hls) return Promise.resolve(window.Hls);
+  if (!url) return Promise.reject(new Error('no hls.js url'));
+  if (!hlsJsPromise) {
+    hlsJsPromise = new Promise(function (resolve, reject) {
+      const s = document.createElement('script');
+      s.src = url;
+      s.async = true;
+      s.onload = function () { window.Hls ? resolve(window.Hls) : reject(new Error('hls.js not loaded')); };
+      s.onerror = function () { reject(new Error('hls.js load failed')); };
+      document.head.appendChild(s);
+    });
+  }
+  return hlsJsPromise;
+}
+
+export function abrConfigFromHost(host) {
+  return {
+    hlsSrc: host.getAttribute('data-hls-src') || '',
+    hlsJsUrl: host.getAttribute('data-hls-js') || ''
+  };
+}
+
+function canNativeHls(video) {
+  try { return !!video.canPlayType('application/vnd.apple.mpegurl'); } catch { return false; }
+}
+
+function canMse() {
+  return !!(window.MediaSource || window.ManagedMediaSource);
+}
+
+// Decided synchronously, so the player can hide the progressive quality menu up front.
+export function abrUsable(video, cfg) {
+  if (!cfg || !cfg.hlsSrc) return false;
+  return canNativeHls(video) || (!!cfg.hlsJsUrl && canMse());
+}
+
+export function attachAbr(video, sourceEl, cfg, d) {
+  const progressiveSrc = (sourceEl && sourceEl.getAttribute('src')) || '';
+  let hls = null;
+
+  function fallback(reason) {
+    d && d('abr: fallback to progressive', reason);
+    const t = video.currentTime || 0;
+    const wasPlaying = !video.paused;
+    try { if (hls) hls.destroy(); } catch {}
+    hls = null;
+    try {
+      video.removeAttribute('src');
+      if (sourceEl) sourceEl.setAttribute('src', progressiveSrc);
+      video.load();
+      if (t > 0) video.addEventListener('loadedmetadata', function () { video.currentTime = t; }, { once: true });
+      if (wasPlaying) video.play().catch(function () {});
+    } catch {}
+  }
+
+  if (canNativeHls(video)) {
+    d && d('abr: native hls', cfg.hlsSrc);
+    if (sourceEl) sourceEl.setAttribute('src', cfg.hlsSrc);
+    const onErr = function () {
+      video.removeEventListener('error', onErr);
+      fallback('native hls error');
+    };
+    video.addEventListener('error', onErr);
+    return;
+  }
+
+  loadHlsJs(cfg.hlsJsUrl).then(function (Hls) {
+    if (!Hls.isSupported()) { d && d('abr: hls.js unsupported'); return; }
+    const t = video.currentTime || 0;
+    hls = new Hls({ startPosition: t > 0 ? t : -1, capLevelToPlayerSize: true });
+    hls.on(Hls.Events.ERROR, function (_e, data) {
+      if (data && data.fatal) fallback('hls.js fatal: ' + data.type + '/' + data.details);
+    });
+    hls.loadSource(cfg.hlsSrc);
+    hls.attachMedia(video);
+    d && d('abr: hls.js attached', cfg.hlsSrc);
+  }).catch(function (e) {
+    d && d('abr: hls.js unavailable', e);
+  });
+}
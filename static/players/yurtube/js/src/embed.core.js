@@ -1,5 +1,6 @@
 import { fmtTime, parseJSONAttr, throttle, copyText } from './util.js';
 import { installFallbackGuards } from './fallback.js';
+import { abrConfigFromHost, abrUsable, attachAbr } from './abr.js';
 import {
   langDisplayNameEn,
   subtitleTracks,
@@ -92,6 +93,10 @@ function mountOne(host, tpl, PLAYER_BASE) {
   const permitDownload = String(host.getAttribute('data-permit-download') || '').trim() === '1';
   const downloadItems = parseJSONAttr(host, 'data-download-items', []);
 
+  // packaged renditions: the player picks quality itself, progressive switching is not offered
+  const abrCfg = abrConfigFromHost(host);
+  const useAbr = abrUsable(video, abrCfg);
+
   if (source) source.setAttribute('src', videoSrc);
   if (poster) video.setAttribute('poster', poster);
   if (opts && opts.autoplay) video.setAttribute('autoplay', '');
@@ -130,6 +135,7 @@ function mountOne(host, tpl, PLAYER_BASE) {
     }
   }
 
+  if (useAbr) attachAbr(video, source, abrCfg, d);
   try { video.load(); d('video.load() called', { src: videoSrc }); } catch (e) { d('video.load() error', e); }
   installFallbackGuards(video, source, d);
 
@@ -151,7 +157,7 @@ function mountOne(host, tpl, PLAYER_BASE) {
   if (centerLogo) centerLogo.setAttribute('src', PLAYER_BASE + '/img/logo.png');
 
   wireEmbed(root, wrap, video, controls, spritesVtt, DEBUG, ccBtn, {
-    sources: Array.isArray(sources) ? sources : [],
+    sources: (!useAbr && Array.isArray(sources)) ? sources : [],
     permitDownload: !!permitDownload,
     downloadItems: Array.isArray(downloadItems) ? downloadItems : []
   });
@@ -1,6 +1,7 @@
 import { fmtTime, clamp, cssPxToNum, throttle, parseJSONAttr, copyText } from './util.js';
 import { load, save } from './storage.js';
 import { installFallbackGuards } from './fallback.js';
+import { abrConfigFromHost, abrUsable, attachAbr } from './abr.js';
 import { attachPlaylist } from './playlist.js';
 import {
   subtitleTracks,
@@ -92,6 +93,10 @@ function mountOne(host, tpl, BASE) {
   const permitDownload = String(host.getAttribute('data-permit-download') || '') === '1';
   const downloadItems = parseJSONAttr(host, 'data-download-items', []);
 
+  // packaged renditions: the player picks quality itself, progressive switching is not offered
+  const abrCfg = abrConfigFromHost(host);
+  const useAbr = abrUsable(video, abrCfg);
+
   const DEBUG = /\byrpdebug=1\b/i.test(location.search) || !!(opts && opts.debug);
 
   const d = (...a) => fmtDebug(DEBUG, ...a);
@@ -132,6 +137,8 @@ function mountOne(host, tpl, BASE) {
     }
   }
 
+  if (useAbr) attachAbr(video, source, abrCfg, d);
+
   try {
     video.load();
     d('video.load()', { src: videoSrc });
@@ -290,7 +297,7 @@ function mountOne(host, tpl, BASE) {
     { overlay, textBox, autoAdjust: adjustOverlayAuto },
     startAt,
     BASE,
-    { sources, permitDownload, downloadItems }
+    { sources: useAbr ? [] : sources, permitDownload, downloadItems }
   );
 }
 
@@ -1,7 +1,149 @@
-from typing import Dict, Any, List
+from typing import Any, Dict, List, Optional, Set
 
 
 def collapse_children(children: List[str], limit: int) -> Dict[str, Any]:
     if len(children) <= limit:
         return {"visible": children, "collapsed": []}
-    return {"visible": children[:limit], "collapsed": children[limit:]}
\ No newline at end of file
+    return {"visible": children[:limit], "collapsed": children[limit:]}
+
+_FALSY_VISIBLE = (False, 0, "false", "False")
+
+
+def _is_hidden(meta: Dict[str, Any]) -> bool:
+    return bool(meta.get("tombstone")) or meta.get("visible") in _FALSY_VISIBLE
+
+
+class CommentTree:
+    """
+    Array-backed comment tree, built once per request from {comment_id: meta}.
+    - nodes are indices; parent[i] is an index, -1 for roots, -2 for orphans (parent not loaded)
+    - drop(): removes soft-banned authors and/or tombstones, children move to the
+      nearest kept ancestor; one BFS pass, no parent-chain walks
+    - serialize(): one sort by created_at (newest first) for roots and every children list
+    Meta dicts are shared with the input and updated in place.
+    """
+
+    __slots__ = ("ids", "metas", "parent", "orphan_pid", "kept")
+
+    def __init__(self, comments: Dict[str, Dict[str, Any]]) -> None:
+        self.ids: List[str] = []
+        self.metas: List[Dict[str, Any]] = []
+        for cid, meta in (comments or {}).items():
+            if isinstance(meta, dict):
+                self.ids.append(cid)
+                self.metas.append(meta)
+        index = {cid: i for i, cid in enumerate(self.ids)}
+        self.parent: List[int] = [-1] * len(self.ids)
+        self.orphan_pid: Dict[int, str] = {}
+        for i, meta in enumerate(self.metas):
+            pid = meta.get("parent_id")
+            if pid is None:
+                continue
+            p = index.get(pid, -2)
+            if p == -2:
+                self.orphan_pid[i] = pid
+            self.parent[i] = p
+        self.kept: List[bool] = [True] * len(self.ids)
+
+    def drop(self, banned_authors: Optional[Set[str]] = None, tombstones: bool = False) -> int:
+        """
+        Remove comments of banned_authors and (if tombstones) deleted/hidden ones, reparenting
+        their replies to the nearest kept ancestor. Returns number of removed comments.
+        """
+        banned = banned_authors or set()
+        kept = self.kept
+        removed = 0
+        for i, meta in enumerate(self.metas):
+            if not kept[i]:
+                continue
+            if (banned and str(meta.get("author_uid") or "").strip() in banned) or (tombstones and _is_hidden(meta)):
+                kept[i] = False
+                removed += 1
+        if not removed:
+            return 0
+
+        n = len(self.ids)
+        parent = self.parent
+        # CSR children arrays
+        counts = [0] * (n + 1)
+        for p in parent:
+            if p >= 0:
+                counts[p + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        fill = counts[:-1]
+        child = [0] * counts[n]
+        for i, p in enumerate(parent):
+            if p >= 0:
+                child[fill[p]] = i
+                fill[p] += 1
+
+        # nearest kept ancestor-or-self, parents visited before children:
+        # index, -1 (none, root level) or -3 - t (none, under missing parent of orphan t)
+        anc = [-1] * n
+        queue = [i for i, p in enumerate(parent) if p < 0]
+        for i in queue:
+            anc[i] = i if kept[i] else (-1 if parent[i] == -1 else -3 - i)
+        head = 0
+        while head < len(queue):
+            i = queue[head]
+            head += 1
+            for k in range(counts[i], counts[i + 1]):
+                c = child[k]
+                anc[c] = c if kept[c] else anc[i]
+                queue.append(c)
+
+        for i in queue:
+            p = parent[i]
+            if p < 0 or not kept[i] or kept[p]:
+                continue
+            a = anc[p]
+            if a >= 0:
+                parent[i] = a
+                self.metas[i]["parent_id"] = self.ids[a]
+            elif a == -1:
+                parent[i] = -1
+                self.metas[i]["parent_id"] = None
+            else:
+                pid = self.orphan_pid[-3 - a]
+                parent[i] = -2
+                self.orphan_pid[i] = pid
+                self.metas[i]["parent_id"] = pid
+        return removed
+
+    def mark_tombstones(self) -> None:
+        for i, meta in enumerate(self.metas):
+            if self.kept[i] and (bool(meta.get("is_deleted")) or meta.get("visible") in _FALSY_VISIBLE):
+                meta["tombstone"] = True
+                meta["visible"] = False
+
+    def kept_ids(self) -> List[str]:
+        return [cid for cid, k in zip(self.ids, self.kept) if k]
+
+    def author_uids(self) -> Set[str]:
+        return {m.get("author_uid") for m, k in zip(self.metas, self.kept) if k and m.get("author_uid")}
+
+    def serialize(self) -> Dict[str, Any]:
+        """
+        {"comments", "roots", "children_map"}; roots and children lists newest first, comments in the same order.
+        """
+        metas = self.metas
+        order = sorted(
+            (i for i, k in enumerate(self.kept) if k),
+            key=lambda i: int(metas[i].get("created_at") or 0),
+            reverse=True,
+        )
+        comments: Dict[str, Dict[str, Any]] = {}
+        roots: List[str] = []
+        children_map: Dict[str, List[str]] = {}
+        for i in order:
+            cid = self.ids[i]
+            comments[cid] = metas[i]
+            p = self.parent[i]
+            if p == -1:
+                roots.append(cid)
+            elif p >= 0:
+                children_map.setdefault(self.ids[p], []).append(cid)
+            else:
+                children_map.setdefault(self.orphan_pid.get(i, ""), []).append(cid)
+        return {"comments": comments, "roots": roots, "children_map": children_map}
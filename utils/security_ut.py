@@ -1,10 +1,12 @@
 import base64
 import hmac
 import time
+from collections import OrderedDict
 from hashlib import sha256
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import Request, Response
+from fastapi.responses import JSONResponse
 from passlib.context import CryptContext
 
 from config.config import settings
@@ -48,10 +50,21 @@ def clear_session_cookie(response: Response) -> None:
     response.delete_cookie(settings.SESSION_COOKIE_NAME)
 
 
-def get_current_user(request: Request) -> Optional[Dict[str, Any]]:
-    cookie = request.cookies.get(settings.SESSION_COOKIE_NAME)
-    if not cookie:
-        return None
+# session cookie -> (user_uid, exp) that already passed the HMAC check; expiry is still checked per call
+_verified: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+_VERIFIED_MAX = 10000
+_UNRESOLVED = object()
+
+
+def _verify_session_cookie(cookie: str) -> Optional[str]:
+    hit = _verified.get(cookie)
+    if hit is not None:
+        user_uid, exp = hit
+        if exp < int(time.time()):
+            _verified.pop(cookie, None)
+            return None
+        _verified.move_to_end(cookie)
+        return user_uid
     parts = cookie.split(".")
     if len(parts) != 3:
         return None
@@ -62,6 +75,45 @@ def get_current_user(request: Request) -> Optional[Dict[str, Any]]:
         return None
     if exp < int(time.time()):
         return None
-    if _sign(user_uid, exp) != sig:
+    if not hmac.compare_digest(_sign(user_uid, exp), sig):
         return None
-    return {"user_uid": user_uid}
\ No newline at end of file
+    _verified[cookie] = (user_uid, exp)
+    while len(_verified) > _VERIFIED_MAX:
+        _verified.popitem(last=False)
+    return user_uid
+
+
+def get_current_user(request: Request) -> Optional[Dict[str, Any]]:
+    """
+    Session user of this request, resolved once and kept in request.state (shared by route code,
+    Depends(get_current_user) and templates).
+    """
+    user = getattr(request.state, "current_user", _UNRESOLVED)
+    if user is not _UNRESOLVED:
+        return user
+    cookie = request.cookies.get(settings.SESSION_COOKIE_NAME)
+    user_uid = _verify_session_cookie(cookie) if cookie else None
+    user = {"user_uid": user_uid} if user_uid else None
+    request.state.current_user = user
+    return user
+
+
+async def require_admin(request: Request) -> Optional[JSONResponse]:
+    """
+    None when the session user has the admin role, else the 401/403 JSON response to return.
+    """
+    # db.users_db imports this module: import the DB side here
+    from db import get_conn, release_conn
+    from db.users_db import get_user_by_uid
+
+    user = get_current_user(request)
+    if not user:
+        return JSONResponse({"ok": False, "error": "login_required"}, status_code=401)
+    conn = await get_conn()
+    try:
+        row = await get_user_by_uid(conn, user["user_uid"])
+    finally:
+        await release_conn(conn)
+    if not row or (row["role"] or "") != "admin":
+        return JSONResponse({"ok": False, "error": "forbidden"}, status_code=403)
+    return None
@@ -0,0 +1,75 @@
+"""
+The one Jinja2 environment every router renders with.
+
+- one template cache per process instead of one per router module
+- compiled templates go to an on-disk bytecode cache shared by workers and restarts
+  (keys include the source checksum, so edited templates are never served stale)
+- auto_reload (a stat() of every template on each render) only with DEBUG / TEMPLATES_AUTO_RELOAD
+- filters and the site-wide globals (site name, brand, icons) are set here once; a context key of the
+  same name still wins
+- precompile_templates() at startup loads everything, so first requests don't pay for parsing
+"""
+import logging
+import time
+from typing import Optional
+
+import jinja2
+from fastapi.templating import Jinja2Templates
+
+from config.config import settings
+from utils.format_ut import fmt_dt
+from utils.url_ut import build_storage_url
+
+log = logging.getLogger(__name__)
+
+TEMPLATES_DIR = "templates"
+
+
+def _bytecode_cache() -> Optional[jinja2.BytecodeCache]:
+    if not settings.TEMPLATES_BYTECODE_CACHE:
+        return None
+    return jinja2.FileSystemBytecodeCache(settings.TEMPLATES_BYTECODE_CACHE_DIR or None)
+
+
+def _build_env() -> jinja2.Environment:
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(TEMPLATES_DIR),
+        autoescape=True,
+        auto_reload=settings.TEMPLATES_AUTO_RELOAD,
+        bytecode_cache=_bytecode_cache(),
+        cache_size=-1,  # never evict: the template set is small and fixed
+    )
+    env.filters["dt"] = fmt_dt
+    env.globals["storage_url"] = build_storage_url  # storage rel path -> URL for the current delivery mode
+    env.globals.update(
+        sitename=settings.SITENAME,
+        support_email=settings.SUPPORT_EMAIL,
+        brand_logo_url=settings.BRAND_LOGO_URL,
+        brand_tagline=settings.BRAND_TAGLINE,
+        favicon_url=settings.FAVICON_URL,
+        apple_touch_icon_url=settings.APPLE_TOUCH_ICON_URL,
+    )
+    return env
+
+
+templates = Jinja2Templates(env=_build_env())
+
+
+def precompile_templates() -> None:
+    """
+    Compiles (or loads from the bytecode cache) every template. Never raises: a broken template is
+    logged here and fails again on the request that renders it.
+    """
+    if not settings.TEMPLATES_PRECOMPILE:
+        return
+    t0 = time.perf_counter()
+    env = templates.env
+    names = env.list_templates(filter_func=lambda n: n.endswith(".html"))
+    failed = 0
+    for name in names:
+        try:
+            env.get_template(name)
+        except jinja2.TemplateError as e:
+            failed += 1
+            log.warning("template %s does not compile: %s", name, e)
+    log.info("templates precompiled=%s failed=%s in %.0f ms", len(names) - failed, failed, (time.perf_counter() - t0) * 1000.0)
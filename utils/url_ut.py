@@ -1,17 +1,147 @@
+import base64
+import hashlib
+import hmac
+import posixpath
+import re
+import time
 import urllib.parse
+from typing import Optional
+
+from config.config import settings
+from config.ytstorage.ytstorage_cfg import (
+    YTSTORAGE_DELIVERY_MODE,
+    YTSTORAGE_PUBLIC_BASE_URL,
+    YTSTORAGE_URL_SIGN_KEY,
+    YTSTORAGE_URL_SIGN_SCHEME,
+    YTSTORAGE_URL_TTL_SEC,
+    YTSTORAGE_URL_TTL_BUCKET_SEC,
+    YTSTORAGE_URL_REQUIRE_SIG,
+)
+
+STORAGE_PROXY_PREFIX = "/internal/storage/file/"
+
+
+def _sign_key() -> bytes:
+    return (YTSTORAGE_URL_SIGN_KEY or settings.SECRET_KEY or "").encode("utf-8")
+
+
+def _b64url(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _expires_at(now: Optional[float] = None) -> int:
+    """
+    Expiry rounded up to a bucket boundary: the same file gets the same URL
+    for the whole bucket, so browser/edge caches keep working.
+    """
+    t = int(now if now is not None else time.time()) + int(YTSTORAGE_URL_TTL_SEC)
+    b = int(YTSTORAGE_URL_TTL_BUCKET_SEC)
+    return ((t + b - 1) // b) * b
+
+
+def _signature(uri: str, expires: int) -> str:
+    """
+    Signature over "<expires><uri>".
+    - hmac:  base64url(HMAC-SHA256(key, expires + uri))
+    - nginx: base64url(md5(expires + uri + " " + key)), verifiable by ngx_http_secure_link_module:
+             secure_link $arg_sig,$arg_expires; secure_link_md5 "$secure_link_expires$uri <key>";
+    """
+    msg = f"{int(expires)}{uri}"
+    if YTSTORAGE_URL_SIGN_SCHEME == "nginx":
+        return _b64url(hashlib.md5(f"{msg} ".encode("utf-8") + _sign_key()).digest())
+    return _b64url(hmac.new(_sign_key(), msg.encode("utf-8"), hashlib.sha256).digest())
+
+
+def _signed(uri: str, now: Optional[float] = None) -> str:
+    exp = _expires_at(now)
+    return f"{uri}?expires={exp}&sig={_signature(uri, exp)}"
+
+
+def _proxy_uri(rel: str) -> str:
+    return f"{STORAGE_PROXY_PREFIX}{urllib.parse.quote(rel)}"
+
+
+def verify_storage_signature(rel_path: str, expires: Optional[str], sig: Optional[str]) -> bool:
+    """
+    Verify signed app URL (/internal/storage/file/<rel>?expires=..&sig=..).
+    """
+    if not expires or not sig:
+        return False
+    try:
+        exp = int(expires)
+    except Exception:
+        return False
+    if exp < int(time.time()):
+        return False
+    rel = (rel_path or "").lstrip("/")
+    return hmac.compare_digest(_signature(_proxy_uri(rel), exp), sig)
 
 
 def build_storage_url(rel_path: str | None) -> str | None:
     """
-    Build an application URL for serving a file stored in ytstorage.
+    Build a URL for serving a file stored in ytstorage.
 
-    NOTE:
-    - local storage mode is deprecated
-    - we always serve via internal proxy route: /internal/storage/file/<rel_path>
+    Depends on YTSTORAGE_DELIVERY_MODE:
+    - proxy:  /internal/storage/file/<rel_path>, app streams bytes (default)
+    - signed: <YTSTORAGE_PUBLIC_BASE_URL>/<rel_path>?expires=..&sig=.., static edge serves bytes;
+              without public base falls back to signed proxy URL
+    - accel:  signed /internal/storage/file/<rel_path>, app checks it and offloads via X-Accel-Redirect
     """
     if not rel_path:
         return None
     rel = rel_path.lstrip("/")
 
+    if YTSTORAGE_DELIVERY_MODE == "signed" and YTSTORAGE_PUBLIC_BASE_URL:
+        base = YTSTORAGE_PUBLIC_BASE_URL.rstrip("/")
+        parts = urllib.parse.urlsplit(base)
+        uri = f"{parts.path}/{urllib.parse.quote(rel)}"
+        signed = _signed(uri)
+        return f"{parts.scheme}://{parts.netloc}{signed}" if parts.netloc else signed
+
     # Use path-form (works well for VTT and avoids query escaping issues)
-    return f"/internal/storage/file/{urllib.parse.quote(rel)}"
\ No newline at end of file
+    uri = _proxy_uri(rel)
+    if YTSTORAGE_DELIVERY_MODE in ("signed", "accel"):
+        return _signed(uri)
+    return uri
+
+
+
+def storage_urls_signed() -> bool:
+    """
+    True when storage URLs carry expires/sig: derived URLs (relative refs inside files) would be refused.
+    """
+    return YTSTORAGE_DELIVERY_MODE != "proxy" or YTSTORAGE_URL_REQUIRE_SIG
+
+
+def build_sprites_vtt_url(rel_path: str | None) -> str | None:
+    """
+    Sprite (seek preview) VTT URL. Its cues point at sprite images by relative path, which would be
+    unsigned; while URLs are signed the VTT is therefore always fetched through the app proxy
+    (signed), which rewrites those refs with sign_sprite_refs(). The images themselves still come
+    from wherever build_storage_url() sends them.
+    """
+    if not rel_path:
+        return None
+    if not storage_urls_signed():
+        return build_storage_url(rel_path)
+    return _signed(_proxy_uri(rel_path.lstrip("/")))
+
+
+# cue payload of a sprite VTT: "sprite_0001.jpg#xywh=0,0,160,90" (caption cues never match)
+_SPRITE_REF_RE = re.compile(r"^([^\s#?:]+\.(?:jpe?g|png|webp))(#xywh=[\d,]+)?$", re.IGNORECASE)
+
+
+def sign_sprite_refs(vtt_text: str, vtt_rel: str) -> str:
+    """
+    Replaces relative sprite image refs in a VTT with build_storage_url() URLs of the same files.
+    """
+    base_dir = posixpath.dirname(vtt_rel.lstrip("/"))
+    out = []
+    for line in vtt_text.split("\n"):
+        m = _SPRITE_REF_RE.match(line.strip())
+        if m and not m.group(1).startswith("/"):
+            rel = posixpath.normpath(posixpath.join(base_dir, m.group(1)))
+            if not rel.startswith("../"):
+                line = (build_storage_url(rel) or "") + (m.group(2) or "")
+        out.append(line)
+    return "\n".join(out)
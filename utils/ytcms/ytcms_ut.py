@@ -7,6 +7,7 @@ import grpc
 
 from services.ytadmin.ytadmin_proto import info_pb2, info_pb2_grpc
 from services.ytcms.ytcms_client_srv import pick_ytcms_server_addr
+from services.monitor.metrics_srv import grpc_intercept
 
 
 _HOSTPORT_RE = re.compile(r"^\s*(\[[^\]]+\]|[^:]+)\s*:\s*(\d+)\s*$")
@@ -67,7 +68,7 @@ def get_active_cms_server(timeout_sec: float = 1.0) -> Dict[str, Any]:
 
     channel = None
     try:
-        channel = grpc.insecure_channel(addr)
+        channel = grpc_intercept(grpc.insecure_channel(addr))
         stub = info_pb2_grpc.InfoStub(channel)
         resp = stub.All(info_pb2.InfoRequest(selector=""), timeout=timeout_sec)
 